@@ -0,0 +1,27 @@
+# Generates inputs for Day 1: https://adventofcode.com/2022/day/1
+#
+# Each Elf carries a handful of snacks, listed one calorie count per line, with
+# a blank line between Elves. The real input has about 250 Elves, so we'll
+# generate 250 Elves per step of scale.
+
+
+def generate(scale, rng):
+    """Generate a list of snacks carried by each Elf.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    for i in range(250 * scale):
+        if i > 0:
+            yield ''
+
+        for j in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 65000))
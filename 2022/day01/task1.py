@@ -21,25 +21,37 @@
 # input processing. So it's just a bit easier to manage, and just a bit more
 # resilient.
 
-cur_elf = 1
-cur_elf_calories = 0
-max_elf = 0
-max_elf_calories = 0
+from aoc.inputs import accepts_streams, open_text_input
 
 
-with open('input', 'r') as fp:
-    for line in fp:
-        line = line.strip()
+def get_max_calories(source):
+    cur_elf = 1
+    cur_elf_calories = 0
+    max_elf = 0
+    max_elf_calories = 0
 
-        if line:
-            cur_elf_calories += int(line)
+    with open_text_input(source) as fp:
+        for line in fp:
+            line = line.strip()
 
-            if cur_elf_calories > max_elf_calories:
-                max_elf_calories = cur_elf_calories
-                max_elf = cur_elf
-        else:
-            cur_elf += 1
-            cur_elf_calories = 0
+            if line:
+                cur_elf_calories += int(line)
 
+                if cur_elf_calories > max_elf_calories:
+                    max_elf_calories = cur_elf_calories
+                    max_elf = cur_elf
+            else:
+                cur_elf += 1
+                cur_elf_calories = 0
 
-print('Elf %s: Max calories: %s' % (max_elf, max_elf_calories))
+    return max_elf, max_elf_calories
+
+
+@accepts_streams
+def solve(source):
+    return get_max_calories(source)[1]
+
+
+if __name__ == '__main__':
+    max_elf, max_elf_calories = get_max_calories('input')
+    print('Elf %s: Max calories: %s' % (max_elf, max_elf_calories))
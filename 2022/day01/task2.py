@@ -14,59 +14,321 @@
 # That then lets us keep our processing loop simple. We just iterate over the
 # data yielded.
 #
-# We still need to know the top three elves and their calories, so what we do
-# is keep a list of the top 3, in order from highest to lowest calories.
-# For each result, we loop through the rankings and see if the new elf beats
-# out a ranked elf to a calorie count. If so, we insert the new one right
-# before that one, and then we cap the ranks back to 3.
+# We still need to know the top three elves and their calories. Rather than
+# keeping a sorted list of the top 3 and inserting into it, we let heapq do
+# the work. heapq.nlargest() keeps a small heap of the best elves seen so
+# far, and each new elf only has to beat the lowest of those. That's cheap
+# no matter how many elves there are, or how many we want to rank.
+#
+# Going line by line is slow for really large inputs, though. So rather than
+# reading a line at a time, we read large chunks at a time, split those on
+# blank lines, and sum up all the numbers for each elf in one go.
+#
+# And for the really, REALLY large inputs, we can split the work across
+# processes. The input is split into a chunk per CPU (always on a blank line,
+# so no elf is split between chunks), each process ranks the elves in its
+# chunk, and then we just rank the top elves from each chunk. Elf numbers
+# are counted from the start of each chunk, so they're offset by the number
+# of elves in the chunks before.
+#
+# There's also a NumPy version (run with --backend=numpy). This parses the
+# whole input into one array of numbers in a single call, with a marker in
+# place of each blank line. The markers tell us where each elf's numbers
+# start, and np.add.reduceat() sums up each elf's run of numbers at once.
+# Then np.argpartition() finds the top elves without sorting all of them.
+
+import heapq
+from operator import itemgetter
+
+from aoc.backends import with_backends
+from aoc.inputs import (CHUNK_SIZE, accepts_streams, is_path_source,
+                        iter_input_chunks, open_input, open_text_input,
+                        parse_int_array)
+from aoc.parallel import map_input_chunks, should_split_input
 
 
 TOP_RANKED_ELVES = 3
 
-# These are ranked from highest to lowest calorie counts.
-#
-# Tuple of: (elf_num, calories)
-max_elf_rankings = [(0, 0)] * TOP_RANKED_ELVES
 
+def iter_record_calories(records):
+    """Iterate through the calorie totals in records of calorie counts.
+
+    Args:
+        records (list of bytes):
+            The records to parse, each containing the calorie counts for an
+            elf on separate lines.
+
+    Yields:
+        int:
+        The total calories for each elf.
+    """
+    for record in records:
+        calories = record.split()
+
+        # Extra blank lines don't start new elves.
+        if calories:
+            yield sum(map(int, calories))
 
-def iter_elf_input():
-    found_calories = False
+
+def iter_elf_input(source):
+    """Iterate through the elves in an input, and their calorie totals.
+
+    Args:
+        source (aoc.inputs.InputSource):
+            The input source.
+
+    Yields:
+        tuple:
+        A 2-tuple of ``(elf_num, calories)`` for each elf, in order.
+    """
     elf = 1
-    calories = 0
-
-    with open('input', 'r') as fp:
-        for line in fp:
-            line = line.strip()
-
-            if line:
-                calories += int(line)
-                found_calories = True
-            elif found_calories:
-                yield elf, calories
-                elf += 1
-                calories = 0
-                found_calories = False
-
-        if found_calories:
+
+    # Chunks end on a line, but not necessarily a blank one, so the last
+    # elf in each chunk may continue into the next.
+    leftover = b''
+
+    for chunk in iter_input_chunks(source):
+        records = (leftover + chunk).split(b'\n\n')
+        leftover = records.pop()
+
+        for calories in iter_record_calories(records):
             yield elf, calories
+            elf += 1
+
+    for calories in iter_record_calories([leftover]):
+        yield elf, calories
+
+
+def rank_elves(elves, count=TOP_RANKED_ELVES):
+    """Return the elves carrying the most calories.
+
+    Args:
+        elves (iterable of tuple):
+            The elves, as 2-tuples of ``(elf_num, calories)``.
+
+        count (int, optional):
+            The number of elves to rank.
+
+    Returns:
+        list of tuple:
+        The top elves, as 2-tuples of ``(elf_num, calories)``, ranked from
+        highest to lowest calories.
+    """
+    return heapq.nlargest(count, elves, key=itemgetter(1))
+
+
+def rank_elves_in_chunk(path, start, end, count):
+    """Return the number of elves in a chunk of input, and the top elves.
+
+    This is run in a worker process (see :py:func:`get_max_elf_rankings`).
+
+    Args:
+        path (str):
+            The path to the input file.
+
+        start (int):
+            The offset of the start of the chunk.
+
+        end (int):
+            The offset of the end of the chunk.
+
+        count (int):
+            The number of elves to rank.
+
+    Returns:
+        tuple:
+        A 2-tuple of ``(num_elves, rankings)``. Elf numbers in the rankings
+        are relative to the start of the chunk.
+    """
+    num_elves = 0
+
+    def _iter_elves():
+        nonlocal num_elves
+
+        with open_input(path) as data:
+            buf = data.data.obj
+
+            for chunk_start, chunk_end in data.iter_chunk_bounds(
+                    CHUNK_SIZE,
+                    separator=b'\n\n',
+                    start=start,
+                    end=end):
+                records = buf[chunk_start:chunk_end].split(b'\n\n')
+
+                for calories in iter_record_calories(records):
+                    num_elves += 1
+                    yield num_elves, calories
+
+    rankings = rank_elves(_iter_elves(), count)
+
+    return num_elves, rankings
+
+
+def get_max_elf_rankings(source, count=TOP_RANKED_ELVES):
+    """Return the elves carrying the most calories.
+
+    Large input files are split across processes.
+
+    Args:
+        source (aoc.inputs.InputSource):
+            The input source.
+
+        count (int, optional):
+            The number of elves to rank.
+
+    Returns:
+        list of tuple:
+        The top elves, as 2-tuples of ``(elf_num, calories)``, ranked from
+        highest to lowest calories.
+    """
+    if not is_path_source(source) or not should_split_input(source):
+        return rank_elves(iter_elf_input(source), count)
+
+    chunk_rankings = []
+    first_elf = 0
+
+    for num_elves, rankings in map_input_chunks(rank_elves_in_chunk,
+                                                source,
+                                                args=(count,),
+                                                separator=b'\n\n'):
+        chunk_rankings += [
+            (first_elf + elf, calories)
+            for elf, calories in rankings
+        ]
+        first_elf += num_elves
+
+    return rank_elves(chunk_rankings, count)
+
+
+def get_elf_calories_numpy(source):
+    """Return the calorie totals for each elf in an input, using NumPy.
+
+    Args:
+        source (aoc.inputs.InputSource):
+            The input source.
+
+    Returns:
+        numpy.ndarray:
+        A 1D array of ``int64`` calorie totals, indexed by elf (starting at
+        0).
+
+    Raises:
+        ValueError:
+            The input contained something other than numbers.
+    """
+    import numpy as np
+
+    with open_text_input(source) as fp:
+        text = fp.read()
+
+    # Calories are never negative, so a -1 in place of each blank line marks
+    # where one elf ends and the next begins.
+    #
+    # Anything in the input that isn't a number is an error, rather than
+    # quietly dropping every elf after it.
+    values = parse_int_array(text.replace('\n\n', '\n-1\n'))
+    is_marker = values < 0
+
+    # Number each value by the elf carrying it, and drop the markers. Extra
+    # blank lines don't start new elves, since no values are left between
+    # their markers.
+    elf_ids = np.cumsum(is_marker)[~is_marker]
+    values = values[~is_marker]
+
+    if len(values) == 0:
+        return values
+
+    # Each elf starts wherever the elf number changes.
+    starts = np.flatnonzero(np.diff(elf_ids, prepend=-1))
+
+    return np.add.reduceat(values, starts)
+
+
+def get_max_elf_rankings_numpy(source, count=TOP_RANKED_ELVES):
+    """Return the elves carrying the most calories, using NumPy.
+
+    Args:
+        source (aoc.inputs.InputSource):
+            The input source.
+
+        count (int, optional):
+            The number of elves to rank.
+
+    Returns:
+        list of tuple:
+        The top elves, as 2-tuples of ``(elf_num, calories)``, ranked from
+        highest to lowest calories.
+    """
+    import numpy as np
+
+    totals = get_elf_calories_numpy(source)
+
+    if count < len(totals):
+        # This moves the top elves to the end, in no particular order, so
+        # only those few need sorting.
+        top = np.argpartition(totals, -count)[-count:]
+    else:
+        top = np.arange(len(totals))
+
+    # Elves carrying the same calories are ranked in input order, like
+    # rank_elves() does.
+    top = top[np.lexsort((top, -totals[top]))]
+
+    return [
+        (int(elf) + 1, int(totals[elf]))
+        for elf in top
+    ]
+
+
+@accepts_streams
+def get_total_max_calories(source):
+    """Return the total calories carried by the top elves.
+
+    Args:
+        source (aoc.inputs.InputSource):
+            The input source.
+
+    Returns:
+        int:
+        The total calories.
+    """
+    return sum(
+        max_calories
+        for max_elf, max_calories in get_max_elf_rankings(source)
+    )
+
+
+@accepts_streams
+def get_total_max_calories_numpy(source):
+    """Return the total calories carried by the top elves, using NumPy.
+
+    Args:
+        source (aoc.inputs.InputSource):
+            The input source.
+
+    Returns:
+        int:
+        The total calories.
+    """
+    return sum(
+        max_calories
+        for max_elf, max_calories in get_max_elf_rankings_numpy(source)
+    )
 
 
-for cur_elf, cur_calories in iter_elf_input():
-    for i, (max_elf, max_calories) in enumerate(max_elf_rankings):
-        if cur_calories >= max_calories:
-            max_elf_rankings.insert(i, (cur_elf, cur_calories))
-            max_elf_rankings = max_elf_rankings[:3]
-            break
+solve = with_backends(get_total_max_calories,
+                      numpy=get_total_max_calories_numpy)
 
 
-print('Rankings:')
+if __name__ == '__main__':
+    print('Rankings:')
 
-total_max_calories = 0
+    total_max_calories = 0
 
-for max_elf, max_calories in max_elf_rankings:
-    print('Elf %s: %s' % (max_elf, max_calories))
+    for max_elf, max_calories in get_max_elf_rankings('input'):
+        print('Elf %s: %s' % (max_elf, max_calories))
 
-    total_max_calories += max_calories
+        total_max_calories += max_calories
 
-print()
-print('Total max calories = %s' % total_max_calories)
+    print()
+    print('Total max calories = %s' % total_max_calories)
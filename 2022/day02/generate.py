@@ -0,0 +1,22 @@
+# Generates inputs for Day 2: https://adventofcode.com/2022/day/2
+#
+# Each line is a round of Rock-Paper-Scissors: the opponent's shape (A, B, or
+# C) and our column (X, Y, or Z). The real input has 2,500 rounds.
+
+
+def generate(scale, rng):
+    """Generate a strategy guide of rounds.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    for i in range(2500 * scale):
+        yield '%s %s' % (rng.choice('ABC'), rng.choice('XYZ'))
@@ -0,0 +1,95 @@
+# Generates inputs for Day 3: https://adventofcode.com/2022/day/3
+#
+# Each line is a rucksack, with two equally-sized compartments that share
+# exactly one item type. Every group of three rucksacks also shares exactly one
+# item type (the badge) across all three.
+#
+# To make sure nothing else is shared by the whole group, the other item types
+# are split into three pools, and each rucksack in the group skips one of the
+# pools. Within a rucksack, the remaining item types are split again between
+# the two compartments, so only the chosen shared item lands in both.
+#
+# The real input has 100 groups (300 rucksacks).
+
+import string
+
+
+ITEM_TYPES = string.ascii_letters
+
+
+def generate_rucksack(rng, *, item_types, badge):
+    """Generate a single rucksack.
+
+    Args:
+        rng (random.Random):
+            The random number generator to use.
+
+        item_types (list of str):
+            The item types this rucksack can contain, other than the badge.
+
+        badge (str):
+            The badge item type, which will be placed in one compartment.
+
+    Returns:
+        str:
+        The rucksack's contents.
+    """
+    item_types = list(item_types)
+    rng.shuffle(item_types)
+
+    # One item type goes in both compartments. The rest are split between
+    # them.
+    shared = item_types.pop()
+    split = len(item_types) // 2
+    compartment_types = [
+        item_types[:split],
+        item_types[split:],
+    ]
+    size = rng.randint(6, 20)
+    compartments = []
+
+    for types in compartment_types:
+        compartments.append([shared] + [
+            rng.choice(types)
+            for i in range(size - 1)
+        ])
+
+    compartments[rng.randint(0, 1)][-1] = badge
+
+    for compartment in compartments:
+        rng.shuffle(compartment)
+
+    return ''.join(compartments[0] + compartments[1])
+
+
+def generate(scale, rng):
+    """Generate a list of rucksacks.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    for i in range(100 * scale):
+        item_types = list(ITEM_TYPES)
+        rng.shuffle(item_types)
+
+        badge = item_types.pop()
+        pools = [item_types[j::3] for j in range(3)]
+
+        for j in range(3):
+            yield generate_rucksack(
+                rng,
+                item_types=[
+                    item_type
+                    for k, pool in enumerate(pools)
+                    if k != j
+                    for item_type in pool
+                ],
+                badge=badge)
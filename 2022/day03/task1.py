@@ -3,41 +3,58 @@
 # We need to look in both compartments of each rucksack, looking for a
 # duplicate item, and then getting the sum of priorities for each.
 #
-# For this, like many others, I take an optimized approach. Process one line
-# at a time, keep minimal state.
+# For this, like many others, I take an optimized approach. Read the input a
+# large chunk of raw bytes at a time (no decoding into strings), split each
+# chunk into rucksacks, and keep minimal state.
 #
 # Python's set() data type makes this logic very simple. I can convert the
-# values in each compartment (which are just [A-Za-z]) to a set(), and then
-# get the intersection of two sets to figure out where the duplicate is. This
-# is probably the fastest approach in Python, since this utilizes C code for
-# this handling.
+# items in the first compartment (which are just [A-Za-z]) to a set(), and
+# then intersect that with the second compartment to figure out where the
+# duplicate is. set.intersection() takes the second compartment's bytes
+# as-is, so only one set() is built per rucksack. This is probably the
+# fastest approach in Python, since this utilizes C code for this handling.
 #
-# Then I calculate a priority based on uppercase or lowercase letters. There
-# are many was this could be done, but I go with simple math. We can easily
-# compare letters for ranges, to see if it's uppercase or lowercase (we could
-# also use some string functions for this).
+# Then I need the item's priority. Items are bytes, so each one is just a
+# number from 0 to 255. I build a table up-front, mapping each of those
+# numbers to its priority (1-26 for 'a' through 'z', 27-52 for 'A' through
+# 'Z'), and look the item up in it. No comparisons or math needed.
 #
-# To actually calculate a priority, we're getting the character codes and
-# calculating based on the lowest in the range ('a' or 'A'). This gives us an
-# index into the alphabet that we can add on to a starting priority value.
+# I also tried turning each compartment into a 52-bit integer mask (one bit
+# per priority) and intersecting those with &, but building each mask takes
+# a Python-level step per item, which is slower than letting set() do it in
+# C.
 
-a_ORD = ord('a')
-A_ORD = ord('A')
+from aoc.inputs import accepts_streams, iter_input_chunks
 
 
-total_priority = 0
+ITEMS = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
-with open('input', 'r') as fp:
-    for line in fp:
-        line = line.strip()
-        num_compartment_items = len(line) // 2
-        compartment1 = line[:num_compartment_items]
-        compartment2 = line[num_compartment_items:]
+# Map each byte value to the priority of the item, or 0 if it's not an item.
+PRIORITIES = [0] * 256
 
-        for item in set(compartment1) & set(compartment2):
-            if 'a' <= item <= 'z':
-                total_priority += 1 + (ord(item) - a_ORD)
-            elif 'A' <= item <= 'Z':
-                total_priority += 27 + (ord(item) - A_ORD)
+for _priority, _item in enumerate(ITEMS, start=1):
+    PRIORITIES[_item] = _priority
 
-print(f'Total priority = {total_priority}')
+
+@accepts_streams
+def solve(source):
+    total_priority = 0
+
+    for chunk in iter_input_chunks(source):
+        # Chunks of files are memoryviews, which can't split(). Copying a
+        # chunk to bytes is a single quick memcpy, and takes a tiny fraction
+        # of the time spent splitting it.
+        for rucksack in bytes(chunk).split():
+            num_compartment_items = len(rucksack) // 2
+            compartment1 = rucksack[:num_compartment_items]
+            compartment2 = rucksack[num_compartment_items:]
+
+            for item in set(compartment1).intersection(compartment2):
+                total_priority += PRIORITIES[item]
+
+    return total_priority
+
+
+if __name__ == '__main__':
+    total_priority = solve('input')
+    print(f'Total priority = {total_priority}')
@@ -0,0 +1,39 @@
+# Generates inputs for Day 4: https://adventofcode.com/2022/day/4
+#
+# Each line is a pair of section assignment ranges, in the form of "a-b,c-d",
+# with sections numbered 1 through 99. The real input has 1,000 pairs.
+
+
+def generate_range(rng):
+    """Generate a section assignment range.
+
+    Args:
+        rng (random.Random):
+            The random number generator to use.
+
+    Returns:
+        str:
+        The range, in "start-end" form.
+    """
+    start = rng.randint(1, 99)
+    end = rng.randint(start, 99)
+
+    return '%s-%s' % (start, end)
+
+
+def generate(scale, rng):
+    """Generate a list of section assignment pairs.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    for i in range(1000 * scale):
+        yield '%s,%s' % (generate_range(rng), generate_range(rng))
@@ -17,24 +17,29 @@
 # some of this if I wanted.
 #
 # I then just need to see if one range fully consumes another. Basic math.
+#
+# These days, the ranges are loaded up-front by aoc.intervals, into lists of
+# the starts and ends of each range in each pair. That gets all the parsing
+# done in a few big steps, rather than splitting and converting each line
+# separately. Checking for containment is then a matter of running the math
+# over those lists with map() and the operator module, which do the work in
+# C rather than a Python loop.
+#
+# The math is a bit different now, too. One range contains the other when
+# its start comes no later and its end comes no earlier. Put another way,
+# the difference between the starts and the difference between the ends
+# don't have the same sign, so multiplying them never gives a positive
+# number. One check instead of four.
 
-num_full_overlaps = 0
-
-
-with open('input', 'r') as fp:
-    for line in fp.readlines():
-        pairs = line.strip().split(',')
-        assert len(pairs) == 2
-
-        range1 = [int(i) for i in pairs[0].split('-')]
-        range2 = [int(i) for i in pairs[1].split('-')]
+from aoc.inputs import accepts_streams
+from aoc.intervals import IntervalPairs
 
-        assert len(range1) == 2
-        assert len(range2) == 2
 
-        if ((range1[0] >= range2[0] and range1[1] <= range2[1]) or
-            (range2[0] >= range1[0] and range2[1] <= range1[1])):
-            num_full_overlaps += 1
+@accepts_streams
+def solve(source):
+    return IntervalPairs.from_input(source).count_contained()
 
 
-print(f'Number of overlapped schedules = {num_full_overlaps}')
+if __name__ == '__main__':
+    num_full_overlaps = solve('input')
+    print(f'Number of overlapped schedules = {num_full_overlaps}')
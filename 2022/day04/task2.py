@@ -18,24 +18,33 @@
 #
 # I then just need to check if one range's lower bound exists within the
 # other's range, and vice-versa. That'll get me the overlaps.
+#
+# These days, the ranges are loaded up-front by aoc.intervals, into lists of
+# the starts and ends of each range in each pair, just like in task1.py.
+#
+# Rather than checking for overlaps, it's simpler to count the pairs that
+# don't overlap, which is when one range ends before the other starts. Those
+# are just two comparisons, run over the lists with map() and the operator
+# module in C, and the rest of the pairs overlap.
+#
+# Having all the ranges loaded also lets us ask other questions without
+# going through the input again. Running this directly also shows the most
+# assignments covering any one section, found by sweeping through the sorted
+# starts and ends of every range.
 
-num_full_overlaps = 0
-
-
-with open('input', 'r') as fp:
-    for line in fp.readlines():
-        pairs = line.strip().split(',')
-        assert len(pairs) == 2
+from aoc.inputs import accepts_streams
+from aoc.intervals import IntervalPairs
 
-        range1 = [int(i) for i in pairs[0].split('-')]
-        range2 = [int(i) for i in pairs[1].split('-')]
 
-        assert len(range1) == 2
-        assert len(range2) == 2
+@accepts_streams
+def solve(source):
+    return IntervalPairs.from_input(source).count_overlapping()
 
-        if ((range1[0] <= range2[0] <= range1[1]) or
-            (range2[0] <= range1[0] <= range2[1])):
-            num_full_overlaps += 1
 
+if __name__ == '__main__':
+    pairs = IntervalPairs.from_input('input')
+    max_assignments, section = pairs.get_intervals().get_max_overlapping()
 
-print(f'Number of overlapped schedules = {num_full_overlaps}')
+    print(f'Number of overlapped schedules = {pairs.count_overlapping()}')
+    print(f'Most assignments for one section = {max_assignments} '
+          f'(section {section})')
@@ -0,0 +1,72 @@
+# Generates inputs for Day 5: https://adventofcode.com/2022/day/5
+#
+# The input starts with a drawing of 9 stacks of crates, followed by a list of
+# moves. The stack numbers are single digits, so we always have 9 stacks, and
+# scale the number of crates and moves instead. The real input has about 50
+# crates and 500 moves.
+#
+# Moves are simulated as they're generated, so that they never take more
+# crates than a stack has. We also never empty a stack, since the answer is
+# built from the top crate of each.
+
+import string
+
+
+NUM_STACKS = 9
+
+
+def generate(scale, rng):
+    """Generate a drawing of stacks of crates and a list of moves.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    stacks = [
+        [rng.choice(string.ascii_uppercase)]
+        for i in range(NUM_STACKS)
+    ]
+
+    for i in range(50 * scale - NUM_STACKS):
+        rng.choice(stacks).append(rng.choice(string.ascii_uppercase))
+
+    # Draw the stacks, top-down. Every row is padded out to the full width.
+    for y in range(max(len(stack) for stack in stacks) - 1, -1, -1):
+        yield ' '.join(
+            '[%s]' % stack[y] if y < len(stack) else '   '
+            for stack in stacks
+        )
+
+    yield ' '.join(
+        ' %s ' % (i + 1)
+        for i in range(NUM_STACKS)
+    )
+    yield ''
+
+    for i in range(500 * scale):
+        move_from = rng.choice([
+            j
+            for j, stack in enumerate(stacks)
+            if len(stack) > 1
+        ])
+        move_to = rng.choice([
+            j
+            for j in range(NUM_STACKS)
+            if j != move_from
+        ])
+
+        stack = stacks[move_from]
+        move_count = rng.randint(1, min(len(stack) - 1, 30))
+
+        stacks[move_to] += stack[-move_count:]
+        del stack[-move_count:]
+
+        yield 'move %s from %s to %s' % (move_count, move_from + 1,
+                                         move_to + 1)
@@ -18,8 +18,9 @@
 # which can match cargo or a blank area where cargo would be. I then just
 # iterate through the results, inserting the cargo at the start of each stack.
 #
-# Once I'm in the move processing phase, I use another regex to parse out the
-# move instruction. Then I just need to handle the move.
+# Once I'm in the move processing phase, each move instruction is just 3
+# numbers, so I pull those out of the rest of the input in bulk. Then I just
+# need to handle the move.
 #
 # The logic for this part is similar to task1.py, except I don't need to
 # reverse the crates I'm extracting. I just extract them as-is and put them
@@ -27,56 +28,49 @@
 #
 # That makes this code effectively identical to task1.py, minus a reverse().
 
-import re
+from aoc.parsing import iter_int_records
+from aoc.patterns import lazy_compile
 
 
-MOVE_RE = re.compile(r'^move (\d+) from (\d+) to (\d+)')
-CRATES_RE = re.compile(r'(?:\[(?P<cargo>[A-Z])\]|   ) ?')
+CRATES_RE = lazy_compile(r'(?:\[(?P<cargo>[A-Z])\]|   ) ?')
 
 
-# Index 0 in a stack is the bottom-most item.
-stacks = []
+def solve(filename):
+    # Index 0 in a stack is the bottom-most item.
+    stacks = []
 
-# Whether we're in the setup phase, parsing the initial stacks.
-in_setup = True
-
-
-with open('input', 'r') as fp:
-    for line in fp.readlines():
-        if in_setup:
-            # Load in crate data.
+    with open(filename, 'r') as fp:
+        # Load in crate data.
+        for line in fp:
             if line.lstrip().startswith('1 '):
                 # We've reached the numbers row. We're done with setup.
-                in_setup = False
-            else:
-                cargo_items = CRATES_RE.findall(line)
+                break
+
+            cargo_items = CRATES_RE.findall(line)
 
-                if not stacks:
-                    stacks = [
-                        []
-                        for i in cargo_items
-                    ]
+            if not stacks:
+                stacks = [
+                    []
+                    for i in cargo_items
+                ]
 
-                for i, cargo in enumerate(cargo_items):
-                    if cargo:
-                        stacks[i].insert(0, cargo)
-        else:
-            # Process the moves.
-            line = line.strip()
+            for i, cargo in enumerate(cargo_items):
+                if cargo:
+                    stacks[i].insert(0, cargo)
 
-            if line:
-                m = MOVE_RE.match(line)
-                assert m, line
+        # Process the moves in the rest of the file.
+        for move_count, move_from, move_to in iter_int_records(fp, 3):
+            move_from -= 1
+            move_to -= 1
 
-                move_count = int(m.group(1))
-                move_from = int(m.group(2)) - 1
-                move_to = int(m.group(3)) - 1
+            stacks[move_to] += stacks[move_from][-move_count:]
+            stacks[move_from] = stacks[move_from][:-move_count]
 
-                stacks[move_to] += stacks[move_from][-move_count:]
-                stacks[move_from] = stacks[move_from][:-move_count]
+    return ''.join(
+        stack[-1]
+        for stack in stacks
+    )
 
 
-print(''.join(
-    stack[-1]
-    for stack in stacks
-))
+if __name__ == '__main__':
+    print(solve('input'))
@@ -0,0 +1,33 @@
+# Generates inputs for Day 6: https://adventofcode.com/2022/day/6
+#
+# The input is a single line datastream. The solvers look for the first run of
+# 4 (and then 14) distinct characters, so to make them scan the whole thing,
+# the datastream is built from only 3 letters, followed by a run of 14 distinct
+# letters at the very end. The real input is 4,096 characters long.
+
+import string
+
+
+def generate(scale, rng):
+    """Generate a datastream.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    letters = rng.sample(string.ascii_lowercase, 14)
+    filler = letters[:3]
+
+    yield ''.join(
+        [
+            rng.choice(filler)
+            for i in range(4096 * scale - len(letters))
+        ] + letters
+    )
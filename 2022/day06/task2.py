@@ -22,19 +22,28 @@
 MARKER_LEN = 14
 
 
-with open('input', 'r') as fp:
-    count = 0
-    buf = []
+def find_marker(filename):
+    with open(filename, 'r') as fp:
+        count = 0
+        buf = []
 
-    while len(set(buf)) != MARKER_LEN:
-        count += 1
-        c = fp.read(1)
+        while len(set(buf)) != MARKER_LEN:
+            count += 1
+            c = fp.read(1)
 
-        if not c:
-            break
+            if not c:
+                break
 
-        buf = buf[-(MARKER_LEN - 1):] + [c]
+            buf = buf[-(MARKER_LEN - 1):] + [c]
 
+    return ''.join(buf), count
 
-print('code = %r' % ''.join(buf))
-print('count = %s' % count)
+
+def solve(filename):
+    return find_marker(filename)[1]
+
+
+if __name__ == '__main__':
+    code, count = find_marker('input')
+    print('code = %r' % code)
+    print('count = %s' % count)
@@ -0,0 +1,112 @@
+# Generates inputs for Day 7: https://adventofcode.com/2022/day/7
+#
+# The input is a terminal session exploring a filesystem with "cd" and "ls".
+#
+# We'll build a random directory tree first, with each new directory placed
+# under any existing one, and then walk it depth-first, listing each
+# directory's contents before descending into its subdirectories. The real
+# input has about 180 directories.
+
+import string
+
+
+def generate_name(rng, used_names):
+    """Generate a name that's unique within a directory.
+
+    Args:
+        rng (random.Random):
+            The random number generator to use.
+
+        used_names (set of str):
+            The names already used in the directory. The new name will be
+            added to this.
+
+    Returns:
+        str:
+        The new name.
+    """
+    while True:
+        name = ''.join(
+            rng.choice(string.ascii_lowercase)
+            for i in range(rng.randint(1, 8))
+        )
+
+        if rng.random() < 0.5:
+            name += '.' + ''.join(
+                rng.choice(string.ascii_lowercase)
+                for i in range(3)
+            )
+
+        if name not in used_names:
+            used_names.add(name)
+
+            return name
+
+
+def generate(scale, rng):
+    """Generate a terminal session exploring a filesystem.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    # Each directory is a list of (name, subdirectory index) entries and a
+    # list of (name, size) files, with the names tracked separately to keep
+    # them unique.
+    dirs = []
+
+    for i in range(180 * scale):
+        dirs.append(([], [], set()))
+
+        if i > 0:
+            subdirs, files, used_names = dirs[rng.randrange(i)]
+            subdirs.append((generate_name(rng, used_names), i))
+
+    for subdirs, files, used_names in dirs:
+        for i in range(rng.randint(0, 4)):
+            files.append((generate_name(rng, used_names),
+                          rng.randint(1000, 300000)))
+
+    def _list_dir(dir_index):
+        subdirs, files, used_names = dirs[dir_index]
+        listing = [
+            'dir %s' % name
+            for name, subdir_index in subdirs
+        ] + [
+            '%s %s' % (size, name)
+            for name, size in files
+        ]
+        rng.shuffle(listing)
+
+        yield '$ ls'
+        yield from listing
+
+    yield '$ cd /'
+    yield from _list_dir(0)
+
+    # Walk the tree depth-first, without recursion. Each entry in the stack
+    # iterates through the subdirectories left to visit in a directory.
+    stack = [iter(dirs[0][0])]
+
+    while stack:
+        try:
+            name, dir_index = next(stack[-1])
+        except StopIteration:
+            stack.pop()
+
+            if stack:
+                yield '$ cd ..'
+
+            continue
+
+        yield '$ cd %s' % name
+        yield from _list_dir(dir_index)
+
+        stack.append(iter(dirs[dir_index][0]))
@@ -168,50 +168,67 @@ COMMANDS = {
 
 
 cwd = None
-root = DirNode(name='')
+root = None
 
 
-with open('input', 'r') as fp:
-    cur_cmdline = None
-    cwd = None
-    cmd_output = []
+def load_filesystem(filename):
+    """Load the filesystem tree from the command history in a file.
+
+    This resets the current directory and the root of the tree before
+    replaying the commands, so this can be called more than once.
+    """
+    global cwd, root
 
-    def run_cur_command():
-        global cmd_output
-        global cur_cmdline
+    cwd = None
+    root = DirNode(name='')
 
-        COMMANDS[cur_cmdline[0]](*cur_cmdline[1:],
-                                 output=cmd_output)
+    with open(filename, 'r') as fp:
+        cur_cmdline = None
         cmd_output = []
-        cur_cmdline = []
 
-    # For our command parser, we're going to find any new commands being run,
-    # parse the command line, store it, and then grab any output.
-    #
-    # Once we find a new command, we "execute" the stored command and pass
-    # the output, then reset state. The same happens once we've finished the
-    # full input stream.
-    for line in fp.readlines():
-        if line.startswith('$ '):
-            # Command
-            if cur_cmdline is not None:
-                run_cur_command()
-
-            cur_cmdline = line[2:].split()
-        else:
-            cmd_output.append(line)
+        def run_cur_command():
+            nonlocal cmd_output
+            nonlocal cur_cmdline
+
+            COMMANDS[cur_cmdline[0]](*cur_cmdline[1:],
+                                     output=cmd_output)
+            cmd_output = []
+            cur_cmdline = []
 
-    run_cur_command()
+        # For our command parser, we're going to find any new commands being
+        # run, parse the command line, store it, and then grab any output.
+        #
+        # Once we find a new command, we "execute" the stored command and pass
+        # the output, then reset state. The same happens once we've finished
+        # the full input stream.
+        for line in fp.readlines():
+            if line.startswith('$ '):
+                # Command
+                if cur_cmdline is not None:
+                    run_cur_command()
+
+                cur_cmdline = line[2:].split()
+            else:
+                cmd_output.append(line)
+
+        run_cur_command()
 
 
 # We know the maximum size we can consider. Gram the sum of every directory
 # under this size.
 MAX_DIR_SIZE = 100000
 
-total_sums = sum(
-    node.size
-    for node in walk_dirs()
-    if node.size <= MAX_DIR_SIZE
-)
 
-print(f'Total sums of dirs < {MAX_DIR_SIZE}: {total_sums}')
+def solve(filename):
+    load_filesystem(filename)
+
+    return sum(
+        node.size
+        for node in walk_dirs()
+        if node.size <= MAX_DIR_SIZE
+    )
+
+
+if __name__ == '__main__':
+    total_sums = solve('input')
+    print(f'Total sums of dirs < {MAX_DIR_SIZE}: {total_sums}')
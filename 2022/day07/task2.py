@@ -176,41 +176,51 @@ COMMANDS = {
 
 
 cwd = None
-root = DirNode(name='')
+root = None
 
 
-with open('input', 'r') as fp:
-    cur_cmdline = None
-    cwd = None
-    cmd_output = []
+def load_filesystem(filename):
+    """Load the filesystem tree from the command history in a file.
+
+    This resets the current directory and the root of the tree before
+    replaying the commands, so this can be called more than once.
+    """
+    global cwd, root
 
-    def run_cur_command():
-        global cmd_output
-        global cur_cmdline
+    cwd = None
+    root = DirNode(name='')
 
-        COMMANDS[cur_cmdline[0]](*cur_cmdline[1:],
-                                 output=cmd_output)
+    with open(filename, 'r') as fp:
+        cur_cmdline = None
         cmd_output = []
-        cur_cmdline = []
 
-    # For our command parser, we're going to find any new commands being run,
-    # parse the command line, store it, and then grab any output.
-    #
-    # Once we find a new command, we "execute" the stored command and pass
-    # the output, then reset state. The same happens once we've finished the
-    # full input stream.
-    for line in fp.readlines():
-        if line.startswith('$ '):
-            # This is a command.
-            if cur_cmdline is not None:
-                run_cur_command()
-
-            cur_cmdline = line[2:].split()
-        else:
-            # This is output for a current command.
-            cmd_output.append(line)
+        def run_cur_command():
+            nonlocal cmd_output
+            nonlocal cur_cmdline
+
+            COMMANDS[cur_cmdline[0]](*cur_cmdline[1:],
+                                     output=cmd_output)
+            cmd_output = []
+            cur_cmdline = []
+
+        # For our command parser, we're going to find any new commands being
+        # run, parse the command line, store it, and then grab any output.
+        #
+        # Once we find a new command, we "execute" the stored command and pass
+        # the output, then reset state. The same happens once we've finished
+        # the full input stream.
+        for line in fp.readlines():
+            if line.startswith('$ '):
+                # This is a command.
+                if cur_cmdline is not None:
+                    run_cur_command()
 
-    run_cur_command()
+                cur_cmdline = line[2:].split()
+            else:
+                # This is output for a current command.
+                cmd_output.append(line)
+
+        run_cur_command()
 
 
 # We need to figure out the smallest directory we can delete that will give
@@ -227,14 +237,27 @@ with open('input', 'r') as fp:
 TOTAL_SPACE = 70_000_000
 SPACE_NEEDED = 30_000_000
 
-space_available = TOTAL_SPACE - root.size
-smallest_candidate = None
 
-for node in walk_dirs():
-    if space_available + node.size >= SPACE_NEEDED:
-        if smallest_candidate is None or node.size < smallest_candidate.size:
-            smallest_candidate = node
+def find_smallest_candidate(filename):
+    load_filesystem(filename)
+
+    space_available = TOTAL_SPACE - root.size
+    smallest_candidate = None
+
+    for node in walk_dirs():
+        if space_available + node.size >= SPACE_NEEDED:
+            if (smallest_candidate is None or
+                node.size < smallest_candidate.size):
+                smallest_candidate = node
+
+    return smallest_candidate
+
+
+def solve(filename):
+    return find_smallest_candidate(filename).size
 
 
-print(f'Smallest candidate dir = %s (size=%d)' % (smallest_candidate.full_path,
-                                                  smallest_candidate.size))
+if __name__ == '__main__':
+    smallest_candidate = find_smallest_candidate('input')
+    print(f'Smallest candidate dir = %s (size=%d)'
+          % (smallest_candidate.full_path, smallest_candidate.size))
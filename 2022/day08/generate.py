@@ -0,0 +1,32 @@
+# Generates inputs for Day 8: https://adventofcode.com/2022/day/8
+#
+# The input is a square grid of tree heights (0-9). The real input is 99x99,
+# and the number of trees grows with the scale, so each side grows by the
+# square root of the scale.
+#
+# Heights are random, but taller trees are made a bit rarer, to keep some long
+# lines of sight around.
+
+import math
+
+
+def generate(scale, rng):
+    """Generate a grid of tree heights.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    size = round(99 * math.sqrt(scale))
+    heights = '0123456789'
+    weights = [10, 10, 10, 10, 9, 8, 7, 6, 5, 4]
+
+    for y in range(size):
+        yield ''.join(rng.choices(heights, weights, k=size))
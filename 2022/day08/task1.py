@@ -11,103 +11,128 @@
 #
 # Mainly, I'm optimizing for runtime performance.
 #
-# For that, I try to keep scans to a minimum. When I load the file, I load
-# each line at a time and perform scans to calculate values (stored within
-# the resulting loaded tree_map) as I go. One left-to-right scan to calculate
-# visibility, and one right-to-left scan for the same.
+# For that, I try to keep scans to a minimum. The tree map is loaded into a
+# flat Grid of character codes, and visibility is tracked in a parallel
+# bytearray of flags (one byte per tree), rather than a list per tree. One
+# left-to-right scan calculates visibility for each row, and one right-to-left
+# scan does the same.
 #
 # I then do the same thing for the vertical scans. One top-to-bottom, one
 # bottom-to-top.
 #
-# To save a final computation loop, my final calculations for the end result
-# are done in that bottom-to-top loop. At the point when this is processing
-# data, I have everything I need to come up with a visibility total, so I just
-# set a flag to compute values, return that from the function, and add that
-# to a grand total for display.
+# Once that's done, the number of visible trees is just a count of the flags
+# that were set, which happens in native code.
+#
+# There's also a NumPy version (run with --backend=numpy). A tree is visible
+# from an edge if it's taller than the running maximum of the trees before
+# it, and NumPy can compute that running maximum for every row at once.
+
+from aoc.backends import with_backends
+from aoc.grid import Grid
 
 
 EDGE_CODE = ord(b'0') - 1
 
-tree_map_width = None
-tree_map_height = 0
-tree_map = []
 
+def scan_visibility(tree_map, visible, offsets):
+    """Flag all trees visible from the start of a row or column.
 
-def iter_dir(length, reverse=False):
-    if reverse:
-        for i in range(length):
-            yield length - i - 1
-    else:
-        for i in range(length):
-            yield i
+    Args:
+        tree_map (bytearray):
+            The flat tree map data.
 
+        visible (bytearray):
+            The visibility flags to update, parallel to ``tree_map``.
 
-def iter_cols(row, reverse=False):
-    for x in iter_dir(tree_map_width, reverse=reverse):
-        yield row[x]
+        offsets (iterable of int):
+            The offsets of the trees to scan, starting from the edge.
+    """
+    max_code = EDGE_CODE
 
+    for offset in offsets:
+        c = tree_map[offset]
 
-def iter_rows(x, reverse=False):
-    for y in iter_dir(tree_map_height, reverse=reverse):
-        yield tree_map[y][x]
+        if max_code < c:
+            visible[offset] = 1
+            max_code = c
 
 
-def scan_visibility(iterator, calc_count=False):
-    max_code = EDGE_CODE
-    visible_count = 0
+def count_visible_trees(filename):
+    """Return the number of trees visible from outside the grid.
 
-    for row_data in iterator:
-        c = row_data[0]
+    Args:
+        filename (str):
+            The name of the input file.
 
-        if max_code < c:
-            row_data[1] = True
-            max_code = c
+    Returns:
+        int:
+        The number of visible trees.
+    """
+    tree_map = Grid.from_file(filename)
+    tree_data = tree_map.data
+    visible = bytearray(len(tree_data))
+
+    # Calculate visibility horizontally. Left-to-right, and then
+    # right-to-left.
+    for y in range(tree_map.height):
+        offsets = tree_map.row_offsets(y)
+
+        scan_visibility(tree_data, visible, offsets)
+        scan_visibility(tree_data, visible, reversed(offsets))
+
+    # Complete a second pass, this time checking vertically. Top-to-bottom,
+    # and then bottom-to-top.
+    for x in range(tree_map.width):
+        offsets = tree_map.column_offsets(x)
 
-        if calc_count and row_data[1]:
-            visible_count += 1
+        scan_visibility(tree_data, visible, offsets)
+        scan_visibility(tree_data, visible, reversed(offsets))
 
-    return visible_count
+    return visible.count(1)
 
 
-with open('input', 'rb') as fp:
-    # Read through each line, processing the visibility map horizontally
-    # as we go.
-    for line in fp.readlines():
-        line = line.strip()
-        tree_map_height += 1
+def count_visible_trees_numpy(filename):
+    """Return the number of trees visible from outside the grid, using NumPy.
 
-        if tree_map_width is None:
-            tree_map_width = len(line)
-        else:
-            # Just make sure we don't have anything funky in our data.
-            assert tree_map_width == len(line)
+    Args:
+        filename (str):
+            The name of the input file.
 
-        # We'll store rows as [char_code, is_visible]
-        row = [
-            [c, False]
-            for c in line
-        ]
+    Returns:
+        int:
+        The number of visible trees.
+    """
+    import numpy as np
 
-        # Calculate visible trees left-to-right.
-        scan_visibility(iter_cols(row))
+    heights = Grid.from_file(filename).to_numpy().astype(np.int16)
+    visible = np.zeros(heights.shape, dtype=bool)
 
-        # And then right-to-left.
-        scan_visibility(iter_cols(row, reverse=True))
+    # Look in from each edge by scanning rows left-to-right in a flipped or
+    # transposed view of the grid. These are views, so flagging trees in the
+    # visibility view flags them in the original.
+    for orient in (lambda a: a,
+                   lambda a: a[:, ::-1],
+                   lambda a: a.T,
+                   lambda a: a.T[:, ::-1]):
+        view_heights = orient(heights)
+        view_visible = orient(visible)
 
-        tree_map.append(row)
+        # Find the tallest tree before each tree in the row. Nothing is in
+        # front of the edge trees, so they see past a height of -1.
+        tallest_before = np.empty_like(view_heights)
+        tallest_before[:, 0] = -1
+        tallest_before[:, 1:] = \
+            np.maximum.accumulate(view_heights, axis=1)[:, :-1]
 
+        view_visible |= view_heights > tallest_before
 
-# Complete a second pass, this time checking vertically. We'll also grab
-# counts in the bottom-to-top loop, avoiding having to loop through again.
-visible_count = 0
+    return int(np.count_nonzero(visible))
 
-for x in range(tree_map_width):
-    # Calculate visibility top-to-bottom.
-    scan_visibility(iter_rows(x))
 
-    # And now bottom-to-top, calculating final results as we go.
-    visible_count += scan_visibility(iter_rows(x, reverse=True),
-                                     calc_count=True)
+solve = with_backends(count_visible_trees,
+                      numpy=count_visible_trees_numpy)
 
 
-print(f'Visible trees = {visible_count}')
+if __name__ == '__main__':
+    visible_count = solve('input')
+    print(f'Visible trees = {visible_count}')
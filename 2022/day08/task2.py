@@ -12,19 +12,16 @@
 #
 # Not a huge optimization, but I'll take what I can get.
 #
-# These resulting integers go into tree_map, since I need to ultimately
-# compare integers and use them as indexes. This differs from my approach in
-# task1.py, which never needs to worry about actual numeric values.
+# The tree map is loaded into a flat Grid of character codes, and scores are
+# tracked in a parallel list of integers (one per tree), rather than a list of
+# values per tree. This differs from my approach in task1.py, which never
+# needs to worry about actual numeric values.
 #
-# For each node in the tree, I store a list of:
+# Each tree's score starts at 1, and each scan multiplies in the distance for
+# its direction. After the four scans, each entry is the final score.
 #
-#     [height, left_dist, right_dist, top_dist, bottom_dist]
-#
-# I try to keep runtime costs to a minimum. When I load the file, I load each
-# line at a time and perform scans to calculate values (stored within the
-# resulting loaded tree_map, as above) as I go. One left-to-right scan to
-# calculate distance scores for each tree, and one right-to-left scan for the
-# same.
+# I try to keep runtime costs to a minimum. One left-to-right scan calculates
+# distance scores for each row, and one right-to-left scan does the same.
 #
 # I then do the same thing for the vertical scans. One top-to-bottom, one
 # bottom-to-top.
@@ -43,41 +40,46 @@
 # up with the best tree candidates for each column. These are returned (by
 # setting a flag), and the outer loop managing each set of vertical scans
 # considers those for a final best tree calculation, which is then displayed.
+#
+# The NumPy version (run with --backend=numpy) uses the same idea, but scans
+# a whole column at a time, keeping the last position of each height for
+# every row at once. A running maximum across the heights then gives the
+# closest position of a tree at least as tall as each tree.
 
+from aoc.backends import with_backends
+from aoc.grid import Grid
 
-MIN_CODE = ord(b'0')
-
-tree_map_width = None
-tree_map_height = 0
-tree_map = []
 
+MIN_CODE = ord(b'0')
 
-def iter_dir(length, reverse=False):
-    if reverse:
-        for i in range(length):
-            yield length - i - 1
-    else:
-        for i in range(length):
-            yield i
 
+def scan_tree_scores(tree_map, scores, offsets, calc_best=False):
+    """Multiply in the viewing distance of each tree in a row or column.
 
-def iter_cols(row, reverse=False):
-    for x in iter_dir(tree_map_width, reverse=reverse):
-        yield x, row[x]
+    Args:
+        tree_map (bytearray):
+            The flat tree map data.
 
+        scores (list of int):
+            The scores to update, parallel to ``tree_map``.
 
-def iter_rows(x, reverse=False):
-    for y in iter_dir(tree_map_height, reverse=reverse):
-        yield y, tree_map[y][x]
+        offsets (iterable of int):
+            The offsets of the trees to scan, starting from the edge.
 
+        calc_best (bool, optional):
+            Whether to find the best score once this scan has been applied.
 
-def scan_tree_scores(length, iterator, result_i, calc_best=False):
+    Returns:
+        tuple:
+        A 2-tuple of the best score and its offset, if ``calc_best`` is
+        set. Otherwise, both values will be ``None``.
+    """
     last_height_pos = [None] * 10
     best_tree_score = None
-    best_tree_i = None
+    best_tree_offset = None
 
-    for pos, (i, row_data) in enumerate(iterator):
-        h = row_data[0]
+    for pos, offset in enumerate(offsets):
+        h = tree_map[offset] - MIN_CODE
 
         # Find the closest tree. We'll only consider ones at least as tall
         # as this tree.
@@ -96,86 +98,133 @@ def scan_tree_scores(length, iterator, result_i, calc_best=False):
             # We didn't find a closest tree. The current tree can see all
             # the way to the border. Its distance is the current position
             # (0-based) relative to the border.
-            row_data[result_i] = pos
+            scores[offset] *= pos
         else:
             # We found a closest tree, meaning this tree is blocked. We can
             # use the difference in position of the current tree and that tree
             # to figure out the distance for the score.
-            row_data[result_i] = pos - last_height_pos[closest_h]
+            scores[offset] *= pos - last_height_pos[closest_h]
 
         # Update the last position of this current height.
         last_height_pos[h] = pos
 
         if calc_best:
-            tree_score = row_data[1] * row_data[2] * row_data[3] * row_data[4]
+            tree_score = scores[offset]
 
             if best_tree_score is None or tree_score > best_tree_score:
                 # We found the best tree for this range.
                 best_tree_score = tree_score
-                best_tree_i = i
+                best_tree_offset = offset
 
-    return best_tree_score, best_tree_i
+    return best_tree_score, best_tree_offset
 
 
-with open('input', 'rb') as fp:
-    # Read through each line, processing the visibility map horizontally
-    # as we go.
-    for line in fp.readlines():
-        line = line.strip()
-        tree_map_height += 1
+def find_best_spot(filename):
+    tree_map = Grid.from_file(filename)
+    tree_data = tree_map.data
+    scores = [1] * len(tree_data)
 
-        if tree_map_width is None:
-            tree_map_width = len(line)
-        else:
-            # Just make sure we don't have anything funky in our data.
-            assert tree_map_width == len(line)
-
-        # We'll store rows as:
-        #
-        # [height_value, left_distance, right_distance, top_distance,
-        #  bottom_distance]
-        row = [
-            [c - MIN_CODE, 0, 0, 0, 0]
-            for c in line
-        ]
-
-        # Calculate tree distane scores left-to-right.
-        scan_tree_scores(tree_map_width,
-                         iter_cols(row),
-                         result_i=1)
-
-        # And then right-to-left.
-        scan_tree_scores(tree_map_width,
-                         iter_cols(row, reverse=True),
-                         result_i=2)
-
-        tree_map.append(row)
-
-
-# Complete a second pass, this time checking vertically. We'll also grab
-# counts in this same reverse column loop.
-best_spot_score = 0
-best_spot_y = None
-best_spot_x = None
-
-for x in range(tree_map_width):
-    # Calculate tree distance scores top-to-bottom.
-    scan_tree_scores(tree_map_height,
-                     iter_rows(x),
-                     result_i=3)
-
-    # And now bottom-to-top, calculating final results as we go.
-    x_best_score, x_best_y = scan_tree_scores(tree_map_height,
-                                              iter_rows(x, reverse=True),
-                                              result_i=4,
-                                              calc_best=True)
-
-    if x_best_score > best_spot_score:
-        # We have a new best score. Track that.
-        best_spot_score = x_best_score
-        best_spot_y = x_best_y
-        best_spot_x = x
-
-
-print(f'Best tree = {best_spot_x}, {best_spot_y} with '
-      f'score = {best_spot_score}')
+    # Calculate tree distance scores horizontally. Left-to-right, and then
+    # right-to-left.
+    for y in range(tree_map.height):
+        offsets = tree_map.row_offsets(y)
+
+        scan_tree_scores(tree_data, scores, offsets)
+        scan_tree_scores(tree_data, scores, reversed(offsets))
+
+    # Complete a second pass, this time checking vertically. We'll also grab
+    # the best scores in the reverse column loop.
+    best_spot_score = 0
+    best_spot_offset = None
+
+    for x in range(tree_map.width):
+        offsets = tree_map.column_offsets(x)
+
+        # Calculate tree distance scores top-to-bottom.
+        scan_tree_scores(tree_data, scores, offsets)
+
+        # And now bottom-to-top, calculating final results as we go.
+        x_best_score, x_best_offset = scan_tree_scores(tree_data,
+                                                       scores,
+                                                       reversed(offsets),
+                                                       calc_best=True)
+
+        if x_best_score > best_spot_score:
+            # We have a new best score. Track that.
+            best_spot_score = x_best_score
+            best_spot_offset = x_best_offset
+
+    best_spot_x, best_spot_y = tree_map.get_pos(best_spot_offset)
+
+    return best_spot_x, best_spot_y, best_spot_score
+
+
+def get_best_score(filename):
+    """Return the best scenic score of any tree.
+
+    Args:
+        filename (str):
+            The name of the input file.
+
+    Returns:
+        int:
+        The best scenic score.
+    """
+    return find_best_spot(filename)[2]
+
+
+def get_best_score_numpy(filename):
+    """Return the best scenic score of any tree, using NumPy.
+
+    Args:
+        filename (str):
+            The name of the input file.
+
+    Returns:
+        int:
+        The best scenic score.
+    """
+    import numpy as np
+
+    heights = (Grid.from_file(filename).to_numpy() - MIN_CODE).astype(np.intp)
+    scores = np.ones(heights.shape, dtype=np.int64)
+
+    # Look out from each tree toward each edge by scanning rows right-to-left
+    # in a flipped or transposed view of the grid. These are views, so
+    # scoring trees in the scores view scores them in the original.
+    for orient in (lambda a: a,
+                   lambda a: a[:, ::-1],
+                   lambda a: a.T,
+                   lambda a: a.T[:, ::-1]):
+        view_heights = orient(heights)
+        view_scores = orient(scores)
+        num_rows, num_columns = view_heights.shape
+        rows = np.arange(num_rows)
+
+        # The last position of a tree of each height, for each row. Position
+        # 0 is the edge, so trees that can see the edge get their position
+        # as their distance.
+        last_height_pos = np.zeros((num_rows, 10), dtype=np.int64)
+
+        for pos in range(num_columns):
+            h = view_heights[:, pos]
+
+            # Find the closest tree at least as tall as each tree, by taking
+            # the running maximum of positions from the tallest height down.
+            closest_pos = np.maximum.accumulate(
+                last_height_pos[:, ::-1], axis=1)[:, ::-1][rows, h]
+
+            view_scores[:, pos] *= pos - closest_pos
+            last_height_pos[rows, h] = pos
+
+    return int(scores.max())
+
+
+solve = with_backends(get_best_score,
+                      numpy=get_best_score_numpy)
+
+
+if __name__ == '__main__':
+    best_spot_x, best_spot_y, best_spot_score = find_best_spot('input')
+    print(f'Best tree = {best_spot_x}, {best_spot_y} with '
+          f'score = {best_spot_score}')
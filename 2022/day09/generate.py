@@ -0,0 +1,22 @@
+# Generates inputs for Day 9: https://adventofcode.com/2022/day/9
+#
+# Each line moves the head of the rope in a direction (U, D, L, or R) by a
+# number of steps. The real input has 2,000 moves.
+
+
+def generate(scale, rng):
+    """Generate a list of rope moves.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    for i in range(2000 * scale):
+        yield '%s %s' % (rng.choice('UDLR'), rng.randint(1, 20))
@@ -34,45 +34,41 @@
 # head and tail, and each move line as it comes in. This could scale to any
 # grid size, any number of instructions.
 
-import re
+from aoc.inputs import accepts_streams
+from aoc.parsing import iter_field_records
+from aoc.patterns import lazy_compile
 
 
-MOVE_RE = re.compile(r'^(?P<direction>[UDLR]) (?P<move_count>\d+)$')
+MOVE_RE = lazy_compile(rb'([UDLR]) (\d+)')
 
 
 HEAD_MOVE_DELTAS = {
-    'U': (0, -1),
-    'D': (0, 1),
-    'L': (-1, 0),
-    'R': (1, 0),
+    b'U': (0, -1),
+    b'D': (0, 1),
+    b'L': (-1, 0),
+    b'R': (1, 0),
 }
 
 
-head = (0, 0)
-tail = (0, 0)
+@accepts_streams
+def solve(source):
+    head = (0, 0)
+    tail = (0, 0)
 
+    # Set the initial visiting position to the starting position.
+    visited_positions = {tail}
 
-# Set the initial visiting position to the starting position.
-visited_positions = {tail}
-
-
-with open('input', 'r') as fp:
-    for line in fp.readlines():
-        m = MOVE_RE.match(line.rstrip())
-        assert m
-
-        direction = m.group('direction')
-        move_count = int(m.group('move_count'))
-
-        for move_i in range(move_count):
+    for direction, move_count in iter_field_records(source, MOVE_RE):
+        for move_i in range(int(move_count)):
             # We'll start off by updating the head's position, based on the
             # delta for the move.
             head_delta = HEAD_MOVE_DELTAS[direction]
             head = (head[0] + head_delta[0],
                     head[1] + head_delta[1])
 
-            # Figure out a relative directions between the head and the tail.
-            # We'll use this to figure out which move needs to be made.
+            # Figure out a relative directions between the head and the
+            # tail. We'll use this to figure out which move needs to be
+            # made.
             #
             # We'll loop over the coordinates, just to reduce the amount of
             # code needed here. Also super useful for 5D snake! When's that
@@ -85,8 +81,9 @@ with open('input', 'r') as fp:
                 elif prev_val > val:
                     rel[rel_i] = 1
 
-            # Now that we have the relative move, build the new tail position.
-            # If it doesn't overlap with the head, we we can set it.
+            # Now that we have the relative move, build the new tail
+            # position. If it doesn't overlap with the head, we we can set
+            # it.
             new_tail = (tail[0] + rel[0],
                         tail[1] + rel[1])
 
@@ -94,9 +91,13 @@ with open('input', 'r') as fp:
                 tail = new_tail
 
                 # Add the tail's position to the set of visited positions.
-                # Since this is a set, we don't have to worry about duplicate
-                # positions.
+                # Since this is a set, we don't have to worry about
+                # duplicate positions.
                 visited_positions.add(tail)
 
+    return len(visited_positions)
+
 
-print(f'Number of positions visited by the tail = {len(visited_positions)}')
+if __name__ == '__main__':
+    num_visited = solve('input')
+    print(f'Number of positions visited by the tail = {num_visited}')
@@ -39,40 +39,36 @@
 # segment, and each move line as it comes in. This could scale to any grid
 # size, any number of instructions, and number of segments.
 
-import re
+from aoc.inputs import accepts_streams
+from aoc.parsing import iter_field_records
+from aoc.patterns import lazy_compile
 
 
-MOVE_RE = re.compile(r'^(?P<direction>[UDLR]) (?P<move_count>\d+)$')
+MOVE_RE = lazy_compile(rb'([UDLR]) (\d+)')
 
 NUM_PARTS = 10
 
 HEAD_MOVE_DELTAS = {
-    'U': (0, -1),
-    'D': (0, 1),
-    'L': (-1, 0),
-    'R': (1, 0),
+    b'U': (0, -1),
+    b'D': (0, 1),
+    b'L': (-1, 0),
+    b'R': (1, 0),
 }
 
 
-# The segments of the snake start at the head and end at the tail.
-segments = [
-    (0, 0)
-    for i in range(NUM_PARTS)
-]
+@accepts_streams
+def solve(source):
+    # The segments of the snake start at the head and end at the tail.
+    segments = [
+        (0, 0)
+        for i in range(NUM_PARTS)
+    ]
 
-# Set the initial visiting position to the starting position.
-visited_positions = {segments[0]}
+    # Set the initial visiting position to the starting position.
+    visited_positions = {segments[0]}
 
-
-with open('input', 'r') as fp:
-    for line in fp.readlines():
-        m = MOVE_RE.match(line.rstrip())
-        assert m
-
-        direction = m.group('direction')
-        move_count = int(m.group('move_count'))
-
-        for move_i in range(move_count):
+    for direction, move_count in iter_field_records(source, MOVE_RE):
+        for move_i in range(int(move_count)):
             # We'll start off by updating the head's position, based on the
             # delta for the move.
             rel = HEAD_MOVE_DELTAS[direction]
@@ -87,12 +83,12 @@ with open('input', 'r') as fp:
                 prev_segment = segments[segment_i - 1]
 
                 # Figure out a relative directions between the previous
-                # segment and the current segment. We'll use this to figure out
-                # which move needs to be made.
+                # segment and the current segment. We'll use this to figure
+                # out which move needs to be made.
                 #
-                # We'll loop over the coordinates, just to reduce the amount
-                # of code needed here. Also super useful for 5D snake! When's
-                # that puzzle?
+                # We'll loop over the coordinates, just to reduce the
+                # amount of code needed here. Also super useful for 5D
+                # snake! When's that puzzle?
                 rel = [0, 0]
 
                 for rel_i, (prev_val, val) in enumerate(zip(prev_segment,
@@ -103,17 +99,22 @@ with open('input', 'r') as fp:
                         rel[rel_i] = 1
 
                 # Now that we have the relative move, build the new segment
-                # position. If it doesn't overlap with the previous segment,
-                # we can set it.
+                # position. If it doesn't overlap with the previous
+                # segment, we can set it.
                 segment = (segment[0] + rel[0],
                            segment[1] + rel[1])
 
                 if segment != prev_segment:
                     segments[segment_i] = segment
 
-            # Add the tail's position to the set of visited positions. Since
-            # this is a set, we don't have to worry about duplicate positions.
+            # Add the tail's position to the set of visited positions.
+            # Since this is a set, we don't have to worry about duplicate
+            # positions.
             visited_positions.add(segments[-1])
 
+    return len(visited_positions)
+
 
-print(f'Number of positions visited by the tail = {len(visited_positions)}')
+if __name__ == '__main__':
+    num_visited = solve('input')
+    print(f'Number of positions visited by the tail = {num_visited}')
@@ -0,0 +1,44 @@
+# Generates inputs for Day 10: https://adventofcode.com/2022/day/10
+#
+# Each line is a CPU instruction: either "noop" (1 cycle) or "addx V" (2
+# cycles). The real input runs for 240 cycles, which is all the solvers ever
+# read (task 1 samples up to cycle 220, and task 2 draws a 240-pixel screen).
+# We generate 240 cycles of instructions per step of scale anyway, so that
+# larger inputs are still valid.
+#
+# The X register is kept within the width of the screen, so the sprite stays
+# visible.
+
+
+def generate(scale, rng):
+    """Generate a list of CPU instructions.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    x = 1
+    cycles = 0
+
+    while cycles < 240 * scale:
+        if rng.random() < 0.3:
+            cycles += 1
+
+            yield 'noop'
+        else:
+            value = rng.randint(-15, 15)
+
+            if not (0 <= x + value < 40):
+                value = -value
+
+            x += value
+            cycles += 2
+
+            yield 'addx %s' % value
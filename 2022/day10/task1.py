@@ -34,6 +34,9 @@
 # instructions from a file as we go, only as needed. No buffering of
 # instructions.
 
+from aoc.inputs import accepts_streams, open_text_input
+
+
 def _op_noop():
     """Perform a no-op.
 
@@ -106,65 +109,70 @@ registers = {
 }
 
 
-# Number of cycles we've executed.
-cycle_count = 0
-
-
-# State on the current instruction we're handling.
-opcode_handler = None
-opcode_cycles_remaining = 0
-opcode_values = ()
-
-
-# Indicates whether we're on the last instruction.
-last = False
-
-
-# Final result we're trying to calculate for the answer.
-signal_strength = 0
-
-
-with open('input', 'r') as fp:
-    while not last:
-        if opcode_cycles_remaining == 0:
-            # Our countdown concluded (or we're on the final instruction).
-            # Execute whatever instruction we had read, if any.
-            if opcode_handler is not None:
-                opcode_handler(*opcode_values)
-                opcode_handler = None
-
-            # And now get a new instruction.
-            opcode, opcode_values = read_instruction(fp)
-
-            if opcode:
-                # We found one, so queue that up for execution and reset the
-                # cycle remaining counter.
-                opcode_cycles_remaining, opcode_handler = OPCODES[opcode]
-            else:
-                # There were no more instructions to read. Finish this cycle
-                # and then we'll be done.
-                last = True
-
-        opcode_cycles_remaining -= 1
-        cycle_count += 1
-
-        # Check if we're ready to add to the signal strength for the final
-        # answer.
-        #
-        # We want this on 20 and then every 40 from there (60, 100, 140, etc.).
-        # We can subtract 20 and then get the remainder dividing by 40 to see
-        # if we're on a 40 count.
-        #
-        # The math works out such that this is done on at cycles:
-        #
-        #  20: ((20 - 20) % 40) == (0 % 40) == 0
-        #  60: ((60 - 20) % 40) == (40 % 40) == 0
-        # 100: ((100 - 20) % 40) == (80 % 40) == 0
-        # 140: ((140 - 20) % 40) == (120 % 40) == 0
-        # 180: ((180 - 20) % 40) == (160 % 40) == 0
-        # 220: ((220 - 20) % 40) == (200 % 40) == 0
-        if ((cycle_count - 20) % 40 == 0):
-            signal_strength += (cycle_count * registers['X'])
-
-
-print(f'Signal strength = {signal_strength}')
+@accepts_streams
+def solve(source):
+    # Reset the registers, in case we're solving more than once.
+    registers['X'] = 1
+
+    # Number of cycles we've executed.
+    cycle_count = 0
+
+    # State on the current instruction we're handling.
+    opcode_handler = None
+    opcode_cycles_remaining = 0
+    opcode_values = ()
+
+    # Indicates whether we're on the last instruction.
+    last = False
+
+    # Final result we're trying to calculate for the answer.
+    signal_strength = 0
+
+    with open_text_input(source) as fp:
+        while not last:
+            if opcode_cycles_remaining == 0:
+                # Our countdown concluded (or we're on the final instruction).
+                # Execute whatever instruction we had read, if any.
+                if opcode_handler is not None:
+                    opcode_handler(*opcode_values)
+                    opcode_handler = None
+
+                # And now get a new instruction.
+                opcode, opcode_values = read_instruction(fp)
+
+                if opcode:
+                    # We found one, so queue that up for execution and reset
+                    # the cycle remaining counter.
+                    opcode_cycles_remaining, opcode_handler = OPCODES[opcode]
+                else:
+                    # There were no more instructions to read. Finish this
+                    # cycle and then we'll be done.
+                    last = True
+
+            opcode_cycles_remaining -= 1
+            cycle_count += 1
+
+            # Check if we're ready to add to the signal strength for the final
+            # answer.
+            #
+            # We want this on 20 and then every 40 from there (60, 100, 140,
+            # etc.). We can subtract 20 and then get the remainder dividing by
+            # 40 to see if we're on a 40 count.
+            #
+            # The math works out such that this is done on at cycles:
+            #
+            #  20: ((20 - 20) % 40) == (0 % 40) == 0
+            #  60: ((60 - 20) % 40) == (40 % 40) == 0
+            # 100: ((100 - 20) % 40) == (80 % 40) == 0
+            # 140: ((140 - 20) % 40) == (120 % 40) == 0
+            # 180: ((180 - 20) % 40) == (160 % 40) == 0
+            # 220: ((220 - 20) % 40) == (200 % 40) == 0
+            if ((cycle_count - 20) % 40 == 0):
+                signal_strength += (cycle_count * registers['X'])
+
+    return signal_strength
+
+
+if __name__ == '__main__':
+    signal_strength = solve('input')
+    print(f'Signal strength = {signal_strength}')
@@ -19,6 +19,9 @@
 # instructions from a file as we go, only as needed. No buffering of
 # instructions.
 
+from aoc.inputs import accepts_streams, open_text_input
+
+
 def _op_noop():
     """Perform a no-op.
 
@@ -94,58 +97,72 @@ registers = {
 }
 
 
-# Number of cycles we've executed.
-cycle_count = 0
+@accepts_streams
+def solve(source):
+    # Reset the registers, in case we're solving more than once.
+    registers['X'] = 1
+
+    # Number of cycles we've executed.
+    cycle_count = 0
+
+    # The current screen drawing position.
+    screen_x = 0
+    screen_y = 0
 
+    # The lines drawn to the screen, and the line currently being drawn.
+    screen_lines = []
+    cur_line = []
 
-# The current screen drawing position.
-screen_x = 0
-screen_y = 0
+    # State on the current instruction we're handling.
+    opcode_handler = None
+    opcode_cycles_remaining = 0
+    opcode_values = ()
 
+    with open_text_input(source) as fp:
+        while screen_y != SCREEN_HEIGHT:
+            if opcode_cycles_remaining == 0:
+                # Our countdown concluded (or we're on the final instruction).
+                # Execute whatever instruction we had read, if any.
+                if opcode_handler is not None:
+                    opcode_handler(*opcode_values)
+                    opcode_handler = None
 
-# State on the current instruction we're handling.
-opcode_handler = None
-opcode_cycles_remaining = 0
-opcode_values = ()
+                # And now get a new instruction.
+                opcode, opcode_values = read_instruction(fp)
 
+                if opcode:
+                    # We found one, so queue that up for execution and reset
+                    # the cycle remaining counter.
+                    opcode_cycles_remaining, opcode_handler = OPCODES[opcode]
 
-with open('input', 'r') as fp:
-    while screen_y != SCREEN_HEIGHT:
-        if opcode_cycles_remaining == 0:
-            # Our countdown concluded (or we're on the final instruction).
-            # Execute whatever instruction we had read, if any.
-            if opcode_handler is not None:
-                opcode_handler(*opcode_values)
-                opcode_handler = None
+            # Draw the current pixel position on the screen. If the X
+            # coordinate overlaps the sprite (X represents the middle of the
+            # 3-pixel sprite), then we'll draw a "#". Otherwise, we'll draw a
+            # ".".
+            x = registers['X']
 
-            # And now get a new instruction.
-            opcode, opcode_values = read_instruction(fp)
+            if x - 1 <= screen_x <= x + 1:
+                pixel = '#'
+            else:
+                pixel = '.'
 
-            if opcode:
-                # We found one, so queue that up for execution and reset the
-                # cycle remaining counter.
-                opcode_cycles_remaining, opcode_handler = OPCODES[opcode]
+            cur_line.append(pixel)
 
-        # Draw the current pixel position on the screen. If the X coordinate
-        # overlaps the sprite (X represents the middle of the 3-pixel sprite),
-        # then we'll draw a "#". Otherwise, we'll draw a ".".
-        x = registers['X']
+            # Update the next drawing position. If we're at the end of the
+            # line, finish it off and move to the next line.
+            screen_x += 1
 
-        if x - 1 <= screen_x <= x + 1:
-            pixel = '#'
-        else:
-            pixel = '.'
+            if screen_x == SCREEN_WIDTH:
+                screen_lines.append(''.join(cur_line))
+                cur_line = []
+                screen_x = 0
+                screen_y += 1
 
-        print(pixel, end='')
+            opcode_cycles_remaining -= 1
+            cycle_count += 1
 
-        # Update the next drawing position. If we're at the end of the line,
-        # draw a newline and move to the next line.
-        screen_x += 1
+    return '\n'.join(screen_lines)
 
-        if screen_x == SCREEN_WIDTH:
-            print()
-            screen_x = 0
-            screen_y += 1
 
-        opcode_cycles_remaining -= 1
-        cycle_count += 1
+if __name__ == '__main__':
+    print(solve('input'))
@@ -0,0 +1,99 @@
+# Generates inputs for Day 11: https://adventofcode.com/2022/day/11
+#
+# Each monkey has a list of starting items, an operation, a divisibility test,
+# and the monkeys to throw to depending on the test. The real input has 8
+# monkeys, so we'll generate 8 monkeys per step of scale.
+#
+# Task 2 keeps worry levels in check by working modulo the product of all the
+# divisors, so every monkey gets a different prime divisor. With many monkeys,
+# that product gets very large, which is part of what we want to stress.
+#
+# Only a couple of monkeys square their worry levels, as in the real input.
+# Squaring over and over would make worry levels grow without bound, so no
+# monkey throws to a squaring monkey. They only square their starting items.
+
+
+MAX_SQUARING_MONKEYS = 2
+
+
+def iter_primes():
+    """Iterate through prime numbers.
+
+    Yields:
+        int:
+        Each prime number, in order.
+    """
+    primes = []
+    candidate = 2
+
+    while True:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+
+            yield candidate
+
+        candidate += 1
+
+
+def generate(scale, rng):
+    """Generate a list of monkeys.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    num_monkeys = 8 * scale
+    primes = iter_primes()
+    divisors = [
+        next(primes)
+        for i in range(num_monkeys)
+    ]
+    rng.shuffle(divisors)
+
+    squaring_monkeys = set(rng.sample(range(num_monkeys),
+                                      min(MAX_SQUARING_MONKEYS,
+                                          1 + scale // 8)))
+    throw_targets = [
+        monkey_id
+        for monkey_id in range(num_monkeys)
+        if monkey_id not in squaring_monkeys
+    ]
+
+    for monkey_id, divisor in enumerate(divisors):
+        if monkey_id > 0:
+            yield ''
+
+        items = [
+            str(rng.randint(50, 99))
+            for i in range(rng.randint(1, 8))
+        ]
+
+        if monkey_id in squaring_monkeys:
+            operation = 'old * old'
+        elif rng.random() < 0.3:
+            operation = 'old * %s' % rng.randint(2, 19)
+        else:
+            operation = 'old + %s' % rng.randint(1, 8)
+
+        # Throw to two other monkeys that don't square their worry levels.
+        if_true, if_false = rng.sample(
+            [
+                target_id
+                for target_id in throw_targets
+                if target_id != monkey_id
+            ],
+            2)
+
+        yield 'Monkey %s:' % monkey_id
+        yield '  Starting items: %s' % ', '.join(items)
+        yield '  Operation: new = %s' % operation
+        yield '  Test: divisible by %s' % divisor
+        yield '    If true: throw to monkey %s' % if_true
+        yield '    If false: throw to monkey %s' % if_false
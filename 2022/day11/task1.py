@@ -41,7 +41,7 @@
 # Once all that is done, we get the monkeys with the two highest item processed
 # counters, multiply those, and that is the answer.
 
-import re
+from aoc.patterns import lazy_compile
 
 
 class Item:
@@ -68,7 +68,7 @@ class Operation:
     a "+" or a "*" to two values, both of which may be variables or integers.
     """
 
-    OPERATION_RE = re.compile(
+    OPERATION_RE = lazy_compile(
         r'new = (?P<value1>old|\d+) (?P<op>[\+\*]) (?P<value2>old|\d+)')
 
     @classmethod
@@ -154,7 +154,7 @@ class TestExpression:
     This will only test if a value is divisible by another value.
     """
 
-    EXPRESSION_RE = re.compile(r'divisible by (?P<value>\d+)')
+    EXPRESSION_RE = lazy_compile(r'divisible by (?P<value>\d+)')
 
     @classmethod
     def from_string(cls, expression_str):
@@ -207,7 +207,7 @@ class ThrowCommand:
     When run, this will place an item at the end of a recipient monkey's list.
     """
 
-    THROW_RE = re.compile(r'throw to monkey (?P<monkey>\d+)')
+    THROW_RE = lazy_compile(r'throw to monkey (?P<monkey>\d+)')
 
     @classmethod
     def from_string(cls, command_str):
@@ -257,7 +257,7 @@ class Monkey:
     a monkey's phase each turn.
     """
 
-    MONKEY_ID_RE = re.compile(r'^Monkey (?P<monkey_id>\d+):')
+    MONKEY_ID_RE = lazy_compile(r'^Monkey (?P<monkey_id>\d+):')
 
     @classmethod
     def read(cls, fp):
@@ -369,7 +369,7 @@ class Monkey:
         # For each item, figure out new worry levels and what needs to be
         # done based on the worry level of the item.
         for item in self.items:
-            worry_level = int(operation.apply(item.worry_level) / 3)
+            worry_level = operation.apply(item.worry_level) // 3
             item.worry_level = worry_level
 
             if test_expression.test(worry_level):
@@ -393,30 +393,40 @@ ROUNDS = 20
 monkeys = []
 
 
-with open('input', 'r') as fp:
-    while True:
-        monkey = Monkey.read(fp)
-        assert monkey.id == len(monkeys)
+def solve(filename):
+    global monkeys
 
-        monkeys.append(monkey)
+    # Reset the monkeys, in case we're solving more than once.
+    monkeys = []
 
-        if fp.readline() == '':
-            # We've parsed the end of the file.
-            break
+    with open(filename, 'r') as fp:
+        while True:
+            monkey = Monkey.read(fp)
+            assert monkey.id == len(monkeys)
 
-    # As per the instructions, we'll be performing 20 rounds. We want to know
-    # the two most active monkeys (defined as how many items they inspect).
-    for i in range(ROUNDS):
-        for monkey in monkeys:
-            monkey.run()
+            monkeys.append(monkey)
 
-    # We can now find the top two monkeys.
-    max_inspection_counts = sorted(
-        [
-            monkey.inspect_count
-            for monkey in monkeys
-        ],
-        reverse=True)[:2]
+            if fp.readline() == '':
+                # We've parsed the end of the file.
+                break
 
-    print('Level of monkey business = %s'
-          % (max_inspection_counts[0] * max_inspection_counts[1]))
+        # As per the instructions, we'll be performing 20 rounds. We want to
+        # know the two most active monkeys (defined as how many items they
+        # inspect).
+        for i in range(ROUNDS):
+            for monkey in monkeys:
+                monkey.run()
+
+        # We can now find the top two monkeys.
+        max_inspection_counts = sorted(
+            [
+                monkey.inspect_count
+                for monkey in monkeys
+            ],
+            reverse=True)[:2]
+
+    return max_inspection_counts[0] * max_inspection_counts[1]
+
+
+if __name__ == '__main__':
+    print('Level of monkey business = %s' % solve('input'))
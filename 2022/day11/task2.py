@@ -78,7 +78,8 @@
 #       Any non-integer results, and it all breaks down. But this works for
 #       the tasks.
 
-import re
+from aoc import tracing
+from aoc.patterns import lazy_compile
 
 
 class Item:
@@ -105,7 +106,7 @@ class Operation:
     a "+" or a "*" to two values, both of which may be variables or integers.
     """
 
-    OPERATION_RE = re.compile(
+    OPERATION_RE = lazy_compile(
         r'new = (?P<value1>old|\d+) (?P<op>[\+\*]) (?P<value2>old|\d+)')
 
     @classmethod
@@ -198,7 +199,7 @@ class TestExpression:
     This will only test if a value is divisible by another value.
     """
 
-    EXPRESSION_RE = re.compile(r'divisible by (?P<value>\d+)')
+    EXPRESSION_RE = lazy_compile(r'divisible by (?P<value>\d+)')
 
     @classmethod
     def from_string(cls, expression_str):
@@ -251,7 +252,7 @@ class ThrowCommand:
     When run, this will place an item at the end of a recipient monkey's list.
     """
 
-    THROW_RE = re.compile(r'throw to monkey (?P<monkey>\d+)')
+    THROW_RE = lazy_compile(r'throw to monkey (?P<monkey>\d+)')
 
     @classmethod
     def from_string(cls, command_str):
@@ -301,7 +302,7 @@ class Monkey:
     a monkey's phase each turn.
     """
 
-    MONKEY_ID_RE = re.compile(r'^Monkey (?P<monkey_id>\d+):')
+    MONKEY_ID_RE = lazy_compile(r'^Monkey (?P<monkey_id>\d+):')
 
     @classmethod
     def read(cls, fp):
@@ -416,7 +417,10 @@ class Monkey:
         # done based on the worry level of the item.
         for item in items:
             worry_level = operation.apply(item.worry_level) % worry_level_mod
-            print(f'{item.worry_level} => {worry_level}')
+
+            if trace_worry_levels:
+                trace_worry_levels('%s => %s', item.worry_level, worry_level)
+
             item.worry_level = worry_level
 
             if test_expression.test(worry_level):
@@ -444,45 +448,67 @@ monkeys = []
 worry_level_mod = 1
 
 
-with open('input', 'r') as fp:
-    while True:
-        monkey = Monkey.read(fp)
-        assert monkey.id == len(monkeys)
-
-        # During loading, update worry_level_mod. This will be the product
-        # of all test expression divisors. We'll apply a
-        # `worry_level % worry_level_mod` each time we process an item,
-        # capping the value of worry_level to a value that can't grow out
-        # of control, while also allowing the divisors to work.
-        worry_level_mod *= monkey.test_expression.divisor
-
-        monkeys.append(monkey)
-
-        if fp.readline() == '':
-            # We've parsed the end of the file.
-            break
-
-    # As per the instructions, we'll be performing 20 rounds. We want to know
-    # the two most active monkeys (defined as how many items they inspect).
-    #for i in range(ROUNDS):
-    for i in range(ROUNDS):
-        if i % 100 == 0:
-            print('Round %s' % i)
-
-        for monkey in monkeys:
-            monkey.run()
-
-    for monkey in monkeys:
-        print('Monkey %s inspected items %s times.'
-              % (monkey.id, monkey.inspect_count))
-
-    # We can now find the top two monkeys.
-    max_inspection_counts = sorted(
-        [
-            monkey.inspect_count
-            for monkey in monkeys
-        ],
-        reverse=True)[:2]
-
-    print('Level of monkey business = %s'
-          % (max_inspection_counts[0] * max_inspection_counts[1]))
+# A tracer for every item's change in worry level, if enabled.
+#
+# This is fetched once per solve, since checking it happens in the hottest
+# loop.
+trace_worry_levels = None
+
+
+def solve(filename):
+    global monkeys, worry_level_mod, trace_worry_levels
+
+    # Reset the state, in case we're solving more than once.
+    monkeys = []
+    worry_level_mod = 1
+    trace_worry_levels = tracing.get_tracer(tracing.TRACE)
+    trace_rounds = tracing.get_tracer(tracing.DEBUG)
+    trace_summary = tracing.get_tracer(tracing.INFO)
+
+    with open(filename, 'r') as fp:
+        while True:
+            monkey = Monkey.read(fp)
+            assert monkey.id == len(monkeys)
+
+            # During loading, update worry_level_mod. This will be the product
+            # of all test expression divisors. We'll apply a
+            # `worry_level % worry_level_mod` each time we process an item,
+            # capping the value of worry_level to a value that can't grow out
+            # of control, while also allowing the divisors to work.
+            worry_level_mod *= monkey.test_expression.divisor
+
+            monkeys.append(monkey)
+
+            if fp.readline() == '':
+                # We've parsed the end of the file.
+                break
+
+        # As per the instructions, we'll be performing 20 rounds. We want to
+        # know the two most active monkeys (defined as how many items they
+        # inspect).
+        #for i in range(ROUNDS):
+        for i in range(ROUNDS):
+            if trace_rounds and i % 100 == 0:
+                trace_rounds('Round %s', i)
+
+            for monkey in monkeys:
+                monkey.run()
+
+        if trace_summary:
+            for monkey in monkeys:
+                trace_summary('Monkey %s inspected items %s times.',
+                              monkey.id, monkey.inspect_count)
+
+        # We can now find the top two monkeys.
+        max_inspection_counts = sorted(
+            [
+                monkey.inspect_count
+                for monkey in monkeys
+            ],
+            reverse=True)[:2]
+
+    return max_inspection_counts[0] * max_inspection_counts[1]
+
+
+if __name__ == '__main__':
+    print('Level of monkey business = %s' % solve('input'))
@@ -0,0 +1,76 @@
+# Generates inputs for Day 12: https://adventofcode.com/2022/day/12
+#
+# The input is a heightmap of letters (a-z), with a start (S) on the left edge
+# and a destination (E) on the right edge. The real input is 41x101, and each
+# side grows by the square root of the scale.
+#
+# Heights ramp up from "a" on the left to "z" on the right, never going up by
+# more than one per column. Cells are then randomly raised or lowered to make
+# walls and valleys. To guarantee the destination can be reached, a corridor
+# wanders from the start to the destination, and its cells are left on the
+# ramp.
+
+import math
+
+
+def generate(scale, rng):
+    """Generate a heightmap.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    height = round(41 * math.sqrt(scale))
+    width = max(round(101 * math.sqrt(scale)), 27)
+
+    # The base height of each column.
+    ramp = [
+        min(x * 26 // (width - 1), 25)
+        for x in range(width)
+    ]
+
+    rows = []
+
+    for y in range(height):
+        row = []
+
+        for base in ramp:
+            n = rng.random()
+
+            if n < 0.15:
+                base = min(base + 2, 25)
+            elif n < 0.45:
+                base = max(base - rng.randint(1, 3), 0)
+
+            row.append(base)
+
+        rows.append(row)
+
+    # Carve the corridor, moving up or down at random within each column.
+    start_y = rng.randrange(height)
+    y = start_y
+
+    for x, base in enumerate(ramp):
+        new_y = min(max(y + rng.randint(-3, 3), 0), height - 1)
+
+        for corridor_y in range(min(y, new_y), max(y, new_y) + 1):
+            rows[corridor_y][x] = base
+
+        y = new_y
+
+    lines = [
+        [chr(ord('a') + cell) for cell in row]
+        for row in rows
+    ]
+    lines[start_y][0] = 'S'
+    lines[y][-1] = 'E'
+
+    for line in lines:
+        yield ''.join(line)
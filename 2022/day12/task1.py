@@ -4,172 +4,162 @@
 # location to a destination location, using a heightmap of characters a..z that
 # depict elevation.
 #
-# For shortest path, I go with Djikstra's algorithm, which is fast. There's a
+# For shortest path, I originally went with Djikstra's algorithm. There's a
 # good overview of it here: https://www.programiz.com/dsa/dijkstra-algorithm
 #
+# But every step here costs the same, and in that case Djikstra's algorithm
+# boils down to a breadth-first search: visit everything 1 step away, then
+# everything 2 steps away, and so on. The first time we reach the end, we're
+# done. That's what the shared aoc.graph.bfs() does, without needing to find
+# the nearest position to visit on every step.
+#
 # As usual for my solutions on these tasks, I'm trying to avoid long processing
-# times or memory usage. Djikstra's algorithm helps with the processing time.
+# times or memory usage. The breadth-first search helps with the processing
+# time.
 #
 # For memory, I'm choosing to keep my representation of the height map (input
 # file) as simple as possible. Instead of some fancy data structure or even
-# nested arrays pointing to integers, I'm reading in as lists of byte strings.
-# Each row is a byte string in an array. These are fast to scan, cheap to
-# store, and still give me integers (representing character codes) when
-# indexing into the string.
+# nested arrays pointing to integers, I'm reading it into a flat Grid of
+# bytes, with a border around it. This is fast to scan, cheap to store, and
+# still gives me integers (representing character codes) when indexing into
+# it. Positions are just offsets into the grid, and neighbors are a fixed
+# offset away.
 #
 # We don't actually care what the values are for each position in the map, just
 # that they're consistently relative to each other, so that means there's no
 # reason to normalize any of the values. The character code for 'a' is one
 # lower than for 'b', but it doesn't matter what those character codes are.
 
-from heapq import heappush, heappop
+from aoc.graph import bfs
+from aoc.grid import Grid
+
 
+# A height above anything on the map, used for the border.
+BORDER_HEIGHT = 0xFF
 
-def iter_neighbors(*, x, y, max_height):
+
+def iter_neighbors(offset, *, max_height):
     """Iterate through all reachable neighbors.
 
-    This takes a starting position, and a maximum allowable height.
+    This takes a starting position and a maximum allowable height.
 
     Args:
-        x (int):
-            The X position all neighbors are relative to.
-
-        y (int):
-            The Y position all neighbors are relative to.
+        offset (int):
+            The offset of the position all neighbors are relative to.
 
         max_height (int):
             The maximum height allowed for a neighbor.
 
     Yields:
-        tuple:
-        Each neighbor position in (x, y) form.
+        int:
+        Each neighbor's offset.
     """
-    candidates = [
-        (x - 1, y),
-        (x + 1, y),
-        (x, y - 1),
-        (x, y + 1),
-    ]
-
-    # Go through those. If they're within bounds, and either one level
-    # higher or any level lower, we can process it.
-    for candidate_x, candidate_y in candidates:
-        if (0 <= candidate_x < heightmap_width and
-            0 <= candidate_y < heightmap_height and
-            heightmap[candidate_y][candidate_x] <= max_height):
-            yield candidate_x, candidate_y
+    # Go through the neighbors. If they're either one level higher or any
+    # level lower, we can process it. There's no need for bounds checks,
+    # since the border is too high to ever be reachable.
+    data = heightmap.data
 
+    for delta in heightmap.offsets4:
+        candidate = offset + delta
 
-def get_shortest_path_steps(start_pos, end_pos):
-    """Find the number of steps for the shortest path between two positions.
+        if data[candidate] <= max_height:
+            yield candidate
 
-    This uses Djikstra's algorithm to quickly find the shortest path.
 
-    Args:
-        start_pos (tuple):
-            A starting position of (x, y).
+def get_neighbors(offset):
+    """Return all reachable neighbors of a position.
 
-        end_pos (tuple):
-            An ending position of (x, y).
+    A neighbor is reachable if it's at most one level higher than the
+    position.
+
+    Args:
+        offset (int):
+            The offset of the position.
 
     Returns:
-        int:
-        The number of steps in the shortest path.
+        iterator of int:
+        Each reachable neighbor's offset.
     """
-    to_visit = {start_pos}
-    distances = {start_pos: 0}
-    parents = {}
-
-    while to_visit:
-        # Find the nearest position to start with.
-        current_pos = min(to_visit, key=lambda node: distances[node])
+    return iter_neighbors(offset,
+                          max_height=heightmap.data[offset] + 1)
 
-        # Remove that from the visit list, so we don't try it again.
-        to_visit.remove(current_pos)
 
-        if current_pos == end_pos:
-            # We're done!
-            break
-
-        # Start figuring out which adjacent spaces we should check next.
-        current_x, current_y = current_pos
-        max_candidate_height = heightmap[current_y][current_x] + 1
-
-        for neighbor_pos in iter_neighbors(x=current_x,
-                                           y=current_y,
-                                           max_height=max_candidate_height):
-            # It matches the criteria. This is a traversable candidate
-            # neighbor of sufficient height.
-            distance = distances[current_pos] + 1
+def get_shortest_path_steps(start_pos, end_pos):
+    """Find the number of steps for the shortest path between two positions.
 
-            if (neighbor_pos not in distances or
-                distance < distances[neighbor_pos]):
-                # We haven't processed this position yet, or it's closer
-                # than it was from another path, so begin tracking it
-                # and queue it up for possible visits.
-                distances[neighbor_pos] = distance
-                parents[neighbor_pos] = current_pos
-                to_visit.add(neighbor_pos)
+    Every step costs the same, so this uses a breadth-first search to find
+    the shortest path. Positions are visited in order of distance, so the
+    first time we reach the end position, we've found the shortest path.
 
-    # We found a path. We're now going to walk the paths to get the step count.
-    last_pos = end_pos
-    i = 0
+    Args:
+        start_pos (int):
+            The offset of the starting position.
 
-    while last_pos != start_pos:
-        i += 1
-        last_pos = parents[last_pos]
+        end_pos (int):
+            The offset of the ending position.
 
-    return i
+    Returns:
+        int:
+        The number of steps in the shortest path.
+    """
+    paths = bfs(get_neighbors, start_pos,
+                num_nodes=len(heightmap.data),
+                end=end_pos)
 
+    return paths.distances[end_pos]
 
-heightmap = []
-heightmap_width = None
-heightmap_height = None
-heightmap_start_pos = None
-heightmap_end_pos = None
 
+# The height map, as a Grid of character codes.
+heightmap = None
 
-with open('input', 'rb') as fp:
-    # We could use any representation for the map, but we'll go with lists
-    # of byte strings. This is just to save on memory. When accessing by
-    # index, we'll get an integer of the character code, which can be used for
-    # height comparison.
-    heightmap = []
 
-    for y, line in enumerate(fp.readlines()):
-        line = line.rstrip()
+def load_heightmap(filename):
+    """Load the height map, returning the start and end positions.
 
-        # Look for the start position.
-        if heightmap_start_pos is None:
-            x = line.find(b'S')
+    The 'S' and 'E' markers are replaced by their heights ('a' and 'z').
 
-            if x != -1:
-                heightmap_start_pos = (x, y)
+    Args:
+        filename (str):
+            The name of the file to load.
 
-                # Swap out the 'S' for an 'a', to keep height maps consistent.
-                line = b'%sa%s' % (line[:x], line[x + 1:])
+    Returns:
+        tuple:
+        A 2-tuple of the start and end offsets.
+    """
+    global heightmap
 
-        # Look for the end position.
-        if heightmap_end_pos is None:
-            x = line.find(b'E')
+    # We could use any representation for the map, but we'll go with a flat
+    # Grid of bytes. This is just to save on memory. When accessing by
+    # offset, we'll get an integer of the character code, which can be used
+    # for height comparison.
+    #
+    # The border is set higher than any height, so we never walk off the
+    # map.
+    heightmap = Grid.from_file(filename, border=BORDER_HEIGHT)
+    data = heightmap.data
 
-            if x != -1:
-                heightmap_end_pos = (x, y)
+    # Look for the start position, and swap out the 'S' for an 'a', to keep
+    # height maps consistent.
+    start_pos = heightmap.find(b'S')
+    assert start_pos is not None
+    data[start_pos] = ord(b'a')
 
-                # Swap out the 'E' for a 'z', to keep height maps consistent.
-                line = b'%sz%s' % (line[:x], line[x + 1:])
+    # Look for the end position, and swap out the 'E' for a 'z', to keep
+    # height maps consistent.
+    end_pos = heightmap.find(b'E')
+    assert end_pos is not None
+    data[end_pos] = ord(b'z')
 
-        heightmap.append(line)
+    return start_pos, end_pos
 
-    # We've built our height map. Store the width and heights of the map,
-    # assert we found our starting values, and then move on.
-    heightmap_width = len(heightmap[0])
-    heightmap_height = len(heightmap)
 
-    assert heightmap_start_pos
-    assert heightmap_end_pos
+def solve(filename):
+    start_pos, end_pos = load_heightmap(filename)
 
     # Find the shortest path to the target.
-    steps = get_shortest_path_steps(heightmap_start_pos, heightmap_end_pos)
+    return get_shortest_path_steps(start_pos, end_pos)
+
 
+if __name__ == '__main__':
+    steps = solve('input')
     print(f'Minimum steps to target = {steps}')
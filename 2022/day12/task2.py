@@ -6,62 +6,54 @@
 # reachable without having to climb up).
 #
 # Much of the approach is the same, except that now we're using
-# walk_reachable_positions() to find all positions that we can reach from the
-# starting position, and we're calculating the number of steps from each. The
-# smallest of those results is the winner.
+# walk_neighbors() to find all positions that we can reach from the starting
+# position, and we're calculating the number of steps from the nearest one.
 #
-# This adds to the processing time in that we need to run through many
-# path-finding steps, and adds to the memory usage during reachable position
-# calculation.
-#
-# This could likely be improved by modifying our implementation of Djikstra's
-# algorithm in some way to try to leverage some of the state it's already found
-# (or influence it), but that's not worth doing here. This is fast and cheap
-# enough.
+# Rather than running a path-finding search from each of those, we run a single
+# multi-source breadth-first search, starting from all of them at once. The
+# distance it finds to the end position is the distance from the nearest
+# starting position, which is exactly the answer we want.
 
-from heapq import heappush, heappop
+from aoc.graph import multi_source_bfs
+from aoc.grid import Grid
 
 
 MIN_HEIGHT = ord('a')
 
 
-def iter_neighbors(*, x, y, max_height):
+# A height above anything on the map, used for the border.
+BORDER_HEIGHT = 0xFF
+
+
+def iter_neighbors(offset, *, max_height):
     """Iterate through all reachable neighbors.
 
-    This takes a starting position, a minimum allowable height, and a
-    maximum allowable height.
+    This takes a starting position and a maximum allowable height.
 
     Args:
-        x (int):
-            The X position all neighbors are relative to.
-
-        y (int):
-            The Y position all neighbors are relative to.
+        offset (int):
+            The offset of the position all neighbors are relative to.
 
         max_height (int):
             The maximum height allowed for a neighbor.
 
     Yields:
-        tuple:
-        Each neighbor position in (x, y) form.
+        int:
+        Each neighbor's offset.
     """
-    candidates = [
-        (x - 1, y),
-        (x + 1, y),
-        (x, y - 1),
-        (x, y + 1),
-    ]
-
-    # Go through those. If they're within bounds, and either one level
-    # higher or any level lower, we can process it.
-    for candidate_x, candidate_y in candidates:
-        if (0 <= candidate_x < heightmap_width and
-            0 <= candidate_y < heightmap_height and
-            heightmap[candidate_y][candidate_x] <= max_height):
-            yield candidate_x, candidate_y
-
-
-def walk_neighbors(*, start_x, start_y, max_height):
+    # Go through the neighbors. If they're either one level higher or any
+    # level lower, we can process it. There's no need for bounds checks,
+    # since the border is too high to ever be reachable.
+    data = heightmap.data
+
+    for delta in heightmap.offsets4:
+        candidate = offset + delta
+
+        if data[candidate] <= max_height:
+            yield candidate
+
+
+def walk_neighbors(start_pos, *, max_height):
     """Walk through all reachable neighbors.
 
     This will iterate through reachable positions, not worrying about path
@@ -70,157 +62,131 @@ def walk_neighbors(*, start_x, start_y, max_height):
     This keeps state on visited positions during execution.
 
     Args:
-        start_x (int):
-            The starting X coordinate to check.
-
-        start_y (int):
-            The starting Y coordinate to check.
+        start_pos (int):
+            The offset of the starting position to check.
 
         max_height (int):
             The maximum height allowed for candidate neighbors.
 
     Yields:
-        tuple:
-        Each reachable position in (x, y) form.
+        int:
+        Each reachable position's offset.
     """
     visited = set()
+    to_walk = [start_pos]
 
-    def _walk(x, y):
-        for neighbor in iter_neighbors(x=x,
-                                       y=y,
-                                       max_height=max_height):
+    while to_walk:
+        pos = to_walk.pop()
+
+        for neighbor in iter_neighbors(pos, max_height=max_height):
             if neighbor not in visited:
                 visited.add(neighbor)
-                yield neighbor
+                to_walk.append(neighbor)
 
-                yield from _walk(x=neighbor[0],
-                                 y=neighbor[1])
-
-    yield from _walk(start_x, start_y)
+                yield neighbor
 
 
-def get_shortest_path_steps(start_pos, end_pos):
-    """Find the number of steps for the shortest path between two positions.
+def get_neighbors(offset):
+    """Return all reachable neighbors of a position.
 
-    This uses Djikstra's algorithm to quickly find the shortest path.
+    A neighbor is reachable if it's at most one level higher than the
+    position.
 
     Args:
-        start_pos (tuple):
-            A starting position of (x, y).
-
-        end_pos (tuple):
-            An ending position of (x, y).
+        offset (int):
+            The offset of the position.
 
     Returns:
-        int:
-        The number of steps in the shortest path.
+        iterator of int:
+        Each reachable neighbor's offset.
     """
-    to_visit = {start_pos}
-    distances = {start_pos: 0}
-    parents = {}
-
-    while to_visit:
-        # Find the nearest position to start with.
-        current_pos = min(to_visit, key=lambda node: distances[node])
-
-        # Remove that from the visit list, so we don't try it again.
-        to_visit.remove(current_pos)
+    return iter_neighbors(offset,
+                          max_height=heightmap.data[offset] + 1)
 
-        if current_pos == end_pos:
-            # We're done!
-            break
 
-        # Start figuring out which adjacent spaces we should check next.
-        current_x, current_y = current_pos
-        max_candidate_height = heightmap[current_y][current_x] + 1
+def get_shortest_path_steps(start_positions, end_pos):
+    """Find the number of steps for the shortest path to a position.
 
-        for neighbor_pos in iter_neighbors(x=current_x,
-                                           y=current_y,
-                                           max_height=max_candidate_height):
-            # It matches the criteria. This is a traversable candidate
-            # neighbor of sufficient height.
-            distance = distances[current_pos] + 1
+    Every step costs the same, so this uses a breadth-first search to find
+    the shortest path. Positions are visited in order of distance from the
+    nearest starting position, so the first time we reach the end position,
+    we've found the shortest path.
 
-            if (neighbor_pos not in distances or
-                distance < distances[neighbor_pos]):
-                # We haven't processed this position yet, or it's closer
-                # than it was from another path, so begin tracking it
-                # and queue it up for possible visits.
-                distances[neighbor_pos] = distance
-                parents[neighbor_pos] = current_pos
-                to_visit.add(neighbor_pos)
-
-    # We found a path. We're now going to walk the paths to get the step count.
-    last_pos = end_pos
-    i = 0
+    Args:
+        start_positions (list of int):
+            The offsets of the possible starting positions.
 
-    while last_pos != start_pos:
-        i += 1
-        last_pos = parents[last_pos]
+        end_pos (int):
+            The offset of the ending position.
 
-    return i
+    Returns:
+        int:
+        The number of steps in the shortest path.
+    """
+    paths = multi_source_bfs(get_neighbors, start_positions,
+                             num_nodes=len(heightmap.data),
+                             end=end_pos)
 
+    return paths.distances[end_pos]
 
-heightmap = []
-heightmap_width = None
-heightmap_height = None
-heightmap_start_pos = None
-heightmap_end_pos = None
 
+# The height map, as a Grid of character codes.
+heightmap = None
 
-with open('input', 'rb') as fp:
-    # We could use any represetnation for the map, but we'll go with lists
-    # of byte strings. This is just to save on memory. When accessing by
-    # index, we'll get an integer of the character code, which can be used for
-    # height comparison.
-    heightmap = []
 
-    for y, line in enumerate(fp.readlines()):
-        line = line.rstrip()
+def load_heightmap(filename):
+    """Load the height map, returning the start and end positions.
 
-        # Look for the start position.
-        if heightmap_start_pos is None:
-            x = line.find(b'S')
+    The 'S' and 'E' markers are replaced by their heights ('a' and 'z').
 
-            if x != -1:
-                heightmap_start_pos = (x, y)
+    Args:
+        filename (str):
+            The name of the file to load.
 
-                # Swap out the 'S' for an 'a', to keep height maps consistent.
-                line = b'%sa%s' % (line[:x], line[x + 1:])
+    Returns:
+        tuple:
+        A 2-tuple of the start and end offsets.
+    """
+    global heightmap
 
-        # Look for the end position.
-        if heightmap_end_pos is None:
-            x = line.find(b'E')
+    # We could use any representation for the map, but we'll go with a flat
+    # Grid of bytes. This is just to save on memory. When accessing by
+    # offset, we'll get an integer of the character code, which can be used
+    # for height comparison.
+    #
+    # The border is set higher than any height, so we never walk off the
+    # map.
+    heightmap = Grid.from_file(filename, border=BORDER_HEIGHT)
+    data = heightmap.data
 
-            if x != -1:
-                heightmap_end_pos = (x, y)
+    # Look for the start position, and swap out the 'S' for an 'a', to keep
+    # height maps consistent.
+    start_pos = heightmap.find(b'S')
+    assert start_pos is not None
+    data[start_pos] = ord(b'a')
 
-                # Swap out the 'E' for a 'z', to keep height maps consistent.
-                line = b'%sz%s' % (line[:x], line[x + 1:])
+    # Look for the end position, and swap out the 'E' for a 'z', to keep
+    # height maps consistent.
+    end_pos = heightmap.find(b'E')
+    assert end_pos is not None
+    data[end_pos] = ord(b'z')
 
-        heightmap.append(line)
+    return start_pos, end_pos
 
-    # We've built our height map. Store the width and heights of the map,
-    # assert we found our starting values, and then move on.
-    heightmap_width = len(heightmap[0])
-    heightmap_height = len(heightmap)
 
-    assert heightmap_start_pos
-    assert heightmap_end_pos
+def solve(filename):
+    start_pos, end_pos = load_heightmap(filename)
 
     # Find the shortest path to the target.
     #
     # We'll be going through each possible starting position (any positions
-    # reachable by the starting position that has the same height), and try
-    # out each of those. The smallest number of steps wins.
-    min_steps = None
-
-    for candidate_pos in walk_neighbors(start_x=heightmap_start_pos[0],
-                                        start_y=heightmap_start_pos[1],
-                                        max_height=MIN_HEIGHT):
-        steps = get_shortest_path_steps(candidate_pos, heightmap_end_pos)
+    # reachable by the starting position that has the same height), and
+    # searching from all of them at once. The nearest one wins.
+    return get_shortest_path_steps(
+        list(walk_neighbors(start_pos, max_height=MIN_HEIGHT)),
+        end_pos)
 
-        if min_steps is None or steps < min_steps:
-            min_steps = steps
 
-    print(f'Minimum steps to target = {min_steps}')
+if __name__ == '__main__':
+    steps = solve('input')
+    print(f'Minimum steps to target = {steps}')
@@ -0,0 +1,51 @@
+# Generates inputs for Day 13: https://adventofcode.com/2022/day/13
+#
+# The input is a list of pairs of packets, with a blank line between each
+# pair. A packet is a nested list of integers. The real input has 150 pairs.
+
+
+def generate_packet(rng, *, depth=0):
+    """Generate a packet, or a list nested within one.
+
+    Args:
+        rng (random.Random):
+            The random number generator to use.
+
+        depth (int, optional):
+            How deeply nested this list is.
+
+    Returns:
+        str:
+        The list, in JSON-like form.
+    """
+    items = []
+
+    for i in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(generate_packet(rng, depth=depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+
+    return '[%s]' % ','.join(items)
+
+
+def generate(scale, rng):
+    """Generate a list of packet pairs.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    for i in range(150 * scale):
+        if i > 0:
+            yield ''
+
+        yield generate_packet(rng)
+        yield generate_packet(rng)
@@ -47,6 +47,9 @@
 # Once we're done with all that mess, we just need to get the sum of 1-based
 # pair IDs that were in order and output the result.
 
+from aoc import tracing
+
+
 def parse_list(list_str):
     """Parse a potentially-nested list of integers.
 
@@ -124,7 +127,7 @@ def parse_list(list_str):
     return cur_list[0]
 
 
-def are_lists_in_order(list1, list2, indent=''):
+def are_lists_in_order(list1, list2, indent='', trace_compare=None):
     """Return whether two lists are in order.
 
     This will return True if the two lists are in order, False if they are not,
@@ -132,7 +135,8 @@ def are_lists_in_order(list1, list2, indent=''):
 
     This will be called recursively for sub-lists.
 
-    This will also emit some debug output, so you can all follow along at home.
+    If a tracer is provided, this will also emit some debug output, so you can
+    all follow along at home.
 
     Args:
         list1 (list):
@@ -145,6 +149,9 @@ def are_lists_in_order(list1, list2, indent=''):
             An indentation marker, to help with debugging output for recursive
             calls.
 
+        trace_compare (callable, optional):
+            A tracer from :py:mod:`aoc.tracing` used to show each comparison.
+
     Returns:
         bool:
         ``True`` if the two lists are in order.
@@ -155,7 +162,9 @@ def are_lists_in_order(list1, list2, indent=''):
     """
     # First, make sure the lists have the same number of items. If not, the
     # test failed.
-    print('%s- Compare %r vs %r' % (indent, list1, list2))
+    if trace_compare:
+        trace_compare('%s- Compare %r vs %r', indent, list1, list2)
+
     indent += '  '
 
     for item1, item2 in zip(list1, list2):
@@ -170,20 +179,27 @@ def are_lists_in_order(list1, list2, indent=''):
 
         if item1_is_list != item2_is_list:
             if item1_is_list and not item2_is_list:
-                print('%s- Mixed types; convert right to [%r] and retry'
-                      % (indent, item2))
+                if trace_compare:
+                    trace_compare('%s- Mixed types; convert right to [%r] and '
+                                  'retry',
+                                  indent, item2)
+
                 item2 = [item2]
                 item2_is_list = True
             elif item2_is_list and not item1_is_list:
-                print('%s- Mixed types; convert left to [%r] and retry'
-                      % (indent, item1))
+                if trace_compare:
+                    trace_compare('%s- Mixed types; convert left to [%r] and '
+                                  'retry',
+                                  indent, item1)
+
                 item1 = [item1]
                 item1_is_list = True
 
         if item1_is_list:
             assert item2_is_list
 
-            result = are_lists_in_order(item1, item2, indent + '  ')
+            result = are_lists_in_order(item1, item2, indent + '  ',
+                                        trace_compare=trace_compare)
 
             if result is not None:
                 # We have a definitive result, so return it.
@@ -192,21 +208,26 @@ def are_lists_in_order(list1, list2, indent=''):
             assert isinstance(item1, int)
             assert isinstance(item2, int)
 
-            print('%s- Compare %s vs %s' % (indent, item1, item2))
+            if trace_compare:
+                trace_compare('%s- Compare %s vs %s', indent, item1, item2)
 
             if item1 < item2:
                 # "If the left integer is lower than the right integer, the
                 # inputs are in the right order"
-                print('%s  - Left side is smaller, so inputs ARE in the right '
-                      'order'
-                      % indent)
+                if trace_compare:
+                    trace_compare('%s  - Left side is smaller, so inputs ARE '
+                                  'in the right order',
+                                  indent)
+
                 return True
             elif item1 > item2:
                 # "If the left integer is higher than the right integer, the
                 # inputs are not in the right order"
-                print('%s  - Right side is smaller, so inputs ARE NOT in the '
-                      'right order'
-                      % indent)
+                if trace_compare:
+                    trace_compare('%s  - Right side is smaller, so inputs ARE '
+                                  'NOT in the right order',
+                                  indent)
+
                 return False
             else:
                 # Otherwise, the inputs are the same integer; continue checking
@@ -218,44 +239,57 @@ def are_lists_in_order(list1, list2, indent=''):
     # Or... is it? We need to see if we ran out of items in one list or
     # another before returning a definitive result (or None, to continue on).
     if len(list1) > len(list2):
-        print('%s- Right side ran out of items, so inputs ARE NOT in order (2)'
-              % indent)
+        if trace_compare:
+            trace_compare('%s- Right side ran out of items, so inputs ARE NOT '
+                          'in order (2)',
+                          indent)
+
         return False
     elif len(list1) < len(list2):
-        print('%s- Left side ran out of items, so inputs ARE in order (2)'
-              % indent)
+        if trace_compare:
+            trace_compare('%s- Left side ran out of items, so inputs ARE in '
+                          'order (2)',
+                          indent)
+
         return True
 
     return None
 
 
-pair_num = 1
-pairs_in_order_sum = 0
+def solve(filename):
+    pair_num = 1
+    pairs_in_order_sum = 0
+    trace_compare = tracing.get_tracer(tracing.DEBUG)
 
+    # We can now read through the file input, checking which pairs are in
+    # order, and calculating a sum for the answer.
+    with open(filename, 'r') as fp:
+        while True:
+            pair1 = fp.readline()
+            pair2 = fp.readline()
 
-# We can now read through the file input, checking which pairs are in order,
-# and calculating a sum for the answer.
-with open('input', 'r') as fp:
-    while True:
-        pair1 = fp.readline()
-        pair2 = fp.readline()
+            assert pair1
+            assert pair2
 
-        assert pair1
-        assert pair2
+            items1 = parse_list(pair1.strip())
+            items2 = parse_list(pair2.strip())
 
-        items1 = parse_list(pair1.strip())
-        items2 = parse_list(pair2.strip())
+            if are_lists_in_order(items1, items2,
+                                  trace_compare=trace_compare):
+                pairs_in_order_sum += pair_num
 
-        if are_lists_in_order(items1, items2):
-            pairs_in_order_sum += pair_num
+            if trace_compare:
+                trace_compare('')
 
-        print()
+            # There should be a blank line here. If not, we're done.
+            if fp.readline() == '':
+                break
 
-        # There should be a blank line here. If not, we're done.
-        if fp.readline() == '':
-            break
+            pair_num += 1
 
-        pair_num += 1
+    return pairs_in_order_sum
 
 
-print(f'Sum of indices of pairs in order = {pairs_in_order_sum}')
+if __name__ == '__main__':
+    pairs_in_order_sum = solve('input')
+    print(f'Sum of indices of pairs in order = {pairs_in_order_sum}')
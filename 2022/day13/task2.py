@@ -15,7 +15,9 @@
 # back and use those in task1.py, but I didn't know it'd be used for sorting
 # in this way, so I had no reason to design its interface around that then.
 
-from functools import cmp_to_key
+from functools import cmp_to_key, partial
+
+from aoc import tracing
 
 
 def parse_list(list_str):
@@ -95,10 +97,12 @@ def parse_list(list_str):
     return cur_list[0]
 
 
-def are_lists_in_order(list1, list2, indent=''):
+def are_lists_in_order(list1, list2, indent='', trace_compare=None):
     # First, make sure the lists have the same number of items. If not, the
     # test failed.
-    print('%s- Compare %r vs %r' % (indent, list1, list2))
+    if trace_compare:
+        trace_compare('%s- Compare %r vs %r', indent, list1, list2)
+
     indent += '  '
 
     for item1, item2 in zip(list1, list2):
@@ -113,20 +117,27 @@ def are_lists_in_order(list1, list2, indent=''):
 
         if item1_is_list != item2_is_list:
             if item1_is_list and not item2_is_list:
-                print('%s- Mixed types; convert right to [%r] and retry'
-                      % (indent, item2))
+                if trace_compare:
+                    trace_compare('%s- Mixed types; convert right to [%r] and '
+                                  'retry',
+                                  indent, item2)
+
                 item2 = [item2]
                 item2_is_list = True
             elif item2_is_list and not item1_is_list:
-                print('%s- Mixed types; convert left to [%r] and retry'
-                      % (indent, item1))
+                if trace_compare:
+                    trace_compare('%s- Mixed types; convert left to [%r] and '
+                                  'retry',
+                                  indent, item1)
+
                 item1 = [item1]
                 item1_is_list = True
 
         if item1_is_list:
             assert item2_is_list
 
-            result = are_lists_in_order(item1, item2, indent + '  ')
+            result = are_lists_in_order(item1, item2, indent + '  ',
+                                        trace_compare=trace_compare)
 
             if result != 0:
                 # We have a definitive result, so return it.
@@ -135,21 +146,26 @@ def are_lists_in_order(list1, list2, indent=''):
             assert isinstance(item1, int)
             assert isinstance(item2, int)
 
-            print('%s- Compare %s vs %s' % (indent, item1, item2))
+            if trace_compare:
+                trace_compare('%s- Compare %s vs %s', indent, item1, item2)
 
             if item1 < item2:
                 # "If the left integer is lower than the right integer, the
                 # inputs are in the right order"
-                print('%s  - Left side is smaller, so inputs ARE in the right '
-                      'order'
-                      % indent)
+                if trace_compare:
+                    trace_compare('%s  - Left side is smaller, so inputs ARE '
+                                  'in the right order',
+                                  indent)
+
                 return -1
             elif item1 > item2:
                 # "If the left integer is higher than the right integer, the
                 # inputs are not in the right order"
-                print('%s  - Right side is smaller, so inputs ARE NOT in the '
-                      'right order'
-                      % indent)
+                if trace_compare:
+                    trace_compare('%s  - Right side is smaller, so inputs ARE '
+                                  'NOT in the right order',
+                                  indent)
+
                 return 1
             else:
                 # Otherwise, the inputs are the same integer; continue checking
@@ -161,12 +177,18 @@ def are_lists_in_order(list1, list2, indent=''):
     # Or... is it? We need to see if we ran out of items in one list or
     # another before returning a definitive result (or None, to continue on).
     if len(list1) > len(list2):
-        print('%s- Right side ran out of items, so inputs ARE NOT in order (2)'
-              % indent)
+        if trace_compare:
+            trace_compare('%s- Right side ran out of items, so inputs ARE NOT '
+                          'in order (2)',
+                          indent)
+
         return 1
     elif len(list1) < len(list2):
-        print('%s- Left side ran out of items, so inputs ARE in order (2)'
-              % indent)
+        if trace_compare:
+            trace_compare('%s- Left side ran out of items, so inputs ARE in '
+                          'order (2)',
+                          indent)
+
         return -1
 
     return 0
@@ -199,43 +221,48 @@ def iter_packets(fp):
             yield parse_list(packet)
 
 
-pair_num = 1
-pairs_in_order_sum = 0
-
-
-with open('input', 'r') as fp:
-    # Read in the packets, and mix in our two divider packets. We want to
-    # sort these in order, using are_lists_in_order as a comparator function.
-    packets = sorted(
-        [
-            [[2]],
-            [[6]],
-        ] + list(iter_packets(fp)),
-        key=cmp_to_key(are_lists_in_order))
-
-    # We'll dedicate variables and a counter for these packets.
-    #
-    # I'm going this route because I want to very efficiently be able to tell
-    # when I'm done scanning (using the dividers_found counter) and to have
-    # a dedicated place to store those indexes.
-    divider2_i = None
-    divider6_i = None
-    dividers_found = 0
-
-    # Find the indexes of the divider packets.
-    for i, p in enumerate(packets, start=1):
-        if divider2_i is None and p == [[2]]:
-            divider2_i = i
-            dividers_found += 1
-        elif divider6_i is None and p == [[6]]:
-            divider6_i = i
-            dividers_found += 1
-
-        if dividers_found == 2:
-            # We found all the dividers.
-            break
-
-    # We found them. Now we can multiply to get the decoder key.
-    decoder_key = divider2_i * divider6_i
-
+def solve(filename):
+    with open(filename, 'r') as fp:
+        # Read in the packets, and mix in our two divider packets. We want to
+        # sort these in order, using are_lists_in_order as a comparator
+        # function.
+        packets = sorted(
+            [
+                [[2]],
+                [[6]],
+            ] + list(iter_packets(fp)),
+            key=cmp_to_key(partial(
+                are_lists_in_order,
+                trace_compare=tracing.get_tracer(tracing.DEBUG))))
+
+        # We'll dedicate variables and a counter for these packets.
+        #
+        # I'm going this route because I want to very efficiently be able to
+        # tell when I'm done scanning (using the dividers_found counter) and to
+        # have a dedicated place to store those indexes.
+        divider2_i = None
+        divider6_i = None
+        dividers_found = 0
+
+        # Find the indexes of the divider packets.
+        for i, p in enumerate(packets, start=1):
+            if divider2_i is None and p == [[2]]:
+                divider2_i = i
+                dividers_found += 1
+            elif divider6_i is None and p == [[6]]:
+                divider6_i = i
+                dividers_found += 1
+
+            if dividers_found == 2:
+                # We found all the dividers.
+                break
+
+        # We found them. Now we can multiply to get the decoder key.
+        decoder_key = divider2_i * divider6_i
+
+    return decoder_key
+
+
+if __name__ == '__main__':
+    decoder_key = solve('input')
     print(f'Decoder key = {decoder_key}')
@@ -0,0 +1,56 @@
+# Generates inputs for Day 14: https://adventofcode.com/2022/day/14
+#
+# Each line is a path of rock, made up of horizontal and vertical segments
+# ("x,y -> x,y -> ..."). Sand pours in from 500,0.
+#
+# The real input has 137 paths, with rock spread about 27 columns to either
+# side of the source, and from 13 to 165 rows down. The number of paths grows
+# with the scale, and the area they're spread over grows with it, so the
+# density stays about the same.
+#
+# Task 1 needs all the sand to eventually fall into the abyss. If rock sat too
+# close to the source, sand could pile up until it plugged the source, so the
+# top of the rock is kept further below the source than the rock is wide.
+
+import math
+
+
+def generate(scale, rng):
+    """Generate a list of rock paths.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    spread = round(27 * math.sqrt(scale))
+    depth = round(152 * math.sqrt(scale))
+    min_x = 500 - spread
+    max_x = 500 + spread
+    min_y = spread + 2
+    max_y = min_y + depth
+
+    for i in range(137 * scale):
+        x = rng.randint(min_x, max_x)
+        y = rng.randint(min_y, max_y)
+        path = ['%s,%s' % (x, y)]
+        horizontal = rng.random() < 0.5
+
+        for j in range(rng.randint(1, 6)):
+            delta = rng.choice((-1, 1)) * rng.randint(1, 8)
+
+            if horizontal:
+                x = min(max(x + delta, min_x), max_x)
+            else:
+                y = min(max(y + delta, min_y), max_y)
+
+            path.append('%s,%s' % (x, y))
+            horizontal = not horizontal
+
+        yield ' -> '.join(path)
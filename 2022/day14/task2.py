@@ -12,37 +12,48 @@
 #
 # That's totally how it works.
 #
-# Anyway, we're dropping the out-of-bounds check in favor of a floor Y position
-# check. And, well, I guess that's about it for the changes, basically.
+# Anyway, we're dropping the out-of-bounds check in favor of a floor. Since
+# the cave map is a grid, the floor is just a row of rock at the bottom, so
+# there's nothing special to check for. And, well, I guess that's about it for
+# the changes, basically.
 
 import sys
 
+from aoc import tracing
+from aoc.grid import Grid
+from aoc.preprocessed import cache_preprocessed
+
 
 # The initial position where all sand starts from.
 SAND_SOURCE_POS = (500, 0)
 
 
 # Some character codes for drawing.
-ROCK = b'#'
-AIR = b'.'
-SAND_SOURCE = b'+'
-SAND = b'o'
+ROCK = ord(b'#')
+AIR = ord(b'.')
+SAND_SOURCE = ord(b'+')
+SAND = ord(b'o')
 
 
 # The representation of the cave map.
 #
-# We're using a hashtable as the representation.
-#
-# Since the cave is mostly air, this takes up a lot less space than a grid
-# of cells. It's also very quick to check and mutate.
-cave_map = {
-    SAND_SOURCE_POS: SAND_SOURCE,
-}
+# We're using a Grid as the representation, covering only the columns that
+# sand could ever reach. Every cell is a single byte, and we never need to
+# bounds-check, since sand can never get past the border.
+cave_map = None
+
+
+# The X coordinate of the left-most column of the cave map. Cave X coordinates
+# are translated by this to get cave map X coordinates.
+cave_x_origin = 0
+
+
+# The offset of the sand source in the cave map.
+sand_source_offset = 0
 
 
 # The boundaries and drawing viewport of the cave map.
 cave_height = 0
-cave_width = 0
 cave_min_x1 = SAND_SOURCE_POS[0]
 cave_min_y1 = SAND_SOURCE_POS[1]
 cave_max_x2 = cave_min_x1
@@ -53,53 +64,133 @@ cave_max_y2 = cave_min_y1
 cave_floor_y = None
 
 
-def load_map():
-    """Load the data from the map.
+def get_offset(x, y):
+    """Return the offset of a cave position in the cave map.
+
+    Args:
+        x (int):
+            The X coordinate in the cave.
+
+        y (int):
+            The Y coordinate in the cave.
+
+    Returns:
+        int:
+        The offset in the cave map.
+    """
+    return cave_map.get_offset(x - cave_x_origin, y)
+
+
+def get_pos(offset):
+    """Return the cave position of an offset in the cave map.
+
+    Args:
+        offset (int):
+            The offset in the cave map.
+
+    Returns:
+        tuple:
+        The (x, y) position in the cave.
+    """
+    x, y = cave_map.get_pos(offset)
+
+    return x + cave_x_origin, y
+
+
+def dump_cave(cave):
+    """Return the fields to store for a built cave.
+
+    Args:
+        cave (dict):
+            The built cave, from :py:func:`build_cave`.
+
+    Returns:
+        dict:
+        The fields to store.
+    """
+    cave_map = cave['cave_map']
+
+    return dict(cave,
+                cave_map=cave_map.data,
+                cave_map_width=cave_map.width,
+                cave_map_height=cave_map.height,
+                cave_map_padding=cave_map.padding)
+
+
+def load_cave(fields):
+    """Return a built cave from stored fields.
+
+    The cave map is copied out of the stored fields, so that sand can be
+    dropped into it.
+
+    Args:
+        fields (dict):
+            The fields stored by :py:func:`dump_cave`.
+
+    Returns:
+        dict:
+        The built cave.
+    """
+    cave = dict(fields)
+    cave_map = Grid(cave.pop('cave_map_width'),
+                    cave.pop('cave_map_height'),
+                    padding=cave.pop('cave_map_padding'),
+                    fill=AIR,
+                    border=AIR)
+    cave_map.data[:] = cave['cave_map']
+    cave['cave_map'] = cave_map
+
+    return cave
+
+
+@cache_preprocessed('cave',
+                    dump=dump_cave,
+                    load=load_cave)
+def build_cave(filename):
+    """Build the cave map from the rock paths in the input.
 
     This will parse the paths line-by-line, splitting them up into segments
     separated by " -> " markers, and then parsing out the resulting
     coordinates.
 
-    We track the previous position and the current position for each step,
-    and fill in all the gaps between those. Two positions are only ever
-    connected by a straight horizontal or vertical line.
+    Once we know the size of the cave, we allocate the cave map and fill in
+    the paths. We track the previous position and the current position for
+    each step, and fill in all the gaps between those. Two positions are only
+    ever connected by a straight horizontal or vertical line.
+
+    This sets the map state, and returns it so that it can be cached for
+    later runs. Any previously-loaded map state is reset first.
+
+    Args:
+        filename (str):
+            The name of the file to load.
+
+    Returns:
+        dict:
+        The new map state, keyed off by global variable name.
     """
-    global cave_width, cave_height, cave_floor_y
+    global cave_map, cave_x_origin, cave_height, cave_floor_y
+    global sand_source_offset
     global cave_min_x1, cave_min_y1, cave_max_x2, cave_max_y2
 
-    with open('input', 'rb') as fp:
+    cave_height = 0
+    cave_min_x1 = SAND_SOURCE_POS[0]
+    cave_min_y1 = SAND_SOURCE_POS[1]
+    cave_max_x2 = cave_min_x1
+    cave_max_y2 = cave_min_y1
+
+    paths = []
+
+    with open(filename, 'rb') as fp:
         for line in fp.readlines():
-            prev_pos = None
+            path = []
 
             for pos_str in line.strip().split(b' -> '):
                 x, y = pos_str.split(b',')
                 x = int(x)
                 y = int(y)
 
-                if prev_pos is None:
-                    # Place a rock in this position. We don't want to assume
-                    # there will be another place in the path.
-                    cave_map[(x, y)] = ROCK
-                elif prev_pos[0] != x:
-                    # We're filling in gaps horizontally.
-                    #
-                    # Loop through each spot in the range and place a rock.
-                    cave_map.update({
-                        (temp_x, y): ROCK
-                        for temp_x in range(min(x, prev_pos[0]),
-                                            max(x, prev_pos[0]) + 1)
-                    })
-                elif prev_pos[1] != y:
-                    # We're filling in gaps vertically.
-                    #
-                    # Loop through each spot in the range and place a rock.
-                    cave_map.update({
-                        (x, temp_y): ROCK
-                        for temp_y in range(min(y, prev_pos[1]),
-                                            max(y, prev_pos[1]) + 1)
-                    })
-
-                prev_pos = (x, y)
+                path.append((x, y))
 
                 # Update the stored boundaries to compute the map size and
                 # display viewport.
@@ -107,17 +198,111 @@ def load_map():
                 # We won't bother setting cave_max_y2 here, because we know
                 # we'll need to calculate this at the end given the floor
                 # location.
-                cave_width = max(cave_width, x + 1)
                 cave_height = max(cave_height, y + 1)
 
                 cave_min_x1 = min(cave_min_x1, x)
                 cave_min_y1 = min(cave_min_y1, y)
                 cave_max_x2 = max(cave_max_x2, x)
 
-        # Calculate the floor position and expand the viewport to match.
-        cave_floor_y = cave_height + 1
-        cave_height = cave_floor_y + 1
-        cave_max_y2 = cave_height
+            paths.append(path)
+
+    # Calculate the floor position and expand the viewport to match.
+    cave_floor_y = cave_height + 1
+    cave_height = cave_floor_y + 1
+    cave_max_y2 = cave_height
+
+    # Sand can only ever move one column left or right for each row it
+    # falls, so it can't reach further out than the
+    # floor's depth
+    # on either side of the source. That's all the map needs to cover.
+    reach = cave_floor_y
+    cave_x_origin = min(cave_min_x1, SAND_SOURCE_POS[0] - reach)
+    cave_x_end = max(cave_max_x2, SAND_SOURCE_POS[0] + reach)
+    cave_width = cave_x_end - cave_x_origin + 1
+
+    cave_map = Grid(cave_width, cave_height,
+                    padding=2,
+                    fill=AIR,
+                    border=AIR)
+    data = cave_map.data
+    stride = cave_map.stride
+
+    sand_source_offset = get_offset(*SAND_SOURCE_POS)
+    data[sand_source_offset] = SAND_SOURCE
+
+    for path in paths:
+        prev_pos = None
+
+        for x, y in path:
+            if prev_pos is None:
+                # Place a rock in this position. We don't want to assume
+                # there will be another place in the path.
+                data[get_offset(x, y)] = ROCK
+            elif prev_pos[0] != x:
+                # We're filling in gaps horizontally.
+                #
+                # These are all next to each other in the cave map, so we can
+                # place all the rocks in one go.
+                start = get_offset(min(x, prev_pos[0]), y)
+                end = get_offset(max(x, prev_pos[0]), y) + 1
+                data[start:end] = bytes([ROCK]) * (end - start)
+            elif prev_pos[1] != y:
+                # We're filling in gaps vertically.
+                #
+                # Loop through each spot in the range and place a rock.
+                start = get_offset(x, min(y, prev_pos[1]))
+                end = get_offset(x, max(y, prev_pos[1])) + 1
+
+                for offset in range(start, end, stride):
+                    data[offset] = ROCK
+
+            prev_pos = (x, y)
+
+    # Lay down the floor. It's infinitely-long, but the cave map covers as
+    # far as the sand could ever spread.
+    floor_start = cave_map.get_offset(0, cave_floor_y)
+    data[floor_start:floor_start + cave_width] = bytes([ROCK]) * cave_width
+
+    return {
+        'cave_map': cave_map,
+        'cave_x_origin': cave_x_origin,
+        'cave_height': cave_height,
+        'cave_floor_y': cave_floor_y,
+        'sand_source_offset': sand_source_offset,
+        'cave_min_x1': cave_min_x1,
+        'cave_min_y1': cave_min_y1,
+        'cave_max_x2': cave_max_x2,
+        'cave_max_y2': cave_max_y2,
+    }
+
+
+def load_map(filename):
+    """Load the data from the map.
+
+    The map is built from the input by :py:func:`build_cave`, or loaded from
+    a cache if it was built before.
+
+    Any previously-loaded map state is reset.
+
+    Args:
+        filename (str):
+            The name of the file to load.
+    """
+    global cave_map, cave_x_origin, cave_height, cave_floor_y
+    global sand_source_offset
+    global cave_min_x1, cave_min_y1, cave_max_x2, cave_max_y2
+
+    cave = build_cave(filename)
+
+    cave_map = cave['cave_map']
+    cave_x_origin = cave['cave_x_origin']
+    cave_height = cave['cave_height']
+    cave_floor_y = cave['cave_floor_y']
+    sand_source_offset = cave['sand_source_offset']
+    cave_min_x1 = cave['cave_min_x1']
+    cave_min_y1 = cave['cave_min_y1']
+    cave_max_x2 = cave['cave_max_x2']
+    cave_max_y2 = cave['cave_max_y2']
 
 
 def simulate_sand():
@@ -129,32 +314,32 @@ def simulate_sand():
         int:
         The resulting amount of sand at rest. This will be our final answer.
     """
-    global cave_width, cave_min_x1, cave_min_y1, cave_max_x2, cave_max_y2
+    global cave_min_x1, cave_min_y1, cave_max_x2
 
+    data = cave_map.data
     sand_at_rest = 0
 
     while True:
-        sand_pos = drop_sand()
+        sand_offset = drop_sand()
         sand_at_rest += 1
 
         # Expand the viewport for drawing, if needed.
         #
         # We know we'll never need to expand cave_max_y2, since nothing will
         # fall past the floor.
-        cave_width = max(cave_width, sand_pos[0] + 1)
-        cave_min_x1 = min(cave_min_x1, sand_pos[0])
-        cave_min_y1 = min(cave_min_y1, sand_pos[1])
-        cave_max_x2 = max(cave_max_x2, sand_pos[0])
+        sand_x, sand_y = get_pos(sand_offset)
+        cave_min_x1 = min(cave_min_x1, sand_x)
+        cave_min_y1 = min(cave_min_y1, sand_y)
+        cave_max_x2 = max(cave_max_x2, sand_x)
+
+        data[sand_offset] = SAND
 
         # Unlike in task1.py, we won't be dealing with a None value. Instead,
         # we need to bail here once we know we've overlapped the source,
         # blocking the sand and ending the sand-dropping process.
-        if sand_pos == SAND_SOURCE_POS:
-            cave_map[SAND_SOURCE_POS] = SAND
+        if sand_offset == sand_source_offset:
             break
 
-        cave_map[sand_pos] = SAND
-
     return sand_at_rest
 
 
@@ -165,14 +350,16 @@ def drop_sand():
     at rest.
 
     Unlike in task1.py, we don't have to worry about out-of-bounds locations
-    (so no more ``None`` result), but we do have to consider the floor's Y
-    location.
+    (so no more ``None`` result). The floor is rock in the cave map, so sand
+    will come to rest on it like anything else.
 
     Returns:
-        tuple:
-        A tuple of (x, y) of the at-rest position.
+        int:
+        The offset of the at-rest position in the cave map.
     """
-    x, y = SAND_SOURCE_POS
+    data = cave_map.data
+    stride = cave_map.stride
+    offset = sand_source_offset
     at_rest = False
 
     while not at_rest:
@@ -184,24 +371,20 @@ def drop_sand():
         #
         # If any of these succeed, we'll continue the loop and process again.
         #
-        # Note that in task2.py, we not only need to check the map, but the
-        # floor location as well.
+        # We'll assume we're at rest by default, unless we find we can set a
+        # new position.
         at_rest = True
 
-        if y + 1 == cave_floor_y:
-            # We hit the floor. We're done.
-            break
-
-        for dx in (0, -1, 1):
-            new_pos = (x + dx, y + 1)
+        for delta in (stride, stride - 1, stride + 1):
+            new_offset = offset + delta
 
-            if new_pos not in cave_map:
+            if data[new_offset] == AIR:
                 # We found a spot at this resting position.
-                x, y = new_pos
+                offset = new_offset
                 at_rest = False
                 break
 
-    return x, y
+    return offset
 
 
 def draw_map():
@@ -217,18 +400,26 @@ def draw_map():
     x2 = cave_max_x2 + 2
     y2 = cave_max_y2 + 2
 
-    # Now draw the cave, given the viewport.
+    # Now draw the cave, given the viewport. The rows of the cave map are
+    # already in drawable form.
+    data = cave_map.data
+
     for y in range(y1, y2):
-        sys.stdout.buffer.write(b''.join(
-            cave_map.get((x, y), AIR)
-            for x in range(x1, x2)
-        ))
+        sys.stdout.buffer.write(data[get_offset(x1, y):get_offset(x2, y)])
 
         print()
 
 
-load_map()
-sand_at_rest = simulate_sand()
-draw_map()
+def solve(filename):
+    load_map(filename)
+
+    return simulate_sand()
+
+
+if __name__ == '__main__':
+    sand_at_rest = solve('input')
+
+    if tracing.is_enabled(tracing.DEBUG):
+        draw_map()
 
-print('Sand at rest = %s' % sand_at_rest)
+    print('Sand at rest = %s' % sand_at_rest)
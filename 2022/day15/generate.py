@@ -0,0 +1,111 @@
+# Generates inputs for Day 15: https://adventofcode.com/2022/day/15
+#
+# Each line is a sensor and the closest beacon it found. A sensor covers every
+# position within the Manhattan distance of its beacon. Task 2 needs exactly
+# one position in the 4,000,000x4,000,000 search area that no sensor covers,
+# so we can't just scatter sensors around.
+#
+# The trick is to rotate the coordinates 45 degrees, using u = x + y and
+# v = x - y. A sensor's coverage then becomes a square, and squares are easy
+# to tile:
+#
+# 1. Sensors are laid out on a lattice, with each covering a bit more than its
+#    square of the lattice, so that the whole area is covered.
+#
+# 2. One sensor is removed, and the hidden beacon is placed where it was.
+#
+# 3. Four new sensors are placed around the hidden beacon in a pinwheel, each
+#    one covering the area on one side of it, stopping just short of it:
+#
+#        +------+---+
+#        |      |   |
+#        |  2   | 1 |
+#        |      |   |
+#        +---+--X---+
+#        |   |      |
+#        | 3 |  4   |
+#        |   |      |
+#        +---+------+
+#
+#    Each square covers one of the four lines running out from the hidden
+#    beacon, so together they cover everything around it but the beacon
+#    itself.
+#
+# The real input has 38 sensors, so the lattice spacing is picked to give
+# about 38 sensors per step of scale.
+
+import math
+
+
+SEARCH_MAX = 4_000_000
+
+
+def generate(scale, rng):
+    """Generate a list of sensors and their closest beacons.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    # Each lattice square is 2 * radius wide in rotated coordinates, covering
+    # 2 * radius^2 positions.
+    radius = math.isqrt(SEARCH_MAX * SEARCH_MAX // (2 * 38 * scale))
+    spacing = 2 * radius
+
+    # Pick the lattice sensor to replace with the hidden beacon, somewhere
+    # away from the edges of the search area.
+    while True:
+        hidden_u = spacing * rng.randint(1, SEARCH_MAX // radius)
+        hidden_v = spacing * rng.randint(-SEARCH_MAX // spacing,
+                                         SEARCH_MAX // spacing)
+        hidden_x = (hidden_u + hidden_v) // 2
+        hidden_y = (hidden_u - hidden_v) // 2
+
+        if (radius <= hidden_x <= SEARCH_MAX - radius and
+            radius <= hidden_y <= SEARCH_MAX - radius):
+            break
+
+    # Each sensor is an (x, y, radius) tuple.
+    sensors = [
+        (hidden_x + radius, hidden_y + 1, radius),
+        (hidden_x + 1, hidden_y - radius, radius),
+        (hidden_x - radius, hidden_y - 1, radius),
+        (hidden_x - 1, hidden_y + radius, radius),
+    ]
+
+    # Lay out the rest of the lattice, keeping any sensors that reach into
+    # the search area.
+    num_steps = SEARCH_MAX // spacing + 2
+
+    for i in range(-1, 2 * num_steps):
+        for j in range(-num_steps, num_steps):
+            u = i * spacing
+            v = j * spacing
+            x = (u + v) // 2
+            y = (u - v) // 2
+
+            if (x, y) == (hidden_x, hidden_y):
+                continue
+
+            dist = (max(0, -x, x - SEARCH_MAX) +
+                    max(0, -y, y - SEARCH_MAX))
+
+            if dist <= radius + 1:
+                sensors.append((x, y, radius + 1))
+
+    rng.shuffle(sensors)
+
+    for x, y, sensor_radius in sensors:
+        # Place the beacon anywhere on the edge of the sensor's coverage.
+        beacon_dx = rng.randint(-sensor_radius, sensor_radius)
+        beacon_dy = (sensor_radius - abs(beacon_dx)) * rng.choice((-1, 1))
+
+        yield ('Sensor at x=%s, y=%s: closest beacon is at x=%s, y=%s'
+               % (x, y, x + beacon_dx, y + beacon_dy))
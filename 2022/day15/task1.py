@@ -90,31 +90,20 @@
 # 5. If there's also a beacon on the target row, store that as well.
 # 6. The answer is our sensor coverage minus any beacons.
 
-import re
-
-
-BEACON_RE = re.compile(
-    r'^Sensor at x=(?P<sensor_x>-?\d+), y=(?P<sensor_y>-?\d+): closest beacon '
-    r'is at x=(?P<beacon_x>-?\d+), y=(?P<beacon_y>-?\d+)'
-)
+from aoc import memory
+from aoc.parsing import iter_int_records
 
 
 TARGET_ROW = 2_000_000
 
-target_row_scan_pos = set()
-target_row_beacon_pos = set()
-
-
-with open('input', 'r') as fp:
-    for line in fp.readlines():
-        m = BEACON_RE.match(line)
-        assert m
-
-        sensor_x = int(m.group('sensor_x'))
-        sensor_y = int(m.group('sensor_y'))
-        beacon_x = int(m.group('beacon_x'))
-        beacon_y = int(m.group('beacon_y'))
+def solve(filename):
+    target_row_scan_pos = set()
+    target_row_beacon_pos = set()
+    memory.track_cache('target_row_scan_pos', target_row_scan_pos)
 
+    # Each line has the sensor's X and Y, followed by the beacon's X and Y.
+    for sensor_x, sensor_y, beacon_x, beacon_y in \
+            iter_int_records(filename, 4):
         scan_dist = abs(beacon_x - sensor_x) + abs(beacon_y - sensor_y)
 
         scan_x1 = sensor_x - scan_dist
@@ -138,6 +127,8 @@ with open('input', 'r') as fp:
             # the final results.
             target_row_beacon_pos.add(beacon_x)
 
+    return len(target_row_scan_pos - target_row_beacon_pos)
+
 
-print('Coverage area for row %s: %s'
-      % (TARGET_ROW, len(target_row_scan_pos - target_row_beacon_pos)))
+if __name__ == '__main__':
+    print('Coverage area for row %s: %s' % (TARGET_ROW, solve('input')))
@@ -67,13 +67,8 @@
 #    throwing out or capping ranges. While not normally expensive, it was just
 #    expensive enough to add to the runtime costs.
 
-import re
-
-
-BEACON_RE = re.compile(
-    r'^Sensor at x=(?P<sensor_x>-?\d+), y=(?P<sensor_y>-?\d+): closest beacon '
-    r'is at x=(?P<beacon_x>-?\d+), y=(?P<beacon_y>-?\d+)'
-)
+from aoc import progress, tracing
+from aoc.parsing import iter_int_records
 
 
 BEACON_MIN = 0
@@ -82,19 +77,13 @@ BEACON_MAX = 4_000_000
 TUNING_FREQ_MULTIPLIER = 4_000_000
 
 
-# Load all the sensor data.
-raw_sensors = []
-
-with open('input', 'r') as fp:
-    for line in fp.readlines():
-        m = BEACON_RE.match(line)
-        assert m
-
-        sensor_x = int(m.group('sensor_x'))
-        sensor_y = int(m.group('sensor_y'))
-        beacon_x = int(m.group('beacon_x'))
-        beacon_y = int(m.group('beacon_y'))
+def find_beacon(filename):
+    # Load all the sensor data.
+    raw_sensors = []
 
+    # Each line has the sensor's X and Y, followed by the beacon's X and Y.
+    for sensor_x, sensor_y, beacon_x, beacon_y in \
+            iter_int_records(filename, 4):
         scan_dist = abs(beacon_x - sensor_x) + abs(beacon_y - sensor_y)
 
         scan_x1 = sensor_x - scan_dist
@@ -102,123 +91,140 @@ with open('input', 'r') as fp:
         scan_x2 = sensor_x + scan_dist
         scan_y2 = sensor_y + scan_dist
 
-        # We could only consider sensors that have scans somewhere within the
-        # min/max beacon range, but in our input data, they all are. So
+        # We could only consider sensors that have scans somewhere within
+        # the min/max beacon range, but in our input data, they all are. So
         # that's not an optimization win.
         raw_sensors.append((sensor_y, scan_x1, scan_y1, scan_x2, scan_y2))
 
+    # There are sensors in the input data that overlap in coverage area. Well,
+    # there's one, at least (maybe more?), but given how many rows we have to
+    # check, removing just one sensor can do quite a lot! Let's get rid of it.
+    #
+    # We'll do this by sorting by (Y1, X1), and checking overlap between
+    # consecutive sensors. Any that fully overlap the previous scanner's area
+    # can easily go.
+    #
+    # This sort order will also help us when we scan each row. I'll go into
+    # that below.
+    prev_s = None
+    sensors = []
+
+    for s in sorted(raw_sensors,
+                    key=lambda s: (s[2], s[1])):
+        if (prev_s is None or
+            not (s[1] >= prev_s[1] and s[2] >= prev_s[2] and
+                 s[3] <= prev_s[2] and s[4] <= prev_s[4])):
+            sensors.append(s)
+            prev_s = s
+
+    trace_info = tracing.get_tracer(tracing.INFO)
+
+    if trace_info:
+        trace_info('Eliminated %s overlapping sensor(s)',
+                   len(raw_sensors) - len(sensors))
+
+    # We'll be scanning from top to bottom. Conveniently, our sensors are now
+    # also ordered from top to bottom!
+    #
+    # This is another optimization trick. Since they're ordered, we'll be able
+    # to select the window of sensors applicable to the current location.
+    # Anything outside of the scan range will be ignored.
+    #
+    # But not just ignored. Eliminated from checks. If a sensor scan's Y2 ends
+    # before the current row, we can outright delete it from further checks,
+    # because we'll never use it again.
+    #
+    # Similarly, if a sensor scan's Y1 comes after the scan row, we know that
+    # all subsequent sensors will as well (given the sort), so we can just end
+    # that sensor loop.
+    #
+    # Otherwise, the plan of attack is:
+    #
+    # 1. Loop through each row.
+    # 2. For each row, loop through each sensor.
+    # 3. For each applicable sensor, compute the coverage range and add it to
+    #    row_scan_data.
+    # 4. Sort row_scan_data and check if there are any gaps between ranges. If
+    #    there are, we found our hidden beacon, and we can stop!
+    #
+    #    (I want to get rid of this sort, but I think I need it. At least with
+    #    this current approach.)
+    discard_sensors = []
+    found_pos = None
+    rows_scanned = progress.counter('rows scanned',
+                                    total=BEACON_MAX - BEACON_MIN + 1)
+    progress.track('sensors remaining', lambda: len(sensors))
+
+    for y in range(BEACON_MIN, BEACON_MAX + 1):
+        rows_scanned.count += 1
+        row_scan_data = []
+
+        for sensor in sensors:
+            sensor_y, scan_x1, scan_y1, scan_x2, scan_y2 = sensor
+
+            if scan_y1 > y:
+                # There are no more candidate sensors to check for this row.
+                # All the following sensors are too low to bother checking.
+                # We're done with this row, and can start analyzing data.
+                break
+            elif scan_y2 < y:
+                # This sensor doesn't cover this far down. We'll never need to
+                # process this sensor again. We can discard it.
+                discard_sensors.append(sensor)
+            else:
+                # Figure out the distance between this Y position and our
+                # sensor. That will be the amount we need to shave off the
+                # width of our total scanner range, to get the coverage for
+                # this row.
+                scanner_dy = abs(y - sensor_y)
+                row_x1 = scan_x1 + scanner_dy
+                row_x2 = scan_x2 - scanner_dy
+
+                # The scanned area is within the confirmed beacon range. Add
+                # it to a list of covered rows for further processing.
+                row_scan_data.append((row_x1, row_x2 + 1))
+
+        # We'll now check if we have a contiguous list of ranges. If there's
+        # any gap in our coverage, we know we've found the beacon.
+        x = BEACON_MIN
+
+        for scan_x1, scan_x2 in sorted(row_scan_data):
+            # There are other ways I could have organized this logic, but I'm
+            # going for readability here (explaining each step).
+            if scan_x2 <= x:
+                # There's an overlap. Skip it.
+                continue
+            elif scan_x1 > x:
+                # We found it! Set the flag, and we'll then bail further down.
+                found_pos = (scan_x1 - 1, y)
+                break
+
+            # Update the end of the range for the next check.
+            x = scan_x2
+
+        if found_pos:
+            # We found the beacon! Good job, us!
+            break
 
-# There are sensors in the input data that overlap in coverage area. Well,
-# there's one, at least (maybe more?), but given how many rows we have to
-# check, removing just one sensor can do quite a lot! Let's get rid of it.
-#
-# We'll do this by sorting by (Y1, X1), and checking overlap between
-# consecutive sensors. Any that fully overlap the previous scanner's area
-# can easily go.
-#
-# This sort order will also help us when we scan each row. I'll go into that
-# below.
-prev_s = None
-sensors = []
-
-for s in sorted(raw_sensors,
-                key=lambda s: (s[2], s[1])):
-    if (prev_s is None or
-        not (s[1] >= prev_s[1] and s[2] >= prev_s[2] and
-             s[3] <= prev_s[2] and s[4] <= prev_s[4])):
-        sensors.append(s)
-        prev_s = s
-
-print('Eliminated %s overlapping sensor(s)'
-      % (len(raw_sensors) - len(sensors)))
-
-
-# We'll be scanning from top to bottom. Conveniently, our sensors are now
-# also ordered from top to bottom!
-#
-# This is another optimization trick. Since they're ordered, we'll be able to
-# select the window of sensors applicable to the current location. Anything
-# outside of the scan range will be ignored.
-#
-# But not just ignored. Eliminated from checks. If a sensor scan's Y2 ends
-# before the current row, we can outright delete it from further checks,
-# because we'll never use it again.
-#
-# Similarly, if a sensor scan's Y1 comes after the scan row, we know that
-# all subsequent sensors will as well (given the sort), so we can just end
-# that sensor loop.
-#
-# Otherwise, the plan of attack is:
-#
-# 1. Loop through each row.
-# 2. For each row, loop through each sensor.
-# 3. For each applicable sensor, compute the coverage range and add it to
-#    row_scan_data.
-# 4. Sort row_scan_data and check if there are any gaps between ranges. If
-#    there are, we found our hidden beacon, and we can stop!
-#
-#    (I want to get rid of this sort, but I think I need it. At least with
-#    this current approach.)
-discard_sensors = []
-found_pos = None
-
-for y in range(BEACON_MIN, BEACON_MAX + 1):
-    row_scan_data = []
+        # If we have any sensors to discard, do so now.
+        if discard_sensors:
+            for sensor in discard_sensors:
+                sensors.remove(sensor)
 
-    for sensor in sensors:
-        sensor_y, scan_x1, scan_y1, scan_x2, scan_y2 = sensor
+            discard_sensors = []
 
-        if scan_y1 > y:
-            # There are no more candidate sensors to check for this row.
-            # All the following sensors are too low to bother checking. We're
-            # done with this row, and can start analyzing data.
-            break
-        elif scan_y2 < y:
-            # This sensor doesn't cover this far down. We'll never need to
-            # process this sensor again. We can discard it.
-            discard_sensors.append(sensor)
-        else:
-            # Figure out the distance between this Y position and our sensor.
-            # That will be the amount we need to shave off the width of our
-            # total scanner range, to get the coverage for this row.
-            scanner_dy = abs(y - sensor_y)
-            row_x1 = scan_x1 + scanner_dy
-            row_x2 = scan_x2 - scanner_dy
-
-            # The scanned area is within the confirmed beacon range. Add
-            # it to a list of covered rows for further processing.
-            row_scan_data.append((row_x1, row_x2 + 1))
-
-    # We'll now check if we have a contiguous list of ranges. If there's any
-    # gap in our coverage, we know we've found the beacon.
-    x = BEACON_MIN
-
-    for scan_x1, scan_x2 in sorted(row_scan_data):
-        # There are other ways I could have organized this logic, but I'm
-        # going for readability here (explaining each step).
-        if scan_x2 <= x:
-            # There's an overlap. Skip it.
-            continue
-        elif scan_x1 > x:
-            # We found it! Set the flag, and we'll then bail further down.
-            found_pos = (scan_x1 - 1, y)
-            break
+    return found_pos
 
-        # Update the end of the range for the next check.
-        x = scan_x2
 
-    if found_pos:
-        # We found the beacon! Good job, us!
-        break
+def solve(filename):
+    found_pos = find_beacon(filename)
 
-    # If we have any sensors to discard, do so now.
-    if discard_sensors:
-        for sensor in discard_sensors:
-            sensors.remove(sensor)
+    return TUNING_FREQ_MULTIPLIER * found_pos[0] + found_pos[1]
 
-        discard_sensors = []
 
+if __name__ == '__main__':
+    found_pos = find_beacon('input')
 
-print('Found the beacon at %s, %s' % found_pos)
-print('Frequency = %d'
-      % (TUNING_FREQ_MULTIPLIER * found_pos[0] + found_pos[1]))
+    print('Found the beacon at %s, %s' % found_pos)
+    print('Frequency = %d'
+          % (TUNING_FREQ_MULTIPLIER * found_pos[0] + found_pos[1]))
@@ -0,0 +1,105 @@
+# Generates inputs for Day 16: https://adventofcode.com/2022/day/16
+#
+# Each line is a valve, its flow rate, and the valves its tunnels lead to.
+# Tunnels go both ways, and we start at valve AA.
+#
+# The real input has 56 valves, 15 of which have a non-zero flow rate. The
+# search for the best order to open valves is exponential in the number of
+# valves worth opening, so we keep that at 15 and scale up the rest of the
+# network instead. Valve names are two letters, which limits us to 676 valves.
+#
+# Like the real input, the flow valves (and AA) are joined by corridors of
+# one to three zero-flow valves. The corridors start as a random tree (so
+# everything is reachable), plus a few extra corridors to make loops. The
+# rest of the valves hang off the corridors as dead ends, which adds work to
+# path finding without changing how far apart the flow valves are. Flow rates
+# are all different, since the solvers track the remaining flow rates in a
+# set.
+
+import string
+
+
+MAX_VALVES = 26 * 26
+NUM_FLOW_VALVES = 15
+
+
+def generate(scale, rng):
+    """Generate a list of valves and tunnels.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    # Leave room for the longest possible corridors.
+    num_valves = min(max(56 * scale, 3 * (NUM_FLOW_VALVES + 5) + 16),
+                     MAX_VALVES)
+
+    names = [
+        a + b
+        for a in string.ascii_uppercase
+        for b in string.ascii_uppercase
+        if a + b != 'AA'
+    ]
+    names = ['AA'] + rng.sample(names, num_valves - 1)
+
+    tunnels = [set() for i in range(num_valves)]
+    flow_rates = [0] * num_valves
+    corridor_valves = []
+    next_valve = NUM_FLOW_VALVES + 1
+
+    def _connect(valve1, valve2):
+        tunnels[valve1].add(valve2)
+        tunnels[valve2].add(valve1)
+
+    def _add_corridor(valve1, valve2):
+        nonlocal next_valve
+
+        prev_valve = valve1
+
+        for i in range(rng.randint(1, 3)):
+            _connect(prev_valve, next_valve)
+            corridor_valves.append(next_valve)
+            prev_valve = next_valve
+            next_valve += 1
+
+        _connect(prev_valve, valve2)
+
+    # Valve 0 is AA, and valves 1 through NUM_FLOW_VALVES have flow.
+    for valve, flow_rate in enumerate(rng.sample(range(3, 26),
+                                                 NUM_FLOW_VALVES),
+                                      start=1):
+        flow_rates[valve] = flow_rate
+        _add_corridor(valve, rng.randrange(valve))
+
+    for i in range(NUM_FLOW_VALVES // 3):
+        _add_corridor(*rng.sample(range(NUM_FLOW_VALVES + 1), 2))
+
+    for valve in range(next_valve, num_valves):
+        _connect(valve, rng.choice(corridor_valves))
+        corridor_valves.append(valve)
+
+    lines = []
+
+    for valve, name in enumerate(names):
+        connected = [names[other] for other in sorted(tunnels[valve])]
+        rng.shuffle(connected)
+
+        if len(connected) == 1:
+            tunnels_str = 'tunnel leads to valve'
+        else:
+            tunnels_str = 'tunnels lead to valves'
+
+        lines.append('Valve %s has flow rate=%s; %s %s'
+                     % (name, flow_rates[valve], tunnels_str,
+                        ', '.join(connected)))
+
+    rng.shuffle(lines)
+
+    yield from lines
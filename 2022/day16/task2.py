@@ -26,7 +26,21 @@
 #
 # This has been keeping me up at nights, but I have to move on with my life.
 
-import re
+from array import array
+
+from aoc import memory
+from aoc.graph import bfs
+from aoc.inputs import cache_parsed
+from aoc.memo import MISSING, KeyEncoder, memo_cache
+from aoc.parsing import iter_field_records
+from aoc.patterns import lazy_compile
+from aoc.preprocessed import cache_preprocessed
+
+
+VALVE_RE = lazy_compile(
+    rb'Valve ([A-Z]{2}) has flow rate=(\d+); '
+    rb'tunnels? leads? to valves? ([A-Z]{2}(?:, [A-Z]{2})*)'
+)
 
 
 # The maximum number of minutes in which actions can be taken.
@@ -36,60 +50,51 @@ import re
 MAX_MINUTES = 26
 
 
-# Stored information on all valves in the graph.
-valves = {}
-
-
-def get_shortest_path(start_valve, end_valve):
-    """Find the shortest path between two valves.
-
-    This uses Djikstra's algorithm to quickly find the shortest path. It works
-    very much like the approach in Day 12. However, instead of calculating a
-    number of steps, we'll be returning the path itself.
+# The maximum number of entries in the path cache.
+#
+# Our input needs nowhere near this many, but larger inputs could otherwise
+# grow the cache until we run out of memory.
+PATH_CACHE_MAX_SIZE = 2_000_000
 
-    Returns:
-        int:
-        The number of steps in the shortest path.
-    """
-    to_visit = {start_valve}
-    distances = {
-        start_valve: 0,
-    }
-    parents = {}
 
-    while to_visit:
-        # Find the nearest position to start with.
-        current_valve = min(to_visit, key=lambda valve: distances[valve])
+# Stored information on all valves in the graph.
+valves = {}
 
-        # Remove that from the visit list, so we don't try it again.
-        to_visit.remove(current_valve)
 
-        if current_valve == end_valve:
-            # We're done!
-            break
+def get_shortest_paths(start_node, valve_ids, adjacency):
+    """Find the shortest paths from a valve to all other valves.
 
-        # Start figuring out which adjacent valves we should check next.
-        for candidate_valve in valves[current_valve]['connected']:
-            distance = distances[current_valve] + 1
+    Every tunnel takes the same amount of time to walk, so this uses a
+    breadth-first search over the whole graph at once. It works very much
+    like the approach in Day 12. However, instead of calculating a number of
+    steps, we'll be returning the paths themselves.
 
-            if (candidate_valve not in distances or
-                distance < distances[candidate_valve]):
-                # We haven't processed this valve yet, or it's closer than it
-                # was from another path, so begin tracking it and queue it up
-                # for possible visits.
-                distances[candidate_valve] = distance
-                parents[candidate_valve] = current_valve
-                to_visit.add(candidate_valve)
+    Args:
+        start_node (int):
+            The graph node of the valve to start from.
 
-    # We found a path. We're now going to walk the paths to get the step count.
-    last_valve = end_valve
-    path = [last_valve]
+        valve_ids (list of str):
+            The IDs of all valves, in graph node order.
 
-    while last_valve != start_valve:
-        path.append(parents[last_valve])
-        last_valve = parents[last_valve]
+        adjacency (list of list of int):
+            The connected valve nodes for each valve node.
 
-    return list(reversed(path[:-1]))
+    Returns:
+        dict:
+        A mapping of destination valve IDs to paths. Each path is a list of
+        valve IDs to walk through, ending at the destination (but not
+        including the starting valve).
+    """
+    paths = bfs(adjacency, start_node,
+                num_nodes=len(valve_ids))
+
+    return {
+        dest_valve_id: [
+            valve_ids[node]
+            for node in paths.get_path(dest_node)[1:]
+        ]
+        for dest_node, dest_valve_id in enumerate(valve_ids)
+    }
 
 
 def get_best_score(*, opened_valves=None):
@@ -104,7 +109,31 @@ def get_best_score(*, opened_valves=None):
         The best score found in the graph.
     """
     # A cache used to keep track of scores for particular path/time/valve sets.
-    path_cache = {}
+    path_cache = memo_cache('path_cache',
+                            max_size=PATH_CACHE_MAX_SIZE)
+    memory.track_cache('path_cache', path_cache)
+
+    # Keys for the path cache are packed into a single integer, rather than
+    # a tuple holding a tuple of flow rates and a tuple of valve IDs. Each
+    # flow rate gets a bit in a bitmask, and each path gets an ID.
+    #
+    # We'll look up the paths from each valve (along with their IDs) once,
+    # up-front.
+    flow_rate_bits = KeyEncoder(sorted(
+        _valve['flow_rate']
+        for _valve in valves.values()
+        if _valve['flow_rate'] > 0
+    ))
+    path_ids = KeyEncoder()
+    valve_dests = {
+        _valve_id: [
+            (dest_valve_id, dest_path, path_ids.get_id(tuple(dest_path)))
+            for dest_valve_id, dest_path in _valve['distances'].items()
+        ]
+        for _valve_id, _valve in valves.items()
+    }
+    mins_bits = MAX_MINUTES.bit_length()
+    path_bits = path_ids.bits
 
     def _find_best(*, mins_elapsed, cur_path, opened_valves, avail_flow_rates):
         """Return the best score for the available branches from this valve.
@@ -188,7 +217,16 @@ def get_best_score(*, opened_valves=None):
             #
             # We'll only consider valves that we have enough time to reach and
             # that have not already been opened.
-            for dest_valve_id, dest_path in cur_valve['distances'].items():
+            #
+            # Every key checked from here shares the minutes elapsed and the
+            # available flow rates, so pack those once.
+            state_key = (
+                (flow_rate_bits.get_mask(avail_flow_rates) << mins_bits |
+                 mins_elapsed) << path_bits
+            )
+
+            for dest_valve_id, dest_path, dest_path_id in \
+                    valve_dests[cur_valve_id]:
                 dest_time_remaining = \
                     MAX_MINUTES - mins_elapsed - len(dest_path)
 
@@ -197,15 +235,11 @@ def get_best_score(*, opened_valves=None):
                     # We may have seen this combination of mins elapsed, flow
                     # rates, and path before. If so, we can short-circuit this
                     # branch and just fetch the score we've already computed.
-                    path_cache_key = (
-                        mins_elapsed,
-                        tuple(sorted(avail_flow_rates)),
-                        tuple(dest_path),
-                    )
-
-                    try:
-                        score, full_dest_path = path_cache[path_cache_key]
-                    except KeyError:
+                    path_cache_key = state_key | dest_path_id
+
+                    cached = path_cache.get(path_cache_key, MISSING)
+
+                    if cached is MISSING:
                         # There's nothing in the cache. Recurse into this
                         # valve and cache the store.
                         score, full_dest_path = _find_best(
@@ -214,6 +248,8 @@ def get_best_score(*, opened_valves=None):
                             mins_elapsed=mins_elapsed + len(dest_path) - 1,
                             avail_flow_rates=set(avail_flow_rates))
                         path_cache[path_cache_key] = (score, full_dest_path)
+                    else:
+                        score, full_dest_path = cached
 
                     # Re-compute our best score so far.
                     score += eventual_pressure
@@ -240,45 +276,202 @@ def get_best_score(*, opened_valves=None):
         })
 
 
-def main():
-    """Main logic for the program.
+def dump_valves(valves):
+    """Return the fields to store for a parsed valve network.
 
-    We'll start by parsing the valve list, then running Djikstra's Shortest
-    Path algorithm to compute distances to other valves, and then begin the
-    operation to find the best score.
+    Connected valves and paths are stored as flat arrays of graph nodes (the
+    index of each valve ID), along with offsets marking where each valve's
+    (or path's) nodes end.
+
+    Args:
+        valves (dict):
+            The parsed valves, from :py:func:`parse_valves`.
+
+    Returns:
+        dict:
+        The fields to store.
     """
-    valve_re = re.compile(
-        r'^Valve (?P<valve_id>[A-Z]{2}) has flow rate=(?P<flow_rate>\d+); '
-        r'tunnels? leads? to valves? (?P<connected>[A-Z]{2}(?:, [A-Z]{2})*)$'
-    )
+    valve_ids = list(valves.keys())
+    valve_nodes = {
+        valve_id: node
+        for node, valve_id in enumerate(valve_ids)
+    }
 
+    connected_nodes = array('H')
+    connected_ends = array('I')
+    dest_nodes = array('H')
+    dest_ends = array('I')
+    path_nodes = array('H')
+    path_ends = array('I')
+
+    for valve in valves.values():
+        connected_nodes.extend(
+            valve_nodes[connected_valve_id]
+            for connected_valve_id in valve['connected']
+        )
+        connected_ends.append(len(connected_nodes))
+
+        for dest_valve_id, dest_path in valve['distances'].items():
+            dest_nodes.append(valve_nodes[dest_valve_id])
+            path_nodes.extend(
+                valve_nodes[path_valve_id]
+                for path_valve_id in dest_path
+            )
+            path_ends.append(len(path_nodes))
+
+        dest_ends.append(len(dest_nodes))
+
+    return {
+        'valve_ids': valve_ids,
+        'flow_rates': array('I', (
+            valve['flow_rate']
+            for valve in valves.values()
+        )),
+        'connected_nodes': connected_nodes,
+        'connected_ends': connected_ends,
+        'dest_nodes': dest_nodes,
+        'dest_ends': dest_ends,
+        'path_nodes': path_nodes,
+        'path_ends': path_ends,
+    }
+
+
+def load_valves(fields):
+    """Return a parsed valve network from stored fields.
+
+    Args:
+        fields (dict):
+            The fields stored by :py:func:`dump_valves`.
+
+    Returns:
+        dict:
+        A mapping of valve IDs to information on each valve.
+    """
+    valve_ids = fields['valve_ids']
+    connected_nodes = fields['connected_nodes'].tolist()
+    connected_ends = fields['connected_ends'].tolist()
+    dest_nodes = fields['dest_nodes'].tolist()
+    dest_ends = fields['dest_ends'].tolist()
+    path_nodes = fields['path_nodes'].tolist()
+    path_ends = fields['path_ends'].tolist()
+
+    valves = {}
+    connected_start = 0
+    dest_start = 0
+    path_start = 0
+
+    for valve_id, flow_rate, connected_end, dest_end in \
+            zip(valve_ids, fields['flow_rates'], connected_ends, dest_ends):
+        distances = {}
+
+        for dest_node, path_end in zip(dest_nodes[dest_start:dest_end],
+                                       path_ends[dest_start:dest_end]):
+            distances[valve_ids[dest_node]] = [
+                valve_ids[node]
+                for node in path_nodes[path_start:path_end]
+            ]
+            path_start = path_end
+
+        valves[valve_id] = {
+            'connected': [
+                valve_ids[node]
+                for node in connected_nodes[connected_start:connected_end]
+            ],
+            'distances': distances,
+            'flow_rate': flow_rate,
+            'id': valve_id,
+        }
+
+        connected_start = connected_end
+        dest_start = dest_end
+
+    return valves
+
+
+@cache_parsed
+@cache_preprocessed('valves',
+                    dump=dump_valves,
+                    load=load_valves)
+def parse_valves(filename):
+    """Parse the valve network and compute paths between valves.
+
+    This is the expensive part of setting up, so the result is kept for as
+    long as the input file is unchanged, both in memory and in a cache file
+    next to the input. It must not be modified.
+
+    Args:
+        filename (str):
+            The name of the input file to parse.
+
+    Returns:
+        dict:
+        A mapping of valve IDs to information on each valve.
+    """
     # First, parse out the information on the valve network.
-    with open('input', 'r') as fp:
-        for line in fp.readlines():
-            m = valve_re.match(line)
-            assert m
-
-            valve_id = m.group('valve_id')
-
-            valves[valve_id] = {
-                'connected': m.group('connected').split(', '),
-                'distances': {},
-                'flow_rate': int(m.group('flow_rate')),
-                'id': valve_id,
-            }
-
-    # We're now going to loop through each product of valves, calculating the
-    # shortest path to go from one valve to another.
+    valves = {}
+
+    for valve_id, flow_rate, connected in iter_field_records(filename,
+                                                             VALVE_RE):
+        valve_id = valve_id.decode()
+
+        valves[valve_id] = {
+            'connected': connected.decode().split(', '),
+            'distances': {},
+            'flow_rate': int(flow_rate),
+            'id': valve_id,
+        }
+
+    # We're now going to compute the shortest paths from each valve to every
+    # other valve.
     #
+    # The graph search works on integer nodes, so we'll give each valve an
+    # index and build a list of connected valve nodes for each.
+    valve_ids = list(valves.keys())
+    valve_nodes = {
+        valve_id: node
+        for node, valve_id in enumerate(valve_ids)
+    }
+    adjacency = [
+        [
+            valve_nodes[connected_valve_id]
+            for connected_valve_id in valve['connected']
+        ]
+        for valve in valves.values()
+    ]
+
     # We'll skip any destination valves with a flow rate of 0, because those
     # make for lousy destinations.
     for valve_id, valve in valves.items():
+        dest_paths = get_shortest_paths(valve_nodes[valve_id], valve_ids,
+                                        adjacency)
+
         for dest_valve_id, dest_valve in valves.items():
             if dest_valve_id != valve_id and dest_valve['flow_rate'] != 0:
-                # Calculate the shortest path needed to go from valve_id to
+                # Store the shortest path needed to go from valve_id to
                 # dest_valve_id.
-                valve['distances'][dest_valve_id] = \
-                    get_shortest_path(valve_id, dest_valve_id)
+                valve['distances'][dest_valve_id] = dest_paths[dest_valve_id]
+
+    return valves
+
+
+def solve(filename):
+    """Return the most pressure that can be released.
+
+    We'll start by parsing the valve list, then running a breadth-first
+    search to compute paths to other valves, and then begin the operation to
+    find the best score.
+
+    Args:
+        filename (str):
+            The name of the input file to parse.
+
+    Returns:
+        int:
+        The most pressure that can be released.
+    """
+    # Parse the valve network. Any valves from a previous run are replaced.
+    valves.clear()
+    valves.update(parse_valves(filename))
 
     # Now figure out the best pressure release score achievable.
     #
@@ -294,8 +487,8 @@ def main():
     score2, best_path2 = get_best_score(opened_valves=set(best_path1))
     total_score = score1 + score2
 
-    print('Most pressure released = %s' % total_score)
+    return total_score
 
 
 if __name__ == '__main__':
-    main()
+    print('Most pressure released = %s' % solve('input'))
@@ -0,0 +1,21 @@
+# Generates inputs for Day 17: https://adventofcode.com/2022/day/17
+#
+# The input is a single line of jets of hot gas, each pushing left (<) or
+# right (>). The real input has 10,091 jets.
+
+
+def generate(scale, rng):
+    """Generate a pattern of jets.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    yield ''.join(rng.choices('<>', k=10091 * scale))
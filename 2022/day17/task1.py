@@ -225,8 +225,8 @@ def move_piece(*, piece, new_x, new_y, old_x=None, old_y=None):
     return collides, new_x, new_y
 
 
-def main():
-    """Main logic for the program.
+def solve(filename):
+    """Return the height of the tower of rocks.
 
     This will run through the Tetris-style simulation, reading pieces, placing
     them on the board, running through movement until they land, checking the
@@ -234,6 +234,14 @@ def main():
 
     There's an outer loop for processing until we hit the target row height,
     and an inner loop for handling movement.
+
+    Args:
+        filename (str):
+            The name of the file containing the gust pattern.
+
+    Returns:
+        int:
+        The height of the tower of rocks.
     """
     # Track the current piece, position, and next piece.
     cur_piece = None
@@ -246,7 +254,10 @@ def main():
     populated_height = 0
     num_placed_pieces = 0
 
-    with open('input', 'rb') as fp:
+    # Start with an empty board, in case we're solving more than once.
+    board.clear()
+
+    with open(filename, 'rb') as fp:
         while True:
             assert cur_piece is None
 
@@ -328,8 +339,8 @@ def main():
                 # There are no more pieces needed. We're done!
                 break
 
-    print('Tower of rocks = %s tall' % (populated_height))
+    return populated_height
 
 
 if __name__ == '__main__':
-    main()
+    print('Tower of rocks = %s tall' % solve('input'))
@@ -188,8 +188,8 @@ def move_piece(*, piece, new_x, new_y, old_x=None, old_y=None):
     return collides, new_x, new_y
 
 
-def main():
-    """Main logic for the program.
+def solve(filename):
+    """Return the height of the tower of rocks.
 
     This will run through the Tetris-style simulation, reading pieces, placing
     them on the board, running through movement until they land, checking the
@@ -201,6 +201,14 @@ def main():
     There's also some cycle checks, to find out when we hit a repeatable
     pattern and to infer the values after that, since we have such a massive
     row count we're aiming for.
+
+    Args:
+        filename (str):
+            The name of the file containing the gust pattern.
+
+    Returns:
+        int:
+        The height of the tower of rocks.
     """
     # State for checking for repeated cycles of the same patterns.
     cycle_checks = {}
@@ -221,7 +229,10 @@ def main():
     num_placed_pieces = 0
     populated_height_extra = 0
 
-    with open('input', 'rb') as fp:
+    # Start with an empty board, in case we're solving more than once.
+    board.clear()
+
+    with open(filename, 'rb') as fp:
         while True:
             assert cur_piece is None
 
@@ -362,9 +373,8 @@ def main():
                     # height.
                     num_placed_pieces += cycle_num_placed_pieces * multiplier
 
-    print('Tower of rocks = %s tall'
-          % (populated_height + populate_height_extra))
+    return populated_height + populate_height_extra
 
 
 if __name__ == '__main__':
-    main()
+    print('Tower of rocks = %s tall' % solve('input'))
@@ -0,0 +1,38 @@
+# Generates inputs for Day 18: https://adventofcode.com/2022/day/18
+#
+# Each line is the x,y,z position of a 1x1x1 cube of lava. Together, they
+# form a lumpy droplet with air pockets inside.
+#
+# We'll fill a sphere with cubes, leaving out a random third of them to make
+# the pockets. The real input has about 2,700 cubes in a 22x22x22 space, and
+# the number of cubes grows with the scale, so each side grows by the cube
+# root of the scale.
+
+
+def generate(scale, rng):
+    """Generate a list of lava cube positions.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    size = round(20 * scale ** (1 / 3))
+    center = (size - 1) / 2
+    max_dist_sq = (size / 2) ** 2
+
+    for x in range(size):
+        for y in range(size):
+            for z in range(size):
+                dist_sq = ((x - center) ** 2 +
+                           (y - center) ** 2 +
+                           (z - center) ** 2)
+
+                if dist_sq <= max_dist_sq and rng.random() < 0.65:
+                    yield '%s,%s,%s' % (x, y, z)
@@ -31,55 +31,126 @@
 # Super cheap, super fast.
 #
 # But will it scale? Stay tuned for part 2.
+#
+# For much larger inputs, there's also a NumPy version (run with
+# --backend=numpy). This places the cubes in a 3D grid of flags. Walking along
+# any axis, every change from empty space to cube (or back) is a visible
+# surface, and NumPy can count those changes across the whole grid at once.
 
+from aoc.backends import with_backends
+from aoc.inputs import read_int_array
 
-# Tracking of all visible surface positions.
-#
-# Each entry is a (X, Y, Z) position of a surface (using increments of 0.5
-# for coordinates -- see get_cube_surface_positions().
-visible_surfaces = set()
 
+def count_surfaces(filename):
+    """Return the number of visible surfaces.
 
-# Tracking of all occluded surface positions.
-#
-# Each entry is a (X, Y, Z) position, same as in visible_surfaces.
-occluded_surfaces = set()
-
-
-with open('input', 'r') as fp:
-    for line in fp.readlines():
-        x, y, z = [
-            int(_i)
-            for _i in line.strip().split(',')
-        ]
-
-        # Calculate surface positions.
-        #
-        # I decided to go with a coordinate system that let me easily map
-        # X, Y, and Z to surface positions.
-        #
-        # For this, each coordinate number can have the following relative
-        # values:
-        #
-        #       -1: The surface is to the left/top/back of the cube.
-        #
-        #     -0.5: The middle of the cube. There's no actual surface data
-        #           encoded here. Important for tracking just a left-most,
-        #           top-most, etc. surface while retaining the cube's
-        #           coordinates as part of the storage.
-        #
-        #       +0: The surface is to teh right/bottom/front of the cube.
-        for pos in ((x - 1,   y - 0.5, z - 0.5),
-                    (x,       y - 0.5, z - 0.5),
-                    (x - 0.5, y - 1,   z - 0.5),
-                    (x - 0.5, y,       z - 0.5),
-                    (x - 0.5, y - 0.5, z - 1  ),
-                    (x - 0.5, y - 0.5, z      )):
-            if pos not in occluded_surfaces:
-                if pos in visible_surfaces:
-                    visible_surfaces.remove(pos)
-                    occluded_surfaces.add(pos)
-                else:
-                    visible_surfaces.add(pos)
-
-    print('Number of surfaces = %s' % len(visible_surfaces))
+    Args:
+        filename (str):
+            The name of the file containing cube positions.
+
+    Returns:
+        int:
+        The number of visible surfaces.
+    """
+    # Tracking of all visible surface positions.
+    #
+    # Each entry is a (X, Y, Z) position of a surface (using increments of 0.5
+    # for coordinates -- see get_cube_surface_positions().
+    visible_surfaces = set()
+
+    # Tracking of all occluded surface positions.
+    #
+    # Each entry is a (X, Y, Z) position, same as in visible_surfaces.
+    occluded_surfaces = set()
+
+    with open(filename, 'r') as fp:
+        for line in fp.readlines():
+            x, y, z = [
+                int(_i)
+                for _i in line.strip().split(',')
+            ]
+
+            # Calculate surface positions.
+            #
+            # I decided to go with a coordinate system that let me easily map
+            # X, Y, and Z to surface positions.
+            #
+            # For this, each coordinate number can have the following relative
+            # values:
+            #
+            #       -1: The surface is to the left/top/back of the cube.
+            #
+            #     -0.5: The middle of the cube. There's no actual surface data
+            #           encoded here. Important for tracking just a left-most,
+            #           top-most, etc. surface while retaining the cube's
+            #           coordinates as part of the storage.
+            #
+            #       +0: The surface is to teh right/bottom/front of the cube.
+            for pos in ((x - 1,   y - 0.5, z - 0.5),
+                        (x,       y - 0.5, z - 0.5),
+                        (x - 0.5, y - 1,   z - 0.5),
+                        (x - 0.5, y,       z - 0.5),
+                        (x - 0.5, y - 0.5, z - 1  ),
+                        (x - 0.5, y - 0.5, z      )):
+                if pos not in occluded_surfaces:
+                    if pos in visible_surfaces:
+                        visible_surfaces.remove(pos)
+                        occluded_surfaces.add(pos)
+                    else:
+                        visible_surfaces.add(pos)
+
+    return len(visible_surfaces)
+
+
+def load_cube_grid(filename):
+    """Load the cubes into a 3D grid of flags.
+
+    The grid has a one-cube gap around every side of the cubes.
+
+    Args:
+        filename (str):
+            The name of the file containing cube positions.
+
+    Returns:
+        numpy.ndarray:
+        A 3D array of booleans, indexed by ``[x, y, z]``, set for each cube.
+    """
+    import numpy as np
+
+    positions = read_int_array(filename, columns=3, sep=',')
+    positions -= positions.min(axis=0) - 1
+
+    grid = np.zeros(positions.max(axis=0) + 2, dtype=bool)
+    grid[tuple(positions.T)] = True
+
+    return grid
+
+
+def count_surfaces_numpy(filename):
+    """Return the number of visible surfaces, using NumPy.
+
+    Args:
+        filename (str):
+            The name of the file containing cube positions.
+
+    Returns:
+        int:
+        The number of visible surfaces.
+    """
+    import numpy as np
+
+    grid = load_cube_grid(filename)
+
+    # Every change between empty space and a cube along an axis is a surface.
+    return sum(
+        int(np.count_nonzero(np.diff(grid, axis=axis)))
+        for axis in range(3)
+    )
+
+
+solve = with_backends(count_surfaces,
+                      numpy=count_surfaces_numpy)
+
+
+if __name__ == '__main__':
+    print('Number of surfaces = %s' % solve('input'))
@@ -28,10 +28,19 @@
 #
 # All-in-all, it's quick enough. About 300ms locally. Some improvements could
 # be made, for sure, but I'll take it for this task.
+#
+# For much larger inputs, there's also a NumPy version (run with
+# --backend=numpy). This places the cubes in a 3D grid of flags, and floods
+# the outside by growing it one step in every direction at a time, across
+# the whole grid at once, until it stops changing. The answer is then the
+# number of places where a cube sits next to the outside.
 
 import sys
 from collections import deque
 
+from aoc.backends import with_backends
+from aoc.inputs import read_int_array
+
 
 # Tracking of all placed cube positions.
 #
@@ -232,8 +241,8 @@ def expand_steam(start_pos):
                                  occluded_cubes=occluded_cubes)
 
 
-def main():
-    """Main logic for the program.
+def count_exterior_surfaces(filename):
+    """Return the number of exterior surfaces.
 
     This will read through the input and place cubes (technically, track
     visible/occluded surface positions for cubes).
@@ -244,12 +253,32 @@ def main():
     into.
 
     The delta between those two numbers is our answer.
+
+    Args:
+        filename (str):
+            The name of the file containing cube positions.
+
+    Returns:
+        int:
+        The number of exterior surfaces.
     """
     global min_x, max_x
     global min_y, max_y
     global min_z, max_z
 
-    with open('input', 'r') as fp:
+    # Reset all state, in case we're solving more than once.
+    cubes.clear()
+    visible_surfaces.clear()
+    occluded_surfaces.clear()
+
+    min_x = sys.maxsize
+    min_y = sys.maxsize
+    min_z = sys.maxsize
+    max_x = 0
+    max_y = 0
+    max_z = 0
+
+    with open(filename, 'r') as fp:
         for line in fp.readlines():
             x, y, z = [
                 int(_i)
@@ -287,8 +316,90 @@ def main():
     expand_steam((min_x, min_y, min_z))
     num_surfaces -= len(visible_surfaces)
 
-    print('Number of surfaces = %s' % num_surfaces)
+    return num_surfaces
+
+
+def load_cube_grid(filename):
+    """Load the cubes into a 3D grid of flags.
+
+    The grid has a one-cube gap around every side of the cubes.
+
+    Args:
+        filename (str):
+            The name of the file containing cube positions.
+
+    Returns:
+        numpy.ndarray:
+        A 3D array of booleans, indexed by ``[x, y, z]``, set for each cube.
+    """
+    import numpy as np
+
+    positions = read_int_array(filename, columns=3, sep=',')
+    positions -= positions.min(axis=0) - 1
+
+    grid = np.zeros(positions.max(axis=0) + 2, dtype=bool)
+    grid[tuple(positions.T)] = True
+
+    return grid
+
+
+def count_exterior_surfaces_numpy(filename):
+    """Return the number of exterior surfaces, using NumPy.
+
+    Args:
+        filename (str):
+            The name of the file containing cube positions.
+
+    Returns:
+        int:
+        The number of exterior surfaces.
+    """
+    import numpy as np
+
+    cubes = load_cube_grid(filename)
+    empty = ~cubes
+
+    # Flood the outside, starting from a corner in the gap around the cubes.
+    # Each step grows the flooded area by one position along every axis,
+    # and then trims it back to empty space.
+    outside = np.zeros_like(cubes)
+    outside[0, 0, 0] = True
+    num_outside = 1
+
+    while True:
+        grown = outside.copy()
+        grown[1:, :, :] |= outside[:-1, :, :]
+        grown[:-1, :, :] |= outside[1:, :, :]
+        grown[:, 1:, :] |= outside[:, :-1, :]
+        grown[:, :-1, :] |= outside[:, 1:, :]
+        grown[:, :, 1:] |= outside[:, :, :-1]
+        grown[:, :, :-1] |= outside[:, :, 1:]
+        grown &= empty
+
+        new_num_outside = int(np.count_nonzero(grown))
+
+        if new_num_outside == num_outside:
+            break
+
+        outside = grown
+        num_outside = new_num_outside
+
+    # Count every cube surface that touches the outside, along each axis and
+    # in each direction.
+    return sum(
+        int(np.count_nonzero(axis_cubes[:-1] & axis_outside[1:])) +
+        int(np.count_nonzero(axis_outside[:-1] & axis_cubes[1:]))
+        for axis_cubes, axis_outside in (
+            (cubes, outside),
+            (cubes.swapaxes(0, 1), outside.swapaxes(0, 1)),
+            (cubes.swapaxes(0, 2), outside.swapaxes(0, 2)),
+        )
+    )
+
+
+solve = with_backends(count_exterior_surfaces,
+                      numpy=count_exterior_surfaces_numpy)
 
 
 if __name__ == '__main__':
-    main()
+    print('Number of surfaces = %s' % solve('input'))
@@ -0,0 +1,37 @@
+# Generates inputs for Day 19: https://adventofcode.com/2022/day/19
+#
+# Each line is a blueprint, listing the costs of the four types of robots.
+# Costs are kept within the same ranges as the real input, which has 30
+# blueprints. Task 2 only looks at the first 3 blueprints, so it won't change
+# much with scale.
+
+
+def generate(scale, rng):
+    """Generate a list of blueprints.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    for blueprint_id in range(1, 30 * scale + 1):
+        yield (
+            'Blueprint %s: '
+            'Each ore robot costs %s ore. '
+            'Each clay robot costs %s ore. '
+            'Each obsidian robot costs %s ore and %s clay. '
+            'Each geode robot costs %s ore and %s obsidian.'
+            % (blueprint_id,
+               rng.randint(2, 4),
+               rng.randint(2, 4),
+               rng.randint(2, 4),
+               rng.randint(5, 20),
+               rng.randint(2, 4),
+               rng.randint(7, 20))
+        )
@@ -9,15 +9,47 @@
 #
 # Really, nothing more to say. *shrug*
 
-import re
 import sys
+from itertools import islice
+
+from aoc import memory, progress, tracing
+from aoc.memo import MISSING, memo_cache
+from aoc.parsing import iter_int_records
+
+
+# The robot and resource for each cost listed in a blueprint, in order.
+BLUEPRINT_COSTS = (
+    ('ore', 'ore'),
+    ('clay', 'ore'),
+    ('obsidian', 'ore'),
+    ('obsidian', 'clay'),
+    ('geode', 'ore'),
+    ('geode', 'obsidian'),
+)
 
 
 # The maximum number of minutes we have to build robots and collect geodes.
 MAX_MINUTES = 32
 
 
-def get_quality_level(blueprint):
+# The maximum number of paths to remember for each blueprint.
+#
+# Our input needs nowhere near this many, but larger blueprints could
+# otherwise grow the cache until we run out of memory.
+SEEN_PATHS_MAX_SIZE = 2_000_000
+
+
+# IDs for each candidate robot to build (or none), for the path cache keys.
+CANDIDATE_KEY_IDS = {
+    None: 0,
+    'clay': 1,
+    'geode': 2,
+    'obsidian': 3,
+    'ore': 4,
+}
+
+
+def get_quality_level(blueprint, *, seen_paths, states_explored):
     """Return the quality level from mining geodes.
 
     This attempts to recursively walk through branches of possible bots,
@@ -31,6 +63,14 @@ def get_quality_level(blueprint):
         blueprint (dict):
             The blueprint being tested.
 
+        seen_paths (aoc.memo.MemoCache):
+            The cache for paths, keyed off with enough information available
+            to reliably prune the path. This must be cleared before each
+            blueprint.
+
+        states_explored (aoc.progress.Counter):
+            The counter for the number of states explored.
+
     Returns:
         int:
         The resulting quality level of the blueprint.
@@ -42,10 +82,6 @@ def get_quality_level(blueprint):
     earliest_geode = sys.maxsize
     earliest_obsidian = sys.maxsize
 
-    # Our cache for paths, keyed off with enough information available to
-    # reliably prune the bath.
-    seen_paths = {}
-
     # We don't need to build as many robots as possible. There's a limit to
     # what's useful. We're capping that at the maximum number of resources
     # used to build a robot.
@@ -62,6 +98,8 @@ def get_quality_level(blueprint):
         nonlocal earliest_geode
         nonlocal earliest_obsidian
 
+        states_explored.count += 1
+
         if mins_elapsed >= MAX_MINUTES:
             # We've exceeded our time. Return what we've collected so far.
             return inventory['geode']
@@ -116,20 +154,31 @@ def get_quality_level(blueprint):
         # recursively, try to figure out the optimal score.
         best_score = inventory['geode']
 
+        # We'll cache our path states, in an effort to avoid calculating
+        # possible outcomes of branches when possible.
+        #
+        # The state is packed into a single integer, 16 bits per count, which
+        # takes far less memory than a tuple of tuples. Counts never get
+        # anywhere close to 65,536 in the time we have. The candidate robot
+        # goes in the lowest 3 bits.
+        state_key = (
+            (mins_elapsed << 128) |
+            (inventory['clay'] << 112) |
+            (inventory['geode'] << 96) |
+            (inventory['obsidian'] << 80) |
+            (inventory['ore'] << 64) |
+            (active_robots['clay'] << 48) |
+            (active_robots['geode'] << 32) |
+            (active_robots['obsidian'] << 16) |
+            active_robots['ore']
+        ) << 3
+
         # Test each candidate.
         for robot_id in candidates:
-            # We'll cache our path states, in an effort to avoid calculating
-            # possible outcomes of branches when possible.
-            key = (
-                mins_elapsed,
-                tuple(inventory.items()),
-                tuple(active_robots.items()),
-                robot_id,
-            )
+            key = state_key | CANDIDATE_KEY_IDS[robot_id]
+            score = seen_paths.get(key, MISSING)
 
-            try:
-                score, new_inventory = seen_paths[key]
-            except KeyError:
+            if score is MISSING:
                 # This is our first time in this path. We're going to create
                 # a copy of our inventory and active robots for this branch
                 # simulation.
@@ -156,12 +205,11 @@ def get_quality_level(blueprint):
                 score = _get_best(mins_elapsed=mins_elapsed + 1,
                                   inventory=new_inventory,
                                   active_robots=new_active_robots)
-                seen_paths[key] = (score, new_inventory)
+                seen_paths[key] = score
 
             if score is not None and score > best_score:
                 # We found the best branch! Return the score.
                 best_score = score
-                best_inventory = new_inventory
 
         return best_score
 
@@ -182,64 +230,83 @@ def get_quality_level(blueprint):
 
     quality_level = geodes_opened * blueprint['id']
 
-    print('Blueprint %s geodes opened = %s. Quality level = %s'
-          % (blueprint['id'], geodes_opened, quality_level))
+    trace_info = tracing.get_tracer(tracing.INFO)
+
+    if trace_info:
+        trace_info('Blueprint %s geodes opened = %s. Quality level = %s',
+                   blueprint['id'], geodes_opened, quality_level)
 
     return geodes_opened
 
 
-def main():
-    """Run the program for day 19 task 2.
+def solve(filename):
+    """Return the multiplied geode counts for day 19 task 2.
 
     This will read up to 3 blueprints, compute the number of geodes returned
     by each, and multiply them together.
-    """
-    BLUEPRINT_RE = re.compile(
-        r'Blueprint (?P<blueprint_id>\d+): '
-        r'Each ore robot costs (?P<ore_robot_ore_cost>\d+) ore\. '
-        r'Each clay robot costs (?P<clay_robot_ore_cost>\d+) ore\. '
-        r'Each obsidian robot costs (?P<obsidian_robot_ore_cost>\d+) ore and '
-        r'(?P<obsidian_robot_clay_cost>\d+) clay\. '
-        r'Each geode robot costs (?P<geode_robot_ore_cost>\d+) ore and '
-        r'(?P<geode_robot_obsidian_cost>\d+) obsidian\.')
 
+    Args:
+        filename (str):
+            The name of the file containing the blueprints.
+
+    Returns:
+        int:
+        The geode counts of the first 3 blueprints, multiplied together.
+    """
     geodes_multiple = 1
 
-    with open('input', 'r') as fp:
-        for blueprint_id, line in enumerate(fp.readlines(), start=1):
-            if blueprint_id == 4:
-                break
+    trace_blueprints = tracing.get_tracer(tracing.DEBUG)
+
+    # Keep count of how much work we're doing, in case we're stopped for
+    # taking too long.
+    blueprints_checked = progress.counter('blueprints checked')
+    states_explored = progress.counter('states explored')
+
+    # Our cache for paths. This is cleared for each blueprint, but keeps
+    # stats across all of them.
+    seen_paths = memo_cache('seen_paths',
+                            max_size=SEEN_PATHS_MAX_SIZE)
+    memory.track_cache('seen_paths', seen_paths)
+
+    # Each blueprint has its ID, followed by its costs in BLUEPRINT_COSTS
+    # order. Only the first 3 blueprints are needed.
+    for blueprint_id, *costs in islice(iter_int_records(filename, 7), 3):
+        blueprint = {
+            'id': blueprint_id,
+            'robots': {
+                robot_id: {
+                    'id': robot_id,
+                    'costs': {
+                        'clay': 0,
+                        'obsidian': 0,
+                        'ore': 0,
+                    },
+                }
+                for robot_id in ('clay', 'geode', 'obsidian', 'ore')
+            },
+        }
 
-            m = BLUEPRINT_RE.match(line)
-            assert m
+        for (robot_id, resource), cost in zip(BLUEPRINT_COSTS, costs):
+            blueprint['robots'][robot_id]['costs'][resource] = cost
 
-            group = m.groupdict()
+        if trace_blueprints:
+            trace_blueprints('======= BLUEPRINT %s ========', blueprint_id)
 
-            blueprint = {
-                'id': blueprint_id,
-                'robots': {
-                    robot_id: {
-                        'id': robot_id,
-                        'costs': {
-                            resource: int(
-                                group.get(f'{robot_id}_robot_{resource}_cost',
-                                          0)
-                            )
-                            for resource in ('clay', 'obsidian', 'ore')
-                        },
-                    }
-                    for robot_id in ('clay', 'geode', 'obsidian', 'ore')
-                },
-            }
+        seen_paths.clear()
 
-            print('======= BLUEPRINT %s ========' % blueprint_id)
+        geodes_multiple *= get_quality_level(
+            blueprint,
+            seen_paths=seen_paths,
+            states_explored=states_explored)
+        blueprints_checked.count += 1
 
-            geodes_multiple *= get_quality_level(blueprint)
+    trace_info = tracing.get_tracer(tracing.INFO)
 
-            print()
+    if trace_info:
+        trace_info('seen_paths: %s', seen_paths.format_stats())
 
-    print('Multiplying all geodes = %s' % geodes_multiple)
+    return geodes_multiple
 
 
 if __name__ == '__main__':
-    main()
+    print('Multiplying all geodes = %s' % solve('input'))
@@ -0,0 +1,29 @@
+# Generates inputs for Day 20: https://adventofcode.com/2022/day/20
+#
+# Each line is a number in the encrypted file. Numbers can repeat, but there's
+# exactly one 0, since the answer is based on positions relative to it. The
+# real input has 5,000 numbers.
+
+
+def generate(scale, rng):
+    """Generate an encrypted file of numbers.
+
+    Args:
+        scale (int):
+            The scale of the input.
+
+        rng (random.Random):
+            The random number generator to use.
+
+    Yields:
+        str:
+        Each line of the input.
+    """
+    count = 5000 * scale
+    zero_index = rng.randrange(count)
+
+    for i in range(count):
+        if i == zero_index:
+            yield '0'
+        else:
+            yield str(rng.choice((-1, 1)) * rng.randint(1, 10000))
@@ -37,43 +37,115 @@
 # adding up. The duplicate lists were the cause. I assumed all values were
 # unique. So I altered this to store not just the number, but a pair of
 # (original_position, number), which helps make these unique.
+#
+# Okay, one more thing. For much larger inputs, there's a NumPy version (run
+# with --backend=numpy). It's the same idea as the list version, but works on
+# an array of positions, where NumPy can move big chunks at a time.
 
+from aoc.backends import with_backends
+from aoc.inputs import open_input, read_int_array
 
-with open('input', 'r') as fp:
-    # Read each line from the file, storing as (index, num), so we can
-    # avoid any issues with duplicate numbers. The actual index value doesn't
-    # matter and could be anything unique.
-    sequence = [
-        (i, int(line))
-        for i, line in enumerate(fp.readlines())
-    ]
 
-sequence_len = len(sequence)
-mod = sequence_len - 1
-new_data = list(sequence)
+def mix(filename):
+    """Return the sum of the grove coordinates.
 
-# Run through the sequence, shifting numbers. We'll have positive and
-# negative numbers to deal with.
-#
-# Note that if an item shifts to the end of the list, it'll actually need to
-# wrap around to index 0. We take care of this automatically by modding to
-# sequence_length - 1. This will cause anything at the last index to become 0.
-for i, num in sequence:
-    pos = new_data.index((i, num))
-    new_pos = (num + pos) % mod
-
-    # While a slow and ineffcient operation in Python, this is fast enough for
-    # this task on anything modern.
+    Args:
+        filename (str):
+            The name of the input file.
+
+    Returns:
+        int:
+        The sum of the grove coordinates.
+    """
+    with open_input(filename) as data:
+        # Read each number from the file, storing as (index, num), so we can
+        # avoid any issues with duplicate numbers. The actual index value
+        # doesn't matter and could be anything unique.
+        sequence = list(enumerate(data.read_int_columns()[0]))
+
+    sequence_len = len(sequence)
+    mod = sequence_len - 1
+    new_data = list(sequence)
+
+    # Run through the sequence, shifting numbers. We'll have positive and
+    # negative numbers to deal with.
     #
-    # If we wanted to speed this up, we might employ some form of skip list or
-    # tree.
-    new_data.pop(pos)
-    new_data.insert(new_pos, num)
-
-# We can now find our offset used to look up numbers, and get our answer.
-start = new_data.index(0)
-grove_x = new_data[(start + 1000) % (sequence_len)]
-grove_y = new_data[(start + 2000) % (sequence_len)]
-grove_z = new_data[(start + 3000) % (sequence_len)]
-
-print('Sum of encrypted coords = %s' % (grove_x + grove_y + grove_z))
+    # Note that if an item shifts to the end of the list, it'll actually need
+    # to wrap around to index 0. We take care of this automatically by modding
+    # to sequence_length - 1. This will cause anything at the last index to
+    # become 0.
+    for i, num in sequence:
+        pos = new_data.index((i, num))
+        new_pos = (num + pos) % mod
+
+        # While a slow and ineffcient operation in Python, this is fast enough
+        # for this task on anything modern.
+        #
+        # If we wanted to speed this up, we might employ some form of skip list
+        # or tree.
+        new_data.pop(pos)
+        new_data.insert(new_pos, num)
+
+    # We can now find our offset used to look up numbers, and get our answer.
+    start = new_data.index(0)
+    grove_x = new_data[(start + 1000) % (sequence_len)]
+    grove_y = new_data[(start + 2000) % (sequence_len)]
+    grove_z = new_data[(start + 3000) % (sequence_len)]
+
+    return grove_x + grove_y + grove_z
+
+
+def mix_numpy(filename):
+    """Return the sum of the grove coordinates, using NumPy.
+
+    Instead of moving numbers around a list, this keeps an array of the
+    original indexes of the numbers, in their mixed order. Moving a number
+    is then a matter of finding it and shifting the slice between its old
+    and new positions over by one, which NumPy does with a single copy.
+
+    Args:
+        filename (str):
+            The name of the input file.
+
+    Returns:
+        int:
+        The sum of the grove coordinates.
+    """
+    import numpy as np
+
+    nums = read_int_array(filename, columns=1)[:, 0]
+    sequence_len = len(nums)
+    mod = sequence_len - 1
+
+    # Shifting by the full length of the list (minus the number being moved)
+    # brings a number back where it started, so only the remainder matters.
+    shifts = (nums % mod).tolist()
+    mixed = np.arange(sequence_len)
+
+    for i, shift in enumerate(shifts):
+        pos = int((mixed == i).argmax())
+        new_pos = (pos + shift) % mod
+
+        if new_pos > pos:
+            mixed[pos:new_pos] = mixed[pos + 1:new_pos + 1]
+        elif new_pos < pos:
+            mixed[new_pos + 1:pos + 1] = mixed[new_pos:pos]
+
+        mixed[new_pos] = i
+
+    # Put the numbers in mixed order, and find our answer from the 0.
+    new_data = nums[mixed]
+    start = int(np.flatnonzero(new_data == 0)[0])
+
+    return sum(
+        int(new_data[(start + offset) % sequence_len])
+        for offset in (1000, 2000, 3000)
+    )
+
+
+solve = with_backends(mix,
+                      numpy=mix_numpy)
+
+
+if __name__ == '__main__':
+    print('Sum of encrypted coords = %s' % solve('input'))
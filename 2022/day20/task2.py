@@ -18,65 +18,140 @@
 # the lines.
 #
 # Pretty straight-forward addition to task1.py.
+#
+# The NumPy version (run with --backend=numpy) is the same as in task1.py,
+# just with the decryption key and the extra rounds.
+
+from aoc.backends import with_backends
+from aoc.inputs import open_input, read_int_array
 
 
 DECRYPTION_KEY = 811589153
 
 
-zero = None
-sequence = []
+def mix(filename):
+    """Return the sum of the grove coordinates.
 
-with open('input', 'r') as fp:
-    # Read each line from the file, storing as (index, num), so we can
-    # avoid any issues with duplicate numbers. The actual index value doesn't
-    # matter and could be anything unique.
-    #
-    # We're multiplying each stored number with our decryption key. This
-    # doesn't really affect anything in this implementation, but could affect
-    # implementations that assume numbers can be used as indexes into
-    # something. It also would impact the amount of positions something would
-    # need to shift, but we divide and use the remainder to generate our
-    # destination position.
+    Args:
+        filename (str):
+            The name of the input file.
+
+    Returns:
+        int:
+        The sum of the grove coordinates.
+    """
+    zero = None
+    sequence = []
+
+    with open_input(filename) as data:
+        # Read each line from the file, storing as (index, num), so we can
+        # avoid any issues with duplicate numbers. The actual index value
+        # doesn't matter and could be anything unique.
+        #
+        # We're multiplying each stored number with our decryption key. This
+        # doesn't really affect anything in this implementation, but could
+        # affect implementations that assume numbers can be used as indexes
+        # into something. It also would impact the amount of positions
+        # something would need to shift, but we divide and use the remainder to
+        # generate our destination position.
+        #
+        # Also, we store the location of the '0' item, so we can look it up
+        # after. We didn't have to do this in task1.py, because our resulting
+        # list was just numbers, not (i, num).
+        for i, (num,) in enumerate(data.iter_int_rows()):
+            num *= DECRYPTION_KEY
+            item = (i, num)
+
+            sequence.append(item)
+
+            if num == 0:
+                zero = item
+
+    sequence_len = len(sequence)
+    mod = sequence_len - 1
+    new_data = list(sequence)
+
+    # Run through the sequence 10 times, shifting numbers. We'll have positive
+    # and negative numbers to deal with.
     #
-    # Also, we store the location of the '0' item, so we can look it up after.
-    # We didn't have to do this in task1.py, because our resulting list was
-    # just numbers, not (i, num).
-    for i, line in enumerate(fp.readlines()):
-        num = int(line) * DECRYPTION_KEY
-        item = (i, num)
+    # Note that if an item shifts to the end of the list, it'll actually need
+    # to wrap around to index 0. We take care of this automatically by modding
+    # to sequence_length - 1. This will cause anything at the last index to
+    # become 0.
+    for n in range(10):
+        for i, num in sequence:
+            pos = new_data.index((i, num))
+            new_pos = (num + pos) % mod
 
-        sequence.append(item)
+            # While a slow and ineffcient operation in Python, this is fast
+            # enough for this task on anything modern.
+            #
+            # If we wanted to speed this up, we might employ some form of skip
+            # list or tree.
+            new_data.pop(pos)
+            new_data.insert(new_pos, (i, num))
 
-        if num == 0:
-            zero = item
+    # We can now find our offset used to look up numbers, and get our answer.
+    start = new_data.index(zero)
+    grove_x = new_data[(start + 1000) % (sequence_len)][1]
+    grove_y = new_data[(start + 2000) % (sequence_len)][1]
+    grove_z = new_data[(start + 3000) % (sequence_len)][1]
 
-sequence_len = len(sequence)
-mod = sequence_len - 1
-new_data = list(sequence)
+    return grove_x + grove_y + grove_z
 
-# Run through the sequence 10 times, shifting numbers. We'll have positive and
-# negative numbers to deal with.
-#
-# Note that if an item shifts to the end of the list, it'll actually need to
-# wrap around to index 0. We take care of this automatically by modding to
-# sequence_length - 1. This will cause anything at the last index to become 0.
-for n in range(10):
-    for i, num in sequence:
-        pos = new_data.index((i, num))
-        new_pos = (num + pos) % mod
-
-        # While a slow and ineffcient operation in Python, this is fast enough
-        # for this task on anything modern.
-        #
-        # If we wanted to speed this up, we might employ some form of skip list
-        # or tree.
-        new_data.pop(pos)
-        new_data.insert(new_pos, (i, num))
-
-# We can now find our offset used to look up numbers, and get our answer.
-start = new_data.index(zero)
-grove_x = new_data[(start + 1000) % (sequence_len)][1]
-grove_y = new_data[(start + 2000) % (sequence_len)][1]
-grove_z = new_data[(start + 3000) % (sequence_len)][1]
-
-print('Sum of encrypted coords = %s' % (grove_x + grove_y + grove_z))
+
+def mix_numpy(filename):
+    """Return the sum of the grove coordinates, using NumPy.
+
+    Instead of moving numbers around a list, this keeps an array of the
+    original indexes of the numbers, in their mixed order. Moving a number
+    is then a matter of finding it and shifting the slice between its old
+    and new positions over by one, which NumPy does with a single copy.
+
+    Args:
+        filename (str):
+            The name of the input file.
+
+    Returns:
+        int:
+        The sum of the grove coordinates.
+    """
+    import numpy as np
+
+    nums = read_int_array(filename, columns=1)[:, 0] * DECRYPTION_KEY
+    sequence_len = len(nums)
+    mod = sequence_len - 1
+
+    # Shifting by the full length of the list (minus the number being moved)
+    # brings a number back where it started, so only the remainder matters.
+    shifts = (nums % mod).tolist()
+    mixed = np.arange(sequence_len)
+
+    for n in range(10):
+        for i, shift in enumerate(shifts):
+            pos = int((mixed == i).argmax())
+            new_pos = (pos + shift) % mod
+
+            if new_pos > pos:
+                mixed[pos:new_pos] = mixed[pos + 1:new_pos + 1]
+            elif new_pos < pos:
+                mixed[new_pos + 1:pos + 1] = mixed[new_pos:pos]
+
+            mixed[new_pos] = i
+
+    # Put the numbers in mixed order, and find our answer from the 0.
+    new_data = nums[mixed]
+    start = int(np.flatnonzero(new_data == 0)[0])
+
+    return sum(
+        int(new_data[(start + offset) % sequence_len])
+        for offset in (1000, 2000, 3000)
+    )
+
+
+solve = with_backends(mix,
+                      numpy=mix_numpy)
+
+
+if __name__ == '__main__':
+    print('Sum of encrypted coords = %s' % solve('input'))
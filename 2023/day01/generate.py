@@ -0,0 +1,32 @@
+# Generates inputs for Day 1: https://adventofcode.com/2023/day/1
+#
+# Each line is a jumble of lowercase letters, digits, and spelled-out digits
+# ("one" through "nine"). Every line has at least one real digit, since task 1
+# needs one. The real input has 1,000 lines.
+
+import string
+
+
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven',
+               'eight', 'nine']
+
+
+def generate(scale, rng):
+    for i in range(1000 * scale):
+        parts = []
+
+        for j in range(rng.randint(1, 8)):
+            n = rng.random()
+
+            if n < 0.3:
+                parts.append(rng.choice(string.digits[1:]))
+            elif n < 0.6:
+                parts.append(rng.choice(DIGIT_WORDS))
+            else:
+                parts.append(''.join(rng.choices(string.ascii_lowercase,
+                                                 k=rng.randint(1, 6))))
+
+        parts.insert(rng.randint(0, len(parts)),
+                     rng.choice(string.digits[1:]))
+
+        yield ''.join(parts)
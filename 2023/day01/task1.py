@@ -42,12 +42,15 @@
 import re
 import timeit
 
+from aoc.inputs import accepts_streams, open_text_input
+
 
 # The more optimal character iteration approach.
-def iter_chars_approach():
+@accepts_streams
+def iter_chars_approach(source):
     total = 0
 
-    with open('input', 'r') as fp:
+    with open_text_input(source) as fp:
         for line in fp:
             digit1 = None
             digit2 = None
@@ -74,11 +77,12 @@ def iter_chars_approach():
 
 
 # The regex approach.
-def regex_approach():
+@accepts_streams
+def regex_approach(source):
     values_re = re.compile(r'^[^\d]*(\d).*?(\d)?[^\d]*$')
     total = 0
 
-    with open('input', 'r') as fp:
+    with open_text_input(source) as fp:
         for line in fp:
             m = values_re.match(line)
             assert m, line
@@ -95,18 +99,22 @@ def regex_approach():
     return total
 
 
-# We'll make sure we get the same value with either approach.
-answer1 = iter_chars_approach()
-answer2 = regex_approach()
+# The character iteration approach is the one we'll use for our answer.
+solve = iter_chars_approach
+
 
-assert answer1 == answer2
+if __name__ == '__main__':
+    # We'll make sure we get the same value with either approach.
+    answer1 = iter_chars_approach('input')
+    answer2 = regex_approach('input')
 
-print(f'Answer: {answer1}')
+    assert answer1 == answer2
 
+    print(f'Answer: {answer1}')
 
-# We can time our approaches:
-print()
-print('Iterate characters approach:',
-      timeit.timeit(iter_chars_approach, number=1000))
-print('Regex approach:',
-      timeit.timeit(regex_approach, number=1000))
+    # We can time our approaches:
+    print()
+    print('Iterate characters approach:',
+          timeit.timeit(lambda: iter_chars_approach('input'), number=1000))
+    print('Regex approach:',
+          timeit.timeit(lambda: regex_approach('input'), number=1000))
@@ -33,7 +33,11 @@
 #
 #    We're going to do this with a little Trie (a prefix tree).
 
-def trie_approach():
+from aoc.inputs import accepts_streams, open_text_input
+
+
+@accepts_streams
+def trie_approach(source):
     # Our trie needs are simple, but we do need two of them: One for
     # forward-search, one for reverse. This is just to let us more easily
     # walk backwards in each string.
@@ -149,7 +153,7 @@ def trie_approach():
     # We can now start processing lines.
     total = 0
 
-    with open('input', 'r') as fp:
+    with open_text_input(source) as fp:
         for line in fp:
             digit1 = find_number(line, trie=forward_trie)
             digit2 = find_number(line[::-1], trie=reverse_trie)
@@ -159,5 +163,9 @@ def trie_approach():
     return total
 
 
-total = trie_approach()
-print(f'Answer = {total}')
+solve = trie_approach
+
+
+if __name__ == '__main__':
+    total = trie_approach('input')
+    print(f'Answer = {total}')
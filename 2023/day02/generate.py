@@ -0,0 +1,19 @@
+# Generates inputs for Day 2: https://adventofcode.com/2023/day/2
+#
+# Each line is a game, with a few handfuls of colored cubes pulled from a bag.
+# The real input has 100 games.
+
+
+def generate(scale, rng):
+    for game_id in range(1, 100 * scale + 1):
+        hands = []
+
+        for i in range(rng.randint(1, 6)):
+            colors = rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+
+            hands.append(', '.join(
+                f'{rng.randint(1, 20)} {color}'
+                for color in colors
+            ))
+
+        yield f'Game {game_id}: {"; ".join(hands)}'
@@ -45,39 +45,40 @@
 
 import re
 
+from aoc.inputs import accepts_streams
+from aoc.parsing import iter_field_records
 
-def get_sum_possible_games():
-    line_re = re.compile(r'^Game (?P<id>\d+): (?P<hands>.+)$')
-    cube_count_re = re.compile(r'(?P<count>\d+) (?P<color>blue|green|red)')
+
+@accepts_streams
+def get_sum_possible_games(source):
+    game_re = re.compile(rb'Game (\d+): ([^\n]+)')
+    cube_count_re = re.compile(rb'(\d+) (blue|green|red)')
 
     cube_limits = {
-        'red': 12,
-        'green': 13,
-        'blue': 14,
+        b'red': 12,
+        b'green': 13,
+        b'blue': 14,
     }
 
     answer = 0
 
-    with open('input', 'r') as fp:
-        for line in fp:
-            m = line_re.match(line)
-            assert m
+    for game_id, hands in iter_field_records(source, game_re):
+        possible_game = True
 
-            possible_game = True
+        for count, color in cube_count_re.findall(hands):
+            if int(count) > cube_limits[color]:
+                possible_game = False
+                break
 
-            for cube_m in cube_count_re.finditer(m.group('hands')):
-                count = int(cube_m.group('count'))
-                color = cube_m.group('color')
+        if possible_game:
+            answer += int(game_id)
 
-                if count > cube_limits[color]:
-                    possible_game = False
-                    break
+    return answer
 
-            if possible_game:
-                answer += int(m.group('id'))
 
-    return answer
+solve = get_sum_possible_games
 
 
-answer = get_sum_possible_games()
-print(f'Answer = {answer}')
+if __name__ == '__main__':
+    answer = get_sum_possible_games('input')
+    print(f'Answer = {answer}')
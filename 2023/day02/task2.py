@@ -34,37 +34,38 @@
 
 import re
 
+from aoc.inputs import accepts_streams
+from aoc.parsing import iter_field_records
 
-def get_power_of_minimums():
-    line_re = re.compile(r'^Game (?P<id>\d+): (?P<hands>.+)$')
-    cube_count_re = re.compile(r'(?P<count>\d+) (?P<color>blue|green|red)')
+
+@accepts_streams
+def get_power_of_minimums(source):
+    game_re = re.compile(rb'Game (\d+): ([^\n]+)')
+    cube_count_re = re.compile(rb'(\d+) (blue|green|red)')
 
     answer = 0
 
-    with open('input', 'r') as fp:
-        for line in fp:
-            m = line_re.match(line)
-            assert m
+    for game_id, hands in iter_field_records(source, game_re):
+        max_cubes = {
+            b'red': 0,
+            b'green': 0,
+            b'blue': 0,
+        }
 
-            max_cubes = {
-                'red': 0,
-                'green': 0,
-                'blue': 0,
-            }
+        for count, color in cube_count_re.findall(hands):
+            max_cubes[color] = max(max_cubes[color],
+                                   int(count))
 
-            for cube_m in cube_count_re.finditer(m.group('hands')):
-                count = int(cube_m.group('count'))
-                color = cube_m.group('color')
+        answer += (max_cubes[b'red'] *
+                   max_cubes[b'green'] *
+                   max_cubes[b'blue'])
 
-                max_cubes[color] = max(max_cubes[color],
-                                       count)
+    return answer
 
-            answer += (max_cubes['red'] *
-                       max_cubes['green'] *
-                       max_cubes['blue'])
 
-    return answer
+solve = get_power_of_minimums
 
 
-answer = get_power_of_minimums()
-print(f'Answer = {answer}')
+if __name__ == '__main__':
+    answer = get_power_of_minimums('input')
+    print(f'Answer = {answer}')
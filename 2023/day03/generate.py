@@ -0,0 +1,34 @@
+# Generates inputs for Day 3: https://adventofcode.com/2023/day/3
+#
+# The input is a square engine schematic, with numbers and symbols scattered
+# across a background of periods. The real input is 140x140, and each side
+# grows by the square root of the scale.
+#
+# Numbers are kept at least one space apart on a row, so they don't run
+# together. Gears ("*") are the most common symbol, since task 2 looks for
+# them.
+
+import math
+
+
+SYMBOLS = '*****#+$/@=%&-'
+
+
+def generate(scale, rng):
+    size = round(140 * math.sqrt(scale))
+
+    for y in range(size):
+        row = []
+
+        while len(row) < size:
+            n = rng.random()
+
+            if n < 0.06 and len(row) + 4 <= size:
+                row += str(rng.randint(1, 999))
+                row.append('.')
+            elif n < 0.1:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append('.')
+
+        yield ''.join(row[:size])
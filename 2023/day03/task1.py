@@ -48,6 +48,8 @@
 #
 # 3. Making sure we never have more than three rows in memory at a time.
 
+from aoc.inputs import accepts_streams, open_text_input
+
 
 def scan_lines(fp):
     # So there's a few ways we could do this. We could manage a group of 3
@@ -122,10 +124,11 @@ def get_search_space(*, pre_line, scan_line, post_line, pos, first_digit):
             yield post_line, pos - 1
 
 
-def get_answer():
+@accepts_streams
+def get_answer(source):
     answer = 0
 
-    with open('input', 'r') as fp:
+    with open_text_input(source) as fp:
         for pre_line, scan_line, post_line in scan_lines(fp):
             # Work our way through the line, looking for numbers.
             num_buffer = ''
@@ -172,5 +175,9 @@ def get_answer():
     return answer
 
 
-answer = get_answer()
-print(f'Answer = {answer}')
+solve = get_answer
+
+
+if __name__ == '__main__':
+    answer = get_answer('input')
+    print(f'Answer = {answer}')
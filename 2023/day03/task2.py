@@ -30,6 +30,8 @@
 # process and then discard anything gears on any lines going out of scope.
 # Maybe later.
 
+from aoc.inputs import accepts_streams, open_text_input
+
 
 # This function is the same as in task1. It's documented here exactly the
 # same as before for convenience.
@@ -108,11 +110,12 @@ def get_search_space(*, pre_line, scan_line, post_line, pos, first_digit):
             yield post_line, 2, pos - 1
 
 
-def get_answer():
+@accepts_streams
+def get_answer(source):
     answer = 0
     gear_map = {}
 
-    with open('input', 'r') as fp:
+    with open_text_input(source) as fp:
         for row, (pre_line, scan_line, post_line) in enumerate(scan_lines(fp)):
             # Work our way through the line, looking for numbers.
             num_buffer = ''
@@ -176,5 +179,9 @@ def get_answer():
     return answer
 
 
-answer = get_answer()
-print(f'Answer = {answer}')
+solve = get_answer
+
+
+if __name__ == '__main__':
+    answer = get_answer('input')
+    print(f'Answer = {answer}')
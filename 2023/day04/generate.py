@@ -0,0 +1,30 @@
+# Generates inputs for Day 4: https://adventofcode.com/2023/day/4
+#
+# Each line is a scratchcard, with 10 winning numbers and 25 numbers we have.
+# The real input has 212 cards.
+#
+# In task 2, each matching number wins a copy of a later card, and copies win
+# copies of their own. If cards matched too often on average, the number of
+# copies would grow exponentially with the number of cards, so most cards
+# have no matches at all. Cards near the end never win cards past the end.
+
+
+def generate(scale, rng):
+    num_cards = 212 * scale
+
+    for card_num in range(1, num_cards + 1):
+        if rng.random() < 0.7:
+            num_matches = 0
+        else:
+            num_matches = min(rng.randint(1, 5), num_cards - card_num)
+
+        nums = rng.sample(range(1, 100), 35 - num_matches)
+        winning_nums = nums[:10]
+        our_nums = nums[10:] + winning_nums[:num_matches]
+        rng.shuffle(our_nums)
+
+        yield (
+            f'Card {card_num:>3}: '
+            f'{" ".join(f"{num:>2}" for num in winning_nums)} | '
+            f'{" ".join(f"{num:>2}" for num in our_nums)}'
+        )
@@ -47,27 +47,30 @@
 
 import re
 
+from aoc.inputs import accepts_streams
+from aoc.parsing import iter_field_records
 
-def get_answer():
-    line_re = re.compile(
-        r'^Card\s+\d+: (?P<winning_nums>[\d ]+) \| (?P<our_nums>[\d ]+)$')
-    answer = 0
 
-    with open('input', 'r') as fp:
-        for line in fp:
-            m = line_re.match(line)
-            assert m
+@accepts_streams
+def get_answer(source):
+    card_re = re.compile(rb'Card +\d+: ([\d ]+) \| ([\d ]+)')
+    answer = 0
 
-            winning_nums = set(m.group('winning_nums').split())
-            our_nums = set(m.group('our_nums').split())
+    for winning_nums, our_nums in iter_field_records(source, card_re):
+        winning_nums = set(winning_nums.split())
+        our_nums = set(our_nums.split())
 
-            num_matches = len(winning_nums & our_nums)
+        num_matches = len(winning_nums & our_nums)
 
-            if num_matches > 0:
-                answer += (1 << (num_matches - 1))
+        if num_matches > 0:
+            answer += (1 << (num_matches - 1))
 
     return answer
 
 
-answer = get_answer()
-print(f'Answer = {answer}')
+solve = get_answer
+
+
+if __name__ == '__main__':
+    answer = get_answer('input')
+    print(f'Answer = {answer}')
@@ -52,49 +52,54 @@
 import re
 from collections import defaultdict
 
+from aoc.inputs import accepts_streams
+from aoc.parsing import iter_field_records
 
-def get_answer():
-    line_re = re.compile(
-        r'^Card\s+(?P<card_num>\d+): '
-        r'(?P<winning_nums>[\d ]+) \| '
-        r'(?P<our_nums>[\d ]+)$'
+
+@accepts_streams
+def get_answer(source):
+    card_re = re.compile(
+        rb'Card +(\d+): '
+        rb'([\d ]+) \| '
+        rb'([\d ]+)'
     )
 
     total_cards = 0
     card_multipliers = defaultdict(int)
 
-    with open('input', 'r') as fp:
-        for line in fp:
-            m = line_re.match(line)
-            assert m
-
-            card_num = int(m.group('card_num'))
+    for card_num, winning_nums, our_nums in iter_field_records(source,
+                                                               card_re):
+        card_num = int(card_num)
 
-            # Clear out any prior tracking for previous lines that we'll never
-            # again update.
-            card_multipliers.pop(card_num - 1, None)
+        # Clear out any prior tracking for previous lines that we'll never
+        # again update.
+        card_multipliers.pop(card_num - 1, None)
 
-            # Add at least one card to the total. If there's a multiplier,
-            # we'll add those cards plus this one.
-            multiplier = card_multipliers.get(card_num, 0) + 1
-            total_cards += multiplier
+        # Add at least one card to the total. If there's a multiplier,
+        # we'll add those cards plus this one.
+        multiplier = card_multipliers.get(card_num, 0) + 1
+        total_cards += multiplier
 
-            winning_nums = set(m.group('winning_nums').split())
-            our_nums = set(m.group('our_nums').split())
+        winning_nums = set(winning_nums.split())
+        our_nums = set(our_nums.split())
 
-            num_matches = len(winning_nums & our_nums)
+        num_matches = len(winning_nums & our_nums)
 
-            if num_matches > 0:
-                # Populate the card multipliers with any cards we just won.
-                #
-                # Note the + 1 at the end. This is because range() takes the
-                # upper bound as exclusive rather than inclusive. We want the
-                # value of card_num + num_matches to be in the result.
-                for i in range(card_num + 1, card_num + num_matches + 1):
-                    card_multipliers[i] += multiplier
+        if num_matches > 0:
+            # Populate the card multipliers with any cards we just won.
+            #
+            # Note the + 1 at the end. This is because range() takes the
+            # upper bound as exclusive rather than inclusive. We want the
+            # value of card_num + num_matches to be in the result.
+            for i in range(card_num + 1, card_num + num_matches + 1):
+                card_multipliers[i] += multiplier
 
     return total_cards
 
 
-answer = get_answer()
-print(f'Answer = {answer}')
+solve = get_answer
+
+
+if __name__ == '__main__':
+    answer = get_answer('input')
+    print(f'Answer = {answer}')
@@ -0,0 +1,27 @@
+# Generates inputs for Day 1: https://adventofcode.com/2024/day/1
+#
+# Each line has a location ID from each of the two lists. Some IDs from the
+# left list show up (possibly many times) in the right list, which is what
+# task 2 counts. The real input has 1,000 lines.
+
+import random
+from typing import Iterator
+
+
+def generate(
+    scale: int,
+    rng: random.Random,
+) -> Iterator[str]:
+    count = 1000 * scale
+    left_ids = [
+        rng.randint(10000, 99999)
+        for i in range(count)
+    ]
+    right_ids = [
+        rng.choice(left_ids) if rng.random() < 0.3
+        else rng.randint(10000, 99999)
+        for i in range(count)
+    ]
+
+    for left_id, right_id in zip(left_ids, right_ids):
+        yield f'{left_id}   {right_id}'
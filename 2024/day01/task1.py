@@ -21,21 +21,22 @@
 # For our first task, we're going to read out the lists into two arrays,
 # sort them, and then run through the results and calculate the sum of each
 # delta in one last go.
+#
+# This is also a perfect fit for NumPy (run with --backend=numpy), which can
+# parse both columns into one array, sort them, and sum the deltas without a
+# single Python-level loop.
+
+from aoc.backends import with_backends
+from aoc.inputs import (InputSource, accepts_streams, read_int_array,
+                        read_int_columns)
+
 
+@accepts_streams
 def calc_distances(
-    input_filename: str,
+    source: InputSource,
 ) -> int:
-    location_ids1: list[int] = []
-    location_ids2: list[int] = []
-
     # Read through the input, populating two lists of IDs.
-    with open(input_filename, 'r') as fp:
-        for line in fp:
-            parts = line.split('   ')
-            assert len(parts) == 2
-
-            location_ids1.append(int(parts[0]))
-            location_ids2.append(int(parts[1]))
+    location_ids1, location_ids2 = read_int_columns(source)
 
     # Sort these from lowest numbers to highest.
     location_ids1 = sorted(location_ids1)
@@ -49,6 +50,23 @@ def calc_distances(
     )
 
 
+@accepts_streams
+def calc_distances_numpy(
+    source: InputSource,
+) -> int:
+    import numpy as np
+
+    # Sort each column on its own, and then sum the deltas between rows.
+    location_ids = np.sort(read_int_array(source, columns=2),
+                           axis=0)
+
+    return int(np.abs(location_ids[:, 0] - location_ids[:, 1]).sum())
+
+
+solve = with_backends(calc_distances,
+                      numpy=calc_distances_numpy)
+
+
 if __name__ == '__main__':
     # First, let's verify our sample's answer.
     answer = calc_distances('sample-input')
@@ -14,23 +14,25 @@
 # The trick in this input is that we have values in list 2 that aren't in
 # list 1, so we can't just work with list 2's items. This requires keeping
 # list 1 and iterating through that.
+#
+# The NumPy version (run with --backend=numpy) counts the unique values in
+# list 2, and then looks up every location in list 1 against those with a
+# binary search, all at once.
 
 from collections import Counter
 
+from aoc.backends import with_backends
+from aoc.inputs import (InputSource, accepts_streams, read_int_array,
+                        read_int_columns)
+
 
+@accepts_streams
 def calc_score(
-    input_filename: str,
+    source: InputSource,
 ) -> int:
-    hits = Counter[int]()
-    location_ids1: list[int] = []
-
-    with open(input_filename, 'r') as fp:
-        for line in fp:
-            parts = line.split('   ')
-            assert len(parts) == 2
+    location_ids1, location_ids2 = read_int_columns(source)
 
-            location_ids1.append(int(parts[0]))
-            hits[int(parts[1])] += 1
+    hits = Counter[int](location_ids2)
 
     return sum(
         location_id * hits[location_id]
@@ -38,6 +40,30 @@ def calc_score(
     )
 
 
+@accepts_streams
+def calc_score_numpy(
+    source: InputSource,
+) -> int:
+    import numpy as np
+
+    location_ids = read_int_array(source, columns=2)
+    location_ids1 = location_ids[:, 0]
+
+    # Find where each location in list 1 would be in list 2's sorted unique
+    # values. Anything past the end, or not equal to the value found, has no
+    # hits.
+    values, hits = np.unique(location_ids[:, 1], return_counts=True)
+    indexes = np.minimum(np.searchsorted(values, location_ids1),
+                         len(values) - 1)
+    hits = np.where(values[indexes] == location_ids1, hits[indexes], 0)
+
+    return int((location_ids1 * hits).sum())
+
+
+solve = with_backends(calc_score,
+                      numpy=calc_score_numpy)
+
+
 if __name__ == '__main__':
     # First, let's verify our sample's answer.
     answer = calc_score('sample-input')
@@ -0,0 +1,28 @@
+# Generates inputs for Day 2: https://adventofcode.com/2024/day/2
+#
+# Each line is a report of 5 to 8 levels. Reports start out safe (steadily
+# increasing or decreasing by 1 to 3), and then some have one or two levels
+# replaced, which task 2 may or may not be able to fix. The real input has
+# 1,000 reports.
+
+import random
+from typing import Iterator
+
+
+def generate(
+    scale: int,
+    rng: random.Random,
+) -> Iterator[str]:
+    for i in range(1000 * scale):
+        direction = rng.choice((-1, 1))
+        level = rng.randint(20, 70)
+        levels = []
+
+        for j in range(rng.randint(5, 8)):
+            levels.append(level)
+            level += direction * rng.randint(1, 3)
+
+        for j in range(rng.choice((0, 0, 1, 1, 2))):
+            levels[rng.randrange(len(levels))] = rng.randint(1, 99)
+
+        yield ' '.join(str(level) for level in levels)
@@ -16,12 +16,16 @@
 #
 # 2. Run through the items and compare them.
 
+from aoc.inputs import InputSource, accepts_streams, open_text_input
+
+
+@accepts_streams
 def calc_safe_reports(
-    filename: str,
+    source: InputSource,
 ) -> int:
     answer: int = 0
 
-    with open(filename, 'r') as fp:
+    with open_text_input(source) as fp:
         for line in fp:
             levels = [
                 int(value)
@@ -57,6 +61,9 @@ def calc_safe_reports(
     return answer
 
 
+solve = calc_safe_reports
+
+
 if __name__ == '__main__':
     # First, let's verify our sample's answer.
     answer = calc_safe_reports('sample-input')
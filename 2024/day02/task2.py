@@ -15,6 +15,8 @@
 
 from typing import Optional
 
+from aoc.inputs import InputSource, accepts_streams, open_text_input
+
 
 def check_report(
     report: list[int],
@@ -31,12 +33,13 @@ def check_report(
     return None
 
 
+@accepts_streams
 def calc_safe_reports(
-    filename: str,
+    source: InputSource,
 ) -> int:
     answer: int = 0
 
-    with open(filename, 'r') as fp:
+    with open_text_input(source) as fp:
         for line in fp:
             levels = [
                 int(value)
@@ -86,6 +89,9 @@ def calc_safe_reports(
     return answer
 
 
+solve = calc_safe_reports
+
+
 if __name__ == '__main__':
     # First, let's verify our sample's answer.
     answer = calc_safe_reports('sample-input')
@@ -0,0 +1,45 @@
+# Generates inputs for Day 3: https://adventofcode.com/2024/day/3
+#
+# The input is corrupted memory: valid mul(X,Y), do(), and don't()
+# instructions mixed in with junk, including instructions that are almost
+# valid. The real input has 6 lines of about 3,300 characters each.
+
+import random
+import string
+from typing import Iterator
+
+
+JUNK = [
+    'mul(4*', 'mul ( 2 , 4 )', 'mul[3,7]', 'mul(32,64]', '?(12,34)',
+    'do_not_mul(5,5)', 'from()', 'what()', 'select()', 'who()', 'when()',
+    'where()', 'how()', 'why()', 'don\'t', 'do(', 'mul(',
+]
+
+
+def generate(
+    scale: int,
+    rng: random.Random,
+) -> Iterator[str]:
+    for i in range(6 * scale):
+        parts = []
+        length = 0
+
+        while length < 3300:
+            n = rng.random()
+
+            if n < 0.35:
+                part = f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})'
+            elif n < 0.4:
+                part = 'do()'
+            elif n < 0.45:
+                part = "don't()"
+            elif n < 0.7:
+                part = rng.choice(JUNK)
+            else:
+                part = ''.join(rng.choices(string.punctuation + ' ',
+                                           k=rng.randint(1, 4)))
+
+            parts.append(part)
+            length += len(part)
+
+        yield ''.join(parts)
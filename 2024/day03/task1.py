@@ -19,18 +19,20 @@
 # of regexes, let's iterate through all the self-contained mul(X,Y)
 # instructions we can find on each line and process them.
 
-import re
+from aoc.inputs import InputSource, accepts_streams, open_text_input
+from aoc.patterns import lazy_compile
 
 
-MUL_RE = re.compile(r'mul\((\d{1,3}),(\d{1,3})\)')
+MUL_RE = lazy_compile(r'mul\((\d{1,3}),(\d{1,3})\)')
 
 
+@accepts_streams
 def safely_run_muls(
-    filename: str,
+    source: InputSource,
 ) -> int:
     answer: int = 0
 
-    with open(filename, 'r') as fp:
+    with open_text_input(source) as fp:
         for line in fp:
             for m in MUL_RE.finditer(line):
                 # We know these are integers, since we matched against \d,
@@ -40,6 +42,9 @@ def safely_run_muls(
     return answer
 
 
+solve = safely_run_muls
+
+
 if __name__ == '__main__':
     # First, let's verify our sample's answer.
     answer = safely_run_muls('sample-input1')
@@ -38,6 +38,8 @@
 
 import re
 
+from aoc.inputs import InputSource, accepts_streams, open_text_input
+
 
 class State:
     mul_enabled: bool = True
@@ -111,12 +113,13 @@ INSTRUCTION_RE = re.compile(r'(?P<name>%s)\('
                             % '|'.join(INSTRUCTIONS.keys()))
 
 
+@accepts_streams
 def safely_run_instructions(
-    filename: str,
+    source: InputSource,
 ) -> int:
     state = State()
 
-    with open(filename, 'r') as fp:
+    with open_text_input(source) as fp:
         for line in fp:
             ip: int = 0
             line_len = len(line)
@@ -154,6 +157,9 @@ def safely_run_instructions(
     return state.answer
 
 
+solve = safely_run_instructions
+
+
 if __name__ == '__main__':
     # First, let's verify our sample's answer.
     answer = safely_run_instructions('sample-input2')
@@ -0,0 +1,19 @@
+# Generates inputs for Day 4: https://adventofcode.com/2024/day/4
+#
+# The input is a square word search made up of the letters X, M, A, and S.
+# The real input is 140x140, and each side grows by the square root of the
+# scale.
+
+import math
+import random
+from typing import Iterator
+
+
+def generate(
+    scale: int,
+    rng: random.Random,
+) -> Iterator[str]:
+    size = round(140 * math.sqrt(scale))
+
+    for y in range(size):
+        yield ''.join(rng.choices('XMAS', k=size))
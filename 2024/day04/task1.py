@@ -10,51 +10,48 @@
 # To do this, we'll be iterating through each row and column in the input
 # and ask for an XMAS count starting at that position.
 #
-# That XMAS counter function (count_xmas) will compute the row/column deltas
-# to search and just scan in that direction. We need to avoid running out of
-# bounds, but otherwise this is pretty straight-forward.
+# That XMAS counter function (count_xmas) will scan in each of the 8
+# directions for the rest of the word. The input is loaded into a Grid with
+# a 3-cell border, which is as far as we could ever scan past the edge, so we
+# don't need any bounds checks. Each direction is just a precomputed offset.
+#
+# We also don't visit every cell. We let the grid find each "X" for us, and
+# start from there.
+#
+# For much larger inputs, there's also a NumPy version (run with
+# --backend=numpy). Rather than scanning from each "X", it checks every cell
+# at once for each direction, comparing the whole grid against copies of
+# itself shifted 1, 2, and 3 cells over.
+
+from aoc.backends import with_backends
+from aoc.grid import Grid
+
+
+# The letter starting each "XMAS" (for the NumPy version).
+X = ord('X')
+
+# The letters we'll be scanning for after the "X".
+M = ord('M')
+A = ord('A')
+S = ord('S')
 
 
 def count_xmas(
     *,
-    lines: list[str],
-    x: int,
-    y: int,
-    width: int,
-    height: int,
+    data: bytearray,
+    offset: int,
+    deltas: tuple[int, ...],
 ) -> int:
-    if lines[y][x] != 'X':
-        # Nothing to find here.
-        return 0
-
     count: int = 0
 
-    # Set up our deltas for the directions we'll be scanning.
-    for dy in (-1, 0, 1):
-        for dx in (-1, 0, 1):
-            if dx == 0 and dy == 0:
-                # We won't be moving, so skip it.
-                continue
-
-            # Scan until we determine we won't find at a location. We'll
-            # be iterating through each letter we want to find in order,
-            # navigating in that direction. If we run out of bounds or we
-            # see any other character, we fail this.
-            found = True
-
-            for i, expected_c in enumerate('MAS', start=1):
-                pos_x = x + (i * dx)
-                pos_y = y + (i * dy)
-
-                if (not (0 <= pos_x < width) or
-                    not (0 <= pos_y < height) or
-                    lines[pos_y][pos_x] != expected_c):
-                    # We won't find it here, so skip.
-                    found = False
-                    break
-
-            if found:
-                count += 1
+    # Scan in each direction. We'll be checking each letter we want to find
+    # in order, navigating in that direction. If we see any other character
+    # (including the border), we fail this.
+    for delta in deltas:
+        if (data[offset + delta] == M and
+            data[offset + delta * 2] == A and
+            data[offset + delta * 3] == S):
+            count += 1
 
     return count
 
@@ -62,26 +59,52 @@ def count_xmas(
 def find_all_xmas(
     filename: str,
 ) -> int:
-    global board
-    answer: int = 0
-
-    with open(filename, 'r') as fp:
-        lines = fp.readlines()
-
-    width = len(lines[0])
-    height = len(lines)
-
-    # Go through each row, and then each character in the row, and count the
-    # number of XMAS strings.
-    for y, line in enumerate(lines):
-        for x in range(len(line)):
-            answer += count_xmas(lines=lines,
-                                 x=x,
-                                 y=y,
-                                 width=width,
-                                 height=height)
-
-    return answer
+    grid = Grid.from_file(filename, padding=3)
+    data = grid.data
+    deltas = grid.offsets8
+
+    # Go through each "X" in the grid and count the number of XMAS strings
+    # starting from it.
+    return sum(
+        count_xmas(data=data,
+                   offset=offset,
+                   deltas=deltas)
+        for offset in grid.iter_offsets(b'X')
+    )
+
+
+def find_all_xmas_numpy(
+    filename: str,
+) -> int:
+    grid = Grid.from_file(filename, padding=3)
+    letters = grid.to_numpy(include_border=True)
+    height, width = letters.shape
+
+    def _shifted(
+        dx: int,
+        dy: int,
+    ):
+        # Return a view of the grid's interior, shifted by a number of cells.
+        # The border is wide enough that this never goes past the edge.
+        return letters[3 + dy:height - 3 + dy,
+                       3 + dx:width - 3 + dx]
+
+    is_x = _shifted(0, 0) == X
+    count: int = 0
+
+    for dx, dy in ((0, -1), (1, -1), (1, 0), (1, 1),
+                   (0, 1), (-1, 1), (-1, 0), (-1, -1)):
+        found = (is_x &
+                 (_shifted(dx, dy) == M) &
+                 (_shifted(dx * 2, dy * 2) == A) &
+                 (_shifted(dx * 3, dy * 3) == S))
+        count += int(found.sum())
+
+    return count
+
+
+solve = with_backends(find_all_xmas,
+                      numpy=find_all_xmas_numpy)
 
 
 if __name__ == '__main__':
@@ -10,38 +10,43 @@
 # start with an "A" (the middle of a "MAS"). We then start looking at the
 # corners adjacent to that, looking for an "M" and a "S". If we find 2 of
 # these, then we found it!
+#
+# As with task 1, the input is loaded into a Grid with a border, so corners
+# past the edge are just border cells and need no bounds checks.
+#
+# The NumPy version (run with --backend=numpy) checks every "A" at once. Each
+# diagonal through it must have an "M" at one end and an "S" at the other.
+
+from aoc.backends import with_backends
+from aoc.grid import Grid
+
+
+# The letter in the middle of each "X" (for the NumPy version).
+A = ord('A')
+
+# The letters we'll be checking at the corners.
+M = ord('M')
+S = ord('S')
+
 
 def has_xmas(
     *,
-    lines: list[str],
-    x: int,
-    y: int,
-    width: int,
-    height: int,
+    data: bytearray,
+    offset: int,
+    stride: int,
 ) -> bool:
-    if lines[y][x] != 'A':
-        # Nothing to find here.
-        return False
-
     count: int = 0
 
     # We can inline all the corners we want to check. If we find "M" and "S"
     # at opposing corners, we have a "MAS"!
-    for pos_x1, pos_y1, pos_x2, pos_y2 in ((x - 1, y - 1, x + 1, y + 1),
-                                           (x + 1, y - 1, x - 1, y + 1),
-                                           (x - 1, y + 1, x + 1, y - 1),
-                                           (x + 1, y + 1, x - 1, y - 1)):
-        if (0 <= pos_x1 < width and
-            0 <= pos_x2 < width and
-            0 <= pos_y1 < height and
-            0 <= pos_y2 < height and
-            lines[pos_y1][pos_x1] == 'M' and
-            lines[pos_y2][pos_x2] == 'S'):
+    for delta in (-stride - 1, -stride + 1, stride - 1, stride + 1):
+        if (data[offset + delta] == M and
+            data[offset - delta] == S):
             # We found a "MAS"!
             count += 1
 
-        if count == 2:
-            return True
+            if count == 2:
+                return True
 
     return False
 
@@ -49,27 +54,46 @@ def has_xmas(
 def find_all_xmas(
     filename: str,
 ) -> int:
-    global board
-    answer: int = 0
-
-    with open(filename, 'r') as fp:
-        lines = fp.readlines()
-
-    width = len(lines[0])
-    height = len(lines)
-
-    # Go through each row, and then each character in the row, and count the
-    # number of X-shaped MAS string pairs.
-    for y, line in enumerate(lines):
-        for x in range(len(line)):
-            if has_xmas(lines=lines,
-                        x=x,
-                        y=y,
-                        width=width,
-                        height=height):
-                answer += 1
-
-    return answer
+    grid = Grid.from_file(filename)
+    data = grid.data
+    stride = grid.stride
+
+    # Go through each "A" in the grid, and count the number of X-shaped MAS
+    # string pairs centered on it.
+    return sum(
+        has_xmas(data=data,
+                 offset=offset,
+                 stride=stride)
+        for offset in grid.iter_offsets(b'A')
+    )
+
+
+def find_all_xmas_numpy(
+    filename: str,
+) -> int:
+    grid = Grid.from_file(filename)
+    letters = grid.to_numpy(include_border=True)
+
+    # The grid's interior, and each corner of every cell in it.
+    center = letters[1:-1, 1:-1]
+    top_left = letters[:-2, :-2]
+    top_right = letters[:-2, 2:]
+    bottom_left = letters[2:, :-2]
+    bottom_right = letters[2:, 2:]
+
+    found = (
+        (center == A) &
+        (((top_left == M) & (bottom_right == S)) |
+         ((top_left == S) & (bottom_right == M))) &
+        (((top_right == M) & (bottom_left == S)) |
+         ((top_right == S) & (bottom_left == M)))
+    )
+
+    return int(found.sum())
+
+
+solve = with_backends(find_all_xmas,
+                      numpy=find_all_xmas_numpy)
 
 
 if __name__ == '__main__':
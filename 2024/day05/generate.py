@@ -0,0 +1,41 @@
+# Generates inputs for Day 5: https://adventofcode.com/2024/day/5
+#
+# The input is a list of page ordering rules ("X|Y"), a blank line, and then a
+# list of updates (comma-separated page numbers).
+#
+# Like the real input, there are 49 pages with a rule for every pair of them,
+# so the rules are the same at every scale. Updates are an odd number of
+# distinct pages, about half of them already in order. The real input has
+# about 200 updates.
+
+import random
+from typing import Iterator
+
+
+def generate(
+    scale: int,
+    rng: random.Random,
+) -> Iterator[str]:
+    pages = rng.sample(range(10, 100), 49)
+    page_order = {
+        page: i
+        for i, page in enumerate(pages)
+    }
+
+    rules = [
+        f'{page1}|{page2}'
+        for i, page1 in enumerate(pages)
+        for page2 in pages[i + 1:]
+    ]
+    rng.shuffle(rules)
+
+    yield from rules
+    yield ''
+
+    for i in range(200 * scale):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+
+        if rng.random() < 0.5:
+            update.sort(key=lambda page: page_order[page])
+
+        yield ','.join(str(page) for page in update)
@@ -77,6 +77,9 @@ def printer_fiasco(
     return answer
 
 
+solve = printer_fiasco
+
+
 if __name__ == '__main__':
     # First, let's verify our sample's answer.
     answer = printer_fiasco('sample-input')
@@ -0,0 +1,71 @@
+# Generates inputs for Day 6: https://adventofcode.com/2024/day/6
+#
+# The input is a square map of obstacles ("#") and a guard ("^") facing up.
+# The real input is 130x130 with about 5% of the map covered in obstacles,
+# and each side grows by the square root of the scale.
+#
+# Task 1 needs the guard to eventually walk off the map. Some maps would trap
+# the guard in a loop instead, so we simulate the walk and move the guard
+# somewhere else until they get out.
+
+import math
+import random
+from typing import Iterator
+
+
+def walks_off_map(
+    rows: list[bytearray],
+    start_x: int,
+    start_y: int,
+) -> bool:
+    size = len(rows)
+    x = start_x
+    y = start_y
+    dx = 0
+    dy = -1
+    seen = set[tuple[int, int, int, int]]()
+
+    while True:
+        state = (x, y, dx, dy)
+
+        if state in seen:
+            return False
+
+        seen.add(state)
+
+        new_x = x + dx
+        new_y = y + dy
+
+        if not (0 <= new_x < size and 0 <= new_y < size):
+            return True
+
+        if rows[new_y][new_x] == ord('#'):
+            # Turn right.
+            dx, dy = -dy, dx
+        else:
+            x = new_x
+            y = new_y
+
+
+def generate(
+    scale: int,
+    rng: random.Random,
+) -> Iterator[str]:
+    size = round(130 * math.sqrt(scale))
+    rows = [
+        bytearray(rng.choices(b'#.', weights=(5, 95), k=size))
+        for y in range(size)
+    ]
+
+    while True:
+        start_x = rng.randrange(size)
+        start_y = rng.randrange(size)
+
+        if (rows[start_y][start_x] == ord('.') and
+            walks_off_map(rows, start_x, start_y)):
+            break
+
+    rows[start_y][start_x] = ord('^')
+
+    for row in rows:
+        yield row.decode()
@@ -7,83 +7,61 @@
 # turning 90 degrees, and continuing on until we walk off the board.
 # The answer is the number of distinct positions we hit.
 #
-# This is pretty trivial. We only need to know the starting position, the
-# positions of each obstacle, the dimensions of the board, and the deltas
-# for movement. We don't want to store the entire board, since that's a
-# waste of memory -- we don't need data on empty spaces!
+# This is pretty trivial. We load the board into a Grid, which stores one byte
+# per cell with a border around the outside. Walking is then just adding an
+# offset for the current direction, and walking off the board is just landing
+# on a border cell, so there are no bounds checks.
 #
-# We'll just loop until we're off the board, checking our obstacles set and
-# otherwise updating positions. Every time we loop, we add the current
-# position to our set (duplicates are weeded out automatically), and the
-# length of that set is our answer.
+# We'll just loop until we're off the board, checking for obstacles in the
+# grid and otherwise updating positions. Every time we loop, we mark the
+# current position as visited, and the number of visited positions is our
+# answer.
 
+from aoc.grid import Grid
 
-def rotate_right(
-    dx: int,
-    dy: int,
-) -> tuple[int, int]:
-    if dx == 0:
-        # We're going up or down. Go left or right.
-        return -dy, 0
-    else:
-        # We're going left or right. Go up or down.
-        return 0, dx
+
+OBSTACLE = ord(b'#')
+PLAYER = ord(b'^')
+OUTSIDE = ord(b'@')
 
 
 def count_movement_positions(
     filename: str,
 ) -> int:
-    obstacles: set[tuple[int, int]] = set()
-    width: int = -1
-    height: int = -1
-    pos_x: int = -1
-    pos_y: int = -1
-
-    OBSTACLE = ord(b'#')
-    PLAYER = ord(b'^')
-    SPACE = ord(b'.')
-
-    # Read the board, looking for the starting position and any obstacles.
-    # We won't load every byte of the board, since we don't care about the
-    # empty spaces.
-    with open(filename, 'rb') as fp:
-        x = -1
-        y = -1
-
-        for y, line in enumerate(fp.readlines()):
-            for x, c in enumerate(line):
-                # Most will be a ".", so check that first.
-                if c != SPACE:
-                    if c == OBSTACLE:
-                        obstacles.add((x, y))
-                    elif c == PLAYER:
-                        pos_x = x
-                        pos_y = y
-
-        width = x + 1
-        height = y + 1
+    # Read the board into a grid, with a border of cells marking the outside
+    # of the board. That way, walking off the board is just another cell to
+    # check, rather than a bounds check on every step.
+    grid = Grid.from_file(filename, border=OUTSIDE)
+    data = grid.data
+
+    pos = grid.find(PLAYER)
+    assert pos is not None
+
+    # We'll move by offsets in the grid. Directions are indexes into these
+    # offsets (up, right, down, left), so turning right is just moving to the
+    # next index.
+    directions = grid.offsets4
+    direction: int = 0
 
     # We now know everything we need to about the board. Start walking.
-    positions: set[tuple[int, int]] = set()
-    dx: int = 0
-    dy: int = -1
+    positions = bytearray(len(data))
 
     # Keep walking until we break out of this by walking off the grid.
-    while (0 <= pos_x < width and
-           0 <= pos_y < height):
-        positions.add((pos_x, pos_y))
-        new_x = pos_x + dx
-        new_y = pos_y + dy
+    while data[pos] != OUTSIDE:
+        positions[pos] = 1
+        new_pos = pos + directions[direction]
 
-        if (new_x, new_y) in obstacles:
+        if data[new_pos] == OBSTACLE:
             # We'd hit an obstacle. Turn right 90 degrees.
-            dx, dy = rotate_right(dx, dy)
+            direction = (direction + 1) % 4
         else:
             # We walked! Record the position in our set of distinct positions.
-            pos_x = new_x
-            pos_y = new_y
+            pos = new_pos
+
+    return positions.count(1)
+
 
-    return len(positions)
+solve = count_movement_positions
 
 
 if __name__ == '__main__':
@@ -19,71 +19,62 @@
 #
 # 3. Record any unique obstructions that result in a loop, and use the total
 #    as our answer.
+#
+# The board is loaded into a Grid, so obstructions are placed directly in the
+# grid while simulating, and positions and directions are small integers that
+# are cheap to track.
+
+from typing import Iterator
 
-from typing import Iterator, Optional
+from aoc import memory
+from aoc.grid import Grid
 
 
-def rotate_right(
-    dx: int,
-    dy: int,
-) -> tuple[int, int]:
-    if dx == 0:
-        # We're going up or down. Go left or right.
-        return -dy, 0
-    else:
-        # We're going left or right. Go up or down.
-        return 0, dx
+OBSTACLE = ord(b'#')
+PLAYER = ord(b'^')
+OUTSIDE = ord(b'@')
 
 
 def walk_guard(
     *,
-    start_x: int,
-    start_y: int,
-    dx: int,
-    dy: int,
-    width: int,
-    height: int,
-    obstacles: set[tuple[int, int]],
-    obstruction: Optional[tuple[int, int]] = None,
-) -> Iterator[tuple[int, int, int, int]]:
-    pos_x = start_x
-    pos_y = start_y
+    start_pos: int,
+    direction: int,
+    data: bytearray,
+    directions: tuple[int, ...],
+) -> Iterator[tuple[int, int]]:
+    pos = start_pos
 
     # Keep walking until we break out of this by walking off the grid.
-    while (0 <= pos_x < width and
-           0 <= pos_y < height):
-        yield pos_x, pos_y, dx, dy
+    while data[pos] != OUTSIDE:
+        yield pos, direction
 
-        new_pos = (pos_x + dx,
-                   pos_y + dy)
+        new_pos = pos + directions[direction]
 
-        if new_pos == obstruction or new_pos in obstacles:
+        if data[new_pos] == OBSTACLE:
             # We'd hit an obstacle. Turn right 90 degrees.
-            dx, dy = rotate_right(dx, dy)
+            direction = (direction + 1) % 4
         else:
-            pos_x, pos_y = new_pos
+            pos = new_pos
 
 
 def does_path_loop(
     *,
-    start_x: int,
-    start_y: int,
-    dx: int,
-    dy: int,
+    data: bytearray,
     **kwargs,
 ) -> bool:
-    seen: set[tuple[int, int, int, int]] = set()
-
-    for pos_info in walk_guard(start_x=start_x,
-                               start_y=start_y,
-                               dx=dx,
-                               dy=dy,
-                               **kwargs):
-        if pos_info in seen:
+    # Each cell tracks the directions we've been facing in it, one bit per
+    # direction.
+    seen = bytearray(len(data))
+
+    for pos, direction in walk_guard(data=data,
+                                     **kwargs):
+        bit = 1 << direction
+
+        if seen[pos] & bit:
             # We looped!
             return True
 
-        seen.add(pos_info)
+        seen[pos] |= bit
 
     return False
 
@@ -91,69 +82,59 @@ def does_path_loop(
 def count_movement_positions(
     filename: str,
 ) -> int:
-    obstacles: set[tuple[int, int]] = set()
-    width: int = -1
-    height: int = -1
-    start_x: int = -1
-    start_y: int = -1
-    start_dx = 0
-    start_dy = -1
-
-    OBSTACLE = ord(b'#')
-    PLAYER = ord(b'^')
-    SPACE = ord(b'.')
-
-    # Read the board, looking for the starting position and any obstacles.
-    # We won't load every byte of the board, since we don't care about the
-    # empty spaces.
-    with open(filename, 'rb') as fp:
-        x = -1
-        y = -1
-
-        for y, line in enumerate(fp.readlines()):
-            for x, c in enumerate(line):
-                # Most will be a ".", so check that first.
-                if c != SPACE:
-                    if c == OBSTACLE:
-                        obstacles.add((x, y))
-                    elif c == PLAYER:
-                        start_x = x
-                        start_y = y
-
-        width = x + 1
-        height = y + 1
+    # Read the board into a grid, with a border of cells marking the outside
+    # of the board. That way, walking off the board is just another cell to
+    # check, rather than a bounds check on every step.
+    grid = Grid.from_file(filename, border=OUTSIDE)
+    data = grid.data
+
+    start_pos = grid.find(PLAYER)
+    assert start_pos is not None
+
+    # We'll move by offsets in the grid. Directions are indexes into these
+    # offsets (up, right, down, left), so turning right is just moving to the
+    # next index.
+    directions = grid.offsets4
+    start_direction = 0
 
     # We now know everything we need to about the board. Start walking.
-    new_obstructions = set[tuple[int, int]]()
-
-    for pos_x, pos_y, dx, dy in walk_guard(start_x=start_x,
-                                           start_y=start_y,
-                                           dx=start_dx,
-                                           dy=start_dy,
-                                           width=width,
-                                           height=height,
-                                           obstacles=obstacles):
-        obstruction_pos = (pos_x + dx,
-                           pos_y + dy)
-
-        if (obstruction_pos not in obstacles and
-            obstruction_pos not in new_obstructions):
+    new_obstructions = set[int]()
+    tried = bytearray(len(data))
+    memory.track_cache('new_obstructions', new_obstructions)
+
+    for pos, direction in walk_guard(start_pos=start_pos,
+                                     direction=start_direction,
+                                     data=data,
+                                     directions=directions):
+        obstruction_pos = pos + directions[direction]
+        value = data[obstruction_pos]
+
+        if (value != OBSTACLE and
+            value != OUTSIDE and
+            not tried[obstruction_pos]):
             # We haven't tried placing an obstruction here. If we do, do we
             # loop infinitely?
-            if does_path_loop(start_x=start_x,
-                              start_y=start_y,
-                              dx=start_dx,
-                              dy=start_dy,
-                              width=width,
-                              height=height,
-                              obstacles=obstacles,
-                              obstruction=obstruction_pos):
+            #
+            # We'll temporarily place it in the grid, and put back what was
+            # there afterward.
+            tried[obstruction_pos] = 1
+            data[obstruction_pos] = OBSTACLE
+
+            if does_path_loop(start_pos=start_pos,
+                              direction=start_direction,
+                              data=data,
+                              directions=directions):
                 # This loops! Let's mark it.
                 new_obstructions.add(obstruction_pos)
 
+            data[obstruction_pos] = value
+
     return len(new_obstructions)
 
 
+solve = count_movement_positions
+
+
 if __name__ == '__main__':
     # First, let's verify our sample's answer.
     answer = count_movement_positions('sample-input')
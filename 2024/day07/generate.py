@@ -0,0 +1,38 @@
+# Generates inputs for Day 7: https://adventofcode.com/2024/day/7
+#
+# Each line is an equation's result, followed by the numbers that go into it.
+#
+# Most results are computed from the numbers using random operators
+# (addition, multiplication, and concatenation), so some are solvable in
+# task 1, more are solvable in task 2, and the rest are off by one and can't
+# be solved at all. The real input has 850 equations.
+
+import random
+from typing import Iterator
+
+
+def generate(
+    scale: int,
+    rng: random.Random,
+) -> Iterator[str]:
+    for i in range(850 * scale):
+        nums = [
+            rng.randint(1, 9) if rng.random() < 0.6 else rng.randint(10, 999)
+            for j in range(rng.randint(3, 12))
+        ]
+        result = nums[0]
+
+        for num in nums[1:]:
+            n = rng.random()
+
+            if n < 0.45:
+                result += num
+            elif n < 0.9:
+                result *= num
+            else:
+                result = int(f'{result}{num}')
+
+        if rng.random() < 0.3:
+            result += 1
+
+        yield f'{result}: {" ".join(str(num) for num in nums)}'
@@ -20,6 +20,9 @@
 import operator
 from typing import Iterator
 
+from aoc import progress
+from aoc.inputs import InputSource, accepts_streams, open_text_input
+
 
 def calc(
     *,
@@ -40,13 +43,17 @@ def calc(
                         value=op(value, b))
 
 
+@accepts_streams
 def missing_op_calc(
-    filename: str,
+    source: InputSource,
 ) -> int:
     answer: int = 0
+    equations_checked = progress.counter('equations checked')
+    results_tried = progress.counter('results tried')
 
-    with open(filename, 'r') as fp:
+    with open_text_input(source) as fp:
         for line in fp:
+            equations_checked.count += 1
             parts = line.split()
             expected_line_answer = int(parts[0][:-1])
             nums = [
@@ -56,6 +63,8 @@ def missing_op_calc(
 
             for calc_answer in calc(nums=nums,
                                     value=nums[0]):
+                results_tried.count += 1
+
                 if calc_answer == expected_line_answer:
                     answer += calc_answer
                     break
@@ -63,6 +72,9 @@ def missing_op_calc(
     return answer
 
 
+solve = missing_op_calc
+
+
 if __name__ == '__main__':
     # First, let's verify our sample's answer.
     answer = missing_op_calc('sample-input')
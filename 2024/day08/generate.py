@@ -0,0 +1,36 @@
+# Generates inputs for Day 8: https://adventofcode.com/2024/day/8
+#
+# The input is a square map of antennas, each marked by a letter or digit for
+# its frequency. The real input is 50x50, with about 200 antennas across 50
+# frequencies. Each side grows by the square root of the scale, and so does
+# the number of frequencies (up to the 62 letters and digits available), so
+# the number of antennas per frequency grows too.
+
+import math
+import random
+import string
+from typing import Iterator
+
+
+FREQUENCIES = string.ascii_letters + string.digits
+
+
+def generate(
+    scale: int,
+    rng: random.Random,
+) -> Iterator[str]:
+    size = round(50 * math.sqrt(scale))
+    num_antennas = 200 * scale
+    frequencies = rng.sample(FREQUENCIES,
+                             min(round(50 * math.sqrt(scale)),
+                                 len(FREQUENCIES)))
+
+    rows = [['.'] * size for y in range(size)]
+
+    for i in range(num_antennas):
+        x = rng.randrange(size)
+        y = rng.randrange(size)
+        rows[y][x] = rng.choice(frequencies)
+
+    for row in rows:
+        yield ''.join(row)
@@ -15,45 +15,50 @@
 from collections import defaultdict
 from itertools import permutations
 
+from aoc.grid import Grid
+
 
 def calc_antinode_locations(
     filename: str,
 ) -> int:
     antennas = defaultdict[int, list[tuple[int, int]]](list)
-    antinodes = set[tuple[int, int]]()
 
     BLANK = ord(b'.')
 
-    x = -1
-    y = -1
+    # Load the map into a grid. We only need it to find the antennas and to
+    # check bounds, so no padding is needed.
+    grid = Grid.from_file(filename, padding=0)
 
-    with open(filename, 'rb') as fp:
-        for y, line in enumerate(fp):
-            for x, c in enumerate(line.rstrip()):
-                if c != BLANK:
-                    pos = (x, y)
-                    antennas[c].append(pos)
+    for y in range(grid.height):
+        for x, c in enumerate(grid.row(y)):
+            if c != BLANK:
+                pos = (x, y)
+                antennas[c].append(pos)
 
-    width = x + 1
-    height = y + 1
+    # Each antinode is marked in a grid of the same size. We can count them
+    # all up at the end.
+    antinodes = Grid(grid.width, grid.height, padding=0)
+    in_bounds = grid.in_bounds
 
     for antenna_type, locations in antennas.items():
         for (pos1_x, pos1_y), (pos2_x, pos2_y) in permutations(locations, r=2):
             dx = pos2_x - pos1_x
             dy = pos2_y - pos1_y
 
-            antinodes.add((pos1_x, pos1_y))
+            antinodes[pos1_x, pos1_y] = 1
 
             antinode_x = pos1_x - dx
             antinode_y = pos1_y - dy
 
-            while (0 <= antinode_x < width and
-                   0 <= antinode_y < height):
-                antinodes.add((antinode_x, antinode_y))
+            while in_bounds(antinode_x, antinode_y):
+                antinodes[antinode_x, antinode_y] = 1
                 antinode_x = antinode_x - dx
                 antinode_y = antinode_y - dy
 
-    return len(antinodes)
+    return antinodes.count(1)
+
+
+solve = calc_antinode_locations
 
 
 if __name__ == '__main__':
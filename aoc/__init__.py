@@ -0,0 +1,10 @@
+"""Shared tooling for running and measuring Advent of Code solutions.
+
+Solutions live in ``<year>/day<NN>/task<N>.py``. Each task module exposes a
+``solve`` function that takes the path to an input file and returns the
+answer, so that solutions can be imported and run from one process.
+
+Run them with::
+
+    python -m aoc run 2022 16 2
+"""
@@ -0,0 +1,6 @@
+import sys
+
+from aoc.cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,269 @@
+"""Alternative implementations of solvers, selected at runtime.
+
+Every solver has a pure Python implementation, written to be read and
+learned from. Some days are also a natural fit for array math, and can
+provide an alternative implementation using a library like NumPy that
+handles much larger inputs.
+
+A solver module provides alternatives by wrapping its reference
+implementation with :py:func:`with_backends`::
+
+    from aoc.backends import with_backends
+
+    def solve_python(filename):
+        ...
+
+    def solve_numpy(filename):
+        import numpy as np
+        ...
+
+    solve = with_backends(solve_python,
+                          numpy=solve_numpy)
+
+Calling ``solve()`` runs the implementation for the selected backend, or
+the reference implementation if the solver doesn't provide one. Every
+implementation must return the same answers as the reference, which
+``aoc check --backend`` verifies.
+
+Alternative implementations should import their libraries when called,
+so that NumPy is only needed (and only paid for) when it's used.
+
+The backend is set through the ``AOC_BACKEND`` environment variable, or
+with ``aoc run --backend``.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterator
+
+from aoc.solvers import SolverFunc
+
+
+#: The pure Python reference implementation.
+PYTHON = 'python'
+
+#: An implementation using NumPy arrays.
+NUMPY = 'numpy'
+
+
+#: All supported backends.
+BACKENDS = (PYTHON, NUMPY)
+
+
+#: The modules each backend requires.
+BACKEND_MODULES = {
+    NUMPY: 'numpy',
+}
+
+
+#: The environment variable used to set the backend.
+BACKEND_ENV_VAR = 'AOC_BACKEND'
+
+
+class BackendUnavailableError(Exception):
+    """A backend isn't supported or can't be used here."""
+
+
+def is_backend_available(
+    backend: str,
+) -> bool:
+    """Return whether a backend can be used.
+
+    Args:
+        backend (str):
+            The name of the backend.
+
+    Returns:
+        bool:
+        ``True`` if the backend is supported and its requirements are
+        installed.
+    """
+    if backend not in BACKENDS:
+        return False
+
+    module_name = BACKEND_MODULES.get(backend)
+
+    return (module_name is None or
+            importlib.util.find_spec(module_name) is not None)
+
+
+_backend = PYTHON
+
+
+def get_backend() -> str:
+    """Return the selected backend.
+
+    Returns:
+        str:
+        The name of the backend.
+    """
+    return _backend
+
+
+def set_backend(
+    backend: str,
+) -> None:
+    """Set the backend for solvers to use.
+
+    This also updates the environment, so that any worker processes use the
+    same backend.
+
+    Args:
+        backend (str):
+            The name of the backend.
+
+    Raises:
+        BackendUnavailableError:
+            The backend isn't supported or its requirements aren't
+            installed.
+    """
+    global _backend
+
+    if backend not in BACKENDS:
+        raise BackendUnavailableError(
+            f'Unknown backend "{backend}". This must be one of: '
+            f'{", ".join(BACKENDS)}.')
+
+    if not is_backend_available(backend):
+        raise BackendUnavailableError(
+            f'The {backend} backend requires the '
+            f'"{BACKEND_MODULES[backend]}" module, which is not installed.')
+
+    module_name = BACKEND_MODULES.get(backend)
+
+    if module_name is not None:
+        # Import this now, so that it isn't counted against the first
+        # solver to use it.
+        importlib.import_module(module_name)
+
+    _backend = backend
+    os.environ[BACKEND_ENV_VAR] = backend
+
+
+def _set_env_backend() -> None:
+    """Set the backend from the environment.
+
+    Invalid backends are reported on stderr, and the reference
+    implementations are used instead.
+    """
+    backend = os.environ.get(BACKEND_ENV_VAR)
+
+    if backend and backend != PYTHON:
+        try:
+            set_backend(backend)
+        except BackendUnavailableError as e:
+            sys.stderr.write(f'{BACKEND_ENV_VAR}: {e}\n')
+
+
+_set_env_backend()
+
+
+@contextmanager
+def use_backend(
+    backend: str,
+) -> Iterator[None]:
+    """Temporarily set the backend for solvers to use.
+
+    Args:
+        backend (str):
+            The name of the backend.
+
+    Context:
+        The backend will be selected.
+
+    Raises:
+        BackendUnavailableError:
+            The backend isn't supported or its requirements aren't
+            installed.
+    """
+    old_backend = _backend
+    set_backend(backend)
+
+    try:
+        yield
+    finally:
+        set_backend(old_backend)
+
+
+def with_backends(
+    reference: SolverFunc,
+    **alternatives: SolverFunc,
+) -> SolverFunc:
+    """Return a solver that runs the implementation for the selected backend.
+
+    The returned solver accepts streams (see
+    :py:func:`aoc.inputs.accepts_streams`) only if every implementation
+    does.
+
+    Args:
+        reference (callable):
+            The pure Python reference implementation.
+
+        **alternatives (dict):
+            Alternative implementations, keyed off by backend name.
+
+    Returns:
+        callable:
+        The solver function.
+    """
+    assert set(alternatives) <= set(BACKENDS) - {PYTHON}
+
+    implementations = {
+        PYTHON: reference,
+        **alternatives,
+    }
+
+    def _solve(
+        filename: str,
+    ) -> object:
+        return implementations.get(_backend, reference)(filename)
+
+    _solve.__doc__ = reference.__doc__
+    _solve.backends = tuple(implementations)  # type: ignore
+    _solve.accepts_streams = all(  # type: ignore
+        getattr(func, 'accepts_streams', False)
+        for func in implementations.values()
+    )
+
+    return _solve
+
+
+def get_solver_backends(
+    solve: SolverFunc,
+) -> tuple[str, ...]:
+    """Return the backends a solver provides.
+
+    Args:
+        solve (callable):
+            The solver function.
+
+    Returns:
+        tuple of str:
+        The names of the backends.
+    """
+    return getattr(solve, 'backends', (PYTHON,))
+
+
+def get_active_backend(
+    solve: SolverFunc,
+) -> str:
+    """Return the backend a solver will run with.
+
+    This is the selected backend, if the solver provides it, or the
+    reference implementation otherwise.
+
+    Args:
+        solve (callable):
+            The solver function.
+
+    Returns:
+        str:
+        The name of the backend.
+    """
+    if _backend in get_solver_backends(solve):
+        return _backend
+    else:
+        return PYTHON
@@ -0,0 +1,509 @@
+"""Benchmarking solvers and tracking their timings over time.
+
+Each solver is benchmarked in a fresh worker process, so that timings and
+peak memory usage aren't affected by anything else that was loaded or run
+beforehand. A solver is run a number of warmup times (which are discarded),
+and then a number of measured times.
+
+Results are stored in a JSON history file, keyed off by solver name. The
+first result recorded for a solver becomes its baseline, and later results
+are compared against it to catch regressions.
+"""
+
+import contextlib
+import json
+import math
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import (Any, Iterable, Iterator, Mapping, NamedTuple, Optional,
+                    Sequence)
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows.
+    resource = None
+
+from aoc.solvers import ROOT_DIR, SolverInfo, load_solver
+
+
+#: The default location of the benchmark history file.
+DEFAULT_HISTORY_PATH = os.path.join(ROOT_DIR, '.aoc-benchmarks.json')
+
+
+#: The version of the history file format.
+HISTORY_VERSION = 1
+
+
+#: The maximum number of results kept in the history for each solver.
+MAX_HISTORY_ENTRIES = 50
+
+
+class BenchmarkResult(NamedTuple):
+    """The result of benchmarking a solver."""
+
+    #: Information on the solver that was benchmarked.
+    info: SolverInfo
+
+    #: The answer returned by the solver.
+    answer: Any
+
+    #: The number of measured runs.
+    runs: int
+
+    #: The fastest wall time, in seconds.
+    min: float
+
+    #: The median wall time, in seconds.
+    median: float
+
+    #: The 95th percentile wall time, in seconds.
+    p95: float
+
+    #: The peak resident set size of the worker process, in bytes.
+    #:
+    #: This will be ``None`` if it can't be determined on this platform.
+    max_rss: Optional[int]
+
+    def to_json(self) -> dict[str, Any]:
+        """Return a JSON-serializable entry for the history file.
+
+        Returns:
+            dict:
+            The serialized result.
+        """
+        return {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'runs': self.runs,
+            'min': self.min,
+            'median': self.median,
+            'p95': self.p95,
+            'max_rss': self.max_rss,
+        }
+
+
+class Regression(NamedTuple):
+    """A solver that has become slower than its baseline."""
+
+    #: The name of the solver.
+    name: str
+
+    #: The median wall time of the baseline, in seconds.
+    baseline_median: float
+
+    #: The median wall time of the new result, in seconds.
+    median: float
+
+    @property
+    def ratio(self) -> float:
+        """The new median as a ratio of the baseline median."""
+        return self.median / self.baseline_median
+
+
+def _get_max_rss() -> Optional[int]:
+    """Return the peak resident set size of this process.
+
+    Returns:
+        int:
+        The peak RSS in bytes, or ``None`` if it can't be determined.
+    """
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    if sys.platform == 'darwin':
+        # macOS reports this in bytes. Everything else uses kilobytes.
+        return max_rss
+    else:
+        return max_rss * 1024
+
+
+def percentile(
+    sorted_values: list[float],
+    pct: float,
+) -> float:
+    """Return a percentile of a sorted list of values.
+
+    This uses the nearest-rank method, so the result is always one of the
+    provided values.
+
+    Args:
+        sorted_values (list of float):
+            The values, sorted in ascending order.
+
+        pct (float):
+            The percentile to return, from 0 to 100.
+
+    Returns:
+        float:
+        The value at that percentile.
+    """
+    assert sorted_values
+
+    rank = math.ceil(pct / 100 * len(sorted_values))
+
+    return sorted_values[max(rank - 1, 0)]
+
+
+def estimate_growth(
+    points: Sequence[tuple[float, float]],
+) -> Optional[float]:
+    """Estimate how quickly a solver's time grows with the input's scale.
+
+    This fits a line through the log of each time against the log of each
+    scale. The slope of that line is the exponent ``k`` in
+    ``time = c * scale^k``, so 1 means the solver scales linearly, 2 means
+    quadratically, and so on.
+
+    Args:
+        points (list of tuple):
+            A list of ``(scale, time)`` tuples.
+
+    Returns:
+        float:
+        The estimated exponent, or ``None`` if there aren't at least two
+        different scales to compare.
+    """
+    if len({scale for scale, time in points}) < 2:
+        return None
+
+    slope, intercept = statistics.linear_regression(
+        [math.log(scale) for scale, time in points],
+        [math.log(time) for scale, time in points])
+
+    return slope
+
+
+def benchmark_solver(
+    info: SolverInfo,
+    *,
+    runs: int,
+    warmup: int,
+    input_path: Optional[str] = None,
+) -> BenchmarkResult:
+    """Benchmark a solver in the current process.
+
+    Anything the solver writes to stdout is discarded while running.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver to benchmark.
+
+        runs (int):
+            The number of measured runs.
+
+        warmup (int):
+            The number of unmeasured runs to perform first.
+
+        input_path (str, optional):
+            The path to the input file. This defaults to the day's ``input``
+            file.
+
+    Returns:
+        BenchmarkResult:
+        The result of the benchmark.
+    """
+    assert runs > 0
+
+    solve = load_solver(info)
+
+    if input_path is None:
+        input_path = info.input_path
+
+    timings = []
+    answer = None
+
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            for i in range(warmup):
+                solve(input_path)
+
+            for i in range(runs):
+                start = time.perf_counter()
+                answer = solve(input_path)
+                timings.append(time.perf_counter() - start)
+
+    timings.sort()
+
+    return BenchmarkResult(info=info,
+                           answer=answer,
+                           runs=runs,
+                           min=timings[0],
+                           median=statistics.median(timings),
+                           p95=percentile(timings, 95),
+                           max_rss=_get_max_rss())
+
+
+def iter_benchmarks(
+    solvers: Iterable[SolverInfo],
+    *,
+    runs: int,
+    warmup: int,
+    input_paths: Mapping[str, str] = {},
+) -> Iterator[BenchmarkResult]:
+    """Benchmark solvers one at a time, each in a fresh worker process.
+
+    Solvers are benchmarked sequentially, so they don't compete with each
+    other for CPU time.
+
+    Args:
+        solvers (list of SolverInfo):
+            The solvers to benchmark.
+
+        runs (int):
+            The number of measured runs for each solver.
+
+        warmup (int):
+            The number of unmeasured runs to perform first for each solver.
+
+        input_paths (dict, optional):
+            A mapping of solver names to alternative input files. Solvers
+            not in the mapping use their day's input file.
+
+    Yields:
+        BenchmarkResult:
+        The result of each benchmark, in order.
+    """
+    # A new worker process is spawned for each solver, giving us clean
+    # module state and a meaningful peak RSS.
+    with ProcessPoolExecutor(max_workers=1,
+                             max_tasks_per_child=1) as executor:
+        for info in solvers:
+            future = executor.submit(benchmark_solver,
+                                     info,
+                                     runs=runs,
+                                     warmup=warmup,
+                                     input_path=input_paths.get(info.name))
+
+            yield future.result()
+
+
+class BenchmarkHistory:
+    """A history of benchmark results, stored in a JSON file.
+
+    The file has the following structure::
+
+        {
+            "version": 1,
+            "solvers": {
+                "2022/day16/task1": {
+                    "baseline": {<result>},
+                    "history": [{<result>}, ...]
+                },
+                ...
+            }
+        }
+    """
+
+    def __init__(
+        self,
+        path: str,
+    ) -> None:
+        """Initialize the history, loading it from disk if it exists.
+
+        Args:
+            path (str):
+                The path to the history file.
+
+        Raises:
+            ValueError:
+                The history file is not in a supported format.
+        """
+        self.path = path
+
+        try:
+            with open(path, 'r') as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            data = {
+                'version': HISTORY_VERSION,
+                'solvers': {},
+            }
+
+        if data.get('version') != HISTORY_VERSION:
+            raise ValueError(
+                f'Unsupported benchmark history version in {path}: '
+                f'{data.get("version")!r}')
+
+        self.solvers: dict[str, dict[str, Any]] = data['solvers']
+
+    def get_baseline(
+        self,
+        name: str,
+    ) -> Optional[dict[str, Any]]:
+        """Return the baseline result for a solver.
+
+        Args:
+            name (str):
+                The name of the solver.
+
+        Returns:
+            dict:
+            The baseline result, or ``None`` if one hasn't been recorded.
+        """
+        return self.solvers.get(name, {}).get('baseline')
+
+    def get_latest(
+        self,
+        name: str,
+    ) -> Optional[dict[str, Any]]:
+        """Return the most recent result for a solver.
+
+        Args:
+            name (str):
+                The name of the solver.
+
+        Returns:
+            dict:
+            The latest result, or ``None`` if nothing has been recorded.
+        """
+        history = self.solvers.get(name, {}).get('history')
+
+        if history:
+            return history[-1]
+
+        return None
+
+    def get_expected_time(
+        self,
+        name: str,
+    ) -> Optional[float]:
+        """Return the expected wall time for a solver.
+
+        This is the median time from the most recent result.
+
+        Args:
+            name (str):
+                The name of the solver.
+
+        Returns:
+            float:
+            The expected time in seconds, or ``None`` if nothing has been
+            recorded.
+        """
+        latest = self.get_latest(name)
+
+        if latest is None:
+            return None
+
+        return latest['median']
+
+    def add_result(
+        self,
+        result: BenchmarkResult,
+        *,
+        update_baseline: bool = False,
+    ) -> None:
+        """Add a result to the history.
+
+        If the solver doesn't yet have a baseline, this result becomes it.
+
+        Args:
+            result (BenchmarkResult):
+                The result to add.
+
+            update_baseline (bool, optional):
+                Whether to replace any existing baseline with this result.
+        """
+        entry = result.to_json()
+        solver_data = self.solvers.setdefault(result.info.name, {
+            'baseline': None,
+            'history': [],
+        })
+
+        history = solver_data['history']
+        history.append(entry)
+        del history[:-MAX_HISTORY_ENTRIES]
+
+        if update_baseline or solver_data['baseline'] is None:
+            solver_data['baseline'] = entry
+
+    def check_regression(
+        self,
+        result: BenchmarkResult,
+        *,
+        threshold: float,
+    ) -> Optional[Regression]:
+        """Check whether a result has regressed against the baseline.
+
+        This compares median wall times, which are less prone to noise than
+        the minimum or the 95th percentile.
+
+        Args:
+            result (BenchmarkResult):
+                The result to check.
+
+            threshold (float):
+                The allowed slowdown, as a percentage of the baseline median.
+
+        Returns:
+            Regression:
+            The regression, or ``None`` if the result is within the
+            threshold (or there's no baseline to compare to).
+        """
+        baseline = self.get_baseline(result.info.name)
+
+        if baseline is None:
+            return None
+
+        baseline_median = baseline['median']
+
+        if result.median > baseline_median * (1 + threshold / 100):
+            return Regression(name=result.info.name,
+                              baseline_median=baseline_median,
+                              median=result.median)
+
+        return None
+
+    def save(self) -> None:
+        """Save the history to disk.
+
+        The file is written to a temporary location and then moved into
+        place, so an interrupted save won't corrupt the history.
+        """
+        tmp_path = f'{self.path}.tmp'
+
+        with open(tmp_path, 'w') as fp:
+            json.dump(
+                {
+                    'version': HISTORY_VERSION,
+                    'solvers': self.solvers,
+                },
+                fp,
+                indent=2,
+                sort_keys=True)
+            fp.write('\n')
+
+        os.replace(tmp_path, self.path)
+
+
+def format_benchmark(
+    result: BenchmarkResult,
+) -> str:
+    """Return a displayable line for a benchmark result.
+
+    Args:
+        result (BenchmarkResult):
+            The result to format.
+
+    Returns:
+        str:
+        The formatted result.
+    """
+    if result.max_rss is None:
+        rss = 'n/a'
+    else:
+        rss = f'{result.max_rss / (1024 * 1024):.1f}MiB'
+
+    return (
+        f'{result.info.name}: '
+        f'min={result.min * 1000:.2f}ms '
+        f'median={result.median * 1000:.2f}ms '
+        f'p95={result.p95 * 1000:.2f}ms '
+        f'rss={rss}'
+    )
@@ -0,0 +1,386 @@
+"""A content-addressed cache of solver results.
+
+Some solvers take seconds (or minutes) to run, and most of the time they're
+being re-run without any changes to them or their inputs. This cache stores
+each answer under a key made up of:
+
+* A hash of the solver's source, along with the source of the whole shared
+  ``aoc`` package (solvers may import ``aoc`` modules lazily, so there's no
+  telling which ones they use until they run).
+* A hash of the input file's contents.
+* The solver's parameters (its upper-case module-level constants, such as
+  ``MAX_MINUTES`` or ``ROUNDS``).
+* The backend, for solvers running an alternative implementation (see
+  :py:mod:`aoc.backends`).
+
+If any of those change, the key changes and the solver is run again. Stale
+entries are never looked up again, and are evicted once the cache grows past
+its limits, least recently used first.
+
+Entries are stored in a SQLite database, which keeps concurrent access from
+parallel workers safe.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from types import ModuleType
+from typing import Any, NamedTuple, Optional
+
+from aoc.backends import PYTHON, get_active_backend
+from aoc.solvers import ROOT_DIR
+
+
+#: The default location of the cache database.
+DEFAULT_CACHE_PATH = os.path.join(ROOT_DIR, '.aoc-cache.sqlite3')
+
+
+#: The default maximum number of entries kept in the cache.
+DEFAULT_MAX_ENTRIES = 1000
+
+
+#: The default maximum total size of the cached answers, in bytes.
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+#: Types of answers (and parameters) that can be stored in the cache.
+CACHEABLE_TYPES = (bool, int, float, str)
+
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS results (
+        key TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        answer TEXT NOT NULL,
+        elapsed REAL NOT NULL,
+        size INTEGER NOT NULL,
+        last_used REAL NOT NULL
+    )
+'''
+
+
+class CachedResult(NamedTuple):
+    """A result stored in the cache."""
+
+    #: The answer returned by the solver.
+    answer: Any
+
+    #: The wall time the solver originally took, in seconds.
+    elapsed: float
+
+
+#: The number of bytes of a file to hash at a time.
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def update_file_hash(
+    h: 'hashlib._Hash',
+    path: str,
+) -> None:
+    """Add a file's contents to a hash.
+
+    The file is read a block at a time, so large inputs are never held in
+    memory all at once.
+
+    Args:
+        h (hashlib._Hash):
+            The hash to update.
+
+        path (str):
+            The path to the file.
+    """
+    with open(path, 'rb') as fp:
+        while block := fp.read(HASH_BLOCK_SIZE):
+            h.update(block)
+
+
+def _hash_file(
+    path: str,
+) -> str:
+    """Return a hash of a file's contents.
+
+    Args:
+        path (str):
+            The path to the file.
+
+    Returns:
+        str:
+        The hex digest of the file's contents.
+    """
+    h = hashlib.sha256()
+    update_file_hash(h, path)
+
+    return h.hexdigest()
+
+
+@functools.cache
+def _get_aoc_package_hash() -> str:
+    """Return a hash of the source of every module in the aoc package.
+
+    Solvers (and the ``aoc`` modules they use) may import other ``aoc``
+    modules lazily, inside a function, so there's no reliable way to tell
+    which ones a solver depends on until it's run. Any change to the package
+    changes this hash.
+
+    The package can't change while running without a restart (see
+    :py:mod:`aoc.server`), so this is only computed once per process.
+
+    Returns:
+        str:
+        The hex digest of the combined sources.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha256()
+
+    for filename in sorted(os.listdir(package_dir)):
+        if filename.endswith('.py'):
+            path = os.path.join(package_dir, filename)
+            h.update(os.path.relpath(path, ROOT_DIR).encode())
+            h.update(_hash_file(path).encode())
+
+    return h.hexdigest()
+
+
+def get_source_hash(
+    module: ModuleType,
+) -> str:
+    """Return a hash of a solver module's source and the aoc package.
+
+    Args:
+        module (module):
+            The loaded solver module.
+
+    Returns:
+        str:
+        The hex digest of the combined sources.
+    """
+    assert module.__file__
+    h = hashlib.sha256(_hash_file(module.__file__).encode())
+    h.update(_get_aoc_package_hash().encode())
+
+    return h.hexdigest()
+
+
+def get_solver_params(
+    module: ModuleType,
+) -> dict[str, Any]:
+    """Return the parameters of a solver module.
+
+    Parameters are upper-case module-level constants with simple values
+    (numbers, strings, and tuples of those), such as ``MAX_MINUTES`` or
+    ``ROUNDS``.
+
+    Args:
+        module (module):
+            The loaded solver module.
+
+    Returns:
+        dict:
+        A mapping of parameter names to values.
+    """
+    def _is_param_value(value: Any) -> bool:
+        if isinstance(value, tuple):
+            return all(_is_param_value(item) for item in value)
+
+        return isinstance(value, CACHEABLE_TYPES)
+
+    return {
+        name: value
+        for name, value in sorted(vars(module).items())
+        if name.isupper() and _is_param_value(value)
+    }
+
+
+def make_cache_key(
+    module: ModuleType,
+    input_path: str,
+) -> str:
+    """Return the cache key for running a solver module on an input.
+
+    If the solver will run with an alternative backend (see
+    :py:mod:`aoc.backends`), that's part of the key as well, so that its
+    timings are kept separate from the reference implementation's.
+
+    Args:
+        module (module):
+            The loaded solver module.
+
+        input_path (str):
+            The path to the input file.
+
+    Returns:
+        str:
+        The cache key.
+    """
+    key = {
+        'source': get_source_hash(module),
+        'input': _hash_file(input_path),
+        'params': get_solver_params(module),
+    }
+
+    solve = getattr(module, 'solve', None)
+
+    if solve is not None:
+        backend = get_active_backend(solve)
+
+        if backend != PYTHON:
+            key['backend'] = backend
+
+    key_data = json.dumps(key,
+                          sort_keys=True)
+
+    return hashlib.sha256(key_data.encode()).hexdigest()
+
+
+class ResultCache:
+    """An on-disk cache of solver results.
+
+    A connection is only opened for each operation, so the cache can be
+    passed to (and used from) worker processes.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path (str, optional):
+                The path to the cache database. It's created if it doesn't
+                exist.
+
+            max_entries (int, optional):
+                The maximum number of entries to keep.
+
+            max_bytes (int, optional):
+                The maximum total size of the stored answers, in bytes.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return a new connection to the cache database.
+
+        Returns:
+            sqlite3.Connection:
+            The connection, with the schema set up.
+        """
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute(_SCHEMA)
+
+        return conn
+
+    def get(
+        self,
+        key: str,
+    ) -> Optional[CachedResult]:
+        """Return a stored result, marking it as recently used.
+
+        Args:
+            key (str):
+                The cache key.
+
+        Returns:
+            CachedResult:
+            The stored result, or ``None`` if it's not in the cache.
+        """
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                'SELECT answer, elapsed FROM results WHERE key = ?',
+                (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            conn.execute('UPDATE results SET last_used = ? WHERE key = ?',
+                         (time.time(), key))
+
+        return CachedResult(answer=json.loads(row[0]),
+                            elapsed=row[1])
+
+    def set(
+        self,
+        key: str,
+        *,
+        name: str,
+        answer: Any,
+        elapsed: float,
+    ) -> bool:
+        """Store a result, evicting older entries if needed.
+
+        Answers that aren't simple values (numbers or strings) aren't
+        stored, since they can't be reliably restored.
+
+        Args:
+            key (str):
+                The cache key.
+
+            name (str):
+                The name of the solver, for reference.
+
+            answer (object):
+                The answer returned by the solver.
+
+            elapsed (float):
+                The wall time the solver took, in seconds.
+
+        Returns:
+            bool:
+            Whether the result was stored.
+        """
+        if not isinstance(answer, CACHEABLE_TYPES):
+            return False
+
+        answer_json = json.dumps(answer)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO results'
+                ' (key, name, answer, elapsed, size, last_used)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                (key, name, answer_json, elapsed, len(answer_json),
+                 time.time()))
+            self._evict(conn)
+
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM results')
+
+    def _evict(
+        self,
+        conn: sqlite3.Connection,
+    ) -> None:
+        """Evict the least recently used entries past the cache's limits.
+
+        Args:
+            conn (sqlite3.Connection):
+                The connection to use.
+        """
+        rows = conn.execute(
+            'SELECT key, size FROM results ORDER BY last_used DESC'
+        ).fetchall()
+
+        total_size = 0
+        evict_keys = []
+
+        for i, (key, size) in enumerate(rows):
+            total_size += size
+
+            if i >= self.max_entries or total_size > self.max_bytes:
+                evict_keys.append((key,))
+
+        if evict_keys:
+            conn.executemany('DELETE FROM results WHERE key = ?',
+                             evict_keys)
@@ -0,0 +1,386 @@
+"""Checking solvers against known answers and time budgets.
+
+Each day can have an ``answers.json`` alongside its inputs, listing the
+expected answer for each input file and task, and optionally how long
+solving is allowed to take::
+
+    {
+        "input": {
+            "1": {"answer": 2196996, "budget_ms": 50},
+            "2": {"answer": 23655822, "budget_ms": 50}
+        },
+        "sample-input": {
+            "1": {"answer": 11},
+            "2": {"answer": 31}
+        }
+    }
+
+Answers are compared as strings, so numeric and text answers (such as
+drawn screens) both work.
+
+Checking a solver runs it on each input listed for its task, and fails if
+the answer differs or the time budget is exceeded. A solver still running
+well past its budget is stopped (see :py:mod:`aoc.watchdog`), so one runaway
+solver can't stall the rest of the checks. Together, these make it
+safe to optimize a solver: a faster solver that gets the wrong answer fails
+just the same as a correct one that got slower.
+
+Answers can be recorded from the current solvers, for the day's ``input``
+and any sample inputs. A ``sample-input`` file is used for every task, while
+``sample-input1``, ``sample-input2``, and so on are only used for the
+matching task.
+"""
+
+import json
+import math
+import os
+import re
+import traceback
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+
+from aoc.runner import SolverResult, run_solver
+from aoc.solvers import SolverInfo
+
+
+#: The name of the file containing each day's expected answers.
+ANSWERS_FILENAME = 'answers.json'
+
+
+#: How many times slower than the recorded time a solver is allowed to be.
+#:
+#: Timings vary quite a bit between runs and machines, so budgets need a
+#: fair amount of headroom to avoid spurious failures.
+BUDGET_HEADROOM = 5
+
+
+#: The smallest time budget recorded, in milliseconds.
+MIN_BUDGET_MS = 50
+
+
+#: How many times its budget a solver can run before it's stopped.
+#:
+#: A solver over its budget has already failed, so there's no point waiting
+#: long for it, but it's worth seeing roughly how far over it was.
+TIMEOUT_BUDGET_FACTOR = 3
+
+
+SAMPLE_INPUT_RE = re.compile(r'^sample-input(\d*)$')
+
+
+class CheckCase(NamedTuple):
+    """A solver and input to check."""
+
+    #: Information on the solver to check.
+    info: SolverInfo
+
+    #: The name of the input file in the day's directory.
+    input_name: str
+
+    #: The expected answer.
+    expected: Any
+
+    #: The time budget, in seconds.
+    #:
+    #: This will be ``None`` if the time isn't checked.
+    budget: Optional[float]
+
+    #: The time limit for running the solver, in seconds.
+    #:
+    #: This will be ``None`` if the solver isn't stopped.
+    timeout: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        """A display name for the case."""
+        return f'{self.info.name} ({self.input_name})'
+
+    @property
+    def input_path(self) -> str:
+        """The path to the input file."""
+        return os.path.join(self.info.day_dir, self.input_name)
+
+
+class CheckResult(NamedTuple):
+    """The result of checking a solver."""
+
+    #: The case that was checked.
+    case: CheckCase
+
+    #: The result of running the solver.
+    #:
+    #: This will be ``None`` if the solver raised an exception.
+    result: Optional[SolverResult]
+
+    #: The traceback of the exception raised by the solver, if any.
+    error: Optional[str] = None
+
+    @property
+    def answer_ok(self) -> bool:
+        """Whether the solver returned the expected answer."""
+        return (self.result is not None and
+                str(self.result.answer) == str(self.case.expected))
+
+    @property
+    def time_ok(self) -> bool:
+        """Whether the solver finished within its time budget."""
+        return (self.result is not None and
+                not self.result.timed_out and
+                (self.case.budget is None or
+                 self.result.elapsed <= self.case.budget))
+
+    @property
+    def passed(self) -> bool:
+        """Whether the check passed."""
+        return self.answer_ok and self.time_ok
+
+
+def get_answers_path(
+    info: SolverInfo,
+) -> str:
+    """Return the path to a solver's answers file.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver.
+
+    Returns:
+        str:
+        The path to the day's answers file.
+    """
+    return os.path.join(info.day_dir, ANSWERS_FILENAME)
+
+
+def load_answers(
+    path: str,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Load an answers file.
+
+    Args:
+        path (str):
+            The path to the answers file.
+
+    Returns:
+        dict:
+        The answers for each input and task. This will be empty if the file
+        doesn't exist.
+    """
+    try:
+        with open(path, 'r') as fp:
+            return json.load(fp)
+    except FileNotFoundError:
+        return {}
+
+
+def iter_check_cases(
+    solvers: Iterable[SolverInfo],
+    *,
+    budget_scale: float = 1.0,
+    stop_over_budget: bool = True,
+) -> Iterator[CheckCase]:
+    """Iterate through the recorded cases for solvers.
+
+    Args:
+        solvers (list of SolverInfo):
+            The solvers to check.
+
+        budget_scale (float, optional):
+            A factor to multiply all time budgets by, for slower or faster
+            machines.
+
+        stop_over_budget (bool, optional):
+            Whether to stop solvers that run far past their budgets (see
+            :py:data:`TIMEOUT_BUDGET_FACTOR`).
+
+    Yields:
+        CheckCase:
+        Each case to check, in solver order.
+    """
+    for info in solvers:
+        answers = load_answers(get_answers_path(info))
+
+        for input_name, task_answers in sorted(answers.items()):
+            task_answer = task_answers.get(str(info.task))
+
+            if task_answer is None:
+                continue
+
+            budget_ms = task_answer.get('budget_ms')
+
+            if budget_ms is None:
+                budget = None
+                timeout = None
+            else:
+                budget = budget_ms * budget_scale / 1000
+
+                if stop_over_budget:
+                    timeout = budget * TIMEOUT_BUDGET_FACTOR
+                else:
+                    timeout = None
+
+            yield CheckCase(
+                info=info,
+                input_name=input_name,
+                expected=task_answer['answer'],
+                budget=budget,
+                timeout=timeout)
+
+
+def iter_recordable_inputs(
+    info: SolverInfo,
+) -> Iterator[str]:
+    """Iterate through the inputs that answers can be recorded for.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver.
+
+    Yields:
+        str:
+        The name of each input file in the day's directory.
+    """
+    for name in sorted(os.listdir(info.day_dir)):
+        m = SAMPLE_INPUT_RE.match(name)
+
+        if m and m.group(1) in ('', str(info.task)):
+            yield name
+
+    if os.path.exists(info.input_path):
+        yield 'input'
+
+
+def run_check(
+    case: CheckCase,
+) -> CheckResult:
+    """Run a solver and check its answer and time.
+
+    Solvers are always run, rather than returning cached answers.
+
+    Args:
+        case (CheckCase):
+            The case to check.
+
+    Returns:
+        CheckResult:
+        The result of the check.
+    """
+    try:
+        result = run_solver(case.info,
+                            input_path=case.input_path,
+                            timeout=case.timeout)
+    except Exception:
+        return CheckResult(case=case,
+                           result=None,
+                           error=traceback.format_exc())
+
+    return CheckResult(case=case,
+                       result=result)
+
+
+def record_answers(
+    results: Iterable[tuple[str, SolverResult]],
+    *,
+    budgets: bool = True,
+) -> list[str]:
+    """Record solvers' answers as the expected answers.
+
+    Existing answers for other inputs and tasks are kept.
+
+    Args:
+        results (list of tuple):
+            The results to record. Each is a 2-tuple of
+            ``(input_name, result)``, where ``input_name`` is the name of
+            the input file in the day's directory.
+
+        budgets (bool, optional):
+            Whether to record time budgets, based on the time taken.
+
+    Returns:
+        list of str:
+        The paths to the answers files that were written.
+    """
+    files: dict[str, dict[str, dict[str, Any]]] = {}
+
+    for input_name, result in results:
+        path = get_answers_path(result.info)
+
+        if path not in files:
+            files[path] = load_answers(path)
+
+        answer = result.answer
+
+        if not isinstance(answer, (int, str)):
+            answer = str(answer)
+
+        task_answer: dict[str, Any] = {
+            'answer': answer,
+        }
+
+        if budgets:
+            task_answer['budget_ms'] = max(
+                MIN_BUDGET_MS,
+                math.ceil(result.elapsed * BUDGET_HEADROOM * 100) * 10)
+
+        files[path].setdefault(input_name, {})[str(result.info.task)] = \
+            task_answer
+
+    for path, answers in files.items():
+        with open(path, 'w') as fp:
+            json.dump(
+                {
+                    input_name: dict(sorted(task_answers.items()))
+                    for input_name, task_answers in sorted(answers.items())
+                },
+                fp,
+                indent=4)
+            fp.write('\n')
+
+    return sorted(files)
+
+
+def format_check_result(
+    check: CheckResult,
+) -> str:
+    """Return a displayable line (or lines) for a check's result.
+
+    Args:
+        check (CheckResult):
+            The result to format.
+
+    Returns:
+        str:
+        The formatted result.
+    """
+    case = check.case
+    result = check.result
+
+    if result is None:
+        assert check.error
+        return f'ERROR {case.name}\n{check.error.rstrip()}'
+
+    timing = f'{result.elapsed * 1000:.2f}ms'
+
+    if case.budget is not None:
+        timing += f' of {case.budget * 1000:.0f}ms'
+
+    if check.passed:
+        return f'ok    {case.name} [{timing}]'
+
+    if result.timed_out:
+        lines = [f'FAIL  {case.name} [{timing}]: stopped far over budget']
+        lines += [
+            f'    {line}'
+            for line in result.progress or ['(no progress reported)']
+        ]
+
+        return '\n'.join(lines)
+
+    problems = []
+
+    if not check.answer_ok:
+        problems.append(f'expected {case.expected!r}, got '
+                        f'{str(result.answer)!r}')
+
+    if not check.time_ok:
+        problems.append('over budget')
+
+    return f'FAIL  {case.name} [{timing}]: {"; ".join(problems)}'
@@ -0,0 +1,1174 @@
+"""Command line interface for running solutions.
+
+Usage::
+
+    python -m aoc list [YEAR [DAY]]
+    python -m aoc run YEAR [DAY [TASK]] [--input PATH|-] [--jobs N]
+                       [--scale N] [--seed N] [--no-cache]
+                       [--profile cprofile|sample] [--profile-dir PATH]
+                       [--profile-top N] [--mem] [-v] [--no-server]
+                       [--socket PATH] [--backend python|numpy]
+                       [--no-parsed-cache] [--timeout SECONDS]
+    python -m aoc bench YEAR [DAY [TASK]] [--runs N] [--warmup N]
+                         [--threshold PCT] [--history PATH]
+                         [--update-baseline] [--no-save]
+                         [--scale N [N ...]] [--seed N]
+                         [--backend python|numpy] [--no-parsed-cache]
+    python -m aoc generate YEAR DAY [--scale N] [--seed N] [-o PATH]
+    python -m aoc serve [YEAR [DAY [TASK]]] [--socket PATH]
+    python -m aoc check [YEAR [DAY [TASK]]] [--budget-scale N] [--record]
+                         [--no-budgets] [--backend python|numpy]
+                         [--no-parsed-cache] [--no-timeouts]
+
+Modules needed only by specific commands or options (benchmarking,
+profiling, process pools, and so on) are imported when they're used, so
+that quick commands like ``list`` start up fast.
+"""
+
+import argparse
+import os
+import sys
+from collections import defaultdict
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from aoc import tracing
+from aoc.solvers import (SolverInfo, SolverNotFoundError, get_solver_info,
+                         iter_solvers)
+
+if TYPE_CHECKING:
+    from aoc.bench import BenchmarkHistory
+
+
+def _add_selection_args(
+    parser: argparse.ArgumentParser,
+    *,
+    year_required: bool,
+) -> None:
+    """Add the year/day/task selection arguments to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser):
+            The parser to add arguments to.
+
+        year_required (bool):
+            Whether the year must be provided.
+    """
+    parser.add_argument(
+        'year',
+        type=int,
+        nargs=None if year_required else '?',
+        help='The year to select.')
+    parser.add_argument(
+        'day',
+        type=int,
+        nargs='?',
+        help='The day to select. Defaults to all days.')
+    parser.add_argument(
+        'task',
+        type=int,
+        nargs='?',
+        help='The task to select. Defaults to all tasks.')
+
+
+def _input_path(
+    value: str,
+) -> str:
+    """Check an input path passed on the command line.
+
+    Args:
+        value (str):
+            The path passed to ``--input``.
+
+    Returns:
+        str:
+        The path.
+
+    Raises:
+        argparse.ArgumentTypeError:
+            The path isn't an existing file (or ``-``, for standard input).
+    """
+    if value != '-' and not os.path.isfile(value):
+        if os.path.exists(value):
+            raise argparse.ArgumentTypeError(f'{value} is not a file')
+        else:
+            raise argparse.ArgumentTypeError(f'{value} does not exist')
+
+    return value
+
+
+def _add_input_arg(
+    parser: argparse.ArgumentParser,
+    *,
+    allow_stdin: bool,
+) -> None:
+    """Add the --input argument to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser):
+            The parser to add arguments to.
+
+        allow_stdin (bool):
+            Whether ``-`` can be passed to read from standard input.
+    """
+    help = ("An alternative input file to solve. Defaults to the day's "
+            "input file.")
+
+    if allow_stdin:
+        help += (' Pass "-" to read from standard input. Solvers that '
+                 'support streaming read it as it arrives.')
+
+    parser.add_argument(
+        '--input',
+        metavar='PATH',
+        type=_input_path,
+        help=help)
+
+
+def _add_history_arg(
+    parser: argparse.ArgumentParser,
+) -> None:
+    """Add the --history argument to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser):
+            The parser to add arguments to.
+    """
+    parser.add_argument(
+        '--history',
+        metavar='PATH',
+        help='The JSON file storing benchmark history and baselines. '
+             'Defaults to .aoc-benchmarks.json at the top of the '
+             'repository.')
+
+
+def _load_history(
+    options: argparse.Namespace,
+) -> 'Optional[BenchmarkHistory]':
+    """Load the benchmark history chosen on the command line.
+
+    Any problems are written to stderr.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+    Returns:
+        aoc.bench.BenchmarkHistory:
+        The loaded history, or ``None`` if it couldn't be loaded.
+    """
+    from aoc.bench import DEFAULT_HISTORY_PATH, BenchmarkHistory
+
+    try:
+        return BenchmarkHistory(options.history or DEFAULT_HISTORY_PATH)
+    except ValueError as e:
+        sys.stderr.write(f'{e}\n')
+        return None
+
+
+def _add_scale_args(
+    parser: argparse.ArgumentParser,
+    *,
+    multiple: bool,
+) -> None:
+    """Add the --scale and --seed arguments to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser):
+            The parser to add arguments to.
+
+        multiple (bool):
+            Whether more than one scale can be provided.
+    """
+    if multiple:
+        parser.add_argument(
+            '--scale',
+            type=int,
+            nargs='+',
+            metavar='N',
+            help='Use generated inputs at each of these scales, instead of '
+                 'the real inputs, and estimate how times grow with scale.')
+    else:
+        parser.add_argument(
+            '--scale',
+            type=int,
+            metavar='N',
+            help='Use a generated input at this scale, instead of the real '
+                 'input. A scale of 1 is around the size of the real '
+                 'input.')
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        metavar='N',
+        help='The random seed for generated inputs. Defaults to 0.')
+
+
+def _cmd_list(
+    options: argparse.Namespace,
+) -> int:
+    """Handle the ``list`` command.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+    Returns:
+        int:
+        The exit code.
+    """
+    for info in iter_solvers(year=options.year,
+                             day=options.day,
+                             task=options.task):
+        print(info.name)
+
+    return 0
+
+
+def _get_selected_solvers(
+    options: argparse.Namespace,
+) -> Optional[list[SolverInfo]]:
+    """Return the solvers selected on the command line.
+
+    Any problems with the selection are written to stderr.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+    Returns:
+        list of SolverInfo:
+        The selected solvers, or ``None`` if the selection was invalid.
+    """
+    if options.task is not None:
+        try:
+            solvers = [get_solver_info(options.year, options.day,
+                                       options.task)]
+        except SolverNotFoundError as e:
+            sys.stderr.write(f'{e}\n')
+            return None
+    else:
+        solvers = list(iter_solvers(year=options.year,
+                                    day=options.day))
+
+    if not solvers:
+        sys.stderr.write('No solvers matched.\n')
+        return None
+
+    if options.input is not None:
+        if len(solvers) > 1:
+            sys.stderr.write('--input can only be used with a single '
+                             'task.\n')
+            return None
+
+        if options.scale is not None:
+            sys.stderr.write('--input and --scale cannot be used '
+                             'together.\n')
+            return None
+
+    return solvers
+
+
+def _get_input_paths(
+    options: argparse.Namespace,
+    solvers: list[SolverInfo],
+    *,
+    scale: Optional[int],
+) -> Optional[dict[str, str]]:
+    """Return the alternative input files to use for each solver.
+
+    If a scale is provided, an input is generated for each day (or reused
+    from a previous run). Any problems are written to stderr.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+        solvers (list of SolverInfo):
+            The selected solvers.
+
+        scale (int):
+            The scale of the inputs to generate, if any.
+
+    Returns:
+        dict:
+        A mapping of solver names to input files, or ``None`` if inputs
+        couldn't be generated.
+    """
+    if scale is not None:
+        from aoc.generators import GeneratorNotFoundError, get_generated_input
+
+        if scale < 1:
+            sys.stderr.write('--scale must be at least 1.\n')
+            return None
+
+        try:
+            return {
+                info.name: get_generated_input(info.year, info.day,
+                                               scale=scale,
+                                               seed=options.seed)
+                for info in solvers
+            }
+        except GeneratorNotFoundError as e:
+            sys.stderr.write(f'{e}\n')
+            return None
+    elif options.input is not None:
+        return {
+            info.name: options.input
+            for info in solvers
+        }
+    else:
+        return {}
+
+
+def _add_backend_arg(
+    parser: argparse.ArgumentParser,
+) -> None:
+    """Add the --backend argument to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser):
+            The parser to add arguments to.
+    """
+    parser.add_argument(
+        '--backend',
+        metavar='python|numpy',
+        help='The implementation to run, for solvers that provide more '
+             'than one. "python" runs the pure Python reference '
+             'implementations, and "numpy" runs NumPy-accelerated ones '
+             'where available. Defaults to AOC_BACKEND, or "python".')
+
+
+def _set_backend(
+    options: argparse.Namespace,
+) -> bool:
+    """Select the backend chosen on the command line.
+
+    Any problems with the backend are written to stderr.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+    Returns:
+        bool:
+        ``True`` if the backend was selected.
+    """
+    from aoc.backends import BackendUnavailableError, set_backend
+
+    if options.backend is not None:
+        try:
+            set_backend(options.backend)
+        except BackendUnavailableError as e:
+            sys.stderr.write(f'{e}\n')
+            return False
+
+    return True
+
+
+def _add_parsed_cache_arg(
+    parser: argparse.ArgumentParser,
+) -> None:
+    """Add the --no-parsed-cache argument to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser):
+            The parser to add arguments to.
+    """
+    parser.add_argument(
+        '--no-parsed-cache',
+        dest='parsed_cache',
+        action='store_false',
+        default=True,
+        help="Always preprocess inputs, instead of loading preprocessed "
+             "data cached next to the inputs by previous runs. This can "
+             "also be set with AOC_PARSED_CACHE=0.")
+
+
+def _set_parsed_cache(
+    options: argparse.Namespace,
+) -> None:
+    """Turn off the preprocessed input cache, if requested.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+    """
+    if not options.parsed_cache:
+        from aoc.preprocessed import set_enabled
+
+        set_enabled(False)
+
+
+def _add_socket_arg(
+    parser: argparse.ArgumentParser,
+) -> None:
+    """Add the --socket argument to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser):
+            The parser to add arguments to.
+    """
+    parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        help='The path to the solver server\'s socket. Defaults to '
+             '.aoc-server.sock at the top of the repository.')
+
+
+def _cmd_run(
+    options: argparse.Namespace,
+) -> int:
+    """Handle the ``run`` command.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+    Returns:
+        int:
+        The exit code.
+    """
+    solvers = _get_selected_solvers(options)
+
+    if solvers is None:
+        return 1
+
+    if options.jobs < 1:
+        sys.stderr.write('--jobs must be at least 1.\n')
+        return 1
+
+    from aoc.runner import STDIN_PATH, format_result, run_solver
+
+    if options.verbose:
+        tracing.set_level(min(options.verbose, tracing.TRACE))
+
+    if not _set_backend(options):
+        return 1
+
+    _set_parsed_cache(options)
+
+    if options.timeout is not None:
+        from aoc.watchdog import is_supported
+
+        if options.timeout <= 0:
+            sys.stderr.write('--timeout must be greater than 0.\n')
+            return 1
+
+        if not is_supported():
+            sys.stderr.write('--timeout isn\'t supported on this '
+                             'platform.\n')
+            return 1
+
+        if options.profile is not None or options.mem:
+            sys.stderr.write('--timeout cannot be used with --profile or '
+                             '--mem.\n')
+            return 1
+
+    if (options.input == STDIN_PATH and
+        (options.jobs > 1 or options.profile is not None or options.mem)):
+        sys.stderr.write('Standard input can only be used for a plain run, '
+                         'without --jobs, --profile, or --mem.\n')
+        return 1
+
+    if options.profile is not None or options.mem:
+        if options.profile is not None and options.mem:
+            sys.stderr.write('--profile and --mem cannot be used '
+                             'together.\n')
+            return 1
+
+        if options.jobs > 1:
+            sys.stderr.write('--profile and --mem cannot be used with '
+                             '--jobs.\n')
+            return 1
+
+    if options.profile is not None:
+        from aoc.profiling import (DEFAULT_PROFILE_DIR, PROFILE_MODES,
+                                   format_hot_functions, profile_solver)
+
+        if options.profile not in PROFILE_MODES:
+            sys.stderr.write(f'--profile must be one of: '
+                             f'{", ".join(PROFILE_MODES)}.\n')
+            return 1
+
+        if options.profile_top < 0:
+            sys.stderr.write('--profile-top must not be negative.\n')
+            return 1
+
+    input_paths = _get_input_paths(options, solvers,
+                                   scale=options.scale)
+
+    if input_paths is None:
+        return 1
+
+    if options.profile is not None:
+        # Profiles always run the solvers, so the cache isn't used.
+        for info in solvers:
+            profile = profile_solver(info,
+                                     mode=options.profile,
+                                     input_path=input_paths.get(info.name),
+                                     output_dir=(options.profile_dir or
+                                                 DEFAULT_PROFILE_DIR),
+                                     top=options.profile_top)
+
+            print(format_result(profile.result))
+            print(f'Profile written to {profile.output_path}')
+
+            if profile.hot_functions:
+                print('Hottest functions (self time):')
+                print(format_hot_functions(profile.hot_functions))
+
+            print(flush=True)
+
+        return 0
+
+    if options.mem:
+        from aoc.memory import format_memory_report, measure_solver
+
+        # Like profiles, memory measurements always run the solvers.
+        for info in solvers:
+            report = measure_solver(info,
+                                    input_path=input_paths.get(info.name))
+
+            print(format_result(report.result))
+            print(format_memory_report(report))
+            print(flush=True)
+
+        return 0
+
+    from aoc.backends import PYTHON, get_backend
+
+    if (options.server and
+        options.jobs == 1 and
+        options.input != STDIN_PATH and
+        not options.verbose and
+        options.timeout is None and
+        options.parsed_cache and
+        get_backend() == PYTHON):
+        from aoc.server import (DEFAULT_SOCKET_PATH, ServerError,
+                                ServerUnavailableError, connect_to_server,
+                                iter_server_results)
+
+        try:
+            conn = connect_to_server(options.socket or DEFAULT_SOCKET_PATH)
+        except ServerUnavailableError:
+            # There's no server running, so solve in this process.
+            pass
+        else:
+            try:
+                for result in iter_server_results(conn, solvers,
+                                                  input_paths=input_paths,
+                                                  cache=options.cache):
+                    print(format_result(result), flush=True)
+            except ServerError as e:
+                sys.stderr.write(f'{e}\n')
+                return 1
+
+            return 0
+
+    if options.cache:
+        from aoc.cache import ResultCache
+
+        cache = ResultCache()
+    else:
+        cache = None
+
+    if options.jobs == 1:
+        results = (
+            run_solver(info,
+                       input_path=input_paths.get(info.name),
+                       cache=cache,
+                       timeout=options.timeout)
+            for info in solvers
+        )
+    else:
+        from aoc.runner import iter_parallel_results
+
+        # Schedule using the timings recorded by the benchmarks, if any.
+        history = _load_history(options)
+
+        if history is None:
+            return 1
+
+        expected_times = {}
+
+        for info in solvers:
+            expected_time = history.get_expected_time(info.name)
+
+            if expected_time is not None:
+                expected_times[info.name] = expected_time
+
+        results = iter_parallel_results(solvers,
+                                        jobs=options.jobs,
+                                        expected_times=expected_times,
+                                        input_paths=input_paths,
+                                        cache=cache,
+                                        timeout=options.timeout)
+
+    timed_out = []
+
+    for result in results:
+        print(format_result(result), flush=True)
+
+        if result.timed_out:
+            timed_out.append(result.info.name)
+
+    if timed_out:
+        sys.stderr.write(f'Stopped after {options.timeout:g}s: '
+                         f'{", ".join(timed_out)}\n')
+        return 1
+
+    return 0
+
+
+def _cmd_bench(
+    options: argparse.Namespace,
+) -> int:
+    """Handle the ``bench`` command.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+    Returns:
+        int:
+        The exit code. This is 2 if any solver regressed past the threshold.
+    """
+    solvers = _get_selected_solvers(options)
+
+    if solvers is None:
+        return 1
+
+    if options.runs < 1:
+        sys.stderr.write('--runs must be at least 1.\n')
+        return 1
+
+    if options.warmup < 0 or options.threshold < 0:
+        sys.stderr.write('--warmup and --threshold must not be negative.\n')
+        return 1
+
+    if options.input == '-':
+        sys.stderr.write('Benchmarks need an input file, since each solver '
+                         'is run more than once.\n')
+        return 1
+
+    if not _set_backend(options):
+        return 1
+
+    _set_parsed_cache(options)
+
+    if options.scale is not None:
+        return _bench_scaling(options, solvers)
+
+    from aoc.backends import PYTHON, get_backend
+    from aoc.bench import format_benchmark, iter_benchmarks
+
+    # Only results from the real input, using the reference implementations,
+    # are compared and recorded.
+    use_history = options.input is None and get_backend() == PYTHON
+
+    input_paths = _get_input_paths(options, solvers,
+                                   scale=None)
+    assert input_paths is not None
+
+    history = _load_history(options)
+
+    if history is None:
+        return 1
+
+    regressions = []
+
+    for result in iter_benchmarks(solvers,
+                                  runs=options.runs,
+                                  warmup=options.warmup,
+                                  input_paths=input_paths):
+        line = format_benchmark(result)
+
+        if use_history:
+            regression = history.check_regression(
+                result,
+                threshold=options.threshold)
+
+            if regression is not None:
+                regressions.append(regression)
+                line += (f' REGRESSED ({regression.ratio:.2f}x baseline '
+                         f'{regression.baseline_median * 1000:.2f}ms)')
+
+            history.add_result(result,
+                               update_baseline=options.update_baseline)
+
+        print(line)
+
+    if options.save and use_history:
+        history.save()
+
+    if regressions and not options.update_baseline:
+        sys.stderr.write(
+            f'{len(regressions)} solver(s) regressed by more than '
+            f'{options.threshold:g}%.\n')
+        return 2
+
+    return 0
+
+
+def _bench_scaling(
+    options: argparse.Namespace,
+    solvers: list[SolverInfo],
+) -> int:
+    """Benchmark solvers against generated inputs at several scales.
+
+    Results aren't compared against or recorded in the history, since they
+    aren't for the real inputs. Once all scales are done, the growth of each
+    solver's median time is estimated.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+        solvers (list of SolverInfo):
+            The selected solvers.
+
+    Returns:
+        int:
+        The exit code.
+    """
+    from aoc.bench import estimate_growth, format_benchmark, iter_benchmarks
+
+    timings: defaultdict[str, list[tuple[float, float]]] = defaultdict(list)
+
+    for scale in options.scale:
+        input_paths = _get_input_paths(options, solvers,
+                                       scale=scale)
+
+        if input_paths is None:
+            return 1
+
+        for result in iter_benchmarks(solvers,
+                                      runs=options.runs,
+                                      warmup=options.warmup,
+                                      input_paths=input_paths):
+            timings[result.info.name].append((scale, result.median))
+            print(f'{format_benchmark(result)} scale={scale}', flush=True)
+
+    for name, points in timings.items():
+        growth = estimate_growth(points)
+
+        if growth is not None:
+            print(f'{name}: time grows as scale^{growth:.2f}')
+
+    return 0
+
+
+def _cmd_generate(
+    options: argparse.Namespace,
+) -> int:
+    """Handle the ``generate`` command.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+    Returns:
+        int:
+        The exit code.
+    """
+    from aoc.generators import GeneratorNotFoundError, write_input
+
+    if options.scale < 1:
+        sys.stderr.write('--scale must be at least 1.\n')
+        return 1
+
+    try:
+        if options.output is None:
+            write_input(sys.stdout, options.year, options.day,
+                        scale=options.scale,
+                        seed=options.seed)
+        else:
+            with open(options.output, 'w') as fp:
+                write_input(fp, options.year, options.day,
+                            scale=options.scale,
+                            seed=options.seed)
+    except GeneratorNotFoundError as e:
+        sys.stderr.write(f'{e}\n')
+        return 1
+
+    return 0
+
+
+def _cmd_check(
+    options: argparse.Namespace,
+) -> int:
+    """Handle the ``check`` command.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+    Returns:
+        int:
+        The exit code.
+    """
+    from aoc.checks import (format_check_result, iter_check_cases,
+                            iter_recordable_inputs, record_answers,
+                            run_check)
+    from aoc.runner import format_result, run_solver
+
+    solvers = list(iter_solvers(year=options.year,
+                                day=options.day,
+                                task=options.task))
+
+    if not solvers:
+        sys.stderr.write('No solvers matched.\n')
+        return 1
+
+    if options.budget_scale <= 0:
+        sys.stderr.write('--budget-scale must be greater than 0.\n')
+        return 1
+
+    if not _set_backend(options):
+        return 1
+
+    _set_parsed_cache(options)
+
+    from aoc.backends import PYTHON, get_backend, get_solver_backends
+    from aoc.solvers import load_solver
+
+    backend = get_backend()
+
+    if backend != PYTHON:
+        if options.record:
+            sys.stderr.write('Answers can only be recorded using the '
+                             'python backend.\n')
+            return 1
+
+        # Check the alternative implementations against the answers from
+        # the reference implementations. Solvers without one would only be
+        # checking the reference implementation again.
+        solvers = [
+            info
+            for info in solvers
+            if backend in get_solver_backends(load_solver(info))
+        ]
+
+        if not solvers:
+            sys.stderr.write(f'No selected solvers have a {backend} '
+                             f'backend.\n')
+            return 1
+
+        print(f'Checking the {backend} backend for: '
+              f'{", ".join(info.name for info in solvers)}')
+        print()
+
+    if options.record:
+        results = []
+        failed = False
+
+        for info in solvers:
+            for input_name in iter_recordable_inputs(info):
+                try:
+                    result = run_solver(
+                        info,
+                        input_path=os.path.join(info.day_dir, input_name))
+                except Exception as e:
+                    sys.stderr.write(f'{info.name} ({input_name}) failed: '
+                                     f'{e!r}\n')
+                    failed = True
+                    continue
+
+                print(f'{format_result(result)} ({input_name})', flush=True)
+                results.append((input_name, result))
+
+        for path in record_answers(results,
+                                   budgets=options.budgets):
+            print(f'Wrote {os.path.relpath(path)}')
+
+        return 1 if failed else 0
+
+    num_passed = 0
+    num_failed = 0
+    checked: set[str] = set()
+
+    from aoc.watchdog import is_supported
+
+    for case in iter_check_cases(solvers,
+                                 budget_scale=options.budget_scale,
+                                 stop_over_budget=(options.timeouts and
+                                                   is_supported())):
+        check = run_check(case)
+        checked.add(case.info.name)
+
+        if check.passed:
+            num_passed += 1
+        else:
+            num_failed += 1
+
+        print(format_check_result(check), flush=True)
+
+    unchecked = [
+        info.name
+        for info in solvers
+        if info.name not in checked
+    ]
+
+    print()
+    print(f'{num_passed} passed, {num_failed} failed')
+
+    if unchecked:
+        print(f'No answers recorded for: {", ".join(unchecked)}')
+
+    return 1 if num_failed else 0
+
+
+def _cmd_serve(
+    options: argparse.Namespace,
+) -> int:
+    """Handle the ``serve`` command.
+
+    Args:
+        options (argparse.Namespace):
+            The parsed command line options.
+
+    Returns:
+        int:
+        The exit code.
+    """
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX'):
+        sys.stderr.write('The server needs Unix domain sockets, which '
+                         'aren\'t supported on this platform.\n')
+        return 1
+
+    from aoc.server import DEFAULT_SOCKET_PATH, ServerError, SolverServer
+
+    server = SolverServer(socket_path=options.socket or DEFAULT_SOCKET_PATH)
+
+    for info in iter_solvers(year=options.year,
+                             day=options.day,
+                             task=options.task):
+        server.load(info)
+
+    try:
+        server.serve_forever()
+    except ServerError as e:
+        sys.stderr.write(f'{e}\n')
+        return 1
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv (list of str, optional):
+            The arguments to parse. Defaults to :py:data:`sys.argv`.
+
+    Returns:
+        int:
+        The exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog='aoc',
+        description='Run Advent of Code solutions.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser(
+        'list',
+        help='List available solutions.')
+    _add_selection_args(list_parser, year_required=False)
+    list_parser.set_defaults(func=_cmd_list)
+
+    run_parser = subparsers.add_parser(
+        'run',
+        help='Run one or more solutions in this process.')
+    _add_selection_args(run_parser, year_required=True)
+    _add_input_arg(run_parser, allow_stdin=True)
+    run_parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='The number of solutions to run in parallel, in separate '
+             'processes. Results are shown as they complete. Defaults to 1.')
+    _add_history_arg(run_parser)
+    _add_scale_args(run_parser, multiple=False)
+    run_parser.add_argument(
+        '--no-cache',
+        dest='cache',
+        action='store_false',
+        default=True,
+        help="Always run the solvers, instead of returning answers stored "
+             "from previous runs with the same code and input.")
+    run_parser.add_argument(
+        '--profile',
+        metavar='cprofile|sample',
+        help='Profile each solver, writing the profile to a file and '
+             'showing the hottest functions. "cprofile" traces every call '
+             'and writes .pstats files. "sample" samples the call stack '
+             'and writes collapsed stacks for flamegraphs.')
+    run_parser.add_argument(
+        '--profile-dir',
+        metavar='PATH',
+        help='The directory to write profiles to. Defaults to '
+             '.aoc-profiles/ at the top of the repository.')
+    run_parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=15,
+        metavar='N',
+        help='The number of hottest functions to show. Defaults to 15.')
+    run_parser.add_argument(
+        '--mem',
+        action='store_true',
+        help='Measure the memory used by each solver, showing the peak '
+             'memory allocated, the lines allocating the most memory near '
+             'that peak, and the sizes of any caches the solver tracks. '
+             'Solvers run much slower while measuring.')
+    run_parser.add_argument(
+        '-v',
+        '--verbose',
+        action='count',
+        default=0,
+        help='Show diagnostic output from the solvers on stderr. Repeat for '
+             'more detail (-v for summaries, -vv for progress, -vvv for '
+             'every step). This can also be set with AOC_TRACE.')
+    run_parser.add_argument(
+        '--no-server',
+        dest='server',
+        action='store_false',
+        default=True,
+        help="Always solve in this process, even if a solver server (see "
+             "\"aoc serve\") is running. Runs with --jobs, --profile, --mem, "
+             "-v, --backend, --no-parsed-cache, --timeout, or standard "
+             "input never use the server.")
+    run_parser.add_argument(
+        '--timeout',
+        type=float,
+        metavar='SECONDS',
+        help='Stop any solver still running after this many seconds, and '
+             'show how far it got. The other solvers keep running, and the '
+             'command fails at the end.')
+    _add_socket_arg(run_parser)
+    _add_backend_arg(run_parser)
+    _add_parsed_cache_arg(run_parser)
+    run_parser.set_defaults(func=_cmd_run)
+
+    bench_parser = subparsers.add_parser(
+        'bench',
+        help='Benchmark solutions and check for regressions.')
+    _add_selection_args(bench_parser, year_required=True)
+    _add_input_arg(bench_parser, allow_stdin=False)
+    bench_parser.add_argument(
+        '--runs',
+        type=int,
+        default=5,
+        metavar='N',
+        help='The number of measured runs per solution. Defaults to 5.')
+    bench_parser.add_argument(
+        '--warmup',
+        type=int,
+        default=1,
+        metavar='N',
+        help='The number of unmeasured runs to perform first. Defaults to '
+             '1.')
+    bench_parser.add_argument(
+        '--threshold',
+        type=float,
+        default=20.0,
+        metavar='PCT',
+        help='The allowed slowdown of the median time over the baseline, '
+             'as a percentage. Defaults to 20.')
+    _add_history_arg(bench_parser)
+    bench_parser.add_argument(
+        '--update-baseline',
+        action='store_true',
+        help='Record these results as the new baselines.')
+    bench_parser.add_argument(
+        '--no-save',
+        dest='save',
+        action='store_false',
+        help="Don't record these results in the history.")
+    _add_scale_args(bench_parser, multiple=True)
+    _add_backend_arg(bench_parser)
+    _add_parsed_cache_arg(bench_parser)
+    bench_parser.set_defaults(func=_cmd_bench)
+
+    generate_parser = subparsers.add_parser(
+        'generate',
+        help='Generate a synthetic input for a day.')
+    generate_parser.add_argument(
+        'year',
+        type=int,
+        help='The year of the puzzle.')
+    generate_parser.add_argument(
+        'day',
+        type=int,
+        help='The day of the puzzle.')
+    generate_parser.add_argument(
+        '--scale',
+        type=int,
+        default=1,
+        metavar='N',
+        help='The scale of the input. A scale of 1 is around the size of '
+             'the real input. Defaults to 1.')
+    generate_parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        metavar='N',
+        help='The random seed. Defaults to 0.')
+    generate_parser.add_argument(
+        '-o',
+        '--output',
+        metavar='PATH',
+        help='The file to write to. Defaults to standard output.')
+    generate_parser.set_defaults(func=_cmd_generate)
+
+    serve_parser = subparsers.add_parser(
+        'serve',
+        help='Keep solutions loaded in a server, for fast repeated runs.')
+    _add_selection_args(serve_parser, year_required=False)
+    _add_socket_arg(serve_parser)
+    serve_parser.set_defaults(func=_cmd_serve)
+
+    check_parser = subparsers.add_parser(
+        'check',
+        help='Check solutions against their expected answers and time '
+             'budgets.')
+    _add_selection_args(check_parser, year_required=False)
+    check_parser.add_argument(
+        '--budget-scale',
+        type=float,
+        default=1.0,
+        metavar='N',
+        help='Multiply all time budgets by this amount, for slower '
+             'machines. Defaults to 1.')
+    check_parser.add_argument(
+        '--record',
+        action='store_true',
+        help="Record the current answers on each day's input and sample "
+             "inputs as the expected answers, in answers.json.")
+    check_parser.add_argument(
+        '--no-budgets',
+        dest='budgets',
+        action='store_false',
+        help="Don't record time budgets along with the answers.")
+    check_parser.add_argument(
+        '--no-timeouts',
+        dest='timeouts',
+        action='store_false',
+        help="Let solvers run to completion, instead of stopping them once "
+             "they're far over their time budgets.")
+    _add_backend_arg(check_parser)
+    _add_parsed_cache_arg(check_parser)
+    check_parser.set_defaults(func=_cmd_check)
+
+    options = parser.parse_args(argv)
+
+    return options.func(options)
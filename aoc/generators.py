@@ -0,0 +1,212 @@
+"""Synthetic puzzle inputs, generated at larger scales.
+
+The real puzzle inputs are small, and say very little about how a solver
+scales. Each day can provide a ``generate.py`` alongside its tasks, which
+defines::
+
+    def generate(scale, rng):
+        ...
+
+This yields the lines of a valid puzzle input, without trailing newlines.
+A scale of 1 produces an input around the size of the real one, and larger
+scales grow the amount of data roughly linearly. So a scale of 10 has about
+10 times as many lines, or a grid with about 10 times as many cells. The
+generator draws all of its randomness from ``rng`` (a
+:py:class:`random.Random`), so the same seed always produces the same input.
+
+Generated inputs are cached on disk, keyed off by day, scale, and seed, and
+are regenerated if the day's generator changes.
+"""
+
+import os
+import random
+from typing import Callable, Iterable, TextIO
+
+from aoc.solvers import ROOT_DIR, load_module
+
+
+#: The name of the file in a day's directory that generates inputs.
+GENERATOR_FILENAME = 'generate.py'
+
+
+#: The default directory for caching generated inputs.
+DEFAULT_CACHE_DIR = os.path.join(ROOT_DIR, '.aoc-generated')
+
+
+#: A generator function, taking a scale and a random number generator, and
+#: yielding lines of input.
+GeneratorFunc = Callable[[int, random.Random], Iterable[str]]
+
+
+class GeneratorNotFoundError(LookupError):
+    """A requested input generator could not be found or loaded."""
+
+
+def get_generator_path(
+    year: int,
+    day: int,
+) -> str:
+    """Return the path to the input generator for a day.
+
+    Args:
+        year (int):
+            The year of the puzzle.
+
+        day (int):
+            The day of the puzzle.
+
+    Returns:
+        str:
+        The path to the generator.
+
+    Raises:
+        GeneratorNotFoundError:
+            The day has no generator.
+    """
+    path = os.path.join(ROOT_DIR, str(year), f'day{day:02}',
+                        GENERATOR_FILENAME)
+
+    if not os.path.exists(path):
+        raise GeneratorNotFoundError(
+            f'There is no input generator for {year} day {day}.')
+
+    return path
+
+
+def load_generator(
+    year: int,
+    day: int,
+) -> GeneratorFunc:
+    """Import a day's generator module and return its entry point.
+
+    Args:
+        year (int):
+            The year of the puzzle.
+
+        day (int):
+            The day of the puzzle.
+
+    Returns:
+        callable:
+        The generator's ``generate`` function.
+
+    Raises:
+        GeneratorNotFoundError:
+            The day has no generator, or it does not define a ``generate``
+            function.
+    """
+    module = load_module(get_generator_path(year, day),
+                         module_name=f'_aoc_{year}_day{day:02}_generate')
+
+    try:
+        return module.generate
+    except AttributeError:
+        raise GeneratorNotFoundError(
+            f'The input generator for {year} day {day} does not define a '
+            f'generate() function.')
+
+
+def write_input(
+    fp: TextIO,
+    year: int,
+    day: int,
+    *,
+    scale: int,
+    seed: int = 0,
+) -> None:
+    """Generate an input for a day and write it to a file.
+
+    Args:
+        fp (io.TextIOBase):
+            The file to write to.
+
+        year (int):
+            The year of the puzzle.
+
+        day (int):
+            The day of the puzzle.
+
+        scale (int):
+            The scale of the input. This must be at least 1.
+
+        seed (int, optional):
+            The seed for the random number generator.
+
+    Raises:
+        GeneratorNotFoundError:
+            The day has no generator.
+    """
+    assert scale >= 1
+
+    generate = load_generator(year, day)
+
+    for line in generate(scale, random.Random(seed)):
+        fp.write(line)
+        fp.write('\n')
+
+
+def get_generated_input(
+    year: int,
+    day: int,
+    *,
+    scale: int,
+    seed: int = 0,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+) -> str:
+    """Return the path to a generated input, generating it if needed.
+
+    Args:
+        year (int):
+            The year of the puzzle.
+
+        day (int):
+            The day of the puzzle.
+
+        scale (int):
+            The scale of the input. This must be at least 1.
+
+        seed (int, optional):
+            The seed for the random number generator.
+
+        cache_dir (str, optional):
+            The directory used to cache generated inputs.
+
+    Returns:
+        str:
+        The path to the generated input.
+
+    Raises:
+        GeneratorNotFoundError:
+            The day has no generator.
+    """
+    generator_path = get_generator_path(year, day)
+    path = os.path.join(cache_dir, str(year), f'day{day:02}',
+                        f'scale{scale}-seed{seed}')
+
+    try:
+        is_current = (os.path.getmtime(path) >=
+                      os.path.getmtime(generator_path))
+    except FileNotFoundError:
+        is_current = False
+
+    if not is_current:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file first, so that an interrupted run
+        # doesn't leave a truncated input in the cache.
+        tmp_path = f'{path}.tmp{os.getpid()}'
+
+        try:
+            with open(tmp_path, 'w') as fp:
+                write_input(fp, year, day,
+                            scale=scale,
+                            seed=seed)
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+            raise
+
+    return path
@@ -0,0 +1,341 @@
+"""Shortest-path searches over integer-indexed graphs.
+
+Nodes are plain integers, from ``0`` up to (but not including) the number of
+nodes in the graph. That could be an index into a list of valves, or an
+offset into a :py:class:`~aoc.grid.Grid`. Search state is then kept in flat
+lists indexed by node, rather than in dictionaries.
+
+Neighbors can be provided either as an adjacency list (a list of neighbor
+lists, indexed by node) or as a function that returns the neighbors of a
+node. The latter is handy for grids, where neighbors are just computed
+offsets::
+
+    def get_neighbors(offset):
+        for delta in grid.offsets4:
+            if grid.data[offset + delta] != WALL:
+                yield offset + delta
+
+    paths = bfs(get_neighbors, start, num_nodes=len(grid.data), end=end)
+    steps = paths.distances[end]
+
+Unweighted graphs should use :py:func:`bfs` (or
+:py:func:`multi_source_bfs`). Weighted graphs should use
+:py:func:`dijkstra`, which takes ``(neighbor, weight)`` pairs instead.
+"""
+
+from collections import deque
+from heapq import heappop, heappush
+from typing import (Callable, Iterable, NamedTuple, Optional, Sequence,
+                    Union)
+
+
+#: The distance (and parent) of a node that was never reached.
+UNREACHABLE = -1
+
+
+#: The neighbors of each node, as an adjacency list or a function.
+Neighbors = Union[Sequence[Iterable[int]],
+                  Callable[[int], Iterable[int]]]
+
+
+#: The ``(neighbor, weight)`` pairs of each node, as a list or a function.
+WeightedNeighbors = Union[Sequence[Iterable[tuple[int, int]]],
+                          Callable[[int], Iterable[tuple[int, int]]]]
+
+
+class ShortestPaths(NamedTuple):
+    """The results of a shortest-path search."""
+
+    #: The distance to each node from the nearest source.
+    #:
+    #: Nodes that weren't reached are :py:data:`UNREACHABLE`.
+    distances: list[int]
+
+    #: The previous node on the shortest path to each node.
+    #:
+    #: Sources and nodes that weren't reached are :py:data:`UNREACHABLE`.
+    parents: list[int]
+
+    def get_path(
+        self,
+        node: int,
+    ) -> list[int]:
+        """Return the shortest path to a node.
+
+        Args:
+            node (int):
+                The node to return the path to.
+
+        Returns:
+            list of int:
+            The nodes along the path, starting with the source and ending
+            with ``node``. This will be empty if the node wasn't reached.
+        """
+        if self.distances[node] == UNREACHABLE:
+            return []
+
+        parents = self.parents
+        path = [node]
+
+        while (node := parents[node]) != UNREACHABLE:
+            path.append(node)
+
+        path.reverse()
+
+        return path
+
+
+def _get_neighbors_func(
+    neighbors: Union[Neighbors, WeightedNeighbors],
+) -> Callable:
+    """Return a function for looking up the neighbors of a node.
+
+    Args:
+        neighbors (list or callable):
+            The adjacency list or neighbors function.
+
+    Returns:
+        callable:
+        The function to call with a node.
+    """
+    if callable(neighbors):
+        return neighbors
+
+    return neighbors.__getitem__
+
+
+def multi_source_bfs(
+    neighbors: Neighbors,
+    starts: Iterable[int],
+    *,
+    num_nodes: int,
+    end: Optional[int] = None,
+) -> ShortestPaths:
+    """Find the shortest paths from the nearest of several starting nodes.
+
+    Every edge has a weight of 1. This is the same as adding a new node
+    connected to each starting node and searching from there, but without
+    having to modify the graph.
+
+    Args:
+        neighbors (list or callable):
+            The neighbors of each node.
+
+        starts (list of int):
+            The starting nodes.
+
+        num_nodes (int):
+            The number of nodes in the graph.
+
+        end (int, optional):
+            A node to stop at once reached. Only nodes closer than this are
+            guaranteed to have their final distances.
+
+    Returns:
+        ShortestPaths:
+        The distances and paths from the nearest starting node.
+    """
+    get_neighbors = _get_neighbors_func(neighbors)
+    distances = [UNREACHABLE] * num_nodes
+    parents = [UNREACHABLE] * num_nodes
+    queue = deque[int]()
+
+    for start in starts:
+        if distances[start] == UNREACHABLE:
+            distances[start] = 0
+            queue.append(start)
+
+    while queue:
+        node = queue.popleft()
+
+        if node == end:
+            break
+
+        distance = distances[node] + 1
+
+        for neighbor in get_neighbors(node):
+            if distances[neighbor] == UNREACHABLE:
+                distances[neighbor] = distance
+                parents[neighbor] = node
+                queue.append(neighbor)
+
+    return ShortestPaths(distances=distances,
+                         parents=parents)
+
+
+def bfs(
+    neighbors: Neighbors,
+    start: int,
+    *,
+    num_nodes: int,
+    end: Optional[int] = None,
+) -> ShortestPaths:
+    """Find the shortest paths from a node, where every edge has a weight of 1.
+
+    Args:
+        neighbors (list or callable):
+            The neighbors of each node.
+
+        start (int):
+            The starting node.
+
+        num_nodes (int):
+            The number of nodes in the graph.
+
+        end (int, optional):
+            A node to stop at once reached. Only nodes closer than this are
+            guaranteed to have their final distances.
+
+    Returns:
+        ShortestPaths:
+        The distances and paths from the starting node.
+    """
+    return multi_source_bfs(neighbors, [start],
+                            num_nodes=num_nodes,
+                            end=end)
+
+
+def dijkstra(
+    neighbors: WeightedNeighbors,
+    start: int,
+    *,
+    num_nodes: int,
+    end: Optional[int] = None,
+) -> ShortestPaths:
+    """Find the shortest paths from a node in a weighted graph.
+
+    This uses a binary heap for the nodes to visit. Rather than updating
+    entries in the heap when a shorter path is found, a new entry is pushed,
+    and stale entries are skipped when popped.
+
+    Weights must not be negative.
+
+    Args:
+        neighbors (list or callable):
+            The ``(neighbor, weight)`` pairs of each node.
+
+        start (int):
+            The starting node.
+
+        num_nodes (int):
+            The number of nodes in the graph.
+
+        end (int, optional):
+            A node to stop at once reached. Only nodes closer than this are
+            guaranteed to have their final distances.
+
+    Returns:
+        ShortestPaths:
+        The distances and paths from the starting node.
+    """
+    get_neighbors = _get_neighbors_func(neighbors)
+    distances = [UNREACHABLE] * num_nodes
+    parents = [UNREACHABLE] * num_nodes
+    visited = bytearray(num_nodes)
+    to_visit = [(0, start)]
+
+    distances[start] = 0
+
+    while to_visit:
+        distance, node = heappop(to_visit)
+
+        if visited[node]:
+            # We already found a shorter path to this node.
+            continue
+
+        visited[node] = 1
+
+        if node == end:
+            break
+
+        for neighbor, weight in get_neighbors(node):
+            neighbor_distance = distance + weight
+            cur_distance = distances[neighbor]
+
+            if (cur_distance == UNREACHABLE or
+                neighbor_distance < cur_distance):
+                distances[neighbor] = neighbor_distance
+                parents[neighbor] = node
+                heappush(to_visit, (neighbor_distance, neighbor))
+
+    return ShortestPaths(distances=distances,
+                         parents=parents)
+
+
+def all_pairs_bfs(
+    neighbors: Neighbors,
+    *,
+    num_nodes: int,
+) -> list[list[int]]:
+    """Return the distances between every pair of nodes in a graph.
+
+    Every edge has a weight of 1. This runs a search from every node, which
+    is faster than :py:func:`floyd_warshall` for sparse graphs.
+
+    Args:
+        neighbors (list or callable):
+            The neighbors of each node.
+
+        num_nodes (int):
+            The number of nodes in the graph.
+
+    Returns:
+        list of list of int:
+        A matrix of distances, indexed by ``[from][to]``. Pairs that can't
+        be reached are :py:data:`UNREACHABLE`.
+    """
+    return [
+        bfs(neighbors, node, num_nodes=num_nodes).distances
+        for node in range(num_nodes)
+    ]
+
+
+def floyd_warshall(
+    neighbors: WeightedNeighbors,
+    *,
+    num_nodes: int,
+) -> list[list[int]]:
+    """Return the distances between every pair of nodes in a weighted graph.
+
+    This is best suited to small, dense graphs.
+
+    Args:
+        neighbors (list or callable):
+            The ``(neighbor, weight)`` pairs of each node.
+
+        num_nodes (int):
+            The number of nodes in the graph.
+
+    Returns:
+        list of list of int:
+        A matrix of distances, indexed by ``[from][to]``. Pairs that can't
+        be reached are :py:data:`UNREACHABLE`.
+    """
+    get_neighbors = _get_neighbors_func(neighbors)
+    inf = float('inf')
+    distances = [[inf] * num_nodes for i in range(num_nodes)]
+
+    for node, row in enumerate(distances):
+        row[node] = 0
+
+        for neighbor, weight in get_neighbors(node):
+            row[neighbor] = min(row[neighbor], weight)
+
+    for k, row_k in enumerate(distances):
+        for row_i in distances:
+            dist_ik = row_i[k]
+
+            if dist_ik == inf:
+                continue
+
+            for j, dist_kj in enumerate(row_k):
+                if dist_ik + dist_kj < row_i[j]:
+                    row_i[j] = dist_ik + dist_kj
+
+    return [
+        [
+            UNREACHABLE if distance == inf else distance
+            for distance in row
+        ]
+        for row in distances
+    ]
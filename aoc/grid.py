@@ -0,0 +1,515 @@
+"""A compact 2D grid of bytes, for grid-based puzzles.
+
+Cells are stored in a single flat :py:class:`bytearray`, one byte per cell,
+row after row. Every row is surrounded by a border of padding cells, so
+code walking the grid can step off the edge without bounds checks. It'll
+just land on a border cell, which can be given a value that's easy to
+reject (an impossible height, a wall, etc.).
+
+Hot loops generally work on offsets into :py:attr:`Grid.data` rather than
+``(x, y)`` positions. Moving in a direction is then just adding one of the
+precomputed :py:attr:`Grid.offsets4` or :py:attr:`Grid.offsets8` values::
+
+    grid = Grid.from_file(filename, border=b'#')
+    up, right, down, left = grid.offsets4
+
+    offset = grid.find(b'S')
+
+    while grid.data[offset + up] != ord(b'#'):
+        offset += up
+"""
+
+from typing import Iterable, Iterator, Optional, Union
+
+from aoc.inputs import open_input
+
+
+#: A cell value, as either an integer or a single byte.
+CellValue = Union[int, bytes]
+
+
+def _to_byte(
+    value: CellValue,
+) -> int:
+    """Return a cell value as an integer.
+
+    Args:
+        value (int or bytes):
+            The value to convert.
+
+    Returns:
+        int:
+        The integer byte value.
+    """
+    if isinstance(value, int):
+        return value
+
+    assert len(value) == 1, f'Expected a single byte, got {value!r}'
+
+    return value[0]
+
+
+class Grid:
+    """A 2D grid of bytes with a padded border.
+
+    Positions are ``(x, y)``, with ``(0, 0)`` at the top-left of the
+    grid's interior. Border cells sit at negative positions and at positions
+    past the width and height.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        padding: int = 1,
+        fill: CellValue = 0,
+        border: CellValue = 0,
+    ) -> None:
+        """Initialize the grid.
+
+        Args:
+            width (int):
+                The number of cells in each row, not including padding.
+
+            height (int):
+                The number of rows, not including padding.
+
+            padding (int, optional):
+                The number of border cells around each side of the grid.
+
+            fill (int or bytes, optional):
+                The value to set for all interior cells.
+
+            border (int or bytes, optional):
+                The value to set for all border cells.
+        """
+        assert padding >= 0
+
+        border = _to_byte(border)
+        fill = _to_byte(fill)
+
+        stride = width + padding * 2
+
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.border = border
+
+        #: The number of bytes between the start of each row.
+        self.stride = stride
+
+        #: The flat grid data, including the border.
+        self.data = bytearray([border]) * (stride * (height + padding * 2))
+
+        #: Offsets to the neighbors above, right, below, and left of a cell.
+        self.offsets4 = (-stride, 1, stride, -1)
+
+        #: Offsets to all 8 neighbors of a cell, clockwise from above.
+        self.offsets8 = (-stride, -stride + 1, 1, stride + 1,
+                         stride, stride - 1, -1, -stride - 1)
+
+        if fill != border:
+            fill_row = bytes([fill]) * width
+
+            for offset in self.iter_row_starts():
+                self.data[offset:offset + width] = fill_row
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[bytes],
+        *,
+        padding: int = 1,
+        border: CellValue = 0,
+    ) -> 'Grid':
+        """Create a grid from rows of bytes.
+
+        All rows must be the same length.
+
+        Args:
+            rows (list of bytes):
+                The rows to populate the grid with. These can be any
+                bytes-like objects.
+
+            padding (int, optional):
+                The number of border cells around each side of the grid.
+
+            border (int or bytes, optional):
+                The value to set for all border cells.
+
+        Returns:
+            Grid:
+            The new grid.
+        """
+        rows = list(rows)
+        width = len(rows[0]) if rows else 0
+
+        grid = cls(width, len(rows),
+                   padding=padding,
+                   fill=border,
+                   border=border)
+        data = grid.data
+
+        for offset, row in zip(grid.iter_row_starts(), rows):
+            assert len(row) == width, (
+                f'Expected a row of length {width}, got {len(row)}')
+
+            data[offset:offset + width] = row
+
+        return grid
+
+    @classmethod
+    def from_file(
+        cls,
+        filename: str,
+        *,
+        padding: int = 1,
+        border: CellValue = 0,
+    ) -> 'Grid':
+        """Create a grid from the lines in a file.
+
+        Args:
+            filename (str):
+                The path to the file.
+
+            padding (int, optional):
+                The number of border cells around each side of the grid.
+
+            border (int or bytes, optional):
+                The value to set for all border cells.
+
+        Returns:
+            Grid:
+            The new grid.
+        """
+        with open_input(filename) as input_data:
+            return cls.from_rows(input_data.as_grid().iter_rows(),
+                                 padding=padding,
+                                 border=border)
+
+    def __getitem__(
+        self,
+        pos: tuple[int, int],
+    ) -> int:
+        """Return the value at a position.
+
+        Args:
+            pos (tuple):
+                The ``(x, y)`` position.
+
+        Returns:
+            int:
+            The value at that position.
+        """
+        return self.data[self.get_offset(*pos)]
+
+    def __setitem__(
+        self,
+        pos: tuple[int, int],
+        value: CellValue,
+    ) -> None:
+        """Set the value at a position.
+
+        Args:
+            pos (tuple):
+                The ``(x, y)`` position.
+
+            value (int or bytes):
+                The value to set.
+        """
+        self.data[self.get_offset(*pos)] = _to_byte(value)
+
+    def __str__(self) -> str:
+        """Return the interior of the grid as text, one line per row.
+
+        Returns:
+            str:
+            The grid as text.
+        """
+        return '\n'.join(
+            bytes(self.row(y)).decode('latin-1')
+            for y in range(self.height)
+        )
+
+    def get_offset(
+        self,
+        x: int,
+        y: int,
+    ) -> int:
+        """Return the offset of a position in :py:attr:`data`.
+
+        Args:
+            x (int):
+                The X position.
+
+            y (int):
+                The Y position.
+
+        Returns:
+            int:
+            The offset.
+        """
+        padding = self.padding
+
+        return (y + padding) * self.stride + x + padding
+
+    def get_pos(
+        self,
+        offset: int,
+    ) -> tuple[int, int]:
+        """Return the position of an offset in :py:attr:`data`.
+
+        Args:
+            offset (int):
+                The offset.
+
+        Returns:
+            tuple:
+            The ``(x, y)`` position.
+        """
+        y, x = divmod(offset, self.stride)
+        padding = self.padding
+
+        return x - padding, y - padding
+
+    def in_bounds(
+        self,
+        x: int,
+        y: int,
+    ) -> bool:
+        """Return whether a position is within the grid's interior.
+
+        Args:
+            x (int):
+                The X position.
+
+            y (int):
+                The Y position.
+
+        Returns:
+            bool:
+            ``True`` if the position is inside the grid.
+        """
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def iter_row_starts(self) -> Iterator[int]:
+        """Iterate through the offsets of the first cell in each row.
+
+        Yields:
+            int:
+            The offset of the start of each row.
+        """
+        start = self.get_offset(0, 0)
+
+        yield from range(start, start + self.height * self.stride,
+                         self.stride)
+
+    def row_offsets(
+        self,
+        y: int,
+    ) -> range:
+        """Return the offsets of each cell in a row.
+
+        This can be passed to :py:func:`reversed` to walk right-to-left.
+
+        Args:
+            y (int):
+                The row.
+
+        Returns:
+            range:
+            The offsets, left-to-right.
+        """
+        start = self.get_offset(0, y)
+
+        return range(start, start + self.width)
+
+    def column_offsets(
+        self,
+        x: int,
+    ) -> range:
+        """Return the offsets of each cell in a column.
+
+        This can be passed to :py:func:`reversed` to walk bottom-to-top.
+
+        Args:
+            x (int):
+                The column.
+
+        Returns:
+            range:
+            The offsets, top-to-bottom.
+        """
+        start = self.get_offset(x, 0)
+
+        return range(start, start + self.height * self.stride, self.stride)
+
+    def row(
+        self,
+        y: int,
+    ) -> memoryview:
+        """Return a view of a row.
+
+        Args:
+            y (int):
+                The row.
+
+        Returns:
+            memoryview:
+            A writable view of the row's cells.
+        """
+        start = self.get_offset(0, y)
+
+        return memoryview(self.data)[start:start + self.width]
+
+    def column(
+        self,
+        x: int,
+    ) -> memoryview:
+        """Return a view of a column.
+
+        Args:
+            x (int):
+                The column.
+
+        Returns:
+            memoryview:
+            A writable view of the column's cells.
+        """
+        start = self.get_offset(x, 0)
+
+        return memoryview(self.data)[start:start + self.height * self.stride:
+                                     self.stride]
+
+    def iter_offsets(
+        self,
+        value: CellValue,
+    ) -> Iterator[int]:
+        """Iterate through the offsets of all interior cells with a value.
+
+        Args:
+            value (int or bytes):
+                The value to search for.
+
+        Yields:
+            int:
+            The offset of each matching cell, in row order.
+        """
+        value = bytes([_to_byte(value)])
+        find = self.data.find
+        width = self.width
+
+        for start in self.iter_row_starts():
+            end = start + width
+            offset = find(value, start, end)
+
+            while offset != -1:
+                yield offset
+                offset = find(value, offset + 1, end)
+
+    def iter_positions(
+        self,
+        value: CellValue,
+    ) -> Iterator[tuple[int, int]]:
+        """Iterate through the positions of all interior cells with a value.
+
+        Args:
+            value (int or bytes):
+                The value to search for.
+
+        Yields:
+            tuple:
+            The ``(x, y)`` position of each matching cell, in row order.
+        """
+        get_pos = self.get_pos
+
+        for offset in self.iter_offsets(value):
+            yield get_pos(offset)
+
+    def find(
+        self,
+        value: CellValue,
+    ) -> Optional[int]:
+        """Return the offset of the first interior cell with a value.
+
+        Args:
+            value (int or bytes):
+                The value to search for.
+
+        Returns:
+            int:
+            The offset, or ``None`` if no cell has that value.
+        """
+        for offset in self.iter_offsets(value):
+            return offset
+
+        return None
+
+    def count(
+        self,
+        value: CellValue,
+    ) -> int:
+        """Return the number of interior cells with a value.
+
+        Args:
+            value (int or bytes):
+                The value to count.
+
+        Returns:
+            int:
+            The number of matching cells.
+        """
+        value = bytes([_to_byte(value)])
+        count = self.data.count
+        width = self.width
+
+        return sum(
+            count(value, start, start + width)
+            for start in self.iter_row_starts()
+        )
+
+    def copy(self) -> 'Grid':
+        """Return a copy of the grid.
+
+        Returns:
+            Grid:
+            The new grid.
+        """
+        grid = type(self).__new__(type(self))
+        grid.__dict__.update(self.__dict__)
+        grid.data = bytearray(self.data)
+
+        return grid
+
+    def to_numpy(
+        self,
+        *,
+        include_border: bool = False,
+    ):
+        """Return a NumPy array view of the grid.
+
+        The array shares memory with the grid, so changes to one are visible
+        in the other. This requires NumPy to be installed.
+
+        Args:
+            include_border (bool, optional):
+                Whether to include the border cells.
+
+        Returns:
+            numpy.ndarray:
+            A 2D array of ``uint8`` values, indexed by ``[y, x]``.
+        """
+        import numpy as np
+
+        padding = self.padding
+        array = (
+            np.frombuffer(self.data, dtype=np.uint8)
+            .reshape(-1, self.stride)
+        )
+
+        if include_border:
+            return array
+        else:
+            return array[padding:padding + self.height,
+                         padding:padding + self.width]
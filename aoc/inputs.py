@@ -0,0 +1,935 @@
+"""Memory-mapped access to puzzle inputs.
+
+Most solutions start by reading the whole input into a list of strings.
+That's fine for the real puzzle inputs, but it means every input exists
+twice in memory (once as the file contents and once as Python objects), and
+large generated inputs get expensive quickly.
+
+:py:func:`open_input` instead maps the file into memory and hands out
+zero-copy :py:class:`memoryview` slices of it::
+
+    with open_input(filename) as data:
+        for line in data.iter_lines():
+            ...
+
+Views are only valid while the input is open. Anything that needs to be
+kept around afterward should be copied out with ``bytes(view)``.
+
+Inputs don't have to be files, though. Line-oriented solvers can also read
+from a binary or text stream (such as ``sys.stdin.buffer`` or a pipe from a
+generator or decompressor) or any iterable of lines, processing them as they
+arrive without holding the whole input in memory.
+:py:func:`open_text_input` takes any of these and returns something that
+reads like a text file::
+
+    @accepts_streams
+    def solve(source):
+        with open_text_input(source) as fp:
+            for line in fp:
+                ...
+
+Solvers that support this are marked with :py:func:`accepts_streams`, which
+tells the runner it can hand them a stream directly.
+
+Parsing an input can cost as much as solving it. Parse functions decorated
+with :py:func:`cache_parsed` keep their result for as long as the input file
+is unchanged, so a long-running process (such as ``aoc serve``) only parses
+each input once.
+"""
+
+import functools
+import io
+import mmap
+import os
+import warnings
+from contextlib import contextmanager
+from typing import (IO, Any, Callable, Iterable, Iterator, Optional, TypeVar,
+                    Union)
+
+
+#: The byte value of a newline.
+NEWLINE = ord(b'\n')
+
+
+#: The default size of chunks of input to process at once, in bytes.
+#:
+#: Chunks are extended to the end of the line, so this is a minimum.
+CHUNK_SIZE = 1024 * 1024
+
+
+#: A source of input for a solver.
+#:
+#: This is a path to a file, a binary or text stream, or an iterable of
+#: lines (as strings or bytes, with or without trailing newlines).
+InputSource = Union[str, os.PathLike, IO[bytes], IO[str], Iterable[str],
+                    Iterable[bytes]]
+
+
+_FuncT = TypeVar('_FuncT', bound=Callable[..., Any])
+
+
+class BytesGrid:
+    """A 2D view over an input made up of equal-length lines.
+
+    Cells are addressed by ``(x, y)``, with ``(0, 0)`` at the top-left. The
+    grid doesn't copy anything. It just translates positions into offsets
+    in the underlying data, where each row starts ``stride`` bytes after the
+    previous one.
+    """
+
+    def __init__(
+        self,
+        data: memoryview,
+        *,
+        width: int,
+        height: int,
+        stride: int,
+    ) -> None:
+        """Initialize the grid.
+
+        Args:
+            data (memoryview):
+                The underlying data.
+
+            width (int):
+                The number of cells in each row.
+
+            height (int):
+                The number of rows.
+
+            stride (int):
+                The number of bytes between the start of each row. This is
+                normally the width plus the trailing newline.
+        """
+        self.data = data
+        self.width = width
+        self.height = height
+        self.stride = stride
+
+    def __getitem__(
+        self,
+        pos: tuple[int, int],
+    ) -> int:
+        """Return the byte value at a position.
+
+        No bounds checks are performed beyond those of the underlying data.
+
+        Args:
+            pos (tuple):
+                The ``(x, y)`` position.
+
+        Returns:
+            int:
+            The byte value at that position.
+        """
+        x, y = pos
+
+        return self.data[y * self.stride + x]
+
+    def get_offset(
+        self,
+        x: int,
+        y: int,
+    ) -> int:
+        """Return the offset of a position in the underlying data.
+
+        Args:
+            x (int):
+                The X position.
+
+            y (int):
+                The Y position.
+
+        Returns:
+            int:
+            The offset in :py:attr:`data`.
+        """
+        return y * self.stride + x
+
+    def get_pos(
+        self,
+        offset: int,
+    ) -> tuple[int, int]:
+        """Return the position for an offset in the underlying data.
+
+        Args:
+            offset (int):
+                The offset in :py:attr:`data`.
+
+        Returns:
+            tuple:
+            The ``(x, y)`` position.
+        """
+        y, x = divmod(offset, self.stride)
+
+        return x, y
+
+    def row(
+        self,
+        y: int,
+    ) -> memoryview:
+        """Return a view of a row, without the trailing newline.
+
+        Args:
+            y (int):
+                The row to return.
+
+        Returns:
+            memoryview:
+            The view of the row.
+        """
+        start = y * self.stride
+
+        return self.data[start:start + self.width]
+
+    def iter_rows(self) -> Iterator[memoryview]:
+        """Iterate through views of each row.
+
+        Yields:
+            memoryview:
+            The view of each row, without the trailing newline.
+        """
+        for y in range(self.height):
+            yield self.row(y)
+
+    def iter_offsets(
+        self,
+        value: Union[bytes, int],
+    ) -> Iterator[int]:
+        """Iterate through the offsets of every cell with a given value.
+
+        This searches in native code, rather than visiting each cell, so
+        it's very fast for sparse values.
+
+        Args:
+            value (bytes or int):
+                The value to search for.
+
+        Yields:
+            int:
+            Each offset in :py:attr:`data` containing the value.
+        """
+        if isinstance(value, int):
+            value = bytes((value,))
+
+        # memoryview has no find(), but the object it's viewing does.
+        buf = self.data.obj
+        find = buf.find
+        end = min(len(self.data), self.height * self.stride)
+        offset = find(value, 0, end)
+
+        while offset != -1:
+            yield offset
+            offset = find(value, offset + 1, end)
+
+    def iter_positions(
+        self,
+        value: Union[bytes, int],
+    ) -> Iterator[tuple[int, int]]:
+        """Iterate through the positions of every cell with a given value.
+
+        Args:
+            value (bytes or int):
+                The value to search for.
+
+        Yields:
+            tuple:
+            Each ``(x, y)`` position containing the value.
+        """
+        stride = self.stride
+
+        for offset in self.iter_offsets(value):
+            y, x = divmod(offset, stride)
+
+            yield x, y
+
+    def find(
+        self,
+        value: Union[bytes, int],
+    ) -> Optional[tuple[int, int]]:
+        """Return the position of the first cell with a given value.
+
+        Args:
+            value (bytes or int):
+                The value to search for.
+
+        Returns:
+            tuple:
+            The ``(x, y)`` position, or ``None`` if it wasn't found.
+        """
+        for pos in self.iter_positions(value):
+            return pos
+
+        return None
+
+
+class InputFile:
+    """A memory-mapped puzzle input.
+
+    This can be used as a context manager, which will close the input when
+    done.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+    ) -> None:
+        """Open and map the input.
+
+        Args:
+            filename (str):
+                The path to the input file.
+        """
+        self.filename = filename
+
+        with open(filename, 'rb') as fp:
+            if os.fstat(fp.fileno()).st_size > 0:
+                self._mmap = mmap.mmap(fp.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+                buf = self._mmap
+            else:
+                # Empty files can't be mapped.
+                self._mmap = None
+                buf = b''
+
+        #: A view of the whole input.
+        self.data = memoryview(buf)
+
+    def __enter__(self) -> 'InputFile':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def close(self) -> None:
+        """Close the input.
+
+        Views handed out by this input must not be used after this.
+        """
+        self.data.release()
+
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Something still references a view (commonly the last line
+                # of a loop). The mapping will be closed once that's
+                # garbage-collected.
+                pass
+
+            self._mmap = None
+
+    def iter_line_bounds(self) -> Iterator[tuple[int, int]]:
+        """Iterate through the start and end offsets of each line.
+
+        The end offset excludes the trailing newline. A trailing newline at
+        the end of the input does not produce an extra empty line.
+
+        Yields:
+            tuple:
+            A 2-tuple of ``(start, end)`` offsets for each line.
+        """
+        buf = self.data.obj
+        find = buf.find
+        size = len(buf)
+        start = 0
+
+        while start < size:
+            end = find(b'\n', start)
+
+            if end == -1:
+                end = size
+
+            yield start, end
+            start = end + 1
+
+    def iter_lines(self) -> Iterator[memoryview]:
+        """Iterate through views of each line.
+
+        Yields:
+            memoryview:
+            A view of each line, without the trailing newline.
+        """
+        data = self.data
+
+        for start, end in self.iter_line_bounds():
+            yield data[start:end]
+
+    def iter_chunk_bounds(
+        self,
+        chunk_size: int = CHUNK_SIZE,
+        *,
+        separator: bytes = b'\n',
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[tuple[int, int]]:
+        """Iterate through the start and end offsets of large chunks.
+
+        Each chunk is at least ``chunk_size`` bytes (except for the last),
+        and extends to the end of the next separator, including the
+        separator. By default, this splits the input into chunks of whole
+        lines. A separator of ``b'\\n\\n'`` splits it into chunks of whole
+        blank-line-separated records.
+
+        Args:
+            chunk_size (int, optional):
+                The minimum size of each chunk, in bytes.
+
+            separator (bytes, optional):
+                The separator that chunks must end on.
+
+            start (int, optional):
+                The offset to start from. This should be the start of the
+                input or the end of a previous chunk.
+
+            end (int, optional):
+                The offset to stop at. This defaults to the end of the input.
+
+        Yields:
+            tuple:
+            A 2-tuple of ``(start, end)`` offsets for each chunk.
+        """
+        find = self.data.obj.find
+        sep_len = len(separator)
+
+        if end is None:
+            end = len(self.data)
+
+        while start < end:
+            chunk_end = find(separator,
+                             start + max(0, chunk_size - sep_len),
+                             end)
+
+            if chunk_end == -1:
+                chunk_end = end
+            else:
+                chunk_end += sep_len
+
+            yield start, chunk_end
+            start = chunk_end
+
+    def iter_chunks(
+        self,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Iterator[memoryview]:
+        """Iterate through views of large chunks of whole lines.
+
+        Each chunk is at least ``chunk_size`` bytes (except for the last),
+        and extends to the end of a line, including its newline. Nothing
+        on a line is ever split across chunks.
+
+        Args:
+            chunk_size (int, optional):
+                The minimum size of each chunk, in bytes.
+
+        Yields:
+            memoryview:
+            A view of each chunk.
+        """
+        data = self.data
+
+        for start, end in self.iter_chunk_bounds(chunk_size):
+            yield data[start:end]
+
+    def iter_int_rows(
+        self,
+        sep: Optional[bytes] = None,
+    ) -> Iterator[list[int]]:
+        """Iterate through the integers on each line.
+
+        Empty lines produce an empty list.
+
+        Args:
+            sep (bytes, optional):
+                The separator between integers. By default, integers are
+                separated by any amount of whitespace.
+
+        Yields:
+            list of int:
+            The integers on each line.
+        """
+        buf = self.data.obj
+
+        for start, end in self.iter_line_bounds():
+            yield [
+                int(value)
+                for value in buf[start:end].split(sep)
+            ]
+
+    def read_int_columns(
+        self,
+        sep: Optional[bytes] = None,
+    ) -> list[list[int]]:
+        """Return the integers in each column of the input.
+
+        Every non-empty line must have the same number of integers.
+
+        Args:
+            sep (bytes, optional):
+                The separator between integers. By default, integers are
+                separated by any amount of whitespace.
+
+        Returns:
+            list of list of int:
+            A list of integers for each column.
+        """
+        return _collect_int_columns(self.iter_int_rows(sep))
+
+    def as_grid(self) -> BytesGrid:
+        """Return a grid view over the input.
+
+        All lines must be the same length.
+
+        Returns:
+            BytesGrid:
+            The grid view.
+        """
+        data = self.data
+        size = len(data)
+        width = data.obj.find(b'\n')
+
+        if width == -1:
+            # There's only a single row.
+            return BytesGrid(data, width=size, height=1 if size else 0,
+                             stride=size + 1)
+
+        stride = width + 1
+
+        # The last row may or may not have a trailing newline.
+        height = (size + 1) // stride
+
+        return BytesGrid(data,
+                         width=width,
+                         height=height,
+                         stride=stride)
+
+
+def open_input(
+    filename: str,
+) -> InputFile:
+    """Open a memory-mapped puzzle input.
+
+    Args:
+        filename (str):
+            The path to the input file.
+
+    Returns:
+        InputFile:
+        The opened input. This should be closed when done, or used as a
+        context manager.
+    """
+    return InputFile(filename)
+
+
+class _LineIterableReader(io.TextIOBase):
+    """A read-only text stream over an iterable of lines."""
+
+    def __init__(
+        self,
+        lines: Iterable[Union[str, bytes]],
+    ) -> None:
+        """Initialize the reader.
+
+        Args:
+            lines (iterable):
+                The lines to read, as strings or UTF-8 bytes.
+        """
+        super().__init__()
+
+        self._lines = iter(lines)
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(
+        self,
+        size: Optional[int] = -1,
+    ) -> str:
+        """Return the next line.
+
+        Args:
+            size (int, optional):
+                Unused. Lines are always returned whole.
+
+        Returns:
+            str:
+            The next line, ending in a newline, or an empty string once
+            there are no lines left.
+        """
+        line = next(self._lines, None)
+
+        if line is None:
+            return ''
+
+        if isinstance(line, bytes):
+            line = line.decode()
+
+        if not line.endswith('\n'):
+            line += '\n'
+
+        return line
+
+
+def is_path_source(
+    source: InputSource,
+) -> bool:
+    """Return whether an input source is a path to a file.
+
+    Args:
+        source (InputSource):
+            The input source.
+
+    Returns:
+        bool:
+        ``True`` if the source is a path.
+    """
+    return isinstance(source, (str, os.PathLike))
+
+
+@contextmanager
+def open_text_input(
+    source: InputSource,
+) -> Iterator[IO[str]]:
+    """Open an input source for reading as text.
+
+    Files are opened normally. Streams and iterables are read lazily, a
+    line at a time, so memory use doesn't grow with the size of the input.
+    Streams passed in aren't closed afterward.
+
+    Args:
+        source (InputSource):
+            The input source.
+
+    Context:
+        io.TextIOBase:
+        A text stream supporting iteration and ``readline()``.
+    """
+    if is_path_source(source):
+        with open(source, 'r') as fp:  # type: ignore
+            yield fp
+    elif isinstance(source, io.TextIOBase):
+        yield source
+    elif hasattr(source, 'read'):
+        # This is a binary stream. Wrap it, and then detach the wrapper so
+        # that the caller's stream isn't closed along with it.
+        wrapper = io.TextIOWrapper(source, encoding='utf-8')  # type: ignore
+
+        try:
+            yield wrapper
+        finally:
+            wrapper.detach()
+    else:
+        yield _LineIterableReader(source)  # type: ignore
+
+
+def iter_input_chunks(
+    source: InputSource,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Union[bytes, memoryview]]:
+    """Iterate through large chunks of whole lines from an input source.
+
+    Files are memory-mapped (see :py:meth:`InputFile.iter_chunks`), and
+    anything else is read as a stream, a chunk at a time. Either way,
+    nothing on a line is ever split across chunks.
+
+    Args:
+        source (InputSource):
+            The input source.
+
+        chunk_size (int, optional):
+            The minimum size of each chunk, in bytes.
+
+    Yields:
+        bytes or memoryview:
+        Each chunk of the input, including newlines. These can be searched
+        with bytes regular expressions.
+    """
+    if is_path_source(source):
+        with open_input(source) as data:  # type: ignore
+            yield from data.iter_chunks(chunk_size)
+    else:
+        with open_text_input(source) as fp:
+            while True:
+                lines = fp.readlines(chunk_size)
+
+                if not lines:
+                    break
+
+                yield ''.join(lines).encode()
+
+
+def iter_int_rows(
+    source: InputSource,
+    sep: Optional[str] = None,
+) -> Iterator[list[int]]:
+    """Iterate through the integers on each line of an input source.
+
+    Files are memory-mapped (see :py:meth:`InputFile.iter_int_rows`), and
+    anything else is read as a stream.
+
+    Args:
+        source (InputSource):
+            The input source.
+
+        sep (str, optional):
+            The separator between integers. By default, integers are
+            separated by any amount of whitespace.
+
+    Yields:
+        list of int:
+        The integers on each line.
+    """
+    if is_path_source(source):
+        with open_input(source) as data:  # type: ignore
+            yield from data.iter_int_rows(None if sep is None
+                                          else sep.encode())
+    else:
+        with open_text_input(source) as fp:
+            for line in fp:
+                yield [
+                    int(value)
+                    for value in line.split(sep)
+                ]
+
+
+def read_int_columns(
+    source: InputSource,
+    sep: Optional[str] = None,
+) -> list[list[int]]:
+    """Return the integers in each column of an input source.
+
+    Every non-empty line must have the same number of integers.
+
+    Args:
+        source (InputSource):
+            The input source.
+
+        sep (str, optional):
+            The separator between integers. By default, integers are
+            separated by any amount of whitespace.
+
+    Returns:
+        list of list of int:
+        A list of integers for each column.
+    """
+    return _collect_int_columns(iter_int_rows(source, sep))
+
+
+def read_int_array(
+    source: InputSource,
+    *,
+    columns: int,
+    sep: Optional[str] = None,
+):
+    """Return the integers in an input source as a NumPy array.
+
+    The whole input is parsed in one go by NumPy, which is far faster than
+    parsing a line at a time for large inputs. This requires NumPy to be
+    installed.
+
+    Args:
+        source (InputSource):
+            The input source.
+
+        columns (int):
+            The number of integers on each line.
+
+        sep (str, optional):
+            The separator between integers on a line. By default, integers
+            are separated by any amount of whitespace.
+
+    Returns:
+        numpy.ndarray:
+        A 2D array of ``int64`` values, indexed by ``[line, column]``.
+
+    Raises:
+        ValueError:
+            The input contained something other than integers, or the wrong
+            number of them.
+    """
+    import numpy as np
+
+    with open_text_input(source) as fp:
+        text = fp.read()
+
+    if sep is not None:
+        text = text.replace(sep, ' ')
+
+    values = parse_int_array(text)
+
+    if len(values) % columns:
+        raise ValueError(
+            f'Expected {columns} integers on each line, but found '
+            f'{len(values)} integers in total.')
+
+    return values.reshape(-1, columns)
+
+
+def parse_int_array(
+    text: str,
+):
+    """Return the whitespace-separated integers in text as a NumPy array.
+
+    The text is parsed in one go by NumPy. NumPy stops parsing at the first
+    thing that isn't an integer (older versions just warn about it, rather
+    than failing), so the number of values parsed is checked against the
+    number of whitespace-separated tokens in the text. This requires NumPy
+    to be installed.
+
+    Args:
+        text (str):
+            The text to parse.
+
+    Returns:
+        numpy.ndarray:
+        A 1D array of ``int64`` values.
+
+    Raises:
+        ValueError:
+            The text contained something other than integers and
+            whitespace.
+    """
+    import numpy as np
+
+    # A token starts wherever whitespace (space, or \t through \r) is
+    # followed by anything else, or at the start of the text.
+    chars = np.frombuffer(text.encode(), dtype=np.uint8)
+    is_space = (chars == ord(' ')) | ((chars >= 9) & (chars <= 13))
+    num_tokens = (int(np.count_nonzero(is_space[:-1] & ~is_space[1:])) +
+                  int(len(chars) > 0 and not is_space[0]))
+
+    if num_tokens == 0:
+        # NumPy parses text with nothing but whitespace as a single 0.
+        return np.zeros(0, dtype=np.int64)
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+
+            # A separator of ' ' matches any run of whitespace, including
+            # newlines.
+            values = np.fromstring(text, dtype=np.int64, sep=' ')
+    except (DeprecationWarning, ValueError):
+        values = None
+
+    if values is None or len(values) != num_tokens:
+        # This only happens for bad input, so it's fine to take the slow
+        # path to find out what went wrong.
+        for token in text.split():
+            try:
+                int(token)
+            except ValueError:
+                break
+        else:
+            token = '(unknown)'
+
+        raise ValueError(
+            f'Expected only integers separated by whitespace, but found '
+            f'{token!r}.')
+
+    return values
+
+
+def _collect_int_columns(
+    rows: Iterable[list[int]],
+) -> list[list[int]]:
+    """Collect rows of integers into columns.
+
+    Empty rows are skipped.
+
+    Args:
+        rows (iterable of list of int):
+            The rows of integers.
+
+    Returns:
+        list of list of int:
+        A list of integers for each column.
+    """
+    columns: list[list[int]] = []
+
+    for row in rows:
+        if not row:
+            continue
+
+        if not columns:
+            columns = [[] for i in range(len(row))]
+
+        assert len(row) == len(columns), (
+            f'Expected {len(columns)} columns, got {len(row)}')
+
+        for column, value in zip(columns, row):
+            column.append(value)
+
+    return columns
+
+
+def accepts_streams(
+    func: _FuncT,
+) -> _FuncT:
+    """Mark a solver as accepting any input source.
+
+    By default, solvers are assumed to need a path to a file. Marked solvers
+    can also be given streams or iterables of lines (see
+    :py:data:`InputSource`), so the runner can pipe input straight to them.
+
+    Args:
+        func (callable):
+            The solver function.
+
+    Returns:
+        callable:
+        The same function.
+    """
+    func.accepts_streams = True  # type: ignore
+
+    return func
+
+
+def cache_parsed(
+    func: _FuncT,
+) -> _FuncT:
+    """Cache the result of parsing an input file.
+
+    The decorated function must take the path to an input file as its only
+    argument. Its result is kept until the file's size or modification time
+    changes, and the same object is returned on each call, so callers must
+    not modify it.
+
+    Only the result for the most recent file is kept. Sources that aren't
+    paths are always parsed.
+
+    Args:
+        func (callable):
+            The parse function.
+
+    Returns:
+        callable:
+        The caching parse function.
+    """
+    cached: Optional[tuple[tuple[str, int, int], Any]] = None
+
+    @functools.wraps(func)
+    def _parse(
+        source: InputSource,
+    ) -> Any:
+        nonlocal cached
+
+        if not is_path_source(source):
+            return func(source)
+
+        path = os.path.abspath(source)  # type: ignore
+        st = os.stat(path)
+        key = (path, st.st_size, st.st_mtime_ns)
+
+        if cached is None or cached[0] != key:
+            cached = (key, func(source))
+
+        return cached[1]
+
+    # Let long-running processes find parse functions to preload.
+    _parse.parses_input = True  # type: ignore
+
+    return _parse  # type: ignore
@@ -0,0 +1,320 @@
+"""Batches of integer intervals, and questions about how they overlap.
+
+Puzzles with ranges (such as sections to clean, or rows a sensor covers)
+tend to check each range or pair of ranges on its own, a line at a time.
+That's fine for one question, but every new question means another pass over
+the input, and another round of parsing.
+
+These classes instead load every interval up-front into parallel lists of
+start and end values. Questions about all the intervals at once are then
+answered with :py:func:`map` over those lists, with the comparisons and
+arithmetic done by C functions from :py:mod:`operator`, rather than a
+Python-level loop::
+
+    pairs = IntervalPairs.from_input(filename)
+
+    num_contained = pairs.count_contained()
+    num_overlapping = pairs.count_overlapping()
+
+Questions about where the intervals fall (how many cover a given point, or
+the most covering any one point) are answered from sorted lists of the
+start and end values, built once on first use. After that, counting the
+intervals covering a point is a pair of binary searches::
+
+    intervals = pairs.get_intervals()
+
+    num_covering = intervals.count_containing(42)
+    max_covering, point = intervals.get_max_overlapping()
+
+All intervals are closed, so both the start and end values are part of the
+interval.
+"""
+
+import operator
+from bisect import bisect_left, bisect_right
+from functools import cached_property
+from typing import Optional
+
+from aoc.inputs import InputSource, iter_input_chunks
+
+
+#: A translation table turning anything that isn't a digit into a space.
+#:
+#: Intervals are written like ``3-6``, so a ``-`` here is a separator, not
+#: a negative sign.
+_DIGIT_BYTES_TABLE = bytes(
+    c if c in b'0123456789' else ord(' ')
+    for c in range(256)
+)
+
+
+class Intervals:
+    """A batch of closed integer intervals.
+
+    Intervals are stored as parallel lists of start and end values, and
+    are identified by their index in those lists.
+    """
+
+    def __init__(
+        self,
+        starts: list[int],
+        ends: list[int],
+    ) -> None:
+        """Initialize the intervals.
+
+        Args:
+            starts (list of int):
+                The start of each interval.
+
+            ends (list of int):
+                The end of each interval. Each must be at least the start
+                of its interval.
+        """
+        assert len(starts) == len(ends)
+
+        #: The start of each interval.
+        self.starts = starts
+
+        #: The end of each interval.
+        self.ends = ends
+
+    def __len__(self) -> int:
+        """Return the number of intervals.
+
+        Returns:
+            int:
+            The number of intervals.
+        """
+        return len(self.starts)
+
+    @cached_property
+    def start_order(self) -> list[int]:
+        """The index of each interval, sorted by start value."""
+        return sorted(range(len(self.starts)), key=self.starts.__getitem__)
+
+    @cached_property
+    def sorted_starts(self) -> list[int]:
+        """The start values of all intervals, in sorted order."""
+        starts = self.starts
+
+        return [
+            starts[i]
+            for i in self.start_order
+        ]
+
+    @cached_property
+    def sorted_ends(self) -> list[int]:
+        """The end values of all intervals, in sorted order."""
+        return sorted(self.ends)
+
+    def count_containing(
+        self,
+        point: int,
+    ) -> int:
+        """Return the number of intervals containing a point.
+
+        Every interval starting at or before the point contains it, unless
+        it also ends before the point.
+
+        Args:
+            point (int):
+                The point to check.
+
+        Returns:
+            int:
+            The number of intervals containing the point.
+        """
+        return (bisect_right(self.sorted_starts, point) -
+                bisect_left(self.sorted_ends, point))
+
+    def get_containing(
+        self,
+        point: int,
+    ) -> list[int]:
+        """Return the intervals containing a point.
+
+        Only intervals starting at or before the point can contain it, and
+        those come first in :py:attr:`start_order`. A binary search finds
+        where they stop, and only those are checked for ending at or after
+        the point.
+
+        Args:
+            point (int):
+                The point to check.
+
+        Returns:
+            list of int:
+            The index of each interval containing the point, in order.
+        """
+        ends = self.ends
+        num_started = bisect_right(self.sorted_starts, point)
+
+        return sorted(
+            i
+            for i in self.start_order[:num_started]
+            if ends[i] >= point
+        )
+
+    def get_max_overlapping(self) -> tuple[int, Optional[int]]:
+        """Return the most intervals containing any one point.
+
+        This sweeps through the sorted start values. The most intervals
+        always overlap at the start of one of them, and the number
+        overlapping there is the number started so far, minus the number
+        that ended before it.
+
+        Returns:
+            tuple:
+            A 2-tuple of ``(count, point)``, where ``point`` is the lowest
+            point contained by ``count`` intervals. If there are no
+            intervals, this is ``(0, None)``.
+        """
+        sorted_ends = self.sorted_ends
+        max_count = 0
+        max_point = None
+
+        for num_started, start in enumerate(self.sorted_starts, start=1):
+            count = num_started - bisect_left(sorted_ends, start)
+
+            if count > max_count:
+                max_count = count
+                max_point = start
+
+        return max_count, max_point
+
+
+class IntervalPairs:
+    """A batch of pairs of closed integer intervals.
+
+    Each pair is stored across four parallel lists (the start and end of the
+    first interval, and the start and end of the second), and is identified
+    by its index in those lists.
+    """
+
+    @classmethod
+    def from_input(
+        cls,
+        source: InputSource,
+    ) -> 'IntervalPairs':
+        """Load pairs of intervals from an input source.
+
+        Each pair is written like ``2-4,6-8``. Only the numbers matter, so
+        any other separators will work, too.
+
+        Args:
+            source (aoc.inputs.InputSource):
+                The input source.
+
+        Returns:
+            IntervalPairs:
+            The loaded pairs of intervals.
+
+        Raises:
+            ValueError:
+                The input ended partway through a pair.
+        """
+        values: list[int] = []
+
+        for chunk in iter_input_chunks(source):
+            if isinstance(chunk, memoryview):
+                chunk = chunk.tobytes()
+
+            values += map(int, chunk.translate(_DIGIT_BYTES_TABLE).split())
+
+        if len(values) % 4:
+            raise ValueError(
+                f'The input ended partway through a pair of intervals: '
+                f'{values[-(len(values) % 4):]!r}')
+
+        return cls(values[0::4], values[1::4], values[2::4], values[3::4])
+
+    def __init__(
+        self,
+        starts1: list[int],
+        ends1: list[int],
+        starts2: list[int],
+        ends2: list[int],
+    ) -> None:
+        """Initialize the pairs of intervals.
+
+        Args:
+            starts1 (list of int):
+                The start of the first interval in each pair.
+
+            ends1 (list of int):
+                The end of the first interval in each pair.
+
+            starts2 (list of int):
+                The start of the second interval in each pair.
+
+            ends2 (list of int):
+                The end of the second interval in each pair.
+        """
+        assert len(starts1) == len(ends1) == len(starts2) == len(ends2)
+
+        #: The start of the first interval in each pair.
+        self.starts1 = starts1
+
+        #: The end of the first interval in each pair.
+        self.ends1 = ends1
+
+        #: The start of the second interval in each pair.
+        self.starts2 = starts2
+
+        #: The end of the second interval in each pair.
+        self.ends2 = ends2
+
+    def __len__(self) -> int:
+        """Return the number of pairs.
+
+        Returns:
+            int:
+            The number of pairs.
+        """
+        return len(self.starts1)
+
+    def count_contained(self) -> int:
+        """Return the number of pairs where one interval contains the other.
+
+        One interval contains the other when its start comes no later, and
+        its end comes no earlier. That's when the differences between the
+        starts and between the ends don't have the same sign, so their
+        product is never positive.
+
+        Returns:
+            int:
+            The number of pairs.
+        """
+        return sum(map(
+            (0).__ge__,
+            map(operator.mul,
+                map(operator.sub, self.starts1, self.starts2),
+                map(operator.sub, self.ends1, self.ends2))))
+
+    def count_overlapping(self) -> int:
+        """Return the number of pairs where the intervals overlap at all.
+
+        Rather than checking for overlaps, this counts the pairs that
+        don't overlap, where one interval ends before the other starts.
+        Only one of those can be true for any pair.
+
+        Returns:
+            int:
+            The number of pairs.
+        """
+        return (len(self) -
+                sum(map(operator.lt, self.ends1, self.starts2)) -
+                sum(map(operator.lt, self.ends2, self.starts1)))
+
+    def get_intervals(self) -> Intervals:
+        """Return all intervals from all pairs, for asking where they fall.
+
+        The first interval in pair ``i`` has index ``i``, and the second
+        has index ``len(pairs) + i``.
+
+        Returns:
+            Intervals:
+            All the intervals.
+        """
+        return Intervals(self.starts1 + self.starts2,
+                         self.ends1 + self.ends2)
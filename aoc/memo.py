@@ -0,0 +1,636 @@
+"""Memo caches for recursive searches.
+
+Many solvers search through a huge space of states, remembering the result
+for each state they've seen so they never have to explore it twice. A plain
+dictionary works well for this, but it gives no idea of how well it's
+working, and on large inputs, it can grow until it takes all the memory
+there is.
+
+:py:func:`memo_cache` returns a cache that's used much like a dictionary::
+
+    from aoc.memo import memo_cache
+
+    seen = memo_cache('seen', max_size=1_000_000)
+
+    score = seen.get(key, MISSING)
+
+    if score is MISSING:
+        score = _search(...)
+        seen[key] = score
+
+Looking up keys with :py:meth:`MemoCache.get` avoids raising (and catching)
+an exception for every miss, which adds up quickly in a search that misses
+more often than it hits. ``cache[key]`` works too, raising
+:py:exc:`KeyError` on a miss.
+
+The cache counts its hits and misses, which are reported along with the
+solver's progress (see :py:mod:`aoc.progress`), and can be shown with
+:py:meth:`MemoCache.format_stats`.
+
+If given a maximum size, older entries are evicted to make room for new
+ones. Evicted states are just explored again if seen later, so this trades
+time for memory, but never changes the result of a search that only depends
+on its state.
+
+Two policies are available:
+
+:py:data:`GENERATIONS` (the default):
+    Entries are stored in a young generation. Once it fills up, the old
+    generation is thrown away, and the young one takes its place. Entries
+    used from the old generation are moved back to the young one. This is
+    very cheap, and keeps anything that's still in use.
+
+:py:data:`LRU`:
+    The least recently used entry is evicted for each new entry once the
+    cache is full. This keeps more entries around than generations do, but
+    costs more for every hit.
+
+Keys are kept in memory for as long as their entries are, so they should be
+compact. A tuple of tuples can take hundreds of bytes, while a single
+integer packing the same information takes a few dozen. :py:class:`KeyEncoder`
+helps turn values into small integers (or bitmasks of them) for packing into
+keys.
+"""
+
+import functools
+import operator
+from collections import OrderedDict
+from typing import Any, Collection, Hashable, Iterable, Optional
+
+from aoc import progress
+
+
+#: Evict the oldest generation of entries, once the newest fills up.
+GENERATIONS = 'generations'
+
+#: Evict the least recently used entry.
+LRU = 'lru'
+
+
+#: All supported eviction policies.
+EVICTION_POLICIES = (GENERATIONS, LRU)
+
+
+#: A default for :py:meth:`MemoCache.get`, for caches storing ``None``.
+MISSING = object()
+
+
+class MemoCache:
+    """A memo cache that counts its hits and misses.
+
+    This version is unbounded. Use :py:func:`memo_cache` to create a cache
+    with the right eviction policy.
+    """
+
+    #: The maximum number of entries in the cache.
+    #:
+    #: This is ``None`` if the cache is unbounded.
+    max_size: Optional[int] = None
+
+    def __init__(
+        self,
+        name: str,
+    ) -> None:
+        """Initialize the cache.
+
+        The cache is registered as progress (see :py:mod:`aoc.progress`),
+        so its stats are shown if the solver runs past its time limit.
+
+        Args:
+            name (str):
+                The name to show for the cache.
+        """
+        #: The name to show for the cache.
+        self.name = name
+
+        #: The number of lookups that found an entry.
+        self.hits = 0
+
+        #: The number of lookups that didn't find an entry.
+        self.misses = 0
+
+        #: The number of entries evicted to make room for others.
+        self.evictions = 0
+
+        self._data: dict[Hashable, Any] = {}
+
+        progress.track(name, self.format_stats)
+
+    def __getitem__(
+        self,
+        key: Hashable,
+    ) -> Any:
+        """Return the value for a key, counting the hit or miss.
+
+        Args:
+            key (object):
+                The key to look up.
+
+        Returns:
+            object:
+            The stored value.
+
+        Raises:
+            KeyError:
+                The key isn't in the cache.
+        """
+        value = self.get(key, MISSING)
+
+        if value is MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(
+        self,
+        key: Hashable,
+        value: Any,
+    ) -> None:
+        """Store a value for a key.
+
+        Args:
+            key (object):
+                The key to store.
+
+            value (object):
+                The value to store.
+        """
+        self._data[key] = value
+
+    def __contains__(
+        self,
+        key: Hashable,
+    ) -> bool:
+        """Return whether a key is in the cache.
+
+        This doesn't count as a hit or miss.
+
+        Args:
+            key (object):
+                The key to check.
+
+        Returns:
+            bool:
+            ``True`` if the key is in the cache.
+        """
+        return key in self._data
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache.
+
+        Returns:
+            int:
+            The number of entries.
+        """
+        return len(self._data)
+
+    def get(
+        self,
+        key: Hashable,
+        default: Any = None,
+    ) -> Any:
+        """Return the value for a key, or a default, counting the hit or miss.
+
+        Args:
+            key (object):
+                The key to look up.
+
+            default (object, optional):
+                The value to return if the key isn't in the cache.
+
+        Returns:
+            object:
+            The stored value, or the default.
+        """
+        value = self._data.get(key, MISSING)
+
+        if value is MISSING:
+            self.misses += 1
+
+            return default
+
+        self.hits += 1
+
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries from the cache.
+
+        The stats are kept.
+        """
+        self._data.clear()
+
+    def get_contents(self) -> list[dict[Hashable, Any]]:
+        """Return the dictionaries holding the cache's entries.
+
+        This is used to measure the cache's size (see
+        :py:func:`aoc.memory.get_deep_size`).
+
+        Returns:
+            list of dict:
+            The dictionaries holding the entries.
+        """
+        return [self._data]
+
+    def format_stats(self) -> str:
+        """Return a displayable summary of the cache's stats.
+
+        Returns:
+            str:
+            The summary.
+        """
+        lookups = self.hits + self.misses
+
+        if lookups:
+            hit_rate = f'{self.hits / lookups:.1%}'
+        else:
+            hit_rate = 'n/a'
+
+        stats = (f'{len(self):,} entries, {self.hits:,} hits, '
+                 f'{self.misses:,} misses ({hit_rate} hit rate)')
+
+        if self.max_size is not None:
+            stats += (f', {self.evictions:,} evictions '
+                      f'(max {self.max_size:,})')
+
+        return stats
+
+
+class GenerationalMemoCache(MemoCache):
+    """A memo cache evicting its oldest generation of entries.
+
+    See :py:data:`GENERATIONS`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_size: int,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            name (str):
+                The name to show for the cache.
+
+            max_size (int):
+                The maximum number of entries in the cache. Each generation
+                holds up to half of these.
+        """
+        super().__init__(name)
+
+        self.max_size = max_size
+        self._generation_size = max(1, max_size // 2)
+        self._old_data: dict[Hashable, Any] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        default: Any = None,
+    ) -> Any:
+        """Return the value for a key, or a default, counting the hit or miss.
+
+        Entries found in the old generation are moved to the young one.
+
+        Args:
+            key (object):
+                The key to look up.
+
+            default (object, optional):
+                The value to return if the key isn't in the cache.
+
+        Returns:
+            object:
+            The stored value, or the default.
+        """
+        value = self._data.get(key, MISSING)
+
+        if value is MISSING:
+            value = self._old_data.pop(key, MISSING)
+
+            if value is MISSING:
+                self.misses += 1
+
+                return default
+
+            self[key] = value
+
+        self.hits += 1
+
+        return value
+
+    def __setitem__(
+        self,
+        key: Hashable,
+        value: Any,
+    ) -> None:
+        """Store a value for a key.
+
+        If the young generation fills up, the old generation is evicted.
+
+        Args:
+            key (object):
+                The key to store.
+
+            value (object):
+                The value to store.
+        """
+        data = self._data
+        data[key] = value
+
+        # A key stored again without being looked up first may still be in
+        # the old generation. Only the new value should be kept.
+        if self._old_data:
+            self._old_data.pop(key, None)
+
+        if len(data) >= self._generation_size:
+            self.evictions += len(self._old_data)
+            self._old_data = data
+            self._data = {}
+
+    def __contains__(
+        self,
+        key: Hashable,
+    ) -> bool:
+        """Return whether a key is in the cache.
+
+        This doesn't count as a hit or miss.
+
+        Args:
+            key (object):
+                The key to check.
+
+        Returns:
+            bool:
+            ``True`` if the key is in the cache.
+        """
+        return key in self._data or key in self._old_data
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache.
+
+        An entry is only ever in one generation at a time, so this is exact.
+
+        Returns:
+            int:
+            The number of entries.
+        """
+        return len(self._data) + len(self._old_data)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache.
+
+        The stats are kept.
+        """
+        self._data.clear()
+        self._old_data.clear()
+
+    def get_contents(self) -> list[dict[Hashable, Any]]:
+        """Return the dictionaries holding the cache's entries.
+
+        Returns:
+            list of dict:
+            The dictionaries holding the entries.
+        """
+        return [self._data, self._old_data]
+
+
+class LRUMemoCache(MemoCache):
+    """A memo cache evicting its least recently used entries.
+
+    See :py:data:`LRU`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_size: int,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            name (str):
+                The name to show for the cache.
+
+            max_size (int):
+                The maximum number of entries in the cache.
+        """
+        super().__init__(name)
+
+        self.max_size = max_size
+        self._data = OrderedDict()
+
+    def get(
+        self,
+        key: Hashable,
+        default: Any = None,
+    ) -> Any:
+        """Return the value for a key, or a default, counting the hit or miss.
+
+        The entry becomes the most recently used.
+
+        Args:
+            key (object):
+                The key to look up.
+
+            default (object, optional):
+                The value to return if the key isn't in the cache.
+
+        Returns:
+            object:
+            The stored value, or the default.
+        """
+        data = self._data
+        value = data.get(key, MISSING)
+
+        if value is MISSING:
+            self.misses += 1
+
+            return default
+
+        data.move_to_end(key)  # type: ignore
+        self.hits += 1
+
+        return value
+
+    def __setitem__(
+        self,
+        key: Hashable,
+        value: Any,
+    ) -> None:
+        """Store a value for a key.
+
+        If the cache is full, the least recently used entry is evicted.
+
+        Args:
+            key (object):
+                The key to store.
+
+            value (object):
+                The value to store.
+        """
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)  # type: ignore
+
+        if len(data) > self.max_size:  # type: ignore
+            data.popitem(last=False)  # type: ignore
+            self.evictions += 1
+
+
+def memo_cache(
+    name: str,
+    *,
+    max_size: Optional[int] = None,
+    eviction: str = GENERATIONS,
+) -> MemoCache:
+    """Create a memo cache.
+
+    Args:
+        name (str):
+            The name to show for the cache.
+
+        max_size (int, optional):
+            The maximum number of entries in the cache. If not provided, the
+            cache is unbounded.
+
+        eviction (str, optional):
+            The eviction policy used once the cache is full. This must be
+            one of :py:data:`EVICTION_POLICIES`.
+
+    Returns:
+        MemoCache:
+        The new cache.
+
+    Raises:
+        ValueError:
+            The maximum size or eviction policy is invalid.
+    """
+    if eviction not in EVICTION_POLICIES:
+        raise ValueError(
+            f'Unknown eviction policy "{eviction}". This must be one of: '
+            f'{", ".join(EVICTION_POLICIES)}.')
+
+    if max_size is None:
+        return MemoCache(name)
+    elif max_size < 1:
+        raise ValueError('max_size must be at least 1.')
+    elif eviction == LRU:
+        return LRUMemoCache(name, max_size=max_size)
+    else:
+        return GenerationalMemoCache(name, max_size=max_size)
+
+
+class KeyEncoder:
+    """Assigns small integers to values, for packing into compact keys.
+
+    Each new value is given the next integer, starting at 0::
+
+        valve_ids = KeyEncoder()
+        valve_ids.get_id('AA')                # 0
+        valve_ids.get_id('BB')                # 1
+        valve_ids.get_mask(['AA', 'BB'])      # 0b11
+
+    Once all the values are known, :py:attr:`bits` says how many bits are
+    needed to pack any of their integers into a key.
+    """
+
+    def __init__(
+        self,
+        values: Iterable[Hashable] = (),
+    ) -> None:
+        """Initialize the encoder.
+
+        Args:
+            values (list, optional):
+                Values to assign integers to right away, in order.
+        """
+        self._ids: dict[Hashable, int] = {}
+        self._bits: dict[Hashable, int] = {}
+
+        for value in values:
+            self.get_id(value)
+
+    def __len__(self) -> int:
+        """Return the number of values assigned integers.
+
+        Returns:
+            int:
+            The number of values.
+        """
+        return len(self._ids)
+
+    @property
+    def bits(self) -> int:
+        """The number of bits needed for any assigned integer."""
+        return max(1, (len(self._ids) - 1).bit_length())
+
+    def get_id(
+        self,
+        value: Hashable,
+    ) -> int:
+        """Return the integer for a value, assigning one if needed.
+
+        Args:
+            value (object):
+                The value.
+
+        Returns:
+            int:
+            The integer for the value.
+        """
+        ids = self._ids
+
+        try:
+            return ids[value]
+        except KeyError:
+            value_id = len(ids)
+            ids[value] = value_id
+            self._bits[value] = 1 << value_id
+
+            return value_id
+
+    def get_mask(
+        self,
+        values: Collection[Hashable],
+    ) -> int:
+        """Return a bitmask for a set of values.
+
+        Each value sets the bit for its integer.
+
+        Args:
+            values (list or set or tuple):
+                The values. This must be a collection, rather than an
+                iterator or generator, since the values may need to be
+                iterated through twice.
+
+        Returns:
+            int:
+            The bitmask.
+
+        Raises:
+            TypeError:
+                The values were passed as an iterator or generator.
+        """
+        if iter(values) is values:
+            raise TypeError(
+                f'Values must be passed as a collection, not an iterator: '
+                f'{values!r}')
+
+        bits = self._bits
+
+        try:
+            # This is often called in a hot loop, so keep the loop in C
+            # when all the values are known.
+            return functools.reduce(operator.or_,
+                                    map(bits.__getitem__, values),
+                                    0)
+        except KeyError:
+            mask = 0
+
+            for value in values:
+                mask |= 1 << self.get_id(value)
+
+            return mask
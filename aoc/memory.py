@@ -0,0 +1,362 @@
+"""Measuring how much memory solvers use, and where.
+
+A solver can be run with :py:mod:`tracemalloc` enabled, reporting the peak
+memory allocated while solving, the lines of code responsible for the most
+memory around that peak, and the sizes of any memo caches (or other large
+structures) the solver registered.
+
+Solvers register their caches with :py:func:`track_cache`::
+
+    from aoc import memory
+
+    path_cache = {}
+    memory.track_cache('path_cache', path_cache)
+
+This does nothing unless memory is being measured, so it's safe to leave in
+place.
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, NamedTuple, Optional
+
+from aoc.memo import MemoCache
+from aoc.runner import SolverResult
+from aoc.solvers import ROOT_DIR, SolverInfo, load_solver
+
+
+#: How often the peak memory is checked while solving, in seconds.
+PEAK_CHECK_INTERVAL = 0.01
+
+
+#: How much memory must grow past the last snapshot before taking another.
+#:
+#: This keeps the number of (expensive) snapshots down to a handful, while
+#: still catching what was allocated close to the peak.
+SNAPSHOT_GROWTH = 1.1
+
+
+class AllocationSite(NamedTuple):
+    """A line of code responsible for allocated memory."""
+
+    #: The location of the line, in ``filename:lineno`` form.
+    location: str
+
+    #: The total size of memory allocated there, in bytes.
+    size: int
+
+    #: The number of memory blocks allocated there.
+    count: int
+
+
+class CacheSize(NamedTuple):
+    """The size of a cache tracked by a solver."""
+
+    #: The name the cache was registered under.
+    name: str
+
+    #: The number of entries in the cache.
+    #:
+    #: This will be ``None`` if the cache doesn't have a length.
+    entries: Optional[int]
+
+    #: The approximate total size of the cache and its contents, in bytes.
+    size: int
+
+
+class MemoryReport(NamedTuple):
+    """A report on a solver's memory usage."""
+
+    #: The result of the solver's run.
+    result: SolverResult
+
+    #: The peak memory allocated while solving, in bytes.
+    peak: int
+
+    #: The memory still allocated after solving, in bytes.
+    #:
+    #: This includes any tracked caches, which are kept around until they've
+    #: been measured.
+    final: int
+
+    #: The top allocation sites near the peak, largest first.
+    top_sites: list[AllocationSite]
+
+    #: The final sizes of tracked caches, in registration order.
+    caches: list[CacheSize]
+
+
+# Caches registered by solvers, when memory is being measured.
+_tracked_caches: Optional[dict[str, Any]] = None
+
+
+def track_cache(
+    name: str,
+    cache: Any,
+) -> None:
+    """Register a cache or other structure to report on.
+
+    The size of the cache is computed once the solver is finished. If
+    memory isn't being measured, this does nothing.
+
+    Args:
+        name (str):
+            The name to show for the cache.
+
+        cache (object):
+            The cache to track. This is usually a dictionary or set.
+    """
+    if _tracked_caches is not None:
+        _tracked_caches[name] = cache
+
+
+def get_deep_size(
+    obj: Any,
+) -> int:
+    """Return the approximate size of an object and everything it contains.
+
+    Containers (dictionaries, lists, tuples, sets, frozensets, and memo
+    caches) are walked, and objects shared between them are only counted
+    once.
+
+    Args:
+        obj (object):
+            The object to measure.
+
+    Returns:
+        int:
+        The approximate size, in bytes.
+    """
+    seen: set[int] = set()
+    to_measure = [obj]
+    size = 0
+
+    while to_measure:
+        obj = to_measure.pop()
+        obj_id = id(obj)
+
+        if obj_id in seen:
+            continue
+
+        seen.add(obj_id)
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            to_measure += obj.keys()
+            to_measure += obj.values()
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            to_measure += obj
+        elif isinstance(obj, MemoCache):
+            to_measure += obj.get_contents()
+
+    return size
+
+
+def _get_location(
+    frame: tracemalloc.Frame,
+) -> str:
+    """Return a display location for a traceback frame.
+
+    Files inside the repository are shown relative to it.
+
+    Args:
+        frame (tracemalloc.Frame):
+            The frame.
+
+    Returns:
+        str:
+        The location, in ``filename:lineno`` form.
+    """
+    filename = frame.filename
+
+    if filename.startswith(ROOT_DIR + os.sep):
+        filename = os.path.relpath(filename, ROOT_DIR)
+
+    return f'{filename}:{frame.lineno}'
+
+
+def measure_solver(
+    info: SolverInfo,
+    *,
+    input_path: Optional[str] = None,
+    top: int = 10,
+) -> MemoryReport:
+    """Run a solver, measuring its memory usage.
+
+    The solver's module is loaded before measuring, so that importing it
+    doesn't count against it.
+
+    While the solver runs, a background thread snapshots allocations
+    whenever memory grows noticeably past the last snapshot. The allocation
+    sites are taken from the largest snapshot, giving a picture of what was
+    allocated close to the peak (even if it was freed before the solver
+    returned).
+
+    Solvers run much slower while memory is being traced, so the elapsed
+    time isn't representative.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver to measure.
+
+        input_path (str, optional):
+            The path to the input file. This defaults to the day's ``input``
+            file.
+
+        top (int, optional):
+            The number of allocation sites to report.
+
+    Returns:
+        MemoryReport:
+        The report on the solver's memory usage.
+    """
+    global _tracked_caches
+
+    solve = load_solver(info)
+
+    if input_path is None:
+        input_path = info.input_path
+
+    best_snapshot: Optional[tracemalloc.Snapshot] = None
+    best_snapshot_size = 0
+    done = threading.Event()
+
+    def _take_snapshot(
+        growth: float,
+    ) -> None:
+        nonlocal best_snapshot, best_snapshot_size
+
+        current = tracemalloc.get_traced_memory()[0]
+
+        if current > best_snapshot_size * growth:
+            best_snapshot = tracemalloc.take_snapshot()
+            best_snapshot_size = current
+
+    def _watch_peak() -> None:
+        while not done.wait(PEAK_CHECK_INTERVAL):
+            _take_snapshot(SNAPSHOT_GROWTH)
+
+    watcher = threading.Thread(target=_watch_peak,
+                               daemon=True)
+
+    _tracked_caches = {}
+
+    try:
+        tracemalloc.start()
+        watcher.start()
+
+        start = time.perf_counter()
+        answer = solve(input_path)
+        elapsed = time.perf_counter() - start
+
+        done.set()
+        watcher.join()
+
+        # The solver may have grown since the last check.
+        _take_snapshot(1.0)
+
+        final, peak = tracemalloc.get_traced_memory()
+    finally:
+        done.set()
+        tracemalloc.stop()
+        tracked_caches = _tracked_caches
+        _tracked_caches = None
+
+    top_sites: list[AllocationSite] = []
+
+    if best_snapshot is not None:
+        snapshot = best_snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+        top_sites = [
+            AllocationSite(location=_get_location(stat.traceback[0]),
+                           size=stat.size,
+                           count=stat.count)
+            for stat in snapshot.statistics('lineno')[:top]
+        ]
+
+    caches = [
+        CacheSize(name=name,
+                  entries=len(cache) if hasattr(cache, '__len__') else None,
+                  size=get_deep_size(cache))
+        for name, cache in tracked_caches.items()
+    ]
+
+    return MemoryReport(
+        result=SolverResult(info=info,
+                            answer=answer,
+                            elapsed=elapsed),
+        peak=peak,
+        final=final,
+        top_sites=top_sites,
+        caches=caches)
+
+
+def format_size(
+    size: int,
+) -> str:
+    """Return a displayable size.
+
+    Args:
+        size (int):
+            The size, in bytes.
+
+    Returns:
+        str:
+        The formatted size.
+    """
+    if size >= 1024 * 1024:
+        return f'{size / (1024 * 1024):.1f}MiB'
+    elif size >= 1024:
+        return f'{size / 1024:.1f}KiB'
+    else:
+        return f'{size}B'
+
+
+def format_memory_report(
+    report: MemoryReport,
+) -> str:
+    """Return displayable lines for a memory report.
+
+    This doesn't include the solver's answer.
+
+    Args:
+        report (MemoryReport):
+            The report to format.
+
+    Returns:
+        str:
+        The formatted report.
+    """
+    lines = [
+        f'Peak memory: {format_size(report.peak)} '
+        f'(still allocated after solving: {format_size(report.final)})',
+    ]
+
+    if report.top_sites:
+        lines.append('Top allocation sites (near peak):')
+        lines += [
+            f'  {format_size(site.size):>10} {site.count:>10} blocks  '
+            f'{site.location}'
+            for site in report.top_sites
+        ]
+
+    if report.caches:
+        lines.append('Tracked caches:')
+
+        for cache in report.caches:
+            if cache.entries is None:
+                entries = ''
+            else:
+                entries = f'{cache.entries} entries, '
+
+            lines.append(
+                f'  {cache.name}: {entries}{format_size(cache.size)}')
+
+    return '\n'.join(lines)
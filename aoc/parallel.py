@@ -0,0 +1,140 @@
+"""Splitting large inputs across processes.
+
+Most solvers have to look at every byte of their input, and for huge
+generated inputs, just parsing can take longer than everything else. When
+the work for each part of the input is independent (summing, counting, or
+finding the largest of something), the input can be split into chunks,
+each chunk handled by a separate process, and the results combined.
+
+:py:func:`map_input_chunks` splits a file into one chunk per process (on
+line or record boundaries) and calls a function on each chunk's offsets in
+a pool of worker processes::
+
+    def count_in_chunk(path, start, end):
+        with open_input(path) as data:
+            ...
+
+        return count
+
+    counts = map_input_chunks(count_in_chunk, filename)
+    total = sum(counts)
+
+The function is passed to the workers by reference, so it must be defined
+at the top level of its module. Workers map the file themselves, so only
+offsets and results are sent between processes.
+
+Starting a pool of processes takes a while, so this is only worth it for
+large inputs. Solvers should check the size of the input first, and stick
+to a single process for small ones.
+"""
+
+import os
+from typing import Any, Callable, Optional
+
+from aoc.inputs import CHUNK_SIZE, open_input
+
+
+#: The smallest input size worth splitting across processes, in bytes.
+PARALLEL_MIN_SIZE = 32 * 1024 * 1024
+
+
+def should_split_input(
+    path: str,
+    *,
+    min_size: int = PARALLEL_MIN_SIZE,
+) -> bool:
+    """Return whether an input is worth splitting across processes.
+
+    Args:
+        path (str):
+            The path to the input file.
+
+        min_size (int, optional):
+            The smallest input size worth splitting, in bytes.
+
+    Returns:
+        bool:
+        ``True`` if the input is large enough, and there's more than one CPU
+        to split it across.
+    """
+    return ((os.cpu_count() or 1) > 1 and
+            os.path.getsize(path) >= min_size)
+
+
+def map_input_chunks(
+    func: Callable[..., Any],
+    path: str,
+    *,
+    args: tuple[Any, ...] = (),
+    separator: bytes = b'\n',
+    jobs: Optional[int] = None,
+) -> list[Any]:
+    """Call a function on chunks of an input file, across worker processes.
+
+    The file is split into about one chunk per worker, each ending on a
+    separator (see :py:meth:`aoc.inputs.InputFile.iter_chunk_bounds`), and
+    the function is called as ``func(path, start, end, *args)`` for each.
+
+    Args:
+        func (callable):
+            The function to call for each chunk. This must be defined at the
+            top level of a module.
+
+        path (str):
+            The path to the input file.
+
+        args (tuple, optional):
+            Additional arguments to pass to the function.
+
+        separator (bytes, optional):
+            The separator that chunks must end on. Use ``b'\\n\\n'`` for
+            blank-line-separated records.
+
+        jobs (int, optional):
+            The number of worker processes to use. This defaults to the
+            number of CPUs.
+
+    Returns:
+        list:
+        The result for each chunk, in input order.
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    chunk_size = max(CHUNK_SIZE, -(-os.path.getsize(path) // jobs))
+
+    with open_input(path) as data:
+        bounds = list(data.iter_chunk_bounds(chunk_size,
+                                             separator=separator))
+
+    if jobs == 1 or len(bounds) == 1:
+        return [
+            func(path, start, end, *args)
+            for start, end in bounds
+        ]
+
+    # Process pools are only needed here, so don't pay for importing them
+    # unless we're splitting up an input.
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(max_workers=min(jobs, len(bounds)))
+
+    try:
+        futures = [
+            executor.submit(func, path, start, end, *args)
+            for start, end in bounds
+        ]
+
+        results = [
+            future.result()
+            for future in futures
+        ]
+    except BaseException:
+        # Don't wait around for the other chunks if something went wrong
+        # (or the solver was stopped for running too long).
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+    executor.shutdown()
+
+    return results
@@ -0,0 +1,191 @@
+"""Fast parsing of integers and fields out of puzzle inputs.
+
+Most inputs are lines of text with a few numbers (and maybe a few names)
+embedded in them. Matching a regex against each line and pulling out its
+groups works, but for large inputs, the per-line costs (reading the line,
+running the match, building a match object, and converting each group)
+make up most of the time spent parsing.
+
+These functions instead work on large chunks of the input at once. When a
+puzzle only needs the numbers, there's no need to match the rest of the line
+at all. Every byte that can't be part of an integer is turned into a space
+with a single ``bytes.translate()``, and what's left is split apart and
+converted in bulk::
+
+    for sensor_x, sensor_y, beacon_x, beacon_y in iter_int_records(source, 4):
+        ...
+
+When it needs some text too, a single compiled pattern with a group per
+field is run over each chunk with ``findall()``::
+
+    for name, value in iter_field_records(source, rb'(\\w+) = (-?\\d+)'):
+        ...
+
+Files are memory-mapped, and streams are read as they arrive (see
+:py:func:`aoc.inputs.iter_input_chunks`). Either way, only a chunk of the
+input is held in memory at a time.
+"""
+
+import re
+from typing import Iterator, Union
+
+from aoc.inputs import CHUNK_SIZE, InputSource, iter_input_chunks
+from aoc.patterns import LazyPattern, lazy_compile
+
+
+#: A translation table turning anything that isn't part of an integer into
+#: a space.
+_INT_BYTES_TABLE = bytes(
+    c if c in b'-0123456789' else ord(' ')
+    for c in range(256)
+)
+
+
+def _parse_ints(
+    chunk: Union[bytes, memoryview],
+) -> list[int]:
+    """Return every integer in a chunk of input.
+
+    Args:
+        chunk (bytes or memoryview):
+            The chunk of input.
+
+    Returns:
+        list of int:
+        The integers, in order.
+    """
+    if isinstance(chunk, memoryview):
+        chunk = chunk.tobytes()
+
+    chunk = chunk.translate(_INT_BYTES_TABLE)
+
+    if b'-' not in chunk:
+        return list(map(int, chunk.split()))
+
+    # A "-" only belongs to the digits directly after it, so split it off
+    # from anything before it. Any that aren't followed by digits are left
+    # on their own, and thrown away.
+    return [
+        int(value)
+        for value in chunk.replace(b'-', b' -').split()
+        if value != b'-'
+    ]
+
+
+def iter_ints(
+    source: InputSource,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[int]:
+    """Iterate through every integer in an input source.
+
+    Anything that isn't part of an integer is skipped. A ``-`` directly
+    before the digits makes the integer negative.
+
+    Args:
+        source (aoc.inputs.InputSource):
+            The input source.
+
+        chunk_size (int, optional):
+            The minimum size of each chunk of input to scan at once.
+
+    Yields:
+        int:
+        Each integer, in order.
+    """
+    for chunk in iter_input_chunks(source, chunk_size):
+        yield from _parse_ints(chunk)
+
+
+def iter_int_records(
+    source: InputSource,
+    width: int,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple[int, ...]]:
+    """Iterate through fixed-size records of integers in an input source.
+
+    Every integer in the input is collected in order (as with
+    :py:func:`iter_ints`), and grouped into records of ``width`` integers.
+    Records don't have to line up with lines, so this works just as well
+    for records that span several lines.
+
+    Args:
+        source (aoc.inputs.InputSource):
+            The input source.
+
+        width (int):
+            The number of integers in each record.
+
+        chunk_size (int, optional):
+            The minimum size of each chunk of input to scan at once.
+
+    Yields:
+        tuple of int:
+        Each record.
+
+    Raises:
+        ValueError:
+            The number of integers in the input isn't a multiple of
+            ``width``.
+    """
+    leftover: list[int] = []
+
+    for chunk in iter_input_chunks(source, chunk_size):
+        values = _parse_ints(chunk)
+
+        if leftover:
+            values = leftover + values
+
+        end = len(values) - len(values) % width
+        leftover = values[end:]
+
+        if end:
+            values_iter = iter(values[:end] if leftover else values)
+
+            yield from zip(*[values_iter] * width)
+
+    if leftover:
+        raise ValueError(
+            f'The input ended partway through a record of {width} '
+            f'integers: {leftover!r}')
+
+
+def iter_field_records(
+    source: InputSource,
+    pattern: Union[bytes, re.Pattern[bytes], LazyPattern],
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple[bytes, ...]]:
+    """Iterate through the fields of every match of a pattern in an input.
+
+    The pattern is searched for across each chunk of the input, rather than
+    matched against each line, so it shouldn't be anchored with ``^`` or
+    ``$``, and it must not match across a newline. Anything between matches
+    is skipped.
+
+    Args:
+        source (aoc.inputs.InputSource):
+            The input source.
+
+        pattern (bytes or re.Pattern or aoc.patterns.LazyPattern):
+            A bytes regular expression with a group for each field, and at
+            least two fields. This should be compiled ahead of time (such as
+            with :py:func:`aoc.patterns.lazy_compile`) if used more than
+            once.
+
+        chunk_size (int, optional):
+            The minimum size of each chunk of input to scan at once.
+
+    Yields:
+        tuple of bytes:
+        The fields of each match, in order. Converting fields is left to
+        the caller, since only the caller knows which are numbers.
+    """
+    if isinstance(pattern, bytes):
+        pattern = lazy_compile(pattern)
+
+    findall = pattern.findall
+
+    for chunk in iter_input_chunks(source, chunk_size):
+        yield from findall(chunk)
@@ -0,0 +1,106 @@
+"""Regular expressions that are compiled on first use.
+
+Solver modules tend to compile their regexes at import time. That's a cost
+paid by every process that imports the module, even if the solver is never
+run (or its answer comes out of the result cache). :py:func:`lazy_compile`
+defers compiling until the pattern is first used::
+
+    MOVE_RE = lazy_compile(r'^move (\\d+) from (\\d+) to (\\d+)')
+
+    ...
+
+    m = MOVE_RE.match(line)
+
+After the first use, methods are looked up directly on the instance, so
+there's no extra overhead compared to a compiled :py:class:`re.Pattern`.
+"""
+
+import re
+from typing import Any
+
+
+class LazyPattern:
+    """A regular expression that's compiled when first used.
+
+    This can be used anywhere a :py:class:`re.Pattern` would be used to
+    match or search. Any attribute of the compiled pattern (``match``,
+    ``finditer``, ``groupindex``, and so on) is available on the lazy
+    pattern.
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        flags: int = 0,
+    ) -> None:
+        """Initialize the pattern.
+
+        Args:
+            pattern (str):
+                The regular expression.
+
+            flags (int, optional):
+                The flags to compile with.
+        """
+        self.pattern = pattern
+        self.flags = flags
+
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Any:
+        """Return an attribute of the compiled pattern.
+
+        The pattern is compiled on first access. Each attribute is then
+        stored on this instance, so later lookups don't come back here.
+
+        Args:
+            name (str):
+                The name of the attribute.
+
+        Returns:
+            object:
+            The attribute's value.
+
+        Raises:
+            AttributeError:
+                The compiled pattern has no such attribute.
+        """
+        if name.startswith('__'):
+            # Don't compile for special lookups (like those made by copy or
+            # pickle).
+            raise AttributeError(name)
+
+        value = getattr(re.compile(self.pattern, self.flags), name)
+        setattr(self, name, value)
+
+        return value
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pattern.
+
+        Returns:
+            str:
+            The string representation.
+        """
+        return f'lazy_compile({self.pattern!r})'
+
+
+def lazy_compile(
+    pattern: str,
+    flags: int = 0,
+) -> LazyPattern:
+    """Return a regular expression that's compiled when first used.
+
+    Args:
+        pattern (str):
+            The regular expression.
+
+        flags (int, optional):
+            The flags to compile with.
+
+    Returns:
+        LazyPattern:
+        The lazily-compiled pattern.
+    """
+    return LazyPattern(pattern, flags)
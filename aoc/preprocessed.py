@@ -0,0 +1,429 @@
+"""A persistent cache of preprocessed inputs.
+
+Some solvers spend much of their time turning the input into something they
+can work with, such as the shortest paths through a network or a map of
+where all the rocks are. That work only depends on the input and the code
+doing it, so it can be saved and reused by later runs.
+
+:py:func:`cache_preprocessed` stores the result of a preprocessing function
+in a compact binary file next to the input, and memory-maps it back in on
+later runs. The solver provides functions to convert the result to and from
+a dictionary of fields::
+
+    def dump_distances(distances):
+        return {
+            'size': distances.size,
+            'matrix': array('H', distances.matrix),
+        }
+
+    def load_distances(fields):
+        return Distances(fields['size'], fields['matrix'])
+
+    @cache_preprocessed('distances',
+                        dump=dump_distances,
+                        load=load_distances)
+    def compute_distances(filename):
+        ...
+
+Arrays (:py:class:`array.array` or any bytes-like object) are stored as raw
+binary data, and are loaded as :py:class:`memoryview` objects over the
+mapped file, with the same typecode they were stored with. Nothing is copied
+until it's used. Anything else is stored as JSON, so it must be something
+JSON can represent.
+
+A cache file is only used if it was written for the same input contents and
+the same solver source (see :py:func:`aoc.cache.get_source_hash`).
+Otherwise, the preprocessing is run again and the file is replaced.
+
+Cache files are named ``.<input>.<module>.<name>.aoc-parsed`` (such as
+``.input.task1.valves.aoc-parsed``), so that each task keeps its own. They
+can be turned off by setting ``AOC_PARSED_CACHE=0``, or with
+``--no-parsed-cache``.
+
+Each file starts with a fixed-size header (see :py:data:`HEADER`), followed
+by the JSON metadata and then the data for each array, aligned to
+:py:data:`ARRAY_ALIGNMENT` bytes.
+"""
+
+import array
+import functools
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Any, Callable, Iterator, Mapping, Optional, TypeVar
+
+from aoc import tracing
+from aoc.inputs import InputSource, is_path_source
+
+
+#: The magic bytes at the start of every cache file.
+MAGIC = b'AOCPARSE'
+
+
+#: The version of the file format.
+#:
+#: This must be bumped whenever the format changes.
+FORMAT_VERSION = 1
+
+
+#: The file header.
+#:
+#: This contains the magic bytes, the format version, the cache key, and the
+#: length of the JSON metadata.
+HEADER = struct.Struct('<8sI32sI')
+
+
+#: The alignment of the start of each array, in bytes.
+ARRAY_ALIGNMENT = 8
+
+
+#: The suffix for cache files.
+CACHE_FILE_SUFFIX = '.aoc-parsed'
+
+
+#: The environment variable used to turn off the cache.
+ENABLED_ENV_VAR = 'AOC_PARSED_CACHE'
+
+
+_T = TypeVar('_T')
+
+
+def is_enabled() -> bool:
+    """Return whether preprocessed inputs are cached.
+
+    Returns:
+        bool:
+        ``True`` if the cache is enabled.
+    """
+    return os.environ.get(ENABLED_ENV_VAR) != '0'
+
+
+def set_enabled(
+    enabled: bool,
+) -> None:
+    """Set whether preprocessed inputs are cached.
+
+    This also updates the environment, so that any worker processes use the
+    same setting.
+
+    Args:
+        enabled (bool):
+            Whether to enable the cache.
+    """
+    os.environ[ENABLED_ENV_VAR] = '1' if enabled else '0'
+
+
+@contextmanager
+def disabled() -> Iterator[None]:
+    """Turn off the cache within the context.
+
+    This is used for temporary inputs (such as a copy of standard input),
+    which would leave cache files behind once they're removed.
+
+    Context:
+        Preprocessed inputs won't be loaded from or saved to the cache.
+    """
+    old_value = os.environ.get(ENABLED_ENV_VAR)
+    os.environ[ENABLED_ENV_VAR] = '0'
+
+    try:
+        yield
+    finally:
+        if old_value is None:
+            os.environ.pop(ENABLED_ENV_VAR, None)
+        else:
+            os.environ[ENABLED_ENV_VAR] = old_value
+
+
+def get_cache_path(
+    input_path: str,
+    module: ModuleType,
+    name: str,
+) -> str:
+    """Return the path to the cache file for an input.
+
+    Args:
+        input_path (str):
+            The path to the input file.
+
+        module (module):
+            The module doing the preprocessing.
+
+        name (str):
+            The name of the preprocessed data.
+
+    Returns:
+        str:
+        The path to the cache file.
+    """
+    assert module.__file__
+    input_dir, input_name = os.path.split(os.path.abspath(input_path))
+    module_name = os.path.splitext(os.path.basename(module.__file__))[0]
+
+    return os.path.join(
+        input_dir,
+        f'.{input_name}.{module_name}.{name}{CACHE_FILE_SUFFIX}')
+
+
+def make_cache_key(
+    module: ModuleType,
+    func: Callable[..., Any],
+    input_path: str,
+) -> bytes:
+    """Return the cache key for preprocessing an input.
+
+    Args:
+        module (module):
+            The module doing the preprocessing.
+
+        func (callable):
+            The preprocessing function.
+
+        input_path (str):
+            The path to the input file.
+
+    Returns:
+        bytes:
+        The cache key.
+    """
+    from aoc.cache import get_source_hash, update_file_hash
+
+    h = hashlib.sha256()
+    update_file_hash(h, input_path)
+
+    h.update(get_source_hash(module).encode())
+    h.update(func.__qualname__.encode())
+
+    return h.digest()
+
+
+def _align(
+    offset: int,
+) -> int:
+    """Return an offset rounded up to the array alignment.
+
+    Args:
+        offset (int):
+            The offset to align.
+
+    Returns:
+        int:
+        The aligned offset.
+    """
+    return -(-offset // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+
+
+def write_cache_file(
+    path: str,
+    key: bytes,
+    fields: Mapping[str, Any],
+) -> None:
+    """Write preprocessed data to a cache file.
+
+    The file is written to a temporary file first and then moved into place,
+    so other processes never see a partially-written file.
+
+    Args:
+        path (str):
+            The path to the cache file.
+
+        key (bytes):
+            The cache key, from :py:func:`make_cache_key`.
+
+        fields (dict):
+            The fields to store. Arrays and bytes-like objects are stored as
+            binary data, and everything else as JSON.
+
+    Raises:
+        OSError:
+            The file couldn't be written.
+    """
+    json_fields: dict[str, Any] = {}
+    arrays: list[tuple[str, str, memoryview]] = []
+
+    for name, value in fields.items():
+        if isinstance(value, array.array):
+            arrays.append((name, value.typecode, memoryview(value).cast('B')))
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            arrays.append((name, 'B', memoryview(value).cast('B')))
+        else:
+            json_fields[name] = value
+
+    # Array offsets are relative to the start of the array data, which
+    # comes after the metadata.
+    array_infos = []
+    array_offsets = []
+    offset = 0
+
+    for name, typecode, data in arrays:
+        array_infos.append((name, typecode, offset, data.nbytes))
+        array_offsets.append(offset)
+        offset = _align(offset + data.nbytes)
+
+    metadata = json.dumps({
+        'fields': json_fields,
+        'arrays': array_infos,
+    }).encode()
+
+    import tempfile
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, key, len(metadata))
+    data_start = _align(len(header) + len(metadata))
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path),
+                                     prefix=os.path.basename(path),
+                                     suffix='.tmp')
+
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(header)
+            fp.write(metadata)
+
+            for offset, (name, typecode, data) in zip(array_offsets,
+                                                      arrays):
+                fp.seek(data_start + offset)
+                fp.write(data)
+
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def read_cache_file(
+    path: str,
+    key: bytes,
+) -> Optional[dict[str, Any]]:
+    """Read preprocessed data from a cache file.
+
+    Args:
+        path (str):
+            The path to the cache file.
+
+        key (bytes):
+            The expected cache key, from :py:func:`make_cache_key`.
+
+    Returns:
+        dict:
+        The stored fields, or ``None`` if the file doesn't exist, is for a
+        different key or format version, or can't be read. Arrays are
+        :py:class:`memoryview` objects over the mapped file.
+    """
+    try:
+        with open(path, 'rb') as fp:
+            data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # The file doesn't exist, can't be opened, or is empty.
+        return None
+
+    try:
+        magic, version, file_key, metadata_len = HEADER.unpack_from(data)
+
+        if (magic != MAGIC or
+            version != FORMAT_VERSION or
+            file_key != key):
+            return None
+
+        metadata = json.loads(data[HEADER.size:HEADER.size + metadata_len])
+        data_start = _align(HEADER.size + metadata_len)
+        view = memoryview(data)
+        fields = metadata['fields']
+
+        for name, typecode, offset, size in metadata['arrays']:
+            start = data_start + offset
+
+            if start + size > len(data):
+                # The file was truncated.
+                return None
+
+            fields[name] = view[start:start + size].cast(typecode)
+    except (struct.error, ValueError, KeyError, TypeError):
+        return None
+
+    return fields
+
+
+def cache_preprocessed(
+    name: str,
+    *,
+    dump: Callable[[Any], Mapping[str, Any]],
+    load: Callable[[dict[str, Any]], Any],
+) -> Callable[[_T], _T]:
+    """Cache the result of preprocessing an input file on disk.
+
+    The decorated function must take the path to an input file as its only
+    argument. Sources that aren't paths are always preprocessed.
+
+    This can be combined with :py:func:`aoc.inputs.cache_parsed` (applied
+    on top) to also keep the result in memory.
+
+    Args:
+        name (str):
+            A name for the preprocessed data, used in the cache file's name.
+
+        dump (callable):
+            A function converting the result to a dictionary of fields to
+            store.
+
+        load (callable):
+            A function converting the stored fields back into a result.
+            Arrays must be copied if the result is going to be modified.
+
+    Returns:
+        callable:
+        The decorator for the preprocessing function.
+    """
+    def _decorator(
+        func: _T,
+    ) -> _T:
+        @functools.wraps(func)  # type: ignore
+        def _preprocess(
+            source: InputSource,
+        ) -> Any:
+            if not is_enabled() or not is_path_source(source):
+                return func(source)  # type: ignore
+
+            module = sys.modules.get(func.__module__)
+
+            if module is None or not getattr(module, '__file__', None):
+                # There's no source to key the cache off of.
+                return func(source)  # type: ignore
+
+            input_path = os.fspath(source)  # type: ignore
+            key = make_cache_key(module, func, input_path)  # type: ignore
+            cache_path = get_cache_path(input_path, module, name)
+            trace_info = tracing.get_tracer(tracing.INFO)
+            fields = read_cache_file(cache_path, key)
+
+            if fields is not None:
+                if trace_info:
+                    trace_info('Loaded preprocessed %s from %s',
+                               name, cache_path)
+
+                return load(fields)
+
+            result = func(source)  # type: ignore
+
+            try:
+                write_cache_file(cache_path, key, dump(result))
+            except OSError as e:
+                # The input's directory may not be writable. The result
+                # just won't be cached.
+                if trace_info:
+                    trace_info('Unable to cache preprocessed %s at %s: %s',
+                               name, cache_path, e)
+            else:
+                if trace_info:
+                    trace_info('Cached preprocessed %s at %s',
+                               name, cache_path)
+
+            return result
+
+        return _preprocess  # type: ignore
+
+    return _decorator
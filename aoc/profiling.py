@@ -0,0 +1,380 @@
+"""Profiling solvers to find out where their time goes.
+
+Two kinds of profiles are supported:
+
+``cprofile``:
+    Uses :py:mod:`cProfile` to trace every function call. This gives exact
+    call counts and times, at the cost of slowing down call-heavy solvers.
+    Results are written as a ``.pstats`` file, which can be loaded with
+    :py:mod:`pstats` or tools like snakeviz.
+
+``sample``:
+    Periodically samples the solver's call stack from a background thread.
+    This has much less overhead, and records full stacks. Results are
+    written in the collapsed stack format (``frame;frame;frame count``),
+    which can be turned into a flamegraph by tools like ``flamegraph.pl``
+    or speedscope.
+
+Either way, a summary of the hottest functions (by time spent in the
+function itself) is returned for display.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import NamedTuple, Optional
+
+from aoc.runner import SolverResult
+from aoc.solvers import ROOT_DIR, SolverInfo, load_solver
+
+
+#: The supported profiling modes.
+PROFILE_MODES = ('cprofile', 'sample')
+
+
+#: The default directory for profile output.
+DEFAULT_PROFILE_DIR = os.path.join(ROOT_DIR, '.aoc-profiles')
+
+
+#: The default interval between stack samples, in seconds.
+DEFAULT_SAMPLE_INTERVAL = 0.001
+
+
+class HotFunction(NamedTuple):
+    """A function that a solver spent time in."""
+
+    #: A display label for the function, with its file and line.
+    label: str
+
+    #: The time spent in the function itself, in seconds.
+    #:
+    #: For sampled profiles, this is estimated from the sample counts.
+    self_time: float
+
+    #: The fraction of the total profiled time spent in the function.
+    fraction: float
+
+
+class ProfileResult(NamedTuple):
+    """The result of profiling a solver."""
+
+    #: The result of the solver's run.
+    result: SolverResult
+
+    #: The path to the written profile data.
+    output_path: str
+
+    #: The hottest functions, hottest first.
+    hot_functions: list[HotFunction]
+
+
+def _get_code_label(
+    filename: str,
+    lineno: int,
+    func_name: str,
+) -> str:
+    """Return a display label for a function.
+
+    Files inside the repository are shown relative to it.
+
+    Args:
+        filename (str):
+            The function's filename.
+
+        lineno (int):
+            The line the function is defined on.
+
+        func_name (str):
+            The name of the function.
+
+    Returns:
+        str:
+        The label.
+    """
+    if filename.startswith(ROOT_DIR + os.sep):
+        filename = os.path.relpath(filename, ROOT_DIR)
+
+    if lineno:
+        return f'{func_name} ({filename}:{lineno})'
+    else:
+        # Built-in functions don't have a file or line.
+        return func_name
+
+
+def get_profile_path(
+    info: SolverInfo,
+    *,
+    mode: str,
+    output_dir: str = DEFAULT_PROFILE_DIR,
+) -> str:
+    """Return the path to write a solver's profile to.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver.
+
+        mode (str):
+            The profiling mode.
+
+        output_dir (str, optional):
+            The directory containing all profiles.
+
+    Returns:
+        str:
+        The path to the profile file.
+    """
+    if mode == 'cprofile':
+        ext = 'pstats'
+    else:
+        ext = 'collapsed'
+
+    return os.path.join(output_dir, f'{info.name}.{ext}')
+
+
+def _profile_cprofile(
+    info: SolverInfo,
+    *,
+    input_path: str,
+    output_path: str,
+    top: int,
+) -> ProfileResult:
+    """Profile a solver using cProfile.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver.
+
+        input_path (str):
+            The path to the input file.
+
+        output_path (str):
+            The path to write the ``.pstats`` file to.
+
+        top (int):
+            The number of hot functions to return.
+
+    Returns:
+        ProfileResult:
+        The result of the profile.
+    """
+    solve = load_solver(info)
+    profiler = cProfile.Profile()
+
+    start = time.perf_counter()
+    answer = profiler.runcall(solve, input_path)
+    elapsed = time.perf_counter() - start
+
+    profiler.dump_stats(output_path)
+
+    # Each entry maps (filename, lineno, func_name) to
+    # (primitive calls, total calls, self time, cumulative time, callers).
+    stats = pstats.Stats(profiler).stats  # type: ignore
+    total_time = sum(entry[2] for entry in stats.values()) or 1.0
+
+    hot_functions = [
+        HotFunction(label=_get_code_label(*func_key),
+                    self_time=entry[2],
+                    fraction=entry[2] / total_time)
+        for func_key, entry in sorted(stats.items(),
+                                      key=lambda item: item[1][2],
+                                      reverse=True)[:top]
+    ]
+
+    return ProfileResult(
+        result=SolverResult(info=info,
+                            answer=answer,
+                            elapsed=elapsed),
+        output_path=output_path,
+        hot_functions=hot_functions)
+
+
+def _profile_sample(
+    info: SolverInfo,
+    *,
+    input_path: str,
+    output_path: str,
+    top: int,
+    interval: float,
+) -> ProfileResult:
+    """Profile a solver by sampling its call stack.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver.
+
+        input_path (str):
+            The path to the input file.
+
+        output_path (str):
+            The path to write the collapsed stacks to.
+
+        top (int):
+            The number of hot functions to return.
+
+        interval (float):
+            The time between samples, in seconds.
+
+    Returns:
+        ProfileResult:
+        The result of the profile.
+    """
+    solve = load_solver(info)
+
+    thread_id = threading.get_ident()
+    base_frame = sys._getframe()
+    stacks: Counter[tuple[CodeType, ...]] = Counter()
+    done = threading.Event()
+
+    def _sample() -> None:
+        while not done.wait(interval):
+            frame: Optional[FrameType] = \
+                sys._current_frames().get(thread_id)
+            stack = []
+
+            # Walk up to (but not including) this function's frame, so that
+            # only the solver's own frames are recorded.
+            while frame is not None and frame is not base_frame:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+
+            if stack:
+                stack.reverse()
+                stacks[tuple(stack)] += 1
+
+    sampler = threading.Thread(target=_sample,
+                               daemon=True)
+
+    # Ask the interpreter to switch threads often enough that we can
+    # sample at the requested interval.
+    old_switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(old_switch_interval, interval))
+
+    try:
+        sampler.start()
+
+        start = time.perf_counter()
+        answer = solve(input_path)
+        elapsed = time.perf_counter() - start
+    finally:
+        done.set()
+        sampler.join()
+        sys.setswitchinterval(old_switch_interval)
+
+    def _get_label(code: CodeType) -> str:
+        return _get_code_label(code.co_filename, code.co_firstlineno,
+                               code.co_qualname)
+
+    self_counts: Counter[str] = Counter()
+
+    with open(output_path, 'w') as fp:
+        for stack, count in sorted(stacks.items(),
+                                   key=lambda item: item[1],
+                                   reverse=True):
+            labels = [
+                _get_label(code).replace(';', ':')
+                for code in stack
+            ]
+            fp.write(f'{";".join(labels)} {count}\n')
+            self_counts[labels[-1]] += count
+
+    num_samples = sum(self_counts.values()) or 1
+
+    hot_functions = [
+        HotFunction(label=label,
+                    self_time=elapsed * count / num_samples,
+                    fraction=count / num_samples)
+        for label, count in self_counts.most_common(top)
+    ]
+
+    return ProfileResult(
+        result=SolverResult(info=info,
+                            answer=answer,
+                            elapsed=elapsed),
+        output_path=output_path,
+        hot_functions=hot_functions)
+
+
+def profile_solver(
+    info: SolverInfo,
+    *,
+    mode: str,
+    input_path: Optional[str] = None,
+    output_dir: str = DEFAULT_PROFILE_DIR,
+    top: int = 15,
+    interval: float = DEFAULT_SAMPLE_INTERVAL,
+) -> ProfileResult:
+    """Run a solver under a profiler and write out the profile.
+
+    Profiles are written to :file:`{output_dir}/{year}/day{NN}/task{N}`,
+    with a ``.pstats`` or ``.collapsed`` extension, depending on the mode.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver to profile.
+
+        mode (str):
+            The profiling mode. This must be one of :py:data:`PROFILE_MODES`.
+
+        input_path (str, optional):
+            The path to the input file. This defaults to the day's ``input``
+            file.
+
+        output_dir (str, optional):
+            The directory containing all profiles.
+
+        top (int, optional):
+            The number of hot functions to return.
+
+        interval (float, optional):
+            The time between samples, in seconds, for ``sample`` mode.
+
+    Returns:
+        ProfileResult:
+        The result of the profile.
+    """
+    assert mode in PROFILE_MODES
+
+    if input_path is None:
+        input_path = info.input_path
+
+    output_path = get_profile_path(info,
+                                   mode=mode,
+                                   output_dir=output_dir)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    if mode == 'cprofile':
+        return _profile_cprofile(info,
+                                 input_path=input_path,
+                                 output_path=output_path,
+                                 top=top)
+    else:
+        return _profile_sample(info,
+                               input_path=input_path,
+                               output_path=output_path,
+                               top=top,
+                               interval=interval)
+
+
+def format_hot_functions(
+    hot_functions: list[HotFunction],
+) -> str:
+    """Return a displayable table of hot functions.
+
+    Args:
+        hot_functions (list of HotFunction):
+            The hot functions to format.
+
+    Returns:
+        str:
+        The formatted table.
+    """
+    return '\n'.join(
+        f'  {hot_function.fraction * 100:5.1f}% '
+        f'{hot_function.self_time * 1000:10.2f}ms  {hot_function.label}'
+        for hot_function in hot_functions
+    )
@@ -0,0 +1,274 @@
+"""Progress counters for long-running solvers.
+
+When a solver is stopped for running too long (see :py:mod:`aoc.watchdog`),
+knowing how far it got is the best clue to where the time went. Was it
+still parsing? Halfway through the rows? Exploring millions of states with
+a cache that never hits?
+
+Solvers report this by creating counters when they start solving, and
+updating them as they go::
+
+    from aoc import progress
+
+    rows = progress.counter('rows scanned', total=num_rows)
+    path_hits = progress.hit_counter('path cache')
+
+    for y in range(num_rows):
+        rows.count += 1
+
+        if key in path_cache:
+            path_hits.hits += 1
+        else:
+            path_hits.misses += 1
+
+Values the solver already keeps track of can be reported without a counter,
+through a function returning the current value::
+
+    progress.track('seen states', lambda: len(seen))
+
+Counters are plain objects with plain attributes, so updating one costs
+about as much as updating a local variable through an attribute. They're
+only read when progress is reported. Counters are only registered while
+progress is being collected (see :py:func:`collect_progress`), so it's
+safe to leave them in place.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Union
+
+
+class Counter:
+    """A count of work done, optionally out of a known total."""
+
+    __slots__ = ('name', 'count', 'total')
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        total: Optional[int] = None,
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            name (str):
+                The name to show for the counter.
+
+            total (int, optional):
+                The total amount of work, if known ahead of time.
+        """
+        #: The name to show for the counter.
+        self.name = name
+
+        #: The amount of work done so far.
+        self.count = 0
+
+        #: The total amount of work, if known.
+        self.total = total
+
+    def format(self) -> str:
+        """Return a displayable line for the counter.
+
+        Returns:
+            str:
+            The formatted counter.
+        """
+        if self.total:
+            return (f'{self.name}: {self.count:,} of {self.total:,} '
+                    f'({self.count / self.total:.1%})')
+        else:
+            return f'{self.name}: {self.count:,}'
+
+
+class HitCounter:
+    """A count of hits and misses, such as for a memo cache."""
+
+    __slots__ = ('name', 'hits', 'misses')
+
+    def __init__(
+        self,
+        name: str,
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            name (str):
+                The name to show for the counter.
+        """
+        #: The name to show for the counter.
+        self.name = name
+
+        #: The number of hits.
+        self.hits = 0
+
+        #: The number of misses.
+        self.misses = 0
+
+    def format(self) -> str:
+        """Return a displayable line for the counter.
+
+        Returns:
+            str:
+            The formatted counter.
+        """
+        lookups = self.hits + self.misses
+
+        if lookups:
+            hit_rate = f'{self.hits / lookups:.1%}'
+        else:
+            hit_rate = 'n/a'
+
+        return (f'{self.name}: {self.hits:,} hits, {self.misses:,} misses '
+                f'({hit_rate} hit rate)')
+
+
+class TrackedValue:
+    """A value reported through a function, computed when read."""
+
+    __slots__ = ('name', 'get_value')
+
+    def __init__(
+        self,
+        name: str,
+        get_value: Callable[[], Any],
+    ) -> None:
+        """Initialize the tracked value.
+
+        Args:
+            name (str):
+                The name to show for the value.
+
+            get_value (callable):
+                A function returning the current value.
+        """
+        #: The name to show for the value.
+        self.name = name
+
+        #: A function returning the current value.
+        self.get_value = get_value
+
+    def format(self) -> str:
+        """Return a displayable line for the value.
+
+        Returns:
+            str:
+            The formatted value.
+        """
+        value = self.get_value()
+
+        if isinstance(value, int):
+            return f'{self.name}: {value:,}'
+        else:
+            return f'{self.name}: {value}'
+
+
+#: Anything that can be reported as progress.
+ProgressItem = Union[Counter, HitCounter, TrackedValue]
+
+
+_items: Optional[list[ProgressItem]] = None
+
+
+def counter(
+    name: str,
+    *,
+    total: Optional[int] = None,
+) -> Counter:
+    """Create a counter for work done.
+
+    Args:
+        name (str):
+            The name to show for the counter, such as ``rows scanned``.
+
+        total (int, optional):
+            The total amount of work, if known ahead of time.
+
+    Returns:
+        Counter:
+        The new counter.
+    """
+    item = Counter(name, total=total)
+
+    if _items is not None:
+        _items.append(item)
+
+    return item
+
+
+def hit_counter(
+    name: str,
+) -> HitCounter:
+    """Create a counter for hits and misses.
+
+    Args:
+        name (str):
+            The name to show for the counter, such as the cache's name.
+
+    Returns:
+        HitCounter:
+        The new counter.
+    """
+    item = HitCounter(name)
+
+    if _items is not None:
+        _items.append(item)
+
+    return item
+
+
+def track(
+    name: str,
+    get_value: Callable[[], Any],
+) -> None:
+    """Report a value through a function, when progress is reported.
+
+    Args:
+        name (str):
+            The name to show for the value.
+
+        get_value (callable):
+            A function returning the current value.
+    """
+    if _items is not None:
+        _items.append(TrackedValue(name, get_value))
+
+
+@contextmanager
+def collect_progress() -> Iterator[None]:
+    """Collect progress from any counters created within the context.
+
+    Context:
+        Counters will be registered, and can be reported with
+        :py:func:`get_progress`.
+    """
+    global _items
+
+    old_items = _items
+    _items = []
+
+    try:
+        yield
+    finally:
+        _items = old_items
+
+
+def get_progress() -> list[str]:
+    """Return the current progress of the registered counters.
+
+    Values that fail to compute are shown with their error, rather than
+    hiding the rest of the progress.
+
+    Returns:
+        list of str:
+        A displayable line for each counter, in the order they were
+        created.
+    """
+    lines: list[str] = []
+
+    for item in _items or []:
+        try:
+            lines.append(item.format())
+        except Exception as e:
+            lines.append(f'{item.name}: {e!r}')
+
+    return lines
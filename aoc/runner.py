@@ -0,0 +1,311 @@
+"""Running solvers and collecting their results."""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Optional
+
+from aoc import preprocessed
+from aoc.cache import ResultCache, make_cache_key
+from aoc.inputs import InputSource
+from aoc.solvers import (SolverFunc, SolverInfo, load_solver,
+                         load_solver_module)
+
+
+#: The input path used to read the input from standard input.
+STDIN_PATH = '-'
+
+
+class SolverResult(NamedTuple):
+    """The result of running a solver."""
+
+    #: Information on the solver that was run.
+    info: SolverInfo
+
+    #: The answer returned by the solver.
+    answer: Any
+
+    #: The wall time spent solving, in seconds.
+    #:
+    #: For cached results, this is the time the original run took.
+    elapsed: float
+
+    #: Whether the answer came from the result cache.
+    cached: bool = False
+
+    #: Whether the solver was stopped for running past its time limit.
+    #:
+    #: If set, ``answer`` will be ``None``, and ``elapsed`` is the time
+    #: until it was stopped.
+    timed_out: bool = False
+
+    #: The solver's progress when it was stopped, as displayable lines.
+    #:
+    #: See :py:mod:`aoc.progress`.
+    progress: tuple[str, ...] = ()
+
+
+@contextmanager
+def _open_stdin_source(
+    solve: SolverFunc,
+) -> Iterator[InputSource]:
+    """Open standard input as an input source for a solver.
+
+    Solvers that accept streams (see :py:func:`aoc.inputs.accepts_streams`)
+    read from standard input directly, as the input arrives. Anything else
+    needs a file, so the input is first copied to a temporary one. Cache
+    files for preprocessed inputs (see :py:mod:`aoc.preprocessed`) aren't
+    saved next to the temporary file, since nothing would remove them.
+
+    Args:
+        solve (callable):
+            The solver's ``solve`` function.
+
+    Context:
+        object:
+        The input source to pass to the solver.
+    """
+    if getattr(solve, 'accepts_streams', False):
+        yield sys.stdin.buffer
+    else:
+        with tempfile.NamedTemporaryFile(prefix='aoc-input-',
+                                         delete=False) as fp:
+            shutil.copyfileobj(sys.stdin.buffer, fp)
+
+        try:
+            with preprocessed.disabled():
+                yield fp.name
+        finally:
+            os.unlink(fp.name)
+
+
+def _call_solver(
+    info: SolverInfo,
+    solve: SolverFunc,
+    source: InputSource,
+    *,
+    timeout: Optional[float] = None,
+) -> SolverResult:
+    """Call a solver and time it.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver.
+
+        solve (callable):
+            The solver's ``solve`` function.
+
+        source (aoc.inputs.InputSource):
+            The input source to pass to the solver.
+
+        timeout (float, optional):
+            The time limit for the solver, in seconds. If the solver runs
+            past this, it's stopped, and its progress is returned in the
+            result.
+
+    Returns:
+        SolverResult:
+        The result of the call.
+    """
+    if timeout is None:
+        start = time.perf_counter()
+        answer = solve(source)
+        elapsed = time.perf_counter() - start
+    else:
+        from aoc.progress import collect_progress, get_progress
+        from aoc.watchdog import SolverTimeoutError, time_limit
+
+        with collect_progress():
+            start = time.perf_counter()
+
+            try:
+                with time_limit(timeout):
+                    answer = solve(source)
+            except SolverTimeoutError:
+                return SolverResult(info=info,
+                                    answer=None,
+                                    elapsed=time.perf_counter() - start,
+                                    timed_out=True,
+                                    progress=tuple(get_progress()))
+
+            elapsed = time.perf_counter() - start
+
+    return SolverResult(info=info,
+                        answer=answer,
+                        elapsed=elapsed)
+
+
+def run_solver(
+    info: SolverInfo,
+    *,
+    input_path: Optional[str] = None,
+    cache: Optional[ResultCache] = None,
+    timeout: Optional[float] = None,
+) -> SolverResult:
+    """Run a solver and return its result.
+
+    The solver's module is imported on first use, and then kept around for
+    any later runs in the same process.
+
+    If a cache is provided, a stored answer for the same solver source,
+    input, and parameters is returned without running the solver. New
+    answers are stored in the cache.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver to run.
+
+        input_path (str, optional):
+            The path to the input file. This defaults to the day's ``input``
+            file. If this is :py:data:`STDIN_PATH`, the input is read from
+            standard input, and the cache isn't used.
+
+        cache (aoc.cache.ResultCache, optional):
+            The result cache to use.
+
+        timeout (float, optional):
+            The time limit for the solver, in seconds. A solver running past
+            this is stopped (see :py:mod:`aoc.watchdog`), and a result with
+            ``timed_out`` set is returned. These results aren't cached.
+
+    Returns:
+        SolverResult:
+        The result of the run.
+    """
+    solve = load_solver(info)
+
+    if input_path is None:
+        input_path = info.input_path
+    elif input_path == STDIN_PATH:
+        with _open_stdin_source(solve) as source:
+            return _call_solver(info, solve, source,
+                                timeout=timeout)
+
+    if cache is not None:
+        cache_key = make_cache_key(load_solver_module(info), input_path)
+        cached_result = cache.get(cache_key)
+
+        if cached_result is not None:
+            return SolverResult(info=info,
+                                answer=cached_result.answer,
+                                elapsed=cached_result.elapsed,
+                                cached=True)
+
+    result = _call_solver(info, solve, input_path,
+                          timeout=timeout)
+
+    if cache is not None and not result.timed_out:
+        cache.set(cache_key,
+                  name=info.name,
+                  answer=result.answer,
+                  elapsed=result.elapsed)
+
+    return result
+
+
+def iter_parallel_results(
+    solvers: Iterable[SolverInfo],
+    *,
+    jobs: int,
+    expected_times: Mapping[str, float] = {},
+    input_paths: Mapping[str, str] = {},
+    cache: Optional[ResultCache] = None,
+    timeout: Optional[float] = None,
+) -> Iterator[SolverResult]:
+    """Run solvers across a pool of worker processes.
+
+    Solvers are submitted longest-expected-first, so that the slowest
+    solvers start right away and the total wall time is bounded by them,
+    rather than by whatever happened to be queued last. Solvers without an
+    expected time are treated as the slowest, since we don't know any
+    better.
+
+    With a timeout, each solver is stopped once it runs past it, freeing up
+    its worker for the rest, and its result is reported with ``timed_out``
+    set.
+
+    Args:
+        solvers (list of SolverInfo):
+            The solvers to run.
+
+        jobs (int):
+            The number of worker processes to use.
+
+        expected_times (dict, optional):
+            A mapping of solver names to expected wall times, in seconds.
+
+        input_paths (dict, optional):
+            A mapping of solver names to alternative input files. Solvers
+            not in the mapping use their day's input file.
+
+        cache (aoc.cache.ResultCache, optional):
+            The result cache to use.
+
+        timeout (float, optional):
+            The time limit for each solver, in seconds.
+
+    Yields:
+        SolverResult:
+        The result of each solver, in the order they complete.
+    """
+    # Process pools are only needed here, so don't pay for importing them
+    # on every run.
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    def _get_sort_key(
+        info: SolverInfo,
+    ) -> float:
+        return -expected_times.get(info.name, float('inf'))
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(run_solver, info,
+                            input_path=input_paths.get(info.name),
+                            cache=cache,
+                            timeout=timeout)
+            for info in sorted(solvers, key=_get_sort_key)
+        ]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def format_result(
+    result: SolverResult,
+) -> str:
+    """Return a displayable line (or lines) for a solver's result.
+
+    Args:
+        result (SolverResult):
+            The result to format.
+
+    Returns:
+        str:
+        The formatted result.
+    """
+    timing = f'{result.elapsed * 1000:.2f}ms'
+
+    if result.timed_out:
+        lines = [f'{result.info.name}: TIMEOUT [{timing}]']
+        lines += [
+            f'    {line}'
+            for line in result.progress or ['(no progress reported)']
+        ]
+
+        return '\n'.join(lines)
+
+    answer = str(result.answer)
+
+    if result.cached:
+        timing = f'[cached, originally {timing}]'
+    else:
+        timing = f'[{timing}]'
+
+    if '\n' in answer:
+        # Multi-line answers (like drawn screens) go below the heading.
+        return f'{result.info.name}: {timing}\n{answer}'
+    else:
+        return f'{result.info.name}: {answer} {timing}'
@@ -0,0 +1,461 @@
+"""A long-running server that keeps solvers warm between runs.
+
+Every ``aoc run`` normally pays for starting Python, importing the solver,
+and parsing the input before any solving happens. While working on a
+solution, that's paid over and over again for the same day.
+
+``aoc serve`` starts a server that imports solvers once and keeps them in
+memory, along with any inputs parsed by functions decorated with
+:py:func:`aoc.inputs.cache_parsed`. Those parse functions are run on the
+day's input as soon as a solver is loaded, so the first run is warm too.
+
+``aoc run`` hands its solvers to the server over a Unix domain socket, when
+one is running. Task files are watched for changes, and an edited task is
+re-imported on its own, without disturbing any other loaded solvers.
+Changes to the :py:mod:`aoc` package itself need a restart of the server.
+
+Requests and responses are single lines of JSON. A request looks like::
+
+    {"solvers": [{"year": 2022, "day": 16, "task": 1, "input": null}],
+     "cache": true}
+
+The server responds with a line per solver, in order, containing either
+``name``, ``answer`` (as a string), ``elapsed``, and ``cached``, or
+``name`` and ``error``.
+
+Solvers are run one at a time. Many keep state in module globals, so
+running the same solver twice at once isn't safe.
+"""
+
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import traceback
+from typing import Any, Iterator, Mapping, Optional, TextIO
+
+from aoc.cache import ResultCache
+from aoc.runner import SolverResult, format_result, run_solver
+from aoc.solvers import (ROOT_DIR, SolverInfo, get_solver_info,
+                         load_solver_module, unload_module)
+
+
+#: The default path to the server's socket.
+DEFAULT_SOCKET_PATH = os.path.join(ROOT_DIR, '.aoc-server.sock')
+
+
+#: How often task files are checked for changes, in seconds.
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+class ServerError(Exception):
+    """An error starting or communicating with the server."""
+
+
+class ServerUnavailableError(ServerError):
+    """There's no server listening on the socket."""
+
+
+class RemoteSolverError(ServerError):
+    """A solver failed while running on the server."""
+
+
+class SolverServer:
+    """A server running solvers on behalf of ``aoc run``.
+
+    Loaded solver modules are tracked along with their files' modification
+    times. A background thread checks those files for changes, and reloads
+    any that were edited.
+    """
+
+    def __init__(
+        self,
+        *,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        log: TextIO = sys.stderr,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            socket_path (str, optional):
+                The path to listen on.
+
+            poll_interval (float, optional):
+                How often to check task files for changes, in seconds.
+
+            log (io.TextIOBase, optional):
+                The stream to log activity to.
+        """
+        self.socket_path = socket_path
+        self.poll_interval = poll_interval
+        self.log = log
+
+        #: The loaded solvers, keyed off by their task file paths.
+        self._solvers: dict[str, SolverInfo] = {}
+
+        #: The modification times of loaded task files.
+        self._mtimes: dict[str, int] = {}
+
+        # Loading, reloading, and running solvers must never overlap.
+        self._lock = threading.Lock()
+        self._cache: Optional[ResultCache] = None
+        self._done = threading.Event()
+
+    def load(
+        self,
+        info: SolverInfo,
+    ) -> bool:
+        """Load a solver and preload its parsed input.
+
+        Any functions in the module decorated with
+        :py:func:`aoc.inputs.cache_parsed` are called on the day's input,
+        so that they're ready for the first run.
+
+        Problems loading the solver are logged, rather than raised.
+
+        Args:
+            info (SolverInfo):
+                Information on the solver to load.
+
+        Returns:
+            bool:
+            ``True`` if the solver was loaded.
+        """
+        path = info.path
+
+        self._solvers[path] = info
+
+        try:
+            self._mtimes[path] = os.stat(path).st_mtime_ns
+            module = load_solver_module(info)
+
+            if os.path.exists(info.input_path):
+                for value in list(vars(module).values()):
+                    if getattr(value, 'parses_input', False):
+                        value(info.input_path)
+        except Exception:
+            self._write_log(f'Failed to load {info.name}:\n'
+                            f'{traceback.format_exc()}')
+            unload_module(path)
+
+            return False
+
+        return True
+
+    def check_for_changes(self) -> None:
+        """Reload any solvers whose task files have changed."""
+        with self._lock:
+            for path, mtime in list(self._mtimes.items()):
+                try:
+                    new_mtime = os.stat(path).st_mtime_ns
+                except FileNotFoundError:
+                    # The file may be in the middle of being saved. Check
+                    # again later.
+                    continue
+
+                if new_mtime != mtime:
+                    info = self._solvers[path]
+                    unload_module(path)
+
+                    if self.load(info):
+                        self._write_log(f'Reloaded {info.name}')
+
+    def serve_forever(self) -> None:
+        """Listen for and handle requests until interrupted.
+
+        The socket is removed when the server stops.
+
+        Raises:
+            ServerError:
+                Another server is already listening on the socket.
+        """
+        if os.path.exists(self.socket_path):
+            try:
+                connect_to_server(self.socket_path).close()
+            except ServerUnavailableError:
+                # This was left behind by a server that didn't shut down
+                # cleanly.
+                os.unlink(self.socket_path)
+            else:
+                raise ServerError(
+                    f'A server is already listening on {self.socket_path}.')
+
+        # Make sure a terminated server still cleans up its socket.
+        signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+            # Anyone who can connect can run code from this tree against any
+            # file, so only allow the current user. The socket is created
+            # with those permissions, so there's no moment where anyone else
+            # could connect.
+            old_umask = os.umask(0o077)
+
+            try:
+                listener.bind(self.socket_path)
+            finally:
+                os.umask(old_umask)
+
+            try:
+                # Just in case the file system didn't respect the umask.
+                os.chmod(self.socket_path, 0o600)
+                listener.listen()
+
+                watcher = threading.Thread(target=self._watch,
+                                           daemon=True)
+                watcher.start()
+
+                self._write_log(f'Listening on {self.socket_path}')
+
+                while True:
+                    conn, addr = listener.accept()
+
+                    try:
+                        with conn:
+                            self._handle_connection(conn)
+                    except (BrokenPipeError, ConnectionResetError):
+                        # The client went away. There's no point in running
+                        # anything else for it.
+                        pass
+            finally:
+                self._done.set()
+                os.unlink(self.socket_path)
+
+    def _watch(self) -> None:
+        """Check for changed task files until the server stops."""
+        while not self._done.wait(self.poll_interval):
+            self.check_for_changes()
+
+    def _handle_connection(
+        self,
+        conn: socket.socket,
+    ) -> None:
+        """Handle a request from a client.
+
+        Args:
+            conn (socket.socket):
+                The connection to the client.
+        """
+        with conn.makefile('r', encoding='utf-8') as reader, \
+             conn.makefile('w', encoding='utf-8') as writer:
+            line = reader.readline()
+
+            if not line:
+                # This was just a check to see if the server is running.
+                return
+
+            try:
+                request = json.loads(line)
+                use_cache = bool(request.get('cache', True))
+                solvers = [
+                    (get_solver_info(item['year'], item['day'],
+                                     item['task']),
+                     item.get('input'))
+                    for item in request['solvers']
+                ]
+            except Exception as e:
+                self._send(writer, {
+                    'name': None,
+                    'error': f'Invalid request: {e}',
+                })
+                return
+
+            # Pick up any edits that the watcher hasn't seen yet.
+            self.check_for_changes()
+
+            for info, input_path in solvers:
+                self._send(writer, self._run(info,
+                                             input_path=input_path,
+                                             use_cache=use_cache))
+
+    def _run(
+        self,
+        info: SolverInfo,
+        *,
+        input_path: Optional[str],
+        use_cache: bool,
+    ) -> dict[str, Any]:
+        """Run a solver and return its response.
+
+        Args:
+            info (SolverInfo):
+                Information on the solver to run.
+
+            input_path (str):
+                The path to the input file, or ``None`` for the day's input.
+
+            use_cache (bool):
+                Whether to use the result cache.
+
+        Returns:
+            dict:
+            The response to send for the solver.
+        """
+        if use_cache and self._cache is None:
+            self._cache = ResultCache()
+
+        with self._lock:
+            if info.path not in self._solvers and not self.load(info):
+                return {
+                    'name': info.name,
+                    'error': f'{info.name} could not be loaded. See the '
+                             f'server output for details.',
+                }
+
+            try:
+                result = run_solver(info,
+                                    input_path=input_path,
+                                    cache=self._cache if use_cache else None)
+            except Exception:
+                error = traceback.format_exc()
+                self._write_log(f'{info.name} failed:\n{error}')
+
+                return {
+                    'name': info.name,
+                    'error': error,
+                }
+
+        self._write_log(format_result(result))
+
+        return {
+            'name': info.name,
+            'answer': str(result.answer),
+            'elapsed': result.elapsed,
+            'cached': result.cached,
+        }
+
+    def _send(
+        self,
+        writer: TextIO,
+        response: dict[str, Any],
+    ) -> None:
+        """Send a response to the client.
+
+        Args:
+            writer (io.TextIOBase):
+                The stream to write to.
+
+            response (dict):
+                The response to send.
+        """
+        writer.write(f'{json.dumps(response)}\n')
+        writer.flush()
+
+    def _write_log(
+        self,
+        msg: str,
+    ) -> None:
+        """Write a message to the log.
+
+        Args:
+            msg (str):
+                The message to write.
+        """
+        self.log.write(f'{msg.rstrip()}\n')
+        self.log.flush()
+
+
+def connect_to_server(
+    socket_path: str = DEFAULT_SOCKET_PATH,
+) -> socket.socket:
+    """Connect to a running server.
+
+    Args:
+        socket_path (str, optional):
+            The path to the server's socket.
+
+    Returns:
+        socket.socket:
+        The connection to the server.
+
+    Raises:
+        ServerUnavailableError:
+            No server is listening on the socket.
+    """
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        conn.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        conn.close()
+
+        raise ServerUnavailableError(
+            f'No server is listening on {socket_path}: {e}')
+
+    return conn
+
+
+def iter_server_results(
+    conn: socket.socket,
+    solvers: list[SolverInfo],
+    *,
+    input_paths: Mapping[str, str] = {},
+    cache: bool = True,
+) -> Iterator[SolverResult]:
+    """Run solvers on the server, yielding their results.
+
+    The connection is closed once all results have been received.
+
+    Args:
+        conn (socket.socket):
+            The connection to the server, from :py:func:`connect_to_server`.
+
+        solvers (list of SolverInfo):
+            The solvers to run.
+
+        input_paths (dict, optional):
+            A mapping of solver names to alternative input files. Solvers
+            not in the mapping use their day's input file.
+
+        cache (bool, optional):
+            Whether the server should use the result cache.
+
+    Yields:
+        SolverResult:
+        The result of each solver, in order. Answers are always strings.
+
+    Raises:
+        RemoteSolverError:
+            A solver failed on the server.
+
+        ServerError:
+            The server closed the connection early.
+    """
+    request = {
+        'solvers': [
+            {
+                'year': info.year,
+                'day': info.day,
+                'task': info.task,
+                'input': (os.path.abspath(input_paths[info.name])
+                          if info.name in input_paths
+                          else None),
+            }
+            for info in solvers
+        ],
+        'cache': cache,
+    }
+
+    with conn, conn.makefile('r', encoding='utf-8') as reader:
+        conn.sendall(f'{json.dumps(request)}\n'.encode('utf-8'))
+
+        for info in solvers:
+            line = reader.readline()
+
+            if not line:
+                raise ServerError('The server closed the connection before '
+                                  'all solvers were run.')
+
+            response = json.loads(line)
+
+            if 'error' in response:
+                raise RemoteSolverError(
+                    f'{response["name"] or "The server"} failed: '
+                    f'{response["error"]}')
+
+            yield SolverResult(info=info,
+                               answer=response['answer'],
+                               elapsed=response['elapsed'],
+                               cached=response['cached'])
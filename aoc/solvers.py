@@ -0,0 +1,295 @@
+"""Discovery and loading of solvers for each year, day, and task."""
+
+import importlib.util
+import os
+import re
+import sys
+from types import ModuleType
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+
+#: The root of the repository, containing a directory per year.
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                        os.pardir))
+
+
+YEAR_DIR_RE = re.compile(r'^(\d{4})$')
+DAY_DIR_RE = re.compile(r'^day(\d{2})$')
+TASK_FILE_RE = re.compile(r'^task(\d+)\.py$')
+
+
+#: A solver function, taking an input filename and returning the answer.
+SolverFunc = Callable[[str], Any]
+
+
+class SolverNotFoundError(LookupError):
+    """A requested solver could not be found or loaded."""
+
+
+class SolverInfo(NamedTuple):
+    """Information on a solver for a year, day, and task."""
+
+    #: The year of the puzzle.
+    year: int
+
+    #: The day of the puzzle (1-25).
+    day: int
+
+    #: The task number for the day (1 or 2).
+    task: int
+
+    #: The absolute path to the task's Python file.
+    path: str
+
+    @property
+    def name(self) -> str:
+        """A display name for the solver, in ``YYYY/dayNN/taskN`` form."""
+        return f'{self.year}/day{self.day:02}/task{self.task}'
+
+    @property
+    def day_dir(self) -> str:
+        """The directory containing the day's tasks and inputs."""
+        return os.path.dirname(self.path)
+
+    @property
+    def input_path(self) -> str:
+        """The path to the day's puzzle input."""
+        return os.path.join(self.day_dir, 'input')
+
+
+# Modules we've already loaded, keyed off by their paths.
+_loaded_modules: dict[str, ModuleType] = {}
+
+
+def _iter_numbered_entries(
+    path: str,
+    pattern: re.Pattern,
+) -> Iterator[tuple[int, str]]:
+    """Iterate through numbered entries in a directory, in numeric order.
+
+    Args:
+        path (str):
+            The directory to scan.
+
+        pattern (re.Pattern):
+            The pattern used to match entries. Group 1 must be the number.
+
+    Yields:
+        tuple:
+        A 2-tuple of ``(number, entry_path)``.
+    """
+    try:
+        names = os.listdir(path)
+    except FileNotFoundError:
+        return
+
+    entries = []
+
+    for name in names:
+        m = pattern.match(name)
+
+        if m:
+            entries.append((int(m.group(1)), os.path.join(path, name)))
+
+    yield from sorted(entries)
+
+
+def iter_solvers(
+    *,
+    year: Optional[int] = None,
+    day: Optional[int] = None,
+    task: Optional[int] = None,
+) -> Iterator[SolverInfo]:
+    """Iterate through all available solvers, in year/day/task order.
+
+    Solvers are discovered by their filenames. Nothing is imported.
+
+    Args:
+        year (int, optional):
+            A specific year to limit results to.
+
+        day (int, optional):
+            A specific day to limit results to.
+
+        task (int, optional):
+            A specific task to limit results to.
+
+    Yields:
+        SolverInfo:
+        Information on each matching solver.
+    """
+    for solver_year, year_path in _iter_numbered_entries(ROOT_DIR,
+                                                         YEAR_DIR_RE):
+        if year is not None and solver_year != year:
+            continue
+
+        for solver_day, day_path in _iter_numbered_entries(year_path,
+                                                           DAY_DIR_RE):
+            if day is not None and solver_day != day:
+                continue
+
+            for solver_task, task_path in _iter_numbered_entries(
+                day_path, TASK_FILE_RE):
+                if task is None or solver_task == task:
+                    yield SolverInfo(year=solver_year,
+                                     day=solver_day,
+                                     task=solver_task,
+                                     path=task_path)
+
+
+def get_solver_info(
+    year: int,
+    day: int,
+    task: int,
+) -> SolverInfo:
+    """Return information on a specific solver.
+
+    Args:
+        year (int):
+            The year of the puzzle.
+
+        day (int):
+            The day of the puzzle.
+
+        task (int):
+            The task number.
+
+    Returns:
+        SolverInfo:
+        Information on the solver.
+
+    Raises:
+        SolverNotFoundError:
+            The solver does not exist.
+    """
+    path = os.path.join(ROOT_DIR, str(year), f'day{day:02}', f'task{task}.py')
+
+    if not os.path.exists(path):
+        raise SolverNotFoundError(
+            f'There is no solver for {year} day {day} task {task}.')
+
+    return SolverInfo(year=year,
+                      day=day,
+                      task=task,
+                      path=path)
+
+
+def load_module(
+    path: str,
+    *,
+    module_name: str,
+) -> ModuleType:
+    """Import a Python file from a day's directory as a module.
+
+    Day directories aren't packages, so their files are imported by path.
+    Modules are only imported once per process. Later calls return the
+    already-loaded module.
+
+    Args:
+        path (str):
+            The path to the Python file.
+
+        module_name (str):
+            The unique name to register the module under.
+
+    Returns:
+        module:
+        The loaded module.
+    """
+    module = _loaded_modules.get(path)
+
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        assert spec is not None and spec.loader is not None
+
+        module = importlib.util.module_from_spec(spec)
+
+        # Register the module before executing it, so that anything needing
+        # to look it up by name (dataclasses, pickling) can find it.
+        sys.modules[module_name] = module
+
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+
+        _loaded_modules[path] = module
+
+    return module
+
+
+def unload_module(
+    path: str,
+) -> bool:
+    """Forget a module loaded by :py:func:`load_module`.
+
+    The next call to :py:func:`load_module` for the path imports the file
+    again. Anything already holding on to the old module keeps using it.
+
+    Args:
+        path (str):
+            The path to the Python file.
+
+    Returns:
+        bool:
+        ``True`` if the module had been loaded.
+    """
+    module = _loaded_modules.pop(path, None)
+
+    if module is None:
+        return False
+
+    sys.modules.pop(module.__name__, None)
+
+    return True
+
+
+def load_solver_module(
+    info: SolverInfo,
+) -> ModuleType:
+    """Import a solver's module.
+
+    Modules are only imported once per process. Later calls return the
+    already-loaded module.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver to load.
+
+    Returns:
+        module:
+        The solver's module.
+    """
+    return load_module(
+        info.path,
+        module_name=f'_aoc_{info.year}_day{info.day:02}_task{info.task}')
+
+
+def load_solver(
+    info: SolverInfo,
+) -> SolverFunc:
+    """Import a solver's module and return its entry point.
+
+    Modules are only imported once per process. Later calls return the
+    already-loaded entry point.
+
+    Args:
+        info (SolverInfo):
+            Information on the solver to load.
+
+    Returns:
+        callable:
+        The solver's ``solve`` function.
+
+    Raises:
+        SolverNotFoundError:
+            The module does not provide a ``solve`` function.
+    """
+    module = load_solver_module(info)
+
+    try:
+        return module.solve
+    except AttributeError:
+        raise SolverNotFoundError(
+            f'{info.name} does not define a solve() function.')
@@ -0,0 +1,206 @@
+"""Leveled diagnostic output for solvers.
+
+Solvers often want to show what they're doing while being worked on, but
+printing from a hot loop can easily cost more than the work itself. This
+module provides tracers that only exist when their level is enabled.
+
+A tracer is fetched once, outside of the hot code, and checked before use::
+
+    from aoc import tracing
+
+    trace_debug = tracing.get_tracer(tracing.DEBUG)
+
+    for item in items:
+        if trace_debug:
+            trace_debug('%s => %s', item, value)
+
+When the level is disabled, :py:func:`get_tracer` returns ``None``, so the
+only cost in the loop is checking a local variable. The message isn't
+formatted and its arguments aren't even evaluated.
+
+Trace output is written to stderr, keeping stdout free for answers. The
+level is set through the ``AOC_TRACE`` environment variable (as a number or
+a level name), or with ``aoc run -v``.
+"""
+
+import os
+import sys
+from typing import Any, Callable, Optional
+
+
+#: Tracing is disabled.
+OFF = 0
+
+#: High-level progress and summaries, shown a handful of times per solve.
+INFO = 1
+
+#: More detailed progress, such as periodic status within a long loop.
+DEBUG = 2
+
+#: Fine-grained output, potentially for every step of a hot loop.
+TRACE = 3
+
+
+#: A mapping of level names to levels.
+LEVEL_NAMES = {
+    'off': OFF,
+    'info': INFO,
+    'debug': DEBUG,
+    'trace': TRACE,
+}
+
+
+#: The environment variable used to set the level.
+TRACE_ENV_VAR = 'AOC_TRACE'
+
+
+#: A tracer function, taking a %-style format string and its arguments.
+TracerFunc = Callable[..., None]
+
+
+def parse_level(
+    value: str,
+) -> int:
+    """Parse a trace level from a number or a level name.
+
+    Args:
+        value (str):
+            The value to parse.
+
+    Returns:
+        int:
+        The trace level.
+
+    Raises:
+        ValueError:
+            The value isn't a valid level.
+    """
+    value = value.strip().lower()
+
+    if value in LEVEL_NAMES:
+        return LEVEL_NAMES[value]
+
+    try:
+        level = int(value)
+    except ValueError:
+        level = -1
+
+    if not OFF <= level <= TRACE:
+        raise ValueError(
+            f'Invalid trace level {value!r}. This must be a number from '
+            f'{OFF} to {TRACE}, or one of: {", ".join(LEVEL_NAMES)}.')
+
+    return level
+
+
+def _get_env_level() -> int:
+    """Return the trace level set in the environment.
+
+    Invalid values are reported on stderr and treated as :py:data:`OFF`.
+
+    Returns:
+        int:
+        The trace level.
+    """
+    value = os.environ.get(TRACE_ENV_VAR)
+
+    if not value:
+        return OFF
+
+    try:
+        return parse_level(value)
+    except ValueError as e:
+        sys.stderr.write(f'{TRACE_ENV_VAR}: {e}\n')
+
+        return OFF
+
+
+_level = _get_env_level()
+
+
+def get_level() -> int:
+    """Return the current trace level.
+
+    Returns:
+        int:
+        The trace level.
+    """
+    return _level
+
+
+def set_level(
+    level: int,
+) -> None:
+    """Set the trace level.
+
+    This also updates the environment, so that any worker processes use the
+    same level.
+
+    Args:
+        level (int):
+            The new trace level.
+    """
+    global _level
+
+    assert OFF <= level <= TRACE
+
+    _level = level
+    os.environ[TRACE_ENV_VAR] = str(level)
+
+
+def is_enabled(
+    level: int,
+) -> bool:
+    """Return whether a trace level is enabled.
+
+    Args:
+        level (int):
+            The level to check.
+
+    Returns:
+        bool:
+        ``True`` if output at this level should be shown.
+    """
+    return _level >= level
+
+
+def _trace(
+    msg: str,
+    *args: Any,
+) -> None:
+    """Write a trace message to stderr.
+
+    Args:
+        msg (str):
+            The message, as a %-style format string if arguments are given.
+
+        *args (tuple):
+            The arguments for the format string.
+    """
+    if args:
+        msg %= args
+
+    sys.stderr.write(f'{msg}\n')
+
+
+def get_tracer(
+    level: int,
+) -> Optional[TracerFunc]:
+    """Return a tracer for a level, if that level is enabled.
+
+    Callers should fetch a tracer before entering any hot code, and then
+    check that it's not ``None`` before calling it.
+
+    Args:
+        level (int):
+            The level of the output.
+
+    Returns:
+        callable:
+        A function taking a %-style format string and its arguments, or
+        ``None`` if the level is disabled.
+    """
+    if _level >= level:
+        return _trace
+    else:
+        return None
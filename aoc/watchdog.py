@@ -0,0 +1,100 @@
+"""Time limits for solvers.
+
+Some solvers can run for a very long time on unlucky or scaled-up inputs.
+Rather than letting one of them stall a whole run, a time limit can be put
+on each solver. A solver still running when its time is up is interrupted
+with :py:class:`SolverTimeoutError`, and the runner reports how far it got
+(see :py:mod:`aoc.progress`).
+
+The limit is enforced with a ``SIGALRM`` timer, so the solver doesn't need
+to check for it. This only works in the main thread of a process, on
+platforms with :py:func:`signal.setitimer` (see :py:func:`is_supported`).
+Python only handles signals between bytecode instructions, so a solver
+stuck in a single long call into C code (such as sorting a huge list) is
+interrupted once that call returns.
+"""
+
+import signal
+from contextlib import contextmanager
+from types import FrameType
+from typing import Iterator, Optional
+
+
+class SolverTimeoutError(BaseException):
+    """A solver ran past its time limit.
+
+    This inherits from :py:class:`BaseException` (like
+    :py:class:`KeyboardInterrupt`), so that a solver catching
+    :py:class:`Exception` doesn't swallow it.
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+    ) -> None:
+        """Initialize the error.
+
+        Args:
+            timeout (float):
+                The time limit, in seconds.
+        """
+        super().__init__(timeout)
+
+        #: The time limit, in seconds.
+        self.timeout = timeout
+
+    def __str__(self) -> str:
+        """Return a message for the error.
+
+        Returns:
+            str:
+            The error message.
+        """
+        return f'Ran past the time limit of {self.timeout:g}s'
+
+
+def is_supported() -> bool:
+    """Return whether time limits can be used on this platform.
+
+    Returns:
+        bool:
+        ``True`` if time limits are supported.
+    """
+    return hasattr(signal, 'setitimer')
+
+
+@contextmanager
+def time_limit(
+    timeout: float,
+) -> Iterator[None]:
+    """Interrupt the code within the context if it runs past a time limit.
+
+    Any previous ``SIGALRM`` handler is restored afterward.
+
+    Args:
+        timeout (float):
+            The time limit, in seconds.
+
+    Context:
+        The code will be interrupted when the time is up.
+
+    Raises:
+        SolverTimeoutError:
+            The code ran past the time limit.
+    """
+    assert timeout > 0
+
+    def _on_alarm(
+        signum: int,
+        frame: Optional[FrameType],
+    ) -> None:
+        raise SolverTimeoutError(timeout)
+
+    old_handler = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old_handler)